@@ -65,6 +65,8 @@ from .selectors import (
     CssSelectAll,
     XpathSelect,
     XpathSelectAll,
+    CssCount,
+    XpathCount,
     CssRemove,
     XpathRemove,
 )
@@ -192,6 +194,8 @@ __all__ = [
     "CssSelectAll",
     "XpathSelect",
     "XpathSelectAll",
+    "CssCount",
+    "XpathCount",
     "CssRemove",
     "XpathRemove",
     # extract
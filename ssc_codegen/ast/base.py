@@ -19,9 +19,9 @@ class Node:
     parent             — back-reference, excluded from repr to avoid cycles.
     body               — child nodes (pipeline body, struct body, etc.).
     span               — optional source location carried from KdlNode.span.
-                         Populated lazily by parsers that need position info
-                         in codegen (Assert, Re). None for nodes that never
-                         use source location.
+                         Set on every pipeline op; codegen reads it for
+                         messages (Assert, Re), ``check`` for optimizer
+                         reports. None for synthesized nodes.
 
     The scalar ``accept`` / ``ret`` views and the legacy ``type_info`` name are
     exposed as read-only backport properties derived from the TypeInfo fields.
@@ -22,7 +22,14 @@ class CssSelect(Node):
 
 @dataclass
 class CssSelectAll(Node):
+    """All matches of the first query that matches anything.
+
+    ``limit`` > 0 keeps only the first ``limit`` matches; set by the
+    optimizer for ``slice``/``index`` so backends can stop early.
+    """
+
     queries: list[str] = field(default_factory=list)
+    limit: int = 0
     accept_type_info: TypeInfo = field(
         default_factory=lambda: TypeInfo(base=VariableType.DOCUMENT)
     )
@@ -55,7 +62,10 @@ class XpathSelect(Node):
 
 @dataclass
 class XpathSelectAll(Node):
+    """XPath counterpart of ``CssSelectAll``, including ``limit``."""
+
     queries: list[str] = field(default_factory=list)
+    limit: int = 0
     accept_type_info: TypeInfo = field(
         default_factory=lambda: TypeInfo(base=VariableType.DOCUMENT)
     )
@@ -71,6 +81,36 @@ class XpathSelectAll(Node):
         return self.queries[0]
 
 
+@dataclass
+class CssCount(Node):
+    """Number of matches of ``queries[0]``.
+
+    Produced by the optimizer from ``css-all Q; len``, so backends can
+    count without building the match list.
+    """
+
+    queries: list[str] = field(default_factory=list)
+    accept_type_info: TypeInfo = field(
+        default_factory=lambda: TypeInfo(base=VariableType.DOCUMENT)
+    )
+    ret_type_info: TypeInfo = field(
+        default_factory=lambda: TypeInfo(base=VariableType.INT)
+    )
+
+
+@dataclass
+class XpathCount(Node):
+    """XPath counterpart of ``CssCount`` (``xpath-all Q; len``)."""
+
+    queries: list[str] = field(default_factory=list)
+    accept_type_info: TypeInfo = field(
+        default_factory=lambda: TypeInfo(base=VariableType.DOCUMENT)
+    )
+    ret_type_info: TypeInfo = field(
+        default_factory=lambda: TypeInfo(base=VariableType.INT)
+    )
+
+
 @dataclass
 class CssRemove(Node):
     """Removes matched elements from document in-place, passes document forward."""
@@ -549,7 +549,7 @@ class Init(Node):
     Pre-computed named values cached before field parsing.
     Execution order: after PreValidate, before SplitDoc and Fields.
     DSL: @init { name { pipeline... } ... }
-    body: list[InitFieldCall]
+    body: list[InitFieldCall] — only the eager (non-lazy) InitFields
     """
 
     pass
@@ -579,9 +579,14 @@ class InitField(Node):
 
     Separate node from Field — semantics differ:
     InitField is cached and reachable via Self; Field produces output.
+
+    lazy — computed on first Self access instead of in the constructor;
+    has no InitFieldCall. Set on ``@init`` entries without side effects
+    and on values synthesized by the optimizer.
     """
 
     name: str = ""
+    lazy: bool = False
     accept_type_info: TypeInfo = field(
         default_factory=lambda: TypeInfo(base=VariableType.DOCUMENT)
     )
@@ -0,0 +1,395 @@
+"""Benchmark generated Python parsers across HTML backends (``ssc-gen bench``)."""
+
+from __future__ import annotations
+
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from ssc_codegen.ast import Module
+from ssc_codegen.naming import to_pascal_case
+from ssc_codegen.targets.resolver import resolve
+from ssc_codegen.targets.spec import TargetSpec
+
+# prefix of generated per-field methods (``_parse_title``, ``_parse_key``...)
+_FIELD_PREFIX = "_parse_"
+
+
+@dataclass
+class FieldTiming:
+    """Accumulated time spent in one ``_parse_<field>`` method."""
+
+    name: str
+    calls: int = 0
+    total_s: float = 0.0
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_s / self.calls * 1e6 if self.calls else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "field": self.name,
+            "calls": self.calls,
+            "total_ms": round(self.total_s * 1000, 3),
+            "mean_us": round(self.mean_us, 3),
+        }
+
+
+@dataclass
+class LibBenchmark:
+    """Timings of one backend over the whole corpus."""
+
+    lib: str
+    documents: int = 0
+    iterations: int = 0
+    construct_s: float = 0.0  # total time in ``cls(html)``
+    parse_s: float = 0.0  # total time in ``.parse()``
+    peak_bytes: int = 0  # largest tracemalloc peak of a single document
+    fields: list[FieldTiming] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def runs(self) -> int:
+        return self.documents * self.iterations
+
+    @property
+    def docs_per_s(self) -> float:
+        total = self.construct_s + self.parse_s
+        return self.runs / total if total else 0.0
+
+    def _per_doc_ms(self, seconds: float) -> float:
+        return seconds / self.runs * 1000 if self.runs else 0.0
+
+    def to_dict(self) -> dict:
+        if self.error is not None:
+            return {"lib": self.lib, "error": self.error}
+        return {
+            "lib": self.lib,
+            "documents": self.documents,
+            "iterations": self.iterations,
+            "construct_ms_per_doc": round(
+                self._per_doc_ms(self.construct_s), 4
+            ),
+            "parse_ms_per_doc": round(self._per_doc_ms(self.parse_s), 4),
+            "docs_per_s": round(self.docs_per_s, 2),
+            "peak_kib": round(self.peak_bytes / 1024, 1),
+            "fields": [f.to_dict() for f in self.fields],
+        }
+
+
+@dataclass
+class BenchResult:
+    """Result of benchmarking one struct on several backends."""
+
+    struct_name: str
+    results: list[LibBenchmark] = field(default_factory=list)
+
+    def has_errors(self) -> bool:
+        return any(r.error is not None for r in self.results)
+
+    def format(self, fmt: Literal["text", "json"] = "text") -> str:
+        if fmt == "json":
+            return json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        return self._format_text()
+
+    def to_dict(self) -> dict:
+        return {
+            "struct": self.struct_name,
+            "results": [r.to_dict() for r in self.results],
+        }
+
+    def _format_text(self) -> str:
+        ok = [r for r in self.results if r.error is None]
+        lines: list[str] = []
+        if ok:
+            first = ok[0]
+            lines.append(
+                f"{self.struct_name}: {first.documents} document(s) "
+                f"x {first.iterations} iteration(s)"
+            )
+            header = (
+                f"  {'lib':<8}  {'construct ms/doc':>16}  {'parse ms/doc':>12}"
+                f"  {'docs/s':>10}  {'peak KiB':>10}"
+            )
+            lines.append(header)
+            for r in ok:
+                lines.append(
+                    f"  {r.lib:<8}  {r._per_doc_ms(r.construct_s):>16.4f}"
+                    f"  {r._per_doc_ms(r.parse_s):>12.4f}"
+                    f"  {r.docs_per_s:>10.1f}  {r.peak_bytes / 1024:>10.1f}"
+                )
+
+            names = list(dict.fromkeys(f.name for r in ok for f in r.fields))
+            if names:
+                width = max(len(n) for n in names)
+                lines.append("")
+                lines.append("  per-field mean, us/call:")
+                lines.append(
+                    f"  {'field':<{width}}"
+                    + "".join(f"  {r.lib:>10}" for r in ok)
+                )
+                for name in names:
+                    cells = []
+                    for r in ok:
+                        timing = next(
+                            (f for f in r.fields if f.name == name), None
+                        )
+                        cells.append(
+                            f"  {timing.mean_us:>10.2f}"
+                            if timing is not None
+                            else f"  {'-':>10}"
+                        )
+                    lines.append(f"  {name:<{width}}" + "".join(cells))
+
+        for r in self.results:
+            if r.error is not None:
+                lines.append(f"  {r.lib}: ERROR {r.error}")
+        return "\n".join(lines)
+
+
+def _generate(module: Module, lib: str, **meta: Any) -> dict[str, Any]:
+    """Generate ``module`` for the Python ``lib`` backend and exec it."""
+    converter = resolve(TargetSpec(lang="python", lib=lib)).create_converter()
+    code = converter.convert(module, **meta)
+    namespace: dict[str, Any] = {}
+    exec(compile(code, f"<ssc-gen bench {lib}>", "exec"), namespace)  # noqa: S102
+    return namespace
+
+
+def load_parser_class(module: Module, struct_name: str, lib: str) -> type:
+    """Generate ``module`` for the Python ``lib`` backend and return the class.
+
+    Raises ``ResolutionError`` for unknown backends and ``ImportError`` if
+    the backend library is not installed.
+    """
+    return _generate(module, lib)[to_pascal_case(struct_name)]
+
+
+def field_timings(
+    module: Module, struct_name: str, lib: str, documents: list[str]
+) -> list[FieldTiming]:
+    """Per-field time of one ``parse()`` pass over ``documents``.
+
+    Uses the ``--instrument`` build of the parser, so the numbers come
+    from the same ``SSC_METRICS`` counters a deployed parser reports.
+    Timings are inclusive: a field that calls another ``_parse_*`` method
+    (e.g. table rows calling ``_parse_value``) counts that time too.
+    """
+    namespace = _generate(module, lib, instrument=True)
+    cls = namespace[to_pascal_case(struct_name)]
+    metrics = namespace["SSC_METRICS"]
+    metrics.reset()
+    for html in documents:
+        cls(html).parse()
+
+    prefix = f"{cls.__name__}.{_FIELD_PREFIX}"
+    return [
+        FieldTiming(
+            label[len(prefix) :],
+            calls=stats["calls"],
+            total_s=stats["total_ns"] / 1e9,
+        )
+        for label, stats in metrics.snapshot().items()
+        if label.startswith(prefix)
+    ]
+
+
+def bench_class(
+    cls: type,
+    documents: list[str],
+    *,
+    lib: str,
+    iterations: int = 5,
+    warmup: int = 1,
+) -> LibBenchmark:
+    """Benchmark one generated parser class over ``documents``.
+
+    Construction and ``parse()`` are timed in plain runs and peak memory
+    comes from a separate pass, so tracemalloc does not skew the main
+    numbers. Per-field timings are filled in by ``bench_struct``.
+    """
+    result = LibBenchmark(
+        lib=lib, documents=len(documents), iterations=iterations
+    )
+    perf_counter = time.perf_counter
+
+    for _ in range(warmup):
+        for html in documents:
+            cls(html).parse()
+
+    for _ in range(iterations):
+        for html in documents:
+            start = perf_counter()
+            doc = cls(html)
+            built = perf_counter()
+            doc.parse()
+            done = perf_counter()
+            result.construct_s += built - start
+            result.parse_s += done - built
+
+    tracemalloc.start()
+    try:
+        for html in documents:
+            tracemalloc.reset_peak()
+            cls(html).parse()
+            result.peak_bytes = max(
+                result.peak_bytes, tracemalloc.get_traced_memory()[1]
+            )
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def bench_struct(
+    module: Module,
+    struct_name: str,
+    documents: list[str],
+    libs: list[str],
+    *,
+    iterations: int = 5,
+    warmup: int = 1,
+) -> BenchResult:
+    """Benchmark ``struct_name`` on every backend in ``libs``.
+
+    A backend that cannot be generated, imported or run on the corpus is
+    reported with its error instead of aborting the whole benchmark.
+    """
+    result = BenchResult(struct_name=struct_name)
+    for lib in libs:
+        try:
+            cls = load_parser_class(module, struct_name, lib)
+            timings = bench_class(
+                cls, documents, lib=lib, iterations=iterations, warmup=warmup
+            )
+            timings.fields = field_timings(module, struct_name, lib, documents)
+        except Exception as exc:  # noqa: BLE001 - reported per backend
+            timings = LibBenchmark(
+                lib=lib, error=f"{type(exc).__name__}: {exc}"
+            )
+        result.results.append(timings)
+    return result
+
+
+# ─────────────────────────── scout discover ──────────────────────────
+
+# tags per synthetic product card (see ``synthetic_listing``)
+_CARD_NODES = 7
+
+
+def synthetic_listing(nodes: int) -> str:
+    """HTML product listing with roughly ``nodes`` tags.
+
+    Cards are grouped into sections of 100 under ``<main>`` and mix
+    per-card classes, links and nested lists, so every discover stage
+    (repeat containers, common descendants, short selectors) has work.
+    """
+    cards = max(1, nodes // _CARD_NODES)
+    sections: list[str] = []
+    for first in range(0, cards, 100):
+        items = "".join(
+            (
+                f'<div class="card" data-id="{i}">'
+                f'<a class="title" href="/p/{i}">Item {i}</a>'
+                f'<span class="price">${i % 997}.99</span>'
+                f'<ul class="tags"><li>new</li><li>tag-{i % 7}</li></ul>'
+                f"<p>Description {i}</p>"
+                "</div>"
+            )
+            for i in range(first, min(first + 100, cards))
+        )
+        sections.append(
+            f'<section class="page-{first // 100}">{items}</section>'
+        )
+    return (
+        "<html><head><title>listing</title></head>"
+        f'<body><main id="catalogue">{"".join(sections)}</main></body></html>'
+    )
+
+
+@dataclass
+class DiscoverTiming:
+    """``run_discover`` time on one synthetic page."""
+
+    nodes: int
+    html_bytes: int
+    parse_s: float  # best ``parse_html`` time
+    discover_s: float  # best ``run_discover`` time, parsing included
+
+    @property
+    def us_per_node(self) -> float:
+        return self.discover_s / self.nodes * 1e6 if self.nodes else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "nodes": self.nodes,
+            "html_kib": round(self.html_bytes / 1024, 1),
+            "parse_ms": round(self.parse_s * 1000, 3),
+            "discover_ms": round(self.discover_s * 1000, 3),
+            "us_per_node": round(self.us_per_node, 3),
+        }
+
+
+@dataclass
+class DiscoverBenchResult:
+    """Scaling of ``scout --discover`` across page sizes."""
+
+    results: list[DiscoverTiming] = field(default_factory=list)
+
+    def format(self, fmt: Literal["text", "json"] = "text") -> str:
+        if fmt == "json":
+            return json.dumps(
+                {"results": [r.to_dict() for r in self.results]}, indent=2
+            )
+        header = (
+            f"  {'nodes':>9}  {'KiB':>9}  {'parse ms':>10}"
+            f"  {'discover ms':>12}  {'us/node':>8}"
+        )
+        lines = [header]
+        for r in self.results:
+            lines.append(
+                f"  {r.nodes:>9}  {r.html_bytes / 1024:>9.1f}"
+                f"  {r.parse_s * 1000:>10.1f}  {r.discover_s * 1000:>12.1f}"
+                f"  {r.us_per_node:>8.2f}"
+            )
+        return "\n".join(lines)
+
+
+def bench_discover(
+    sizes: tuple[int, ...] = (10_000, 100_000, 1_000_000),
+    *,
+    iterations: int = 1,
+) -> DiscoverBenchResult:
+    """Time ``run_discover`` on synthetic listings of the given node counts.
+
+    Discover indexes the tree in one pass, so ``us_per_node`` should stay
+    flat as pages grow; a rising column means some stage went superlinear.
+    Each size keeps the best of ``iterations`` runs.
+    """
+    from ssc_codegen.explore import parse_html, run_discover
+
+    result = DiscoverBenchResult()
+    perf_counter = time.perf_counter
+    for size in sizes:
+        html = synthetic_listing(size)
+        parse_s = discover_s = float("inf")
+        for _ in range(iterations):
+            start = perf_counter()
+            soup = parse_html(html)
+            parse_s = min(parse_s, perf_counter() - start)
+            nodes = len(soup.find_all(True))
+            del soup
+            start = perf_counter()
+            run_discover(html)
+            discover_s = min(discover_s, perf_counter() - start)
+        result.results.append(
+            DiscoverTiming(
+                nodes=nodes,
+                html_bytes=len(html.encode("utf-8")),
+                parse_s=parse_s,
+                discover_s=discover_s,
+            )
+        )
+    return result
@@ -0,0 +1,329 @@
+"""On-disk caches for ``ssc-gen generate`` and ``run``.
+
+Each schema's generation outcome (diagnostics, generated code and whatever
+the shared runtime files need) is stored under a key hashing everything
+that can change it: the schema source, the contents of its transitive
+``import`` files, the target spec, the generation options and the
+ssc_codegen sources. A hit skips parsing, linting and conversion.
+
+Entries live in ``<root>/<namespace>/<key[:2]>/<key>.json``, with the
+generated code next to it as plain text; nothing is unpickled. The default
+root is a per-user directory, so a checkout cannot ship entries of its own.
+Eviction runs after every command using the cache: entries unused for
+``max_age`` seconds are dropped first, then the least recently used ones
+until the namespace fits ``max_bytes``. Recently used entries are also
+kept in memory, which is what keeps long-lived ``--watch`` processes warm
+(``persistent=False`` keeps only that in-memory layer).
+
+:class:`ParserCache` stores generated Python parsers for ``ssc-gen run``
+as importable ``.py`` files instead, so importlib compiles each one once
+and reuses its ``__pycache__`` bytecode on later runs.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+import py_compile
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from ssc_codegen._logging import logger
+from ssc_codegen.core.module_handler import import_closure
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache root (``$XDG_CACHE_HOME/ssc-codegen`` on Linux)."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData/Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ssc-codegen"
+
+
+DEFAULT_CACHE_DIR = default_cache_dir()
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+
+_MEMORY_ENTRIES = 4096
+# Bump when the layout of cached values changes; changes to the generated
+# code are covered by `codegen_fingerprint`.
+_FORMAT = 9
+# Parser entries are content-addressed and LRU eviction touches their
+# mtime, so their bytecode is never re-validated against the source.
+_PYC_MODE = py_compile.PycInvalidationMode.UNCHECKED_HASH
+
+
+@functools.cache
+def codegen_fingerprint() -> str:
+    """Hash of the ssc_codegen package sources this process runs.
+
+    The installed version does not move in a development checkout, so
+    keys hash the generator itself: any change to it misses the cache.
+    """
+    root = Path(__file__).resolve().parent
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*")):
+        if "__pycache__" in path.parts or not path.is_file():
+            continue
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+class GenerateCache:
+    """Content-addressed store of per-schema generation results.
+
+    Values are JSON objects; a string ``source`` item is kept in a plain
+    text file next to the JSON manifest.
+    """
+
+    suffix = ".json"
+    # Failures reading an entry that mean it is damaged, not missing.
+    _read_errors: tuple[type[Exception], ...] = (OSError, ValueError)
+
+    def __init__(
+        self,
+        root: Path = DEFAULT_CACHE_DIR,
+        *,
+        namespace: str = "generate",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+        persistent: bool = True,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.persistent = persistent
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._entries = root / namespace
+
+    def key(self, kdl_file: Path, **options: Any) -> str | None:
+        """Cache key for ``kdl_file`` generated with ``options``.
+
+        ``options`` must be JSON-serializable once dataclasses are turned
+        into their ``repr``. Returns None if the schema cannot be read.
+        """
+        digest = hashlib.sha256()
+
+        def feed(label: str, data: bytes) -> None:
+            digest.update(label.encode("utf-8"))
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+
+        feed("format", str(_FORMAT).encode())
+        feed("codegen", codegen_fingerprint().encode())
+        feed("path", str(kdl_file).encode("utf-8"))
+        feed(
+            "options",
+            json.dumps(options, sort_keys=True, default=repr).encode("utf-8"),
+        )
+        try:
+            feed("source", kdl_file.read_bytes())
+        except OSError:
+            return None
+        for imported in import_closure(kdl_file):
+            feed("import", str(imported).encode("utf-8"))
+            try:
+                feed("import-source", imported.read_bytes())
+            except OSError:
+                feed("import-missing", b"")
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self._entries / key[:2] / f"{key}{self.suffix}"
+
+    def _files(self, path: Path) -> list[Path]:
+        """Every file belonging to the entry at ``path``."""
+        return [path, path.with_suffix(".txt")]
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > _MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    def load(self, key: str) -> Any:
+        """Return the cached value for ``key`` or None on a miss."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if not self.persistent:
+            return None
+        path = self._entry(key)
+        try:
+            value = self._read(path)
+        except FileNotFoundError:
+            return None
+        except self._read_errors as exc:
+            logger.debug("dropping unreadable cache entry %s: %s", path, exc)
+            self._forget(path)
+            return None
+        # Refresh mtime: eviction is least-recently-used.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._remember(key, value)
+        return value
+
+    def store(self, key: str, value: Any) -> None:
+        """Write ``value`` under ``key``.
+
+        A cache that cannot be written (read-only directory, full disk) is
+        not an error: generation just stays uncached.
+        """
+        self._remember(key, value)
+        if not self.persistent:
+            return
+        path = self._entry(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._write(path, value)
+        except OSError as exc:
+            logger.debug("cache: cannot write %s: %s", path, exc)
+
+    def _read(self, path: Path) -> Any:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("format") != _FORMAT:
+            raise ValueError(f"unknown entry format {manifest.get('format')}")
+        value = manifest["value"]
+        if manifest["source"]:
+            value["source"] = path.with_suffix(".txt").read_text(
+                encoding="utf-8"
+            )
+        return value
+
+    def _write(self, path: Path, value: dict[str, Any]) -> None:
+        # The manifest is written last: it is what makes the entry visible.
+        value = dict(value)
+        source = value.pop("source", None)
+        if source is not None:
+            _write_atomic(path.with_suffix(".txt"), source.encode("utf-8"))
+        manifest = {
+            "format": _FORMAT,
+            "source": source is not None,
+            "value": value,
+        }
+        _write_atomic(path, json.dumps(manifest).encode("utf-8"))
+
+    def _forget(self, path: Path) -> None:
+        for file in self._files(path):
+            file.unlink(missing_ok=True)
+        self._memory.pop(path.stem, None)
+
+    def evict(self) -> int:
+        """Apply the age and size limits; return the number of entries removed."""
+        if not self.persistent or not self._entries.is_dir():
+            return 0
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        removed = 0
+        for path in self._entries.glob(f"*/*{self.suffix}"):
+            try:
+                mtime = path.stat().st_mtime
+                size = sum(
+                    file.stat().st_size
+                    for file in self._files(path)
+                    if file.exists()
+                )
+            except OSError:
+                continue
+            if now - mtime > self.max_age:
+                self._forget(path)
+                removed += 1
+                continue
+            entries.append((mtime, size, path))
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._forget(path)
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug(
+                "cache: evicted %d entr(ies) from %s", removed, self.root
+            )
+        return removed
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class ParserCache(GenerateCache):
+    """Generated Python parsers for ``ssc-gen run``, loaded with importlib.
+
+    ``store`` takes the generated source; ``load`` returns the imported
+    module. The source file never changes once written, so importlib's
+    ``__pycache__`` bytecode stays valid and later runs skip parsing the
+    schema, generating code and compiling it.
+    """
+
+    suffix = ".py"
+    _read_errors = (OSError, ValueError, SyntaxError, ImportError)
+
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, **kwargs: Any) -> None:
+        kwargs.setdefault("namespace", "run")
+        super().__init__(root, **kwargs)
+
+    def _files(self, path: Path) -> list[Path]:
+        return [path, Path(importlib.util.cache_from_source(str(path)))]
+
+    def _read(self, path: Path) -> ModuleType:
+        name = f"_sscgen_run_{path.stem}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"cannot load cached parser {path}")
+        module = importlib.util.module_from_spec(spec)
+        # Generated dataclasses and TypedDicts resolve their module here.
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(name, None)
+            raise
+        return module
+
+    def _write(self, path: Path, value: str) -> None:
+        """Write the parser source and its bytecode.
+
+        Bytecode is compiled explicitly so the cache also works under
+        ``PYTHONDONTWRITEBYTECODE``; the next ``load`` imports the module.
+        """
+        _write_atomic(path, value.encode("utf-8"))
+        try:
+            py_compile.compile(
+                str(path),
+                cfile=importlib.util.cache_from_source(str(path)),
+                doraise=True,
+                invalidation_mode=_PYC_MODE,
+            )
+        except py_compile.PyCompileError as exc:
+            logger.debug("cache: cannot compile %s: %s", path, exc)
+
+    def store(self, key: str, value: str) -> None:
+        super().store(key, value)
+        # The in-memory layer must hold modules, not source text.
+        self._memory.pop(key, None)
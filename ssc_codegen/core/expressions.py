@@ -470,6 +470,8 @@ def parse_expressions(
             parse_assert_expr(node.children, expr, ctx, lint)
         elif isinstance(expr, Match):
             parse_match_expr(node.children, expr, ctx, lint)
+        if expr.span is None:
+            expr.span = node.span
         parent.body.append(expr)
         lint.pop()
 
@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Literal
 
 from kdlquery import ReadDiagnostic, Severity
+from kdlquery.types import Position, Span
 
 try:
     import colorama
@@ -100,6 +101,21 @@ def diagnostic_to_dict(d: ReadDiagnostic) -> dict[str, Any]:
     }
 
 
+def diagnostic_from_dict(data: dict[str, Any]) -> ReadDiagnostic:
+    """Inverse of :func:`diagnostic_to_dict`."""
+    span = data["span"]
+    return ReadDiagnostic(
+        message=data["message"],
+        severity=Severity(data["severity"]),
+        span=Span(start=Position(**span["start"]), end=Position(**span["end"])),
+        path=data["path"],
+        hint=data["hint"],
+        code=data["code"],
+        label=data["label"],
+        notes=tuple(data["notes"]),
+    )
+
+
 def _diagnostic_filepath(
     diagnostic: ReadDiagnostic, fallback: str | Path | None
 ) -> str | Path | None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import difflib as _difflib
+import functools as _functools
 import keyword as _keyword
 import re as _re
 from collections.abc import Mapping
@@ -1433,38 +1434,56 @@ def lint_validate_regex(node: KdlNode, lint: LintContext, pattern: str) -> bool:
         return False
 
 
-def lint_validate_css(node: KdlNode, lint: LintContext, selector: str) -> bool:
+# Selector validation is memoized: schemas repeat selectors heavily, and
+# long-lived processes (``--watch``) re-lint the same ones on every rebuild.
+
+
+@_functools.lru_cache(maxsize=4096)
+def _css_error(selector: str) -> str | None:
     try:
         import soupsieve
 
         soupsieve.compile(selector)
-        return True
+        return None
     except Exception as e:
-        msg = str(e).split("\n")[0] if str(e) else "invalid selector"
-        lint.error(
-            node,
-            message=f"invalid CSS selector: {msg}",
-            code="E002",
-            hint="check selector syntax",
-        )
-        return False
+        return str(e).split("\n")[0] if str(e) else "invalid selector"
 
 
-def lint_validate_xpath(node: KdlNode, lint: LintContext, expr: str) -> bool:
+@_functools.lru_cache(maxsize=4096)
+def _xpath_error(expr: str) -> str | None:
     try:
         from lxml import etree
 
         etree.XPath(expr)
-        return True
+        return None
     except Exception as e:
-        msg = str(e).split("\n")[0] if str(e) else "invalid expression"
-        lint.error(
-            node,
-            message=f"invalid XPath expression: {msg}",
-            code="E002",
-            hint="check XPath syntax",
-        )
-        return False
+        return str(e).split("\n")[0] if str(e) else "invalid expression"
+
+
+def lint_validate_css(node: KdlNode, lint: LintContext, selector: str) -> bool:
+    msg = _css_error(selector)
+    if msg is None:
+        return True
+    lint.error(
+        node,
+        message=f"invalid CSS selector: {msg}",
+        code="E002",
+        hint="check selector syntax",
+    )
+    return False
+
+
+def lint_validate_xpath(node: KdlNode, lint: LintContext, expr: str) -> bool:
+    msg = _xpath_error(expr)
+    if msg is None:
+        return True
+    lint.error(
+        node,
+        message=f"invalid XPath expression: {msg}",
+        code="E002",
+        hint="check XPath syntax",
+    )
+    return False
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -17,7 +17,7 @@ from ssc_codegen.ast import (
     TypeInfo,
 )
 from ssc_codegen.exceptions import BuildTimeError
-from kdlquery import KdlNode, parse as kdl_parse
+from kdlquery import KDLParseError, KdlNode, parse as kdl_parse
 from kdlquery.reader import ReadDiagnostic, Severity
 
 from ssc_codegen.core.contexts import (
@@ -144,6 +144,41 @@ def handle_define(node: KdlNode, ctx: ParseContext, lint: LintContext) -> None:
             )
 
 
+_ParsedImport = tuple[str, list[KdlNode], list[ReadDiagnostic]]
+
+
+class ImportCache:
+    """Parsed and linted import documents, shared across parse_module calls.
+
+    Keyed by resolved path and validated against the file's current text,
+    so a long-lived instance (a generate run, a ``--watch`` session) never
+    serves a stale document. Read and parse failures are not cached: their
+    diagnostics point at the importing node.
+    """
+
+    def __init__(self) -> None:
+        # resolved path -> (source text, top-level nodes, lint diagnostics)
+        self._docs: dict[str, _ParsedImport] = {}
+
+    def get(
+        self, import_key: str, src: str
+    ) -> tuple[list[KdlNode], list[ReadDiagnostic]] | None:
+        """Cached ``(nodes, lint diagnostics)`` if ``src`` is unchanged."""
+        entry = self._docs.get(import_key)
+        if entry is None or entry[0] != src:
+            return None
+        return entry[1], entry[2]
+
+    def put(
+        self,
+        import_key: str,
+        src: str,
+        nodes: list[KdlNode],
+        diagnostics: list[ReadDiagnostic],
+    ) -> None:
+        self._docs[import_key] = (src, nodes, diagnostics)
+
+
 def resolve_imports(
     top_nodes: list[KdlNode],
     source_path: Path | None,
@@ -152,6 +187,7 @@ def resolve_imports(
     diagnostics: list[ReadDiagnostic],
     active: set[str] | None = None,
     loaded: set[str] | None = None,
+    cache: ImportCache | None = None,
 ) -> list[KdlNode]:
     if active is None:
         active = set()
@@ -222,29 +258,37 @@ def resolve_imports(
                 )
             )
             continue
-        try:
-            doc = kdl_parse(src)
-        except Exception as e:
-            diagnostics.append(
-                ReadDiagnostic(
-                    message=f"import: parse error in {import_path}: {e}",
-                    severity=Severity.ERROR,
-                    span=node.span,
-                    path=lint.path,
-                    code="E000",
+        cached = cache.get(import_key, src) if cache is not None else None
+        if cached is not None:
+            imported_doc_nodes, imported_diagnostics = cached
+        else:
+            try:
+                doc = kdl_parse(src)
+            except KDLParseError as e:
+                diagnostics.append(
+                    ReadDiagnostic(
+                        message=f"import: parse error in {import_path}: {e}",
+                        severity=Severity.ERROR,
+                        span=node.span,
+                        path=lint.path,
+                        code="E000",
+                    )
                 )
-            )
-            continue
+                continue
+            from ssc_codegen.core.linter import lint_module
 
-        imported_doc_nodes = list(doc.nodes)
-        register_node_sources(imported_doc_nodes, import_path, ctx)
-        from ssc_codegen.core.linter import lint_module
+            imported_doc_nodes = list(doc.nodes)
+            imported_diagnostics = [
+                _attach_source(diagnostic, import_path)
+                for diagnostic in lint_module(doc, str(import_path))
+            ]
+            if cache is not None:
+                cache.put(
+                    import_key, src, imported_doc_nodes, imported_diagnostics
+                )
 
-        imported_diagnostics = lint_module(doc, str(import_path))
-        diagnostics.extend(
-            _attach_source(diagnostic, import_path)
-            for diagnostic in imported_diagnostics
-        )
+        register_node_sources(imported_doc_nodes, import_path, ctx)
+        diagnostics.extend(imported_diagnostics)
 
         active.add(import_key)
         try:
@@ -256,6 +300,7 @@ def resolve_imports(
                 diagnostics,
                 active,
                 loaded,
+                cache,
             )
         finally:
             active.discard(import_key)
@@ -279,3 +324,33 @@ def resolve_imports(
                 )
         result.extend(imported_nodes)
     return result
+
+
+def import_closure(source_path: Path) -> list[Path]:
+    """Files reachable through ``import`` from ``source_path``, depth-first.
+
+    Follows the same resolution rule as :func:`resolve_imports` (paths are
+    relative to the importing file) without building an AST. Missing or
+    unparsable files are listed but not followed.
+    """
+    result: list[Path] = []
+    seen: set[str] = {str(source_path.resolve())}
+    pending: list[Path] = [source_path]
+    while pending:
+        current = pending.pop()
+        try:
+            doc = kdl_parse(current.read_text(encoding=_KDL_TEXT_ENCODING))
+        except (OSError, UnicodeDecodeError, KDLParseError):
+            continue
+        found: list[Path] = []
+        for node in doc.nodes:
+            if node.name != "import" or not node.args:
+                continue
+            import_path = (current.parent / str(node.args[0].value)).resolve()
+            if str(import_path) in seen:
+                continue
+            seen.add(str(import_path))
+            result.append(import_path)
+            found.append(import_path)
+        pending.extend(reversed(found))
+    return result
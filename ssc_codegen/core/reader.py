@@ -15,6 +15,7 @@ from ssc_codegen.core.linter import lint_cross_refs, lint_module
 from ssc_codegen.core.expressions import typedef_from_struct
 from ssc_codegen.core.rest_artifacts import rest_artifacts_from_struct
 from ssc_codegen.core.module_handler import (
+    ImportCache,
     handle_define,
     handle_function,
     handle_json,
@@ -25,9 +26,16 @@ from ssc_codegen.core.module_handler import (
 
 
 def parse_module(
-    src: str, *, source_path: Path | None = None
+    src: str,
+    *,
+    source_path: Path | None = None,
+    import_cache: ImportCache | None = None,
 ) -> tuple[Module, list[ReadDiagnostic]]:
-    """Parse KDL source -> Module AST + diagnostics."""
+    """Parse KDL source -> Module AST + diagnostics.
+
+    ``import_cache`` lets many schemas importing the same files share one
+    parsed and linted copy of each import (see :class:`ImportCache`).
+    """
     try:
         doc = kdl_parse(src)
     except KDLParseError as exc:
@@ -53,7 +61,9 @@ def parse_module(
     diagnostics: list[ReadDiagnostic] = []
 
     # pass 1 — resolve imports (returns flat list with imported nodes)
-    top_nodes = resolve_imports(top_nodes, source_path, ctx, lint, diagnostics)
+    top_nodes = resolve_imports(
+        top_nodes, source_path, ctx, lint, diagnostics, cache=import_cache
+    )
 
     # pass 2 — structural linting on KdlDocument (current file only)
     root_diagnostics = lint_module(doc, str(source_path or ""))
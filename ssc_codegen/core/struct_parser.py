@@ -6,6 +6,7 @@ from collections.abc import Sequence
 from typing import Any
 
 from ssc_codegen.ast import (
+    Assert,
     Attr,
     CheckMethod,
     CssRemove,
@@ -47,6 +48,7 @@ from kdlquery import KdlNode
 from ssc_codegen.core.contexts import LintContext, ParseContext, WalkCtx
 from ssc_codegen.core.expressions import parse_expressions
 from ssc_codegen.core.type_checking import check_pipeline_types
+from ssc_codegen.traversal.utils import struct_removes_nodes
 
 # AST node types forbidden in (raw)struct — they require a DOM document.
 _RAW_FORBIDDEN_OPS = (
@@ -69,6 +71,18 @@ def _struct_start_type(struct: StructBase) -> VariableType:
     return VariableType.DOCUMENT
 
 
+# ops with an effect beyond their value: the DOM mutation or the failed
+# assertion must happen in the constructor even if the value is never used
+_EAGER_INIT_OPS = (CssRemove, XpathRemove, Assert)
+
+
+def _has_eager_op(expr: Node) -> bool:
+    return any(
+        isinstance(child, _EAGER_INIT_OPS) or _has_eager_op(child)
+        for child in expr.body
+    )
+
+
 def _lint_raw_forbidden_ops(expr: Node, lint: LintContext) -> None:
     """Recursively check that no HTML-only ops appear in a RAW struct node."""
     for child in expr.body:
@@ -318,6 +332,8 @@ def parse_struct(
                 _lint_raw_forbidden_ops(expr, lint)
             parent.body.append(expr)
 
+    if isinstance(parent, Struct):
+        _schedule_init_fields(parent)
     if not isinstance(parent, StructRest):
         parent.body.append(StartParse(parent=parent))
     lint.walk_context = prev_ctx
@@ -444,7 +460,6 @@ def _parse_init_fields(
 ) -> None:
     prev_ctx = lint.walk_context
     lint.walk_context = WalkCtx.INIT_BLOCK
-    init = parent.init
     is_raw = parent.type == StructType.RAW
     start_type = _struct_start_type(parent)
     for node in kdl_nodes:
@@ -462,6 +477,28 @@ def _parse_init_fields(
         if is_raw:
             _lint_raw_forbidden_ops(expr, lint)
         parent.body.append(expr)
-        init.body.append(InitFieldCall(parent=init, name=node.name))
         lint.pop()
     lint.walk_context = prev_ctx
+
+
+def _schedule_init_fields(parent: Struct) -> None:
+    """Mark which ``@init`` values run in the constructor.
+
+    Values are computed on first use. An entry with an eager op, and every
+    entry declared before it, still runs in the constructor, in order, so
+    earlier values never see its DOM mutation. When any field removes
+    nodes, all entries run in the constructor: a lazy value would be
+    computed on the document after that field mutated it.
+    """
+    fields = [n for n in parent.body if isinstance(n, InitField)]
+    if struct_removes_nodes(parent):
+        eager = len(fields) - 1
+    else:
+        eager = max(
+            (i for i, f in enumerate(fields) if _has_eager_op(f)), default=-1
+        )
+    init = parent.init
+    for i, expr in enumerate(fields):
+        expr.lazy = i > eager
+        if not expr.lazy:
+            init.body.append(InitFieldCall(parent=init, name=expr.name))
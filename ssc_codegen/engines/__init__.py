@@ -0,0 +1,53 @@
+"""HTML engines behind ``ssc-gen scout`` and ``ssc-gen health``."""
+
+from __future__ import annotations
+
+from ssc_codegen.engines.base import DomEngine
+
+__all__ = [
+    "DEFAULT_ENGINE",
+    "ENGINE_NAMES",
+    "DomEngine",
+    "EngineError",
+    "get_engine",
+]
+
+ENGINE_NAMES = ("bs4", "lxml", "slax")
+DEFAULT_ENGINE = "bs4"
+
+_ENGINES: dict[str, DomEngine] = {}
+
+
+class EngineError(ValueError):
+    """Unknown engine, or its HTML library is not installed."""
+
+
+def get_engine(name: str = DEFAULT_ENGINE) -> DomEngine:
+    """Return the shared engine instance called ``name``."""
+    engine = _ENGINES.get(name)
+    if engine is not None:
+        return engine
+    try:
+        if name == "bs4":
+            from ssc_codegen.engines.bs4 import Bs4Engine
+
+            engine = Bs4Engine()
+        elif name == "lxml":
+            from ssc_codegen.engines.lxml import LxmlEngine
+
+            engine = LxmlEngine()
+        elif name == "slax":
+            from ssc_codegen.engines.slax import SlaxEngine
+
+            engine = SlaxEngine()
+        else:
+            raise EngineError(
+                f"unknown engine {name!r}. "
+                f"Available: {', '.join(ENGINE_NAMES)}"
+            )
+    except ImportError as exc:
+        raise EngineError(
+            f"engine {name!r} needs a missing library: {exc.name or exc}"
+        ) from exc
+    _ENGINES[name] = engine
+    return engine
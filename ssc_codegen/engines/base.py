@@ -0,0 +1,129 @@
+"""Engine-neutral HTML tree access for scout, discover and health."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from typing import Any
+
+# Tags whose text bs4's ``get_text()`` leaves out of enclosing elements.
+# Engines mirror it so `text` means the same across engines.
+NON_TEXT_TAGS: frozenset[str] = frozenset(
+    {"script", "style", "template", "rt", "rp"}
+)
+
+
+class DomEngine(ABC):
+    """Parse HTML and navigate the resulting tree (data + behavior).
+
+    Mirrors the ``DomSpelling`` split of ``targets/python/html_libs``: the
+    tools are written once against this interface and every concrete
+    engine spells it with its own library.
+
+    Contract:
+        - ``parse`` returns an opaque document; ``roots``, ``elements`` and
+          ``select`` accept it, every other method takes element nodes.
+        - Only elements are returned: text, comments and the document
+          node itself never appear in results.
+        - ``parent`` is None for top-level elements.
+        - Attribute values are strings; multi-valued attributes (``class``,
+          ``rel``) are space-joined.
+    """
+
+    # === DATA (override in concrete subclasses) ===
+
+    name: str = ""
+    supports_xpath: bool = False
+    # Whether `line` returns source lines.
+    supports_lines: bool = False
+
+    # === DOCUMENT ===
+
+    @abstractmethod
+    def parse(self, html: str) -> Any: ...
+
+    @abstractmethod
+    def roots(self, document: Any) -> list[Any]:
+        """Top-level elements, in document order."""
+
+    @abstractmethod
+    def elements(self, document: Any) -> list[Any]:
+        """Every element of the document, in document order."""
+
+    @abstractmethod
+    def select(self, node: Any, query: str) -> list[Any]:
+        """Elements matching CSS ``query``; raises on invalid syntax."""
+
+    def xpath(self, node: Any, query: str) -> Any:
+        """Result of XPath ``query`` (engines with ``supports_xpath``)."""
+        raise NotImplementedError(f"{self.name} engine has no XPath support")
+
+    # === NAVIGATION ===
+
+    @abstractmethod
+    def parent(self, node: Any) -> Any | None: ...
+
+    @abstractmethod
+    def children(self, node: Any) -> list[Any]: ...
+
+    @abstractmethod
+    def next_sibling(self, node: Any) -> Any | None: ...
+
+    @abstractmethod
+    def prev_sibling(self, node: Any) -> Any | None: ...
+
+    def siblings(self, node: Any) -> list[Any]:
+        """Element children of ``node``'s parent, ``node`` included.
+
+        Engines whose documents hold several top-level elements override
+        this to list them for top-level nodes.
+        """
+        parent = self.parent(node)
+        if parent is not None:
+            return self.children(parent)
+        return [node]
+
+    def key(self, node: Any) -> Hashable:
+        """Identity of ``node``, stable while the document is alive."""
+        return node
+
+    # === CONTENT ===
+
+    @abstractmethod
+    def tag_name(self, node: Any) -> str: ...
+
+    @abstractmethod
+    def attrs(self, node: Any) -> dict[str, str]: ...
+
+    def classes(self, node: Any) -> list[str]:
+        return self.attrs(node).get("class", "").split()
+
+    @abstractmethod
+    def text(self, node: Any, *, strip: bool = False) -> str:
+        """Descendant text, like bs4's ``get_text()``.
+
+        With ``strip`` every text node is stripped and empty ones dropped
+        before joining (``get_text(strip=True)``). Without it only
+        whitespace may differ: bs4 collapses whitespace-only text nodes
+        to a single ``"\\n"`` or ``" "`` while parsing, other engines
+        keep them verbatim.
+        """
+
+    @abstractmethod
+    def own_text(self, node: Any) -> list[str]:
+        """Text nodes that are direct children of ``node``."""
+
+    @abstractmethod
+    def html(self, node: Any) -> str:
+        """Outer HTML of ``node``."""
+
+    def line(self, node: Any) -> int | None:
+        """Source line of ``node``'s start tag, when the engine tracks it."""
+        return None
+
+
+def join_text(parts: list[str], strip: bool) -> str:
+    """Join text nodes the way ``get_text`` does."""
+    if strip:
+        return "".join(p for p in (part.strip() for part in parts) if p)
+    return "".join(parts)
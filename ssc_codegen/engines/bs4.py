@@ -0,0 +1,152 @@
+"""BeautifulSoup engine (lxml-built tree, as in generated ``bs4`` code)."""
+
+from __future__ import annotations
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.builder import LXMLTreeBuilder, ParserRejectedMarkup
+from lxml import etree
+
+from ssc_codegen.engines.base import DomEngine
+
+
+class _SourceLineTreeBuilder(LXMLTreeBuilder):
+    """bs4's ``lxml`` builder that also fills ``Tag.sourceline``.
+
+    The stock builder drives lxml in parser-target mode, whose events
+    carry no positions. This one lets lxml build its native tree (which
+    records each element's ``.sourceline``) and replays that tree through
+    the same ``start`` / ``data`` / ``end`` / ``comment`` / ``pi``
+    callbacks. The soup matches ``BeautifulSoup(html, "lxml")`` minus
+    whitespace-only text after ``</html>``, and line numbers need no
+    second parse.
+    """
+
+    def feed(self, markup: str | bytes) -> None:  # type: ignore[override]
+        assert self.soup is not None
+        parser = etree.HTMLParser(
+            recover=True,
+            huge_tree=self.huge_tree,
+            encoding=self.soup.original_encoding,
+            default_doctype=False,
+        )
+        try:
+            parser.feed(markup)
+            root = parser.close()
+        except (UnicodeDecodeError, LookupError, etree.ParserError) as exc:
+            raise ParserRejectedMarkup(exc) from exc
+        except etree.XMLSyntaxError:
+            return  # empty document
+        if root is None:
+            return
+
+        dtd = root.getroottree().docinfo.internalDTD
+        if dtd is not None:
+            self.doctype(dtd.name or "", dtd.external_id, dtd.system_url)
+        # Comments, PIs and stray elements recovered outside the root
+        # element are its siblings in the lxml tree.
+        top = [*reversed(list(root.itersiblings(preceding=True))), root]
+        top.extend(root.itersiblings())
+        for node in top:
+            if isinstance(node.tag, str):
+                self._replay_element(node)
+            else:
+                self._replay_leaf(node)
+
+    def _replay_element(self, element: etree._Element) -> None:
+        soup = self.soup
+        assert soup is not None
+        for event, node in etree.iterwalk(
+            element, events=("start", "end", "comment", "pi")
+        ):
+            if event == "start":
+                self.start(node.tag, node.attrib)
+                soup.currentTag.sourceline = node.sourceline
+                if node.text is not None:
+                    self.data(node.text)
+            elif event == "end":
+                self.end(node.tag)
+                if node.tail is not None:
+                    self.data(node.tail)
+            else:
+                self._replay_leaf(node)
+
+    def _replay_leaf(self, node: etree._Element) -> None:
+        if isinstance(node, etree._Comment):
+            self.comment(node.text or "")
+        elif isinstance(node, etree._ProcessingInstruction):
+            self.pi(node.target, node.text or "")
+        if node.tail is not None:
+            self.data(node.tail)
+
+
+class Bs4Engine(DomEngine):
+    """BeautifulSoup tree with lxml parsing and soupsieve CSS."""
+
+    name = "bs4"
+    supports_lines = True
+
+    def parse(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, builder=_SourceLineTreeBuilder())
+
+    def roots(self, document: BeautifulSoup) -> list[Tag]:
+        return [c for c in document.children if isinstance(c, Tag)]
+
+    def elements(self, document: BeautifulSoup) -> list[Tag]:
+        return document.find_all(True)
+
+    def select(self, node: Tag, query: str) -> list[Tag]:
+        return list(node.select(query))
+
+    def parent(self, node: Tag) -> Tag | None:
+        parent = node.parent
+        if parent is None or isinstance(parent, BeautifulSoup):
+            return None
+        return parent
+
+    def children(self, node: Tag) -> list[Tag]:
+        return [c for c in node.children if isinstance(c, Tag)]
+
+    def siblings(self, node: Tag) -> list[Tag]:
+        parent = node.parent
+        if parent is None:
+            return [node]
+        return [c for c in parent.children if isinstance(c, Tag)]
+
+    def next_sibling(self, node: Tag) -> Tag | None:
+        return node.find_next_sibling()
+
+    def prev_sibling(self, node: Tag) -> Tag | None:
+        return node.find_previous_sibling()
+
+    def key(self, node: Tag) -> int:
+        # Tag.__eq__ compares markup, so equal-looking tags would collide.
+        return id(node)
+
+    def tag_name(self, node: Tag) -> str:
+        return node.name
+
+    def attrs(self, node: Tag) -> dict[str, str]:
+        return {
+            k: " ".join(v) if isinstance(v, list) else v
+            for k, v in node.attrs.items()
+        }
+
+    def classes(self, node: Tag) -> list[str]:
+        raw = node.get("class")
+        if isinstance(raw, list):
+            return [str(c) for c in raw]
+        if raw is not None:
+            return [str(raw)]
+        return []
+
+    def text(self, node: Tag, *, strip: bool = False) -> str:
+        return node.get_text(strip=strip)
+
+    def own_text(self, node: Tag) -> list[str]:
+        return [str(c) for c in node.children if isinstance(c, NavigableString)]
+
+    def html(self, node: Tag) -> str:
+        return str(node)
+
+    def line(self, node: Tag) -> int | None:
+        return node.sourceline
@@ -0,0 +1,126 @@
+"""lxml engine (``lxml.html`` tree, as in generated ``lxml`` code)."""
+
+from __future__ import annotations
+
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+from lxml.html import HtmlElement
+
+from ssc_codegen.engines.base import NON_TEXT_TAGS, DomEngine, join_text
+
+# Same stand-in the generated lxml parsers use for empty documents.
+_FALLBACK_HTML = "<html><body></body></html>"
+
+
+def _is_element(node: object) -> bool:
+    # Comments and processing instructions carry a factory as `.tag`.
+    return isinstance(getattr(node, "tag", None), str)
+
+
+def _top_level(node: HtmlElement) -> list[HtmlElement]:
+    """Top-level elements around the top-level ``node``, in order."""
+    preceding = [n for n in node.itersiblings(preceding=True) if _is_element(n)]
+    following = [n for n in node.itersiblings() if _is_element(n)]
+    return [*reversed(preceding), node, *following]
+
+
+class LxmlEngine(DomEngine):
+    """lxml.html tree with cssselect CSS and native XPath."""
+
+    name = "lxml"
+    supports_xpath = True
+    supports_lines = True
+
+    def __init__(self) -> None:
+        # CSSSelector translates CSS to XPath once per query.
+        self._selectors: dict[str, CSSSelector] = {}
+
+    def parse(self, html: str) -> HtmlElement:
+        try:
+            return lxml_html.document_fromstring(html)
+        except etree.ParserError:  # empty document
+            return lxml_html.document_fromstring(_FALLBACK_HTML)
+
+    def roots(self, document: HtmlElement) -> list[HtmlElement]:
+        return _top_level(document)
+
+    def elements(self, document: HtmlElement) -> list[HtmlElement]:
+        return [
+            node
+            for root in self.roots(document)
+            for node in root.iter(etree.Element)
+        ]
+
+    def select(self, node: HtmlElement, query: str) -> list[HtmlElement]:
+        selector = self._selectors.get(query)
+        if selector is None:
+            selector = CSSSelector(query, translator="html")
+            self._selectors[query] = selector
+        return selector(node)
+
+    def xpath(self, node: HtmlElement, query: str) -> object:
+        return node.xpath(query)
+
+    def parent(self, node: HtmlElement) -> HtmlElement | None:
+        return node.getparent()
+
+    def children(self, node: HtmlElement) -> list[HtmlElement]:
+        return [c for c in node if _is_element(c)]
+
+    def siblings(self, node: HtmlElement) -> list[HtmlElement]:
+        parent = node.getparent()
+        if parent is None:
+            return _top_level(node)
+        return self.children(parent)
+
+    def next_sibling(self, node: HtmlElement) -> HtmlElement | None:
+        for sibling in node.itersiblings():
+            if _is_element(sibling):
+                return sibling
+        return None
+
+    def prev_sibling(self, node: HtmlElement) -> HtmlElement | None:
+        for sibling in node.itersiblings(preceding=True):
+            if _is_element(sibling):
+                return sibling
+        return None
+
+    def tag_name(self, node: HtmlElement) -> str:
+        return node.tag
+
+    def attrs(self, node: HtmlElement) -> dict[str, str]:
+        return dict(node.attrib)
+
+    def text(self, node: HtmlElement, *, strip: bool = False) -> str:
+        parts: list[str] = [node.text] if node.text else []
+        skip = 0  # depth inside a NON_TEXT_TAGS subtree
+        for event, el in etree.iterwalk(
+            node, events=("start", "end", "comment", "pi")
+        ):
+            if el is node:
+                continue
+            if event == "start":
+                if skip or el.tag in NON_TEXT_TAGS:
+                    skip += 1
+                elif el.text:
+                    parts.append(el.text)
+                continue
+            if event == "end" and skip:
+                skip -= 1
+            if not skip and el.tail:
+                parts.append(el.tail)
+        return join_text(parts, strip)
+
+    def own_text(self, node: HtmlElement) -> list[str]:
+        parts = [node.text] if node.text else []
+        parts.extend(child.tail for child in node if child.tail)
+        return parts
+
+    def html(self, node: HtmlElement) -> str:
+        return etree.tostring(
+            node, method="html", encoding="unicode", with_tail=False
+        )
+
+    def line(self, node: HtmlElement) -> int | None:
+        return node.sourceline
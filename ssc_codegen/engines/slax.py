@@ -0,0 +1,87 @@
+"""selectolax engine (lexbor tree, as in generated ``slax`` code)."""
+
+from __future__ import annotations
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from ssc_codegen.engines.base import NON_TEXT_TAGS, DomEngine, join_text
+
+
+class SlaxEngine(DomEngine):
+    """selectolax.lexbor tree with lexbor CSS; no XPath, no source lines."""
+
+    name = "slax"
+
+    def parse(self, html: str) -> LexborHTMLParser:
+        return LexborHTMLParser(html)
+
+    def roots(self, document: LexborHTMLParser) -> list[LexborNode]:
+        root = document.root
+        return [root] if root is not None else []
+
+    def elements(self, document: LexborHTMLParser) -> list[LexborNode]:
+        return [
+            node
+            for root in self.roots(document)
+            for node in root.traverse()
+            if node.is_element_node
+        ]
+
+    def select(
+        self, node: LexborHTMLParser | LexborNode, query: str
+    ) -> list[LexborNode]:
+        return node.css(query)
+
+    def parent(self, node: LexborNode) -> LexborNode | None:
+        parent = node.parent
+        if parent is None or not parent.is_element_node:
+            return None
+        return parent
+
+    def children(self, node: LexborNode) -> list[LexborNode]:
+        return [c for c in node.iter() if c.is_element_node]
+
+    def next_sibling(self, node: LexborNode) -> LexborNode | None:
+        current = node.next
+        while current is not None and not current.is_element_node:
+            current = current.next
+        return current
+
+    def prev_sibling(self, node: LexborNode) -> LexborNode | None:
+        current = node.prev
+        while current is not None and not current.is_element_node:
+            current = current.prev
+        return current
+
+    def key(self, node: LexborNode) -> int:
+        # Node wrappers are created per access; the C pointer is stable.
+        return node.mem_id
+
+    def tag_name(self, node: LexborNode) -> str:
+        return node.tag or ""
+
+    def attrs(self, node: LexborNode) -> dict[str, str]:
+        return {k: v or "" for k, v in node.attributes.items()}
+
+    def text(self, node: LexborNode, *, strip: bool = False) -> str:
+        parts: list[str] = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.is_text_node:
+                parts.append(current.text_content or "")
+            elif current.is_element_node and (
+                current is node or current.tag not in NON_TEXT_TAGS
+            ):
+                stack.extend(reversed(list(current.iter(include_text=True))))
+        return join_text(parts, strip)
+
+    def own_text(self, node: LexborNode) -> list[str]:
+        return [
+            c.text_content or ""
+            for c in node.iter(include_text=True)
+            if c.is_text_node
+        ]
+
+    def html(self, node: LexborNode) -> str:
+        return node.html or ""
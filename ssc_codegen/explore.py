@@ -9,14 +9,26 @@ a `.kdl` schema or for one-off data extraction.
 
 from __future__ import annotations
 
+import bisect
+import heapq
 import json
+import os
 import re
+import statistics
+from collections.abc import Hashable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Iterable, Literal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Literal
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+from lxml import etree
+
+from ssc_codegen.engines import DEFAULT_ENGINE, DomEngine, get_engine
+from ssc_codegen.engines.base import NON_TEXT_TAGS
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
-BS4_PARSER = "lxml"
 DEFAULT_LIMIT = 50
 DEFAULT_SNIPPET = 200
 DEFAULT_FIELDS = ("path", "tag", "text")
@@ -138,232 +150,192 @@ def compile_filters(
 
 
 def parse_html(html: str) -> BeautifulSoup:
-    """Parse HTML string into a BeautifulSoup tree."""
-    return BeautifulSoup(html, BS4_PARSER)
+    """Parse HTML string into a BeautifulSoup tree.
+
+    Uses lxml, like the generated `bs4` parsers; every tag also carries
+    its source line in `Tag.sourceline`.
+    """
+    return get_engine("bs4").parse(html)
 
 
-def _candidate_set(soup: BeautifulSoup, css: str | None) -> list[Tag]:
+def _candidate_set(engine: DomEngine, document: Any, css: str | None) -> list:
     if css:
         try:
-            return list(soup.select(css))
-        except Exception as exc:  # soupsieve raises various exceptions
+            return engine.select(document, css)
+        except Exception as exc:  # each engine raises its own errors
             raise FilterError(f"invalid CSS selector {css!r}: {exc}") from exc
-    return [t for t in soup.find_all(True)]
+    return engine.elements(document)
 
 
-def _matches_text_regex(tag: Tag, pattern: re.Pattern[str]) -> bool:
-    """True if any direct NavigableString child of `tag` matches `pattern`.
+def _matches_text_regex(
+    engine: DomEngine, tag: Any, pattern: re.Pattern[str]
+) -> bool:
+    """True if any direct text child of `tag` matches `pattern`.
 
     Direct children only (not descendants) — prevents every ancestor of
     a matching text node from being reported.
     """
-    for child in tag.children:
-        if isinstance(child, NavigableString) and pattern.search(str(child)):
-            return True
-    return False
+    return any(pattern.search(text) for text in engine.own_text(tag))
 
 
-def _matches_attr(tag: Tag, flt: AttrFilter) -> bool:
+def _matches_attr(attrs: dict[str, str], flt: AttrFilter) -> bool:
     if flt.kind == "present":
-        return tag.has_attr(flt.name)
-    if not tag.has_attr(flt.name):
+        return flt.name in attrs
+    value = attrs.get(flt.name)
+    if value is None:
         return False
-    value = tag.get(flt.name)
-    if isinstance(value, list):  # class/multivalued attr
-        value = " ".join(value)
     if flt.kind == "exact":
         return value == flt.value
     if flt.kind == "regex":
         assert flt.compiled is not None
-        return flt.compiled.search(str(value)) is not None
+        return flt.compiled.search(value) is not None
     return False
 
 
-def _tag_matches(tag: Tag, flt: ScoutFilters) -> bool:
-    if flt.tag is not None and tag.name != flt.tag:
+def _tag_matches(engine: DomEngine, tag: Any, flt: ScoutFilters) -> bool:
+    if flt.tag is not None and engine.tag_name(tag) != flt.tag:
         return False
     if flt.text_regex is not None and not _matches_text_regex(
-        tag, flt.text_regex
+        engine, tag, flt.text_regex
     ):
         return False
-    for attr_flt in flt.attrs:
-        if not _matches_attr(tag, attr_flt):
-            return False
+    if flt.attrs:
+        attrs = engine.attrs(tag)
+        for attr_flt in flt.attrs:
+            if not _matches_attr(attrs, attr_flt):
+                return False
     return True
 
 
 def find_matches(
-    soup: BeautifulSoup, flt: ScoutFilters, invert: bool
-) -> list[Tag]:
-    """Return tags passing filters (or non-passing if `invert`)."""
-    candidates = _candidate_set(soup, flt.css)
+    document: Any,
+    flt: ScoutFilters,
+    invert: bool,
+    engine: DomEngine | None = None,
+) -> list:
+    """Return tags passing filters (or non-passing if `invert`).
+
+    `document` comes from `engine.parse` (a BeautifulSoup by default).
+    """
+    engine = engine or get_engine()
+    candidates = _candidate_set(engine, document, flt.css)
     if invert:
-        return [t for t in candidates if not _tag_matches(t, flt)]
-    return [t for t in candidates if _tag_matches(t, flt)]
+        return [t for t in candidates if not _tag_matches(engine, t, flt)]
+    return [t for t in candidates if _tag_matches(engine, t, flt)]
 
 
 # ─────────────────────────── navigation ────────────────────────────
 
 
-def _first_child_tag(tag: Tag) -> Tag | None:
-    for child in tag.children:
-        if isinstance(child, Tag):
-            return child
-    return None
+def _first_child_tag(engine: DomEngine, tag: Any) -> Any | None:
+    children = engine.children(tag)
+    return children[0] if children else None
 
 
-def _nth_sibling(tag: Tag | None, count: int, forward: bool) -> Tag | None:
+def _nth_sibling(
+    engine: DomEngine, tag: Any | None, count: int, forward: bool
+) -> Any | None:
     current = tag
     remaining = count
     while current is not None and remaining > 0:
         if forward:
-            current = current.find_next_sibling()
+            current = engine.next_sibling(current)
         else:
-            current = current.find_previous_sibling()
+            current = engine.prev_sibling(current)
         if current is None:
             return None
         remaining -= 1
     return current
 
 
-def apply_navigation(tags: list[Tag], nav: NavSpec) -> list[Tag]:
-    """Walk each tag through nav steps, drop None, dedupe by identity."""
+def apply_navigation(
+    tags: list, nav: NavSpec, engine: DomEngine | None = None
+) -> list:
+    """Walk each tag through nav steps, drop None, dedupe by identity.
+
+    Climbing above a top-level element drops the match.
+    """
+    engine = engine or get_engine()
     if nav.is_noop():
         # Still dedupe in case duplicates slipped through filters.
-        seen: set[int] = set()
-        out: list[Tag] = []
+        seen: set[object] = set()
+        out: list = []
         for t in tags:
-            if id(t) not in seen:
-                seen.add(id(t))
+            key = engine.key(t)
+            if key not in seen:
+                seen.add(key)
                 out.append(t)
         return out
 
-    result: list[Tag] = []
-    seen_ids: set[int] = set()
+    result: list = []
+    seen_keys: set[object] = set()
     for tag in tags:
-        current: Tag | None = tag
+        current: Any | None = tag
         for direction, count in nav.steps():
             if count <= 0 or current is None:
                 continue
             if direction == "up":
                 for _ in range(count):
-                    current = current.parent if current is not None else None
+                    current = engine.parent(current)
                     if current is None:
                         break
             elif direction == "down":
                 for _ in range(count):
-                    current = (
-                        _first_child_tag(current)
-                        if current is not None
-                        else None
-                    )
+                    current = _first_child_tag(engine, current)
                     if current is None:
                         break
             elif direction == "next":
-                current = _nth_sibling(current, count, forward=True)
+                current = _nth_sibling(engine, current, count, forward=True)
             elif direction == "prev":
-                current = _nth_sibling(current, count, forward=False)
+                current = _nth_sibling(engine, current, count, forward=False)
             if current is None:
                 break
-        if current is not None and id(current) not in seen_ids:
-            seen_ids.add(id(current))
-            result.append(current)
+        if current is not None:
+            key = engine.key(current)
+            if key not in seen_keys:
+                seen_keys.add(key)
+                result.append(current)
     return result
 
 
 # ─────────────────────────── field extraction ──────────────────────
 
 
-def compute_css_path(tag: Tag) -> str:
+def compute_css_path(tag: Any, engine: DomEngine | None = None) -> str:
     """Return a copy-pasteable CSS path from <html> down to `tag`."""
+    engine = engine or get_engine()
     parts: list[str] = []
-    current: Tag | None = tag
-    while current is not None and current.name not in ("[document]", None):
-        name = current.name
-        raw_classes = current.get("class")
-        if isinstance(raw_classes, list):
-            classes: list[str] = [str(c) for c in raw_classes]
-        elif raw_classes is not None:
-            classes = [str(raw_classes)]
-        else:
-            classes = []
-        classes_str = ".".join(classes)
-        # Compute position among same-tag siblings.
-        same_tag_index = 1
-        sibling: Tag | None = current.find_previous_sibling(name)
-        while sibling is not None:
-            same_tag_index += 1
-            sibling = sibling.find_previous_sibling(name)
-        if same_tag_index > 1 or _has_same_tag_sibling(current, name):
-            segment = f"{name}:nth-of-type({same_tag_index})"
-        else:
-            segment = name
-        if classes_str:
-            segment_full = f"{name}.{'.'.join(classes)}"
-            if ":nth-of-type" in segment:
-                segment_full += f":nth-of-type({same_tag_index})"
-            segment = segment_full
-        parts.append(segment)
-        current = current.parent if isinstance(current.parent, Tag) else None
+    current: Any | None = tag
+    while current is not None:
+        name = engine.tag_name(current)
+        # Position among same-tag siblings.
+        same_tag = [
+            sibling
+            for sibling in engine.siblings(current)
+            if engine.tag_name(sibling) == name
+        ]
+        key = engine.key(current)
+        index = 1 + next(
+            i
+            for i, sibling in enumerate(same_tag)
+            if engine.key(sibling) == key
+        )
+        parts.append(
+            _path_segment(
+                name, engine.classes(current), index, len(same_tag) > 1
+            )
+        )
+        current = engine.parent(current)
     parts.reverse()
     return " > ".join(parts) if parts else ""
 
 
-def _has_same_tag_sibling(tag: Tag, name: str) -> bool:
-    return tag.find_previous_sibling(name) is not None or (
-        tag.find_next_sibling(name) is not None
-    )
-
-
-def lookup_line(tag: Tag, lxml_tree: object) -> int | None:
-    """Look up source line via lxml `.sourceline`.
+def lookup_line(tag: Any, engine: DomEngine | None = None) -> int | None:
+    """Source line of `tag`'s start tag, recorded while parsing.
 
-    Builds a path of (name, index_among_siblings) for `tag` and walks
-    the lxml tree to the same position. Handles the case where lxml's
-    root element already matches the outermost path entry.
+    None when the engine does not track lines (`slax`).
     """
-    try:
-        from lxml import etree  # type: ignore[import-not-found]
-    except ImportError:
-        return None
-    if not isinstance(lxml_tree, etree._Element):
-        return None
-
-    # Build path bottom-up.
-    path_parts: list[tuple[str, int]] = []
-    current: Tag | None = tag
-    while current is not None and current.name not in ("[document]", None):
-        name = current.name
-        index = 1
-        sib: Tag | None = current.find_previous_sibling(name)
-        while sib is not None:
-            index += 1
-            sib = sib.find_previous_sibling(name)
-        path_parts.append((name, index))
-        parent = current.parent
-        current = parent if isinstance(parent, Tag) else None
-    path_parts.reverse()
-
-    node: object = lxml_tree
-    # If the lxml root element matches the outermost path entry, treat it
-    # as already-located and skip descent into that level.
-    if (
-        path_parts
-        and isinstance(node, etree._Element)
-        and node.tag == path_parts[0][0]
-    ):
-        path_parts = path_parts[1:]
-
-    for name, idx in path_parts:
-        if not isinstance(node, etree._Element):
-            return None
-        matching = [c for c in node if c.tag == name]
-        if idx - 1 >= len(matching):
-            return None
-        node = matching[idx - 1]
-
-    sourceline = getattr(node, "sourceline", None)
-    return int(sourceline) if sourceline else None
+    return (engine or get_engine()).line(tag)
 
 
 def _truncate(value: str, limit: int) -> str:
@@ -373,53 +345,36 @@ def _truncate(value: str, limit: int) -> str:
 
 
 def extract_fields(
-    tag: Tag,
+    tag: Any,
     fields: list[str],
     index: int,
     snippet: int,
-    lxml_tree: object | None,
+    engine: DomEngine | None = None,
 ) -> dict[str, object]:
     """Extract requested fields from a tag."""
+    engine = engine or get_engine()
     out: dict[str, object] = {}
     for raw in fields:
         key = raw.strip()
         if key == "index":
             out["index"] = index
         elif key == "tag":
-            out["tag"] = tag.name
+            out["tag"] = engine.tag_name(tag)
         elif key == "text":
-            out["text"] = _truncate(tag.get_text(), snippet)
+            out["text"] = _truncate(engine.text(tag), snippet)
         elif key == "html":
-            out["html"] = _truncate(str(tag), snippet)
+            out["html"] = _truncate(engine.html(tag), snippet)
         elif key == "attrs":
-            attrs_d = {
-                k: (" ".join(v) if isinstance(v, list) else v)
-                for k, v in tag.attrs.items()
-            }
-            out["attrs"] = attrs_d
+            out["attrs"] = engine.attrs(tag)
         elif key == "classes":
-            raw_cls = tag.get("class")
-            if isinstance(raw_cls, list):
-                out["classes"] = raw_cls
-            elif raw_cls is not None:
-                out["classes"] = [raw_cls]
-            else:
-                out["classes"] = []
+            out["classes"] = engine.classes(tag)
         elif key == "path":
-            out["path"] = compute_css_path(tag)
+            out["path"] = compute_css_path(tag, engine)
         elif key == "line":
-            out["line"] = (
-                lookup_line(tag, lxml_tree) if lxml_tree is not None else None
-            )
+            out["line"] = engine.line(tag)
         elif key.startswith("attr."):
             attr_name = key[len("attr.") :]
-            if tag.has_attr(attr_name):
-                v = tag.get(attr_name)
-                out[f"attr.{attr_name}"] = (
-                    " ".join(v) if isinstance(v, list) else v
-                )
-            else:
-                out[f"attr.{attr_name}"] = None
+            out[f"attr.{attr_name}"] = engine.attrs(tag).get(attr_name)
         else:
             raise FilterError(f"unknown field {raw!r}")
     return out
@@ -479,14 +434,18 @@ def run_scout(
     limit: int = DEFAULT_LIMIT,
     offset: int = 0,
     snippet: int = DEFAULT_SNIPPET,
+    engine: str = DEFAULT_ENGINE,
 ) -> ScoutResult:
     """Run scout end-to-end on raw HTML.
 
-    Raises FilterError on invalid regex / CSS / unknown field.
+    `engine` names the HTML library that parses and queries the page
+    (see `ssc_codegen.engines`). Raises FilterError on invalid regex /
+    CSS / unknown field, EngineError on an unknown or missing engine.
     """
-    soup = parse_html(html)
-    matched_tags = find_matches(soup, filters, invert=invert)
-    matched_tags = apply_navigation(matched_tags, nav)
+    dom = get_engine(engine)
+    document = dom.parse(html)
+    matched_tags = find_matches(document, filters, invert=invert, engine=dom)
+    matched_tags = apply_navigation(matched_tags, nav, engine=dom)
 
     total = len(matched_tags)
     truncated = offset + limit < total
@@ -496,20 +455,8 @@ def run_scout(
         else matched_tags[offset:]
     )
 
-    needs_line = "line" in fields
-    lxml_tree: object | None = None
-    if needs_line:
-        try:
-            from lxml import etree  # type: ignore[import-not-found]
-
-            lxml_tree = etree.HTML(html)
-        except ImportError:
-            lxml_tree = None
-
     results = [
-        extract_fields(
-            tag, fields, index=i, snippet=snippet, lxml_tree=lxml_tree
-        )
+        extract_fields(tag, fields, index=i, snippet=snippet, engine=dom)
         for i, tag in enumerate(page)
     ]
 
@@ -788,7 +735,7 @@ class DiscoverResult:
 
 
 def _collect_tag_stats(
-    soup: BeautifulSoup,
+    index: _DomIndex,
 ) -> tuple[
     list[dict[str, object]],
     list[dict[str, object]],
@@ -808,21 +755,38 @@ def _collect_tag_stats(
     id_counts: dict[str, int] = {}
     data_attrs: set[str] = set()
 
-    for tag in soup.find_all(True):
-        name = tag.name
+    for pos, classes in enumerate(index.classes):
+        name = index.name[pos]
         tag_counts[name] = tag_counts.get(name, 0) + 1
 
-        for cls in tag.get("class") or []:
+        for cls in classes:
             class_counts[cls] = class_counts.get(cls, 0) + 1
 
-        id_val = tag.get("id")
-        if isinstance(id_val, str) and id_val:
+        attrs = index.attrs(pos)
+        id_val = attrs.get("id")
+        if id_val:
             id_counts[id_val] = id_counts.get(id_val, 0) + 1
 
-        for attr_name in tag.attrs:
+        for attr_name in attrs:
             if attr_name.startswith("data-"):
                 data_attrs.add(attr_name)
 
+    return _rank_tag_stats(tag_counts, class_counts, id_counts, data_attrs)
+
+
+def _rank_tag_stats(
+    tag_counts: dict[str, int],
+    class_counts: dict[str, int],
+    id_counts: dict[str, int],
+    data_attrs: set[str],
+) -> tuple[
+    list[dict[str, object]],
+    list[dict[str, object]],
+    list[dict[str, object]],
+    list[str],
+    dict[str, int],
+]:
+    """Sort and cap raw counters into `_collect_tag_stats` output."""
     tag_stats = [
         {"tag": t, "count": c}
         for t, c in sorted(tag_counts.items(), key=lambda kv: (-kv[1], kv[0]))
@@ -844,36 +808,167 @@ def _collect_tag_stats(
     )
 
 
-def _depth_of(tag: Tag) -> int:
-    """Depth from the document root (root = 1)."""
-    depth = 0
-    current: object = tag
-    while isinstance(current, Tag) and current.name not in ("[document]",):
-        depth += 1
-        parent = current.parent
-        current = parent
-    return depth
-
-
-def _signature(tag: Tag) -> tuple[str, frozenset[str]]:
-    """Stable identity for grouping siblings: (tag_name, class set)."""
-    raw_classes = tag.get("class")
-    if isinstance(raw_classes, list):
-        classes = frozenset(str(c) for c in raw_classes)
-    elif raw_classes is not None:
-        classes = frozenset([str(raw_classes)])
+class _DomIndex:
+    """Per-node facts for discover, computed in one pre-order walk.
+
+    Every tag gets a position in document order; parallel lists hold its
+    parent position (-1 for top-level tags), depth (root = 1), tag name,
+    class list, grouping signature (tag name, class set),
+    `compute_css_path` segment and the end of its subtree,
+    so descendants of `nodes[i]` are exactly `nodes[i + 1 : end[i]]`.
+    Sibling indexes are counted once per parent and depths are inherited
+    from the parent, so the walk is O(n). Full CSS paths are joined on
+    demand from the parent's memoized path — only groups that are reported
+    pay for them.
+    """
+
+    def __init__(self, engine: DomEngine, document: Any) -> None:
+        self.engine = engine
+        self.nodes: list[Any] = []
+        self.parent: list[int] = []
+        self.depth: list[int] = []
+        self.name: list[str] = []
+        self.classes: list[list[str]] = []
+        self.signature: list[tuple[str, frozenset[str]]] = []
+        self.segment: list[str] = []
+        self.end: list[int] = []
+        self._pos: dict[Hashable, int] = {}
+        self._paths: dict[int, str] = {}
+        self._attrs: dict[int, dict[str, str]] = {}
+        self._by_name: dict[str, list[int]] = {}
+
+        # Stack items: (tag, parent_pos, same_tag_index, has_same_tag_sibling)
+        # for nodes to visit, or a bare position closing that subtree.
+        stack: list[tuple[Any, int, int, bool] | int] = []
+        self._push_children(stack, engine.roots(document), -1)
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                self.end[item] = len(self.nodes)
+                continue
+            tag, parent, index, has_sibling = item
+            pos = len(self.nodes)
+            name = engine.tag_name(tag)
+            classes = engine.classes(tag)
+            self.nodes.append(tag)
+            self.parent.append(parent)
+            self.depth.append(self.depth[parent] + 1 if parent >= 0 else 1)
+            self.name.append(name)
+            self.classes.append(classes)
+            self.signature.append((name, frozenset(classes)))
+            self.segment.append(
+                _path_segment(name, classes, index, has_sibling)
+            )
+            self.end.append(pos + 1)
+            self._pos[engine.key(tag)] = pos
+            self._by_name.setdefault(name, []).append(pos)
+            stack.append(pos)
+            self._push_children(stack, engine.children(tag), pos)
+
+    def _push_children(
+        self,
+        stack: list[tuple[Any, int, int, bool] | int],
+        children: list[Any],
+        pos: int,
+    ) -> None:
+        names = [self.engine.tag_name(child) for child in children]
+        totals: dict[str, int] = {}
+        for name in names:
+            totals[name] = totals.get(name, 0) + 1
+        seen: dict[str, int] = {}
+        entries: list[tuple[Any, int, int, bool]] = []
+        for child, name in zip(children, names):
+            index = seen.get(name, 0) + 1
+            seen[name] = index
+            entries.append((child, pos, index, totals[name] > 1))
+        stack.extend(reversed(entries))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def pos(self, tag: Any) -> int:
+        """Document-order position of `tag`; -1 when it is not indexed."""
+        return self._pos.get(self.engine.key(tag), -1)
+
+    def attrs(self, pos: int) -> dict[str, str]:
+        """`engine.attrs` of the tag at `pos`, memoized."""
+        cached = self._attrs.get(pos)
+        if cached is None:
+            cached = self._attrs[pos] = self.engine.attrs(self.nodes[pos])
+        return cached
+
+    def text(self, pos: int) -> str:
+        """Stripped text of the tag at `pos` (`get_text(strip=True)`)."""
+        return self.engine.text(self.nodes[pos], strip=True)
+
+    def children(self, pos: int) -> list[int]:
+        """Positions of the direct children of `pos`."""
+        out: list[int] = []
+        child = pos + 1
+        while child < self.end[pos]:
+            out.append(child)
+            child = self.end[child]
+        return out
+
+    def descendants(self, pos: int) -> range:
+        """Positions of all descendants of `pos`, in document order."""
+        return range(pos + 1, self.end[pos])
+
+    def named(self, name: str, within: int | None = None) -> list[int]:
+        """Positions of `<name>` tags, optionally only below `within`."""
+        found = self._by_name.get(name, [])
+        if within is None:
+            return list(found)
+        lo = bisect.bisect_right(found, within)
+        hi = bisect.bisect_left(found, self.end[within], lo)
+        return found[lo:hi]
+
+    def path(self, pos: int) -> str:
+        """`compute_css_path` of the tag at `pos` ("" for the document)."""
+        if pos < 0:
+            return ""
+        cached = self._paths.get(pos)
+        if cached is not None:
+            return cached
+        # Climb to the nearest memoized ancestor, then join downwards.
+        chain: list[int] = []
+        current = pos
+        while current >= 0 and current not in self._paths:
+            chain.append(current)
+            current = self.parent[current]
+        prefix = self._paths[current] if current >= 0 else ""
+        for node in reversed(chain):
+            segment = self.segment[node]
+            prefix = f"{prefix} > {segment}" if prefix else segment
+            self._paths[node] = prefix
+        return prefix
+
+
+def _path_segment(
+    name: str, classes: list[str], index: int, has_sibling: bool
+) -> str:
+    """One `compute_css_path` step for a tag with the given sibling facts."""
+    if index > 1 or has_sibling:
+        segment = f"{name}:nth-of-type({index})"
     else:
-        classes = frozenset()
-    return (tag.name, classes)
+        segment = name
+    if ".".join(classes):
+        segment_full = f"{name}.{'.'.join(classes)}"
+        if ":nth-of-type" in segment:
+            segment_full += f":nth-of-type({index})"
+        segment = segment_full
+    return segment
 
 
 def _compute_common_descendants(
-    items: list[Tag],
+    items: list[int],
+    index: _DomIndex,
     *,
     threshold: float = DISCOVER_DESCENDANT_THRESHOLD,
     max_n: int = DISCOVER_TOP_DESCENDANTS,
 ) -> list[dict[str, object]]:
-    """Find descendants that appear in >= `threshold` fraction of `items`.
+    """Find descendants that appear in >= `threshold` fraction of `items`
+    (positions in `index`).
 
     Returns one entry per distinct (tag_name, class_set) signature, with:
     - `attrs`: union of non-class attributes seen across matching descendants
@@ -897,22 +992,22 @@ def _compute_common_descendants(
     per_item_signatures: list[set[tuple[str, frozenset[str]]]] = []
     per_item_attrs: list[dict[tuple[str, frozenset[str]], set[str]]] = []
     per_item_counts: list[dict[tuple[str, frozenset[str]], int]] = []
-    per_item_samples: list[dict[tuple[str, frozenset[str]], Tag]] = []
+    per_item_samples: list[dict[tuple[str, frozenset[str]], int]] = []
     for item in items:
         seen: set[tuple[str, frozenset[str]]] = set()
         attr_map: dict[tuple[str, frozenset[str]], set[str]] = {}
         count_map: dict[tuple[str, frozenset[str]], int] = {}
-        sample_map: dict[tuple[str, frozenset[str]], Tag] = {}
-        for desc in item.find_all(True):
-            sig = _signature(desc)
+        sample_map: dict[tuple[str, frozenset[str]], int] = {}
+        for desc_pos in index.descendants(item):
+            sig = index.signature[desc_pos]
             seen.add(sig)
             attrs = attr_map.setdefault(sig, set())
-            for k in desc.attrs:
+            for k in index.attrs(desc_pos):
                 if k != "class":
                     attrs.add(k)
             count_map[sig] = count_map.get(sig, 0) + 1
             if sig not in sample_map:
-                sample_map[sig] = desc
+                sample_map[sig] = desc_pos
         per_item_signatures.append(seen)
         per_item_attrs.append(attr_map)
         per_item_counts.append(count_map)
@@ -952,7 +1047,7 @@ def _compute_common_descendants(
             if occ > max_per_item:
                 max_per_item = occ
         # Sample values: head + tail (deduped) for variety coverage.
-        samples = _extract_samples(per_item_samples, sig, attr_union)
+        samples = _extract_samples(per_item_samples, sig, attr_union, index)
         entry: dict[str, object] = {
             "tag": tag_name,
             "classes": sorted(classes),
@@ -971,9 +1066,10 @@ def _compute_common_descendants(
 
 
 def _extract_samples(
-    per_item_samples: list[dict[tuple[str, frozenset[str]], Tag]],
+    per_item_samples: list[dict[tuple[str, frozenset[str]], int]],
     sig: tuple[str, frozenset[str]],
     attr_union: set[str],
+    index: _DomIndex,
     *,
     head_n: int = SAMPLE_HEAD_N,
     tail_n: int = SAMPLE_TAIL_N,
@@ -981,7 +1077,7 @@ def _extract_samples(
     """Collect head+tail distinct sample values for a signature.
 
     Walks `per_item_samples` in order, extracts a value (text or first attr)
-    from each item's stored sample Tag, deduplicates, and returns::
+    from each item's stored sample tag position, deduplicates, and returns::
 
         {"sample": [first head_n distinct], "sample_tail": [last tail_n
          distinct not already in head]}
@@ -994,28 +1090,29 @@ def _extract_samples(
     limit = DISCOVER_SAMPLE_LEN
     priority = ["href", "src", "title", "alt", "content", "value"]
 
-    def _value_from(tag: Tag) -> str | None:
-        text = tag.get_text(strip=True)
+    def _value_from(pos: int) -> str | None:
+        text = index.text(pos)
         if text:
             return text[:limit]
+        attrs = index.attrs(pos)
         for name in priority:
             if name in attr_union:
-                val = tag.get(name)
-                if isinstance(val, str) and val:
+                val = attrs.get(name)
+                if val:
                     return val[:limit]
         for name in sorted(attr_union):
-            val = tag.get(name)
-            if isinstance(val, str) and val:
+            val = attrs.get(name)
+            if val:
                 return val[:limit]
         return None
 
     head: list[str] = []
     seen: set[str] = set()
     for sample_map in per_item_samples:
-        tag = sample_map.get(sig)
-        if tag is None:
+        pos = sample_map.get(sig)
+        if pos is None:
             continue
-        val = _value_from(tag)
+        val = _value_from(pos)
         if val is None or val in seen:
             continue
         seen.add(val)
@@ -1025,10 +1122,10 @@ def _extract_samples(
 
     tail: list[str] = []
     for sample_map in reversed(per_item_samples):
-        tag = sample_map.get(sig)
-        if tag is None:
+        pos = sample_map.get(sig)
+        if pos is None:
             continue
-        val = _value_from(tag)
+        val = _value_from(pos)
         if val is None or val in seen:
             continue
         seen.add(val)
@@ -1045,9 +1142,9 @@ def _extract_samples(
 # ─────────────────── discover v2: flags + short selector ─────────────
 
 
-def _detect_single_link_item(items: list[Tag]) -> bool:
+def _detect_single_link_item(items: list[int], index: _DomIndex) -> bool:
     """True when every item is itself a bare `<a>` OR has exactly one direct
-    child Tag and it is `<a>`.
+    child tag and it is `<a>`.
 
     Signals a navigation list: each row is just a link (e.g. `<li><a>...
     </a></li>` or a sequence of sibling `<a>` tags). The LLM can then prefer
@@ -1057,16 +1154,16 @@ def _detect_single_link_item(items: list[Tag]) -> bool:
         return False
     for item in items:
         # Item itself is a bare link.
-        if item.name == "a":
+        if index.name[item] == "a":
             continue
         # Item wraps exactly one <a> child.
-        child_tags = [c for c in item.children if isinstance(c, Tag)]
-        if len(child_tags) != 1 or child_tags[0].name != "a":
+        child_tags = index.children(item)
+        if len(child_tags) != 1 or index.name[child_tags[0]] != "a":
             return False
     return True
 
 
-def _detect_has_th_row(parent: Tag, item_tag: str) -> bool:
+def _detect_has_th_row(parent: int, item_tag: str, index: _DomIndex) -> bool:
     """True when `item_tag == 'tr'` and the enclosing `<table>` contains
     at least one `<th>` anywhere (typically in `<thead>`).
 
@@ -1077,39 +1174,38 @@ def _detect_has_th_row(parent: Tag, item_tag: str) -> bool:
         return False
     # Walk up from the items' parent to the nearest <table> ancestor —
     # <th> may live in a sibling <thead>, not in the same parent as items.
-    table: Tag | None = parent
-    while table is not None and table.name != "table":
-        p = table.parent
-        table = p if isinstance(p, Tag) else None
-    if table is None:
+    table = parent
+    while table >= 0 and index.name[table] != "table":
+        table = index.parent[table]
+    if table < 0:
         return False
-    return table.find("th") is not None
+    return bool(index.named("th", within=table))
 
 
-def _detect_single_label_child(items: list[Tag]) -> bool:
-    """True when at least one item has exactly one direct child Tag with
+def _detect_single_label_child(items: list[int], index: _DomIndex) -> bool:
+    """True when at least one item has exactly one direct child tag with
     a label-like name (strong/b/dt/label) AND non-empty residual text
     (i.e. item text ≠ label child text).
 
     Signals "label: value" patterns typical of definition lists.
     """
     for item in items:
-        child_tags = [c for c in item.children if isinstance(c, Tag)]
-        if len(child_tags) != 1 or child_tags[0].name not in LABEL_TAGS:
+        child_tags = index.children(item)
+        if len(child_tags) != 1 or index.name[child_tags[0]] not in LABEL_TAGS:
             continue
-        child = child_tags[0]
-        item_text = item.get_text(strip=True)
-        child_text = child.get_text(strip=True)
+        item_text = index.text(item)
+        child_text = index.text(child_tags[0])
         if item_text and item_text != child_text:
             return True
     return False
 
 
 def _build_short_selector(
-    item: Tag,
+    item: int,
     class_count: dict[str, int],
+    index: _DomIndex,
 ) -> tuple[str, str]:
-    """Build a short, stable CSS selector for `item`.
+    """Build a short, stable CSS selector for the tag at `item` in `index`.
 
     Walks upward from `item.parent` looking for the nearest "anchor"
     (item itself is never used as anchor — `item_selector` targets ALL
@@ -1128,58 +1224,51 @@ def _build_short_selector(
     Returns `(selector, stability)`. Stability is `"stable"` only when
     a real anchor was found and the path below fits within MAX_DEPTH.
     """
-    # Step 1: walk up from item.parent looking for anchor.
-    anchor: Tag | None = None
+    # Step 1: walk up from item's parent looking for anchor.
+    anchor = -1
     anchor_segment: str = ""
-    current: Tag | None = item.parent if isinstance(item.parent, Tag) else None
-    while current is not None and current.name not in ("[document]", None):
+    current = index.parent[item]
+    while current >= 0:
         # id anchor wins
-        raw_id = current.get("id")
-        if isinstance(raw_id, str) and raw_id:
+        raw_id = index.attrs(current).get("id")
+        if raw_id:
             anchor = current
             anchor_segment = f"#{raw_id}"
             break
         # rare class anchor
-        raw_classes = current.get("class")
-        if isinstance(raw_classes, list):
-            cls_list = [str(c) for c in raw_classes]
-        elif raw_classes is not None:
-            cls_list = [str(raw_classes)]
-        else:
-            cls_list = []
-        rare = [c for c in cls_list if class_count.get(c, 0) <= RARE_CLASS_MAX]
+        rare = [
+            c
+            for c in index.classes[current]
+            if class_count.get(c, 0) <= RARE_CLASS_MAX
+        ]
         if rare:
             anchor = current
-            anchor_segment = f"{current.name}.{'.'.join(rare)}"
+            anchor_segment = f"{index.name[current]}.{'.'.join(rare)}"
             break
-        parent = current.parent
-        current = parent if isinstance(parent, Tag) else None
+        current = index.parent[current]
 
     # No anchor — fragile fallback to full path.
-    if anchor is None or not anchor_segment:
-        return compute_css_path(item), "fragile"
+    if anchor < 0 or not anchor_segment:
+        return index.path(item), "fragile"
 
     # Step 2: build path from anchor down to item.
-    chain: list[Tag] = []
-    walker: Tag | None = item
-    while walker is not None and walker is not anchor:
+    chain: list[int] = []
+    walker = item
+    while walker >= 0 and walker != anchor:
         chain.append(walker)
-        p = walker.parent
-        walker = p if isinstance(p, Tag) else None
+        walker = index.parent[walker]
     chain.reverse()  # anchor-first → item-last
 
     below_segments: list[str] = []
-    for tag in chain:
-        raw_classes = tag.get("class")
-        if isinstance(raw_classes, list):
-            cls_list = [str(c) for c in raw_classes]
-        elif raw_classes is not None:
-            cls_list = [str(raw_classes)]
-        else:
-            cls_list = []
+    for pos in chain:
         # Keep only rare classes below anchor (avoid noise from common ones).
-        rare = [c for c in cls_list if class_count.get(c, 0) <= RARE_CLASS_MAX]
-        seg = f"{tag.name}.{'.'.join(rare)}" if rare else tag.name
+        rare = [
+            c
+            for c in index.classes[pos]
+            if class_count.get(c, 0) <= RARE_CLASS_MAX
+        ]
+        name = index.name[pos]
+        seg = f"{name}.{'.'.join(rare)}" if rare else name
         below_segments.append(seg)
 
     # Depth check: truncate path if too deep, force fragile.
@@ -1219,7 +1308,7 @@ def _try_top_level_keys(body: str) -> list[str] | None:
 
 
 def _find_table_candidates(
-    soup: BeautifulSoup,
+    index: _DomIndex,
     class_count: dict[str, int],
     *,
     max_tables: int = DISCOVER_TOP_TABLES,
@@ -1236,18 +1325,15 @@ def _find_table_candidates(
     Tables with zero rows are skipped.
     """
     candidates: list[dict[str, object]] = []
-    for table in soup.find_all("table"):
-        rows = table.find_all("tr")
+    for table in index.named("table"):
+        rows = index.named("tr", within=table)
         if not rows:
             continue
         keys: list[str] = []
         for row in rows:
-            th_cells = row.find_all("th")
+            th_cells = index.named("th", within=row)
             if th_cells:
-                keys = [
-                    (c.get_text(strip=True) or "")[:DISCOVER_SAMPLE_LEN]
-                    for c in th_cells
-                ]
+                keys = [index.text(c)[:DISCOVER_SAMPLE_LEN] for c in th_cells]
                 # Filter out empty strings — they carry no signal.
                 keys = [k for k in keys if k]
                 if keys:
@@ -1255,14 +1341,14 @@ def _find_table_candidates(
         if not keys:
             # No <th>: take first cell of each row.
             for row in rows:
-                first_td = row.find("td")
-                if first_td is None:
+                first_td = index.named("td", within=row)
+                if not first_td:
                     continue
-                text = first_td.get_text(strip=True)
+                text = index.text(first_td[0])
                 if text:
                     keys.append(text[:DISCOVER_SAMPLE_LEN])
             keys = keys[:DISCOVER_TOP_DESCENDANTS]
-        selector, _ = _build_short_selector(rows[0], class_count)
+        selector, _ = _build_short_selector(rows[0], class_count, index)
         candidates.append(
             {
                 "selector": selector,
@@ -1283,23 +1369,23 @@ def _find_table_candidates(
 
 
 def _build_page_summary(
-    soup: BeautifulSoup,
+    index: _DomIndex,
     repeat_containers: list[dict[str, object]],
     json_signals: list[dict[str, object]],
 ) -> dict[str, object]:
     """Cheap aggregate flags: table presence, embedded JSON presence,
     repeat-container count estimate. Derived purely from existing data —
-    no extra tree walk beyond a single `find('table')` lookup.
+    no extra tree walk beyond a `<table>` lookup in the index.
     """
     return {
-        "has_table": soup.find("table") is not None,
+        "has_table": bool(index.named("table")),
         "has_embedded_json": bool(json_signals),
         "container_count_estimate": len(repeat_containers),
     }
 
 
 def _find_repeat_containers(
-    soup: BeautifulSoup,
+    index: _DomIndex,
     class_count: dict[str, int],
     *,
     max_containers: int = DISCOVER_TOP_CONTAINERS,
@@ -1314,65 +1400,61 @@ def _find_repeat_containers(
     boolean flags (`single_link_item`, `has_th_row`, `single_label_child`)
     that help the LLM pick the right struct shape.
     """
-    # Group by (parent_css_path, signature). Using parent_css_path as
-    # the key keeps grouping stable across re-parses of the same HTML.
-    groups: dict[
-        tuple[str, tuple[str, frozenset[str]]], tuple[Tag, list[Tag]]
-    ] = {}
-    for tag in soup.find_all(True):
-        parent = tag.parent
-        if not isinstance(parent, Tag):
-            continue
-        sig = _signature(tag)
-        parent_path = compute_css_path(parent)
-        key = (parent_path, sig)
-        entry = groups.get(key)
-        if entry is None:
-            groups[key] = (parent, [tag])
-        else:
-            entry[1].append(tag)
-
-    containers: list[dict[str, object]] = []
-    for (parent_path, (tag_name, classes)), (parent, tags) in groups.items():
-        if len(tags) < DISCOVER_MIN_REPEAT:
+    # Group by (parent, signature). A tag's CSS path is unique within the
+    # document, so grouping by parent position matches grouping by parent
+    # path while only paying for the paths of groups that get reported.
+    groups: dict[tuple[int, tuple[str, frozenset[str]]], list[int]] = {}
+    for pos, (parent, sig) in enumerate(zip(index.parent, index.signature)):
+        groups.setdefault((parent, sig), []).append(pos)
+
+    candidates: list[tuple[int, tuple[str, frozenset[str]], list[int]]] = []
+    for (parent, sig), items in groups.items():
+        if len(items) < DISCOVER_MIN_REPEAT:
             continue
+        parent_path = index.path(parent)
         # Skip page boilerplate — head metadata (link/meta/script/style in <head>)
         # is never a list-struct candidate, but frequently dominates by count.
         if " > head" in parent_path or parent_path.endswith(" head"):
             continue
-        descendants = _compute_common_descendants(tags)
-        item_selector, stability = _build_short_selector(tags[0], class_count)
+        candidates.append((parent, sig, items))
+
+    # Sort by count desc, then depth asc (closer to leaves first on ties).
+    # The key needs no per-group analysis, so descendants, selectors and
+    # flags are only computed for the groups that survive the cut.
+    candidates.sort(key=lambda c: (-len(c[2]), index.depth[c[2][0]]))
+
+    containers: list[dict[str, object]] = []
+    for parent, (tag_name, classes), items in candidates[:max_containers]:
+        descendants = _compute_common_descendants(items, index)
+        item_selector, stability = _build_short_selector(
+            items[0], class_count, index
+        )
         entry_dict: dict[str, object] = {
-            "parent_selector": parent_path,
+            "parent_selector": index.path(parent),
             "item_selector": item_selector,
             "item_tag": tag_name,
             "item_classes": sorted(classes),
-            "count": len(tags),
-            "depth": _depth_of(tags[0]),
+            "count": len(items),
+            "depth": index.depth[items[0]],
             "common_descendants": descendants,
-            "single_link_item": _detect_single_link_item(tags),
-            "has_th_row": _detect_has_th_row(parent, tag_name),
-            "single_label_child": _detect_single_label_child(tags),
+            "single_link_item": _detect_single_link_item(items, index),
+            "has_th_row": _detect_has_th_row(parent, tag_name, index),
+            "single_label_child": _detect_single_label_child(items, index),
         }
         # Emit stability marker only when fragile — saves tokens, signals
         # the LLM to prefer `table_candidates` / more precise selectors.
         if stability == "fragile":
             entry_dict["selector_stability"] = "fragile"
         containers.append(entry_dict)
+    return containers
 
-    # Sort by count desc, then depth asc (closer to leaves first on ties).
-    def _sort_key(c: dict[str, object]) -> tuple[int, int]:
-        count = c["count"]
-        depth = c["depth"]
-        assert isinstance(count, int)
-        assert isinstance(depth, int)
-        return (-count, depth)
-
-    containers.sort(key=_sort_key)
-    return containers[:max_containers]
 
-
-def run_discover(html: str) -> DiscoverResult:
+def run_discover(
+    html: str,
+    *,
+    engine: str = DEFAULT_ENGINE,
+    max_containers: int = DISCOVER_TOP_CONTAINERS,
+) -> DiscoverResult:
     """Build a `DiscoverResult` overview for the given HTML.
 
     Single-call replacement for blind selector probing: returns tag/class
@@ -1380,18 +1462,22 @@ def run_discover(html: str) -> DiscoverResult:
     (list-struct candidates) with their common descendants (field hints),
     embedded JSON signals (typed <script>, JS-var assignments, bare JSON
     bodies, JSON-shaped attributes), table candidates with row keys, and
-    a page-level summary.
+    a page-level summary. `engine` names the HTML library that parses the
+    page (see `ssc_codegen.engines`).
     """
-    soup = parse_html(html)
+    dom = get_engine(engine)
+    index = _DomIndex(dom, dom.parse(html))
     tag_stats, class_stats, id_stats, data_attrs, class_count = (
-        _collect_tag_stats(soup)
+        _collect_tag_stats(index)
     )
     # `class_count` is uncapped — used by `_build_short_selector` to detect
     # rare anchor classes (count ≤ RARE_CLASS_MAX) anywhere in the document.
-    repeat_containers = _find_repeat_containers(soup, class_count)
-    json_signals = _find_json_signals(soup)
-    table_candidates = _find_table_candidates(soup, class_count)
-    page_summary = _build_page_summary(soup, repeat_containers, json_signals)
+    repeat_containers = _find_repeat_containers(
+        index, class_count, max_containers=max_containers
+    )
+    json_signals = _find_json_signals(index)
+    table_candidates = _find_table_candidates(index, class_count)
+    page_summary = _build_page_summary(index, repeat_containers, json_signals)
     return DiscoverResult(
         tag_stats=tag_stats,
         class_stats=class_stats,
@@ -1417,7 +1503,7 @@ def _detect_container_kind(snippet: str) -> str:
 
 
 def _find_json_signals(
-    soup: BeautifulSoup,
+    index: _DomIndex,
     *,
     max_scripts: int = DISCOVER_TOP_JSON_SCRIPT,
     max_attrs: int = DISCOVER_TOP_JSON_ATTR,
@@ -1440,16 +1526,13 @@ def _find_json_signals(
     """
     script_signals: list[dict[str, object]] = []
 
-    for script in soup.find_all("script"):
-        body = (script.get_text() or "").strip()
+    for script in index.named("script"):
+        body = index.engine.text(index.nodes[script]).strip()
         if not body:
             continue
 
-        raw_type = script.get("type", "")
-        if isinstance(raw_type, list):
-            script_type = raw_type[0] if raw_type else ""
-        else:
-            script_type = str(raw_type)
+        script_attrs = index.attrs(script)
+        script_type = script_attrs.get("type", "")
 
         signal: dict[str, object] | None = None
         # Substring of `body` that holds the actual JSON payload (for
@@ -1494,9 +1577,9 @@ def _find_json_signals(
         if signal is None:
             continue
 
-        signal["selector"] = compute_css_path(script)
-        sid = script.get("id")
-        if isinstance(sid, str) and sid:
+        signal["selector"] = index.path(script)
+        sid = script_attrs.get("id")
+        if sid:
             signal["script_id"] = sid
         snippet_val = str(signal.get("snippet", ""))
         signal["container_kind"] = _detect_container_kind(snippet_val)
@@ -1510,19 +1593,17 @@ def _find_json_signals(
             break
 
     attr_signals: list[dict[str, object]] = []
-    for tag in soup.find_all(True):
-        for attr_name, raw_val in list(tag.attrs.items()):
+    for pos in range(len(index)):
+        for attr_name, raw_val in index.attrs(pos).items():
             if attr_name in JSON_SKIP_ATTRS:
                 continue
-            if not isinstance(raw_val, str):
-                continue
             v = raw_val.strip()
             if len(v) < 2 or v[0] not in "{[":
                 continue
             attr_signal: dict[str, object] = {
                 "kind": "attr",
                 "subtype": "attr-json",
-                "selector": compute_css_path(tag),
+                "selector": index.path(pos),
                 "attr": attr_name,
                 "container_kind": _detect_container_kind(v),
                 "snippet": v[:snippet_len],
@@ -1538,3 +1619,605 @@ def _find_json_signals(
             break
 
     return script_signals + attr_signals
+
+
+# ─────────────────────────── corpus discover ────────────────────────
+
+# Containers kept per page before merging — deeper than the single-page
+# cut so a container ranked 6th on some pages still counts for them.
+CORPUS_PAGE_CONTAINERS = 20
+CORPUS_TOP_CONTAINERS = 10
+CORPUS_TOP_TABLES = 5
+
+
+@dataclass
+class CorpusDiscoverResult:
+    """`run_discover` merged over many pages of the same site.
+
+    Returned by `run_corpus_discover`. Containers and tables are grouped
+    by selector, so `pages` says how many documents a schema built on
+    that selector would work for, and `count` shows how much the item
+    count moves between pages.
+    """
+
+    pages: int
+    containers: list[dict[str, object]]
+    table_candidates: list[dict[str, object]] = field(default_factory=list)
+    failed: list[dict[str, str]] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        payload: dict[str, object] = {"pages": self.pages}
+        for name in ("containers", "table_candidates", "failed"):
+            value = getattr(self, name)
+            if value:
+                payload[name] = value
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+
+    def to_text(self) -> str:
+        lines: list[str] = [f"# pages: {self.pages}", ""]
+
+        lines.append("== containers ==")
+        for c in self.containers:
+            count = c["count"]
+            assert isinstance(count, dict)
+            lines.append(
+                f"{c['item_selector']}\tpages={c['pages']}/{self.pages}"
+                f"\tcount={count['min']}..{count['max']}"
+                f"\tmean={count['mean']}\tcv={count['cv']}"
+            )
+            alternatives = c.get("item_selectors")
+            if isinstance(alternatives, list):
+                for alt in alternatives[1:]:
+                    lines.append(
+                        f"  also: {alt['selector']}  ({alt['pages']} page(s))"
+                    )
+            fragile = c.get("fragile_pages")
+            if fragile:
+                lines.append(f"  fragile on {fragile} page(s)")
+            descendants = c["common_descendants"]
+            assert isinstance(descendants, list)
+            for d in descendants:
+                assert isinstance(d, dict)
+                d_classes = d["classes"]
+                assert isinstance(d_classes, list)
+                dcls = ".".join(str(x) for x in d_classes) if d_classes else "_"
+                lines.append(f"  - {d['tag']}.{dcls}\tpages={d['pages']}")
+        lines.append("")
+
+        if self.table_candidates:
+            lines.append("== table_candidates ==")
+            for t in self.table_candidates:
+                rows = t["row_count"]
+                assert isinstance(rows, dict)
+                keys = t.get("keys", [])
+                assert isinstance(keys, list)
+                keys_str = ", ".join(str(k) for k in keys) if keys else "(none)"
+                lines.append(
+                    f"{t['selector']}\tpages={t['pages']}/{self.pages}"
+                    f"\trows={rows['min']}..{rows['max']}"
+                )
+                lines.append(f"  keys: {keys_str}")
+            lines.append("")
+
+        if self.failed:
+            lines.append("== failed ==")
+            for f in self.failed:
+                lines.append(f"{f['file']}\t{f['error']}")
+            lines.append("")
+
+        return "\n".join(lines).rstrip()
+
+
+def _discover_file(
+    path: str, engine: str
+) -> tuple[str, DiscoverResult | None, str]:
+    """Process-pool entry point: discover one file, (path, result, error)."""
+    try:
+        html = Path(path).read_text(encoding="utf-8")
+        result = run_discover(
+            html, engine=engine, max_containers=CORPUS_PAGE_CONTAINERS
+        )
+    except Exception as exc:  # noqa: BLE001 - reported per page
+        return path, None, f"{type(exc).__name__}: {exc}"
+    return path, result, ""
+
+
+def _count_stats(values: list[int]) -> dict[str, object]:
+    """min/max/mean/stdev of per-page counts, plus `cv` = stdev / mean.
+
+    `cv` (coefficient of variation) compares spread across containers of
+    different sizes: 0 means the count is the same on every page.
+    """
+    mean = statistics.fmean(values)
+    stdev = statistics.pstdev(values)
+    return {
+        "min": min(values),
+        "max": max(values),
+        "mean": round(mean, 2),
+        "stdev": round(stdev, 2),
+        "cv": round(stdev / mean, 3) if mean else 0.0,
+    }
+
+
+_NTH_OF_TYPE_RE = re.compile(r":nth-of-type\(\d+\)")
+# (item tag, item classes, parent path without :nth-of-type)
+_ContainerKey = tuple[str, tuple[str, ...], str]
+
+
+def _merge_containers(
+    results: list[DiscoverResult], max_n: int
+) -> list[dict[str, object]]:
+    """Group containers of all pages and rank them by stability.
+
+    A container is identified by its item tag, item classes and parent
+    path without `:nth-of-type` — the same list keeps its identity when
+    sibling counts move it around, or when its short `item_selector`
+    changes because a class stops being rare on a bigger page. The
+    selectors seen for it are reported with their page counts.
+    """
+    counts: dict[_ContainerKey, list[int]] = {}
+    selectors: dict[_ContainerKey, dict[str, int]] = {}
+    fragile: dict[_ContainerKey, int] = {}
+    descendants: dict[
+        _ContainerKey, dict[tuple[str, tuple[str, ...]], int]
+    ] = {}
+    for result in results:
+        page_counts: dict[_ContainerKey, int] = {}
+        page_selectors: dict[_ContainerKey, set[str]] = {}
+        page_fragile: set[_ContainerKey] = set()
+        page_descendants: dict[
+            _ContainerKey, set[tuple[str, tuple[str, ...]]]
+        ] = {}
+        for c in result.repeat_containers:
+            item_classes = c["item_classes"]
+            count = c["count"]
+            common = c["common_descendants"]
+            assert isinstance(item_classes, list) and isinstance(count, int)
+            assert isinstance(common, list)
+            key = (
+                str(c["item_tag"]),
+                tuple(item_classes),
+                _NTH_OF_TYPE_RE.sub("", str(c["parent_selector"])),
+            )
+            page_counts[key] = page_counts.get(key, 0) + count
+            page_selectors.setdefault(key, set()).add(str(c["item_selector"]))
+            if c.get("selector_stability") == "fragile":
+                page_fragile.add(key)
+            sigs = page_descendants.setdefault(key, set())
+            for d in common:
+                sigs.add((d["tag"], tuple(d["classes"])))
+        for key, count in page_counts.items():
+            counts.setdefault(key, []).append(count)
+            seen = selectors.setdefault(key, {})
+            for selector in page_selectors[key]:
+                seen[selector] = seen.get(selector, 0) + 1
+        for key in page_fragile:
+            fragile[key] = fragile.get(key, 0) + 1
+        for key, sigs in page_descendants.items():
+            per_sig = descendants.setdefault(key, {})
+            for sig in sigs:
+                per_sig[sig] = per_sig.get(sig, 0) + 1
+
+    total = len(results)
+    merged: list[dict[str, object]] = []
+    for key, values in counts.items():
+        item_tag, item_classes, parent_path = key
+        seen_selectors = sorted(
+            selectors[key].items(), key=lambda kv: (-kv[1], kv[0])
+        )
+        common = sorted(
+            descendants[key].items(), key=lambda kv: (-kv[1], kv[0])
+        )[:DISCOVER_TOP_DESCENDANTS]
+        entry: dict[str, object] = {
+            "item_selector": seen_selectors[0][0],
+            "selector_pages": seen_selectors[0][1],
+            "item_tag": item_tag,
+            "item_classes": list(item_classes),
+            "parent_path": parent_path,
+            "pages": len(values),
+            "page_ratio": round(len(values) / total, 3),
+            "count": _count_stats(values),
+            "common_descendants": [
+                {"tag": tag, "classes": list(classes), "pages": pages}
+                for (tag, classes), pages in common
+            ],
+        }
+        if len(seen_selectors) > 1:
+            entry["item_selectors"] = [
+                {"selector": selector, "pages": pages}
+                for selector, pages in seen_selectors
+            ]
+        if fragile.get(key):
+            entry["fragile_pages"] = fragile[key]
+        merged.append(entry)
+
+    # Stability ranking: pages covered first, then how many of them agree
+    # on one item_selector, then the steadiest count (lowest cv), then
+    # the fewest fragile pages, then the larger lists.
+    def _rank(
+        entry: dict[str, object],
+    ) -> tuple[int, int, float, int, float, str]:
+        pages = entry["pages"]
+        selector_pages = entry["selector_pages"]
+        stats = entry["count"]
+        fragile_pages = entry.get("fragile_pages", 0)
+        assert isinstance(pages, int) and isinstance(selector_pages, int)
+        assert isinstance(stats, dict) and isinstance(fragile_pages, int)
+        return (
+            -pages,
+            -selector_pages,
+            stats["cv"],
+            fragile_pages,
+            -stats["mean"],
+            str(entry["item_selector"]),
+        )
+
+    merged.sort(key=_rank)
+    return merged[:max_n]
+
+
+def _merge_tables(
+    results: list[DiscoverResult], max_n: int
+) -> list[dict[str, object]]:
+    rows: dict[str, list[int]] = {}
+    keys: dict[str, list[str]] = {}
+    for result in results:
+        for t in result.table_candidates:
+            selector = str(t["selector"])
+            row_count = t["row_count"]
+            assert isinstance(row_count, int)
+            rows.setdefault(selector, []).append(row_count)
+            page_keys = t["keys"]
+            assert isinstance(page_keys, list)
+            # Keys shared by every page, in first-page order.
+            if selector in keys:
+                keys[selector] = [k for k in keys[selector] if k in page_keys]
+            else:
+                keys[selector] = list(page_keys)
+    ranked = sorted(rows.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+    return [
+        {
+            "selector": selector,
+            "pages": len(values),
+            "row_count": _count_stats(values),
+            "keys": keys[selector],
+        }
+        for selector, values in ranked[:max_n]
+    ]
+
+
+def run_corpus_discover(
+    paths: list[str],
+    *,
+    jobs: int = 1,
+    engine: str = DEFAULT_ENGINE,
+    max_containers: int = CORPUS_TOP_CONTAINERS,
+    max_tables: int = CORPUS_TOP_TABLES,
+) -> CorpusDiscoverResult:
+    """Discover every page in `paths` and merge the results.
+
+    Pages are analysed in a process pool when `jobs` != 1 (0 = one
+    worker per CPU) and merged in `paths` order, so the result does not
+    depend on `jobs`. Unreadable pages are listed in `failed` and left
+    out of the statistics. Raises EngineError before any work starts if
+    `engine` is unknown or not installed.
+    """
+    get_engine(engine)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(paths))
+    engines = [engine] * len(paths)
+    if jobs <= 1:
+        outcomes = list(map(_discover_file, paths, engines))
+    else:
+        chunksize = max(1, len(paths) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(
+                pool.map(_discover_file, paths, engines, chunksize=chunksize)
+            )
+
+    results = [result for _, result, _ in outcomes if result is not None]
+    failed = [
+        {"file": path, "error": error}
+        for path, result, error in outcomes
+        if result is None
+    ]
+    return CorpusDiscoverResult(
+        pages=len(results),
+        containers=_merge_containers(results, max_containers),
+        table_candidates=_merge_tables(results, max_tables),
+        failed=failed,
+    )
+
+
+# ─────────────────────────── streaming mode ─────────────────────────
+
+# Characters fed to the pull parser per step when reading a file.
+STREAM_CHUNK_SIZE = 1 << 16
+# Stand-in for documents without elements, as in the lxml engine.
+_STREAM_EMPTY_HTML = "<html><body></body></html>"
+
+
+def _stream_events(chunks: Iterable[str]) -> Iterator[tuple[str, Any]]:
+    """(event, element) pairs of lxml's HTML pull parser over `chunks`.
+
+    The tree is the one `lxml.html` builds for the whole text, so the
+    events agree with the `lxml` engine's in-memory tree.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end"), huge_tree=True)
+    empty = True
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event in parser.read_events():
+            empty = False
+            yield event
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:  # no markup at all
+        pass
+    for event in parser.read_events():
+        empty = False
+        yield event
+    if empty:
+        yield from _stream_events([_STREAM_EMPTY_HTML])
+
+
+def _drop_before(parent: Any, child: Any, tails: list[str]) -> None:
+    """Delete `parent`'s finished children in front of `child`.
+
+    Their tails are parent's own text, so they are moved to `tails`
+    first — `child` has started, so every tail before it is complete.
+    """
+    while len(parent) and parent[0] is not child:
+        tail = parent[0].tail
+        if tail:
+            tails.append(tail)
+        del parent[0]
+
+
+class _StreamNode:
+    """`compute_css_path` facts of a streamed element.
+
+    Whether a tag has same-tag siblings is known only when its parent
+    ends, so results keep their node and build the path at the end.
+    """
+
+    __slots__ = ("classes", "counts", "index", "name", "parent")
+
+    def __init__(
+        self,
+        name: str,
+        classes: list[str],
+        index: int,
+        parent: _StreamNode | None,
+    ) -> None:
+        self.name = name
+        self.classes = classes
+        self.index = index
+        self.parent = parent
+        # Child tag name → number of children with that name.
+        self.counts: dict[str, int] = {}
+
+    def path(self) -> str:
+        parts: list[str] = []
+        node = self
+        while node.parent is not None:
+            has_sibling = node.parent.counts[node.name] > 1
+            parts.append(
+                _path_segment(node.name, node.classes, node.index, has_sibling)
+            )
+            node = node.parent
+        parts.reverse()
+        return " > ".join(parts)
+
+
+@dataclass
+class _StreamFrame:
+    """An open element of the streamed document."""
+
+    element: Any
+    node: _StreamNode
+    seq: int
+    # Tag and attribute filters passed (checked at the start tag).
+    passed: bool
+    candidate: bool
+    # Open elements (this one included) whose `text` field receives the
+    # text nodes of this element; text inside NON_TEXT_TAGS only counts
+    # for the NON_TEXT_TAGS element itself, as in `DomEngine.text`.
+    sinks: list[_StreamFrame]
+    text_hit: bool = False
+    text_started: bool = False
+    # `text` field prefix, capped at `snippet + 1` characters.
+    text: list[str] = field(default_factory=list)
+    text_len: int = 0
+
+
+def run_scout_stream(
+    chunks: Iterable[str],
+    filters: ScoutFilters,
+    fields: list[str],
+    *,
+    invert: bool = False,
+    limit: int = DEFAULT_LIMIT,
+    offset: int = 0,
+    snippet: int = DEFAULT_SNIPPET,
+) -> ScoutResult:
+    """`run_scout` over HTML text chunks with bounded memory.
+
+    Parses incrementally with lxml and drops every finished subtree:
+    `--text` is checked one text node at a time and the `text` field is
+    collected as a `snippet`-long prefix, so memory follows the document
+    depth and the result window (`offset + limit` matches), not the
+    document size. `limit <= 0` or `snippet <= 0` lift those bounds.
+
+    Results equal `run_scout(..., engine="lxml")` for the `--tag`,
+    `--attr` and `--text` filters and `invert`. CSS scoping, navigation
+    and the `html` field need the whole tree and raise FilterError.
+    """
+    if filters.css is not None:
+        raise FilterError("--css is not supported in stream mode")
+    keys = [raw.strip() for raw in fields]
+    if "html" in keys:
+        raise FilterError("the html field is not supported in stream mode")
+    lazy = {"index", "path", "text"}
+    eager = [key for key in keys if key not in lazy]
+    wanted = offset + limit if limit > 0 else None
+    wants_text = "text" in keys
+    text_cap = snippet + 1 if snippet > 0 else None
+    lxml_engine = get_engine("lxml")
+    pattern = filters.text_regex
+
+    def add_text(frame: _StreamFrame, piece: str) -> None:
+        # `piece` is a text node directly inside `frame.element`.
+        if pattern is not None and not frame.text_hit and frame.passed:
+            frame.text_hit = pattern.search(piece) is not None
+        for sink in frame.sinks:
+            if text_cap is None or sink.text_len < text_cap:
+                sink.text.append(piece)
+                sink.text_len += len(piece)
+
+    def start_text(frame: _StreamFrame) -> None:
+        # Element text precedes its first child; emit it exactly once.
+        if not frame.text_started:
+            frame.text_started = True
+            if frame.element.text:
+                add_text(frame, frame.element.text)
+
+    document = _StreamNode("", [], 0, None)
+    stack: list[_StreamFrame] = []
+    # Max-heap on start order: the `wanted` earliest matches so far.
+    kept: list[tuple[int, _StreamNode, dict[str, object]]] = []
+    tails: list[str] = []
+    matched = 0
+    seq = 0
+    for event, element in _stream_events(chunks):
+        if event == "start":
+            parent = stack[-1] if stack else None
+            if parent is not None:
+                start_text(parent)
+                _drop_before(parent.element, element, tails)
+                for tail in tails:
+                    add_text(parent, tail)
+                tails.clear()
+            parent_node = parent.node if parent is not None else document
+            name = element.tag
+            attrs = dict(element.attrib)
+            index = parent_node.counts.get(name, 0) + 1
+            parent_node.counts[name] = index
+            passed = (filters.tag is None or name == filters.tag) and all(
+                _matches_attr(attrs, flt) for flt in filters.attrs
+            )
+            candidate = (passed or invert) and (
+                wanted is None or len(kept) < wanted
+            )
+            sinks = (
+                parent.sinks
+                if parent is not None and name not in NON_TEXT_TAGS
+                else []
+            )
+            frame = _StreamFrame(
+                element=element,
+                node=_StreamNode(
+                    name, attrs.get("class", "").split(), index, parent_node
+                ),
+                seq=seq,
+                passed=passed,
+                candidate=candidate,
+                sinks=sinks,
+            )
+            if candidate and wants_text:
+                frame.sinks = [*sinks, frame]
+            stack.append(frame)
+            seq += 1
+            continue
+
+        frame = stack.pop()
+        start_text(frame)
+        for child in element:
+            if child.tail:
+                add_text(frame, child.tail)
+        del element[:]
+        hit = frame.passed and (pattern is None or frame.text_hit)
+        if hit == invert:
+            continue
+        matched += 1
+        if frame.candidate and (
+            wanted is None or len(kept) < wanted or frame.seq < -kept[0][0]
+        ):
+            values = extract_fields(
+                element, eager, 0, snippet, engine=lxml_engine
+            )
+            if wants_text:
+                values["text"] = _truncate("".join(frame.text), snippet)
+            heapq.heappush(kept, (-frame.seq, frame.node, values))
+            if wanted is not None and len(kept) > wanted:
+                heapq.heappop(kept)
+
+    ordered = sorted(kept, key=lambda entry: -entry[0])[offset:]
+    results: list[dict[str, object]] = []
+    for i, (_, node, values) in enumerate(ordered):
+        out: dict[str, object] = {}
+        for key in keys:
+            if key == "index":
+                out[key] = i
+            elif key == "path":
+                out[key] = node.path()
+            else:
+                out[key] = values[key]
+        results.append(out)
+    return ScoutResult(
+        matched=matched,
+        returned=len(results),
+        limit=limit,
+        offset=offset,
+        truncated=offset + limit < matched,
+        results=results,
+    )
+
+
+def run_discover_stream(chunks: Iterable[str]) -> DiscoverResult:
+    """Tag, class, id and data-* statistics of `run_discover`, streamed.
+
+    Counts every start tag and drops finished subtrees right away, so
+    memory follows the document depth, not its size. Sections that need
+    the tree (containers, JSON signals, tables) are left empty.
+    """
+    tag_counts: dict[str, int] = {}
+    class_counts: dict[str, int] = {}
+    id_counts: dict[str, int] = {}
+    data_attrs: set[str] = set()
+    stack: list[Any] = []
+    discard: list[str] = []
+    for event, element in _stream_events(chunks):
+        if event == "end":
+            stack.pop()
+            del element[:]
+            continue
+        if stack:
+            _drop_before(stack[-1], element, discard)
+            discard.clear()
+        stack.append(element)
+        name = element.tag
+        tag_counts[name] = tag_counts.get(name, 0) + 1
+        attrs = element.attrib
+        for cls in attrs.get("class", "").split():
+            class_counts[cls] = class_counts.get(cls, 0) + 1
+        id_val = attrs.get("id")
+        if id_val:
+            id_counts[id_val] = id_counts.get(id_val, 0) + 1
+        for attr_name in attrs:
+            if attr_name.startswith("data-"):
+                data_attrs.add(attr_name)
+
+    tag_stats, class_stats, id_stats, data_list, _ = _rank_tag_stats(
+        tag_counts, class_counts, id_counts, data_attrs
+    )
+    return DiscoverResult(
+        tag_stats=tag_stats,
+        class_stats=class_stats,
+        id_stats=id_stats,
+        data_attrs=data_list,
+        repeat_containers=[],
+        json_signals=[],
+        page_summary={},
+    )
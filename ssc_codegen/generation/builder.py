@@ -17,6 +17,7 @@ class ModuleBuilder:
         self._imports: dict[str, None] = {}
         self._std_defs: dict[str, tuple[list[str], str]] = {}
         self._std_imports: dict[str, None] = {}
+        self._consts: dict[str, str] = {}
 
     # === registration (idempotent) ===
 
@@ -44,11 +45,23 @@ class ModuleBuilder:
         for imp in imps:
             self._std_imports.setdefault(imp, None)
 
+    def require_const(self, name: str, *, code: str) -> str:
+        """Register a module-level constant definition (idempotent by ``name``).
+
+        Used for values hoisted out of generated methods (precompiled
+        regexes, selectors) so they are built once per module instead of
+        on every call. ``code`` is the full definition line in the target
+        language. Returns ``name`` for convenient inline use.
+        """
+        self._consts.setdefault(name, code)
+        return name
+
     def reset(self) -> None:
         """Clear all accumulated state."""
         self._imports.clear()
         self._std_defs.clear()
         self._std_imports.clear()
+        self._consts.clear()
 
     # === queries ===
 
@@ -71,3 +84,11 @@ class ModuleBuilder:
     @property
     def has_std(self) -> bool:
         return bool(self._std_defs)
+
+    @property
+    def consts(self) -> dict[str, str]:
+        return dict(self._consts)
+
+    @property
+    def has_consts(self) -> bool:
+        return bool(self._consts)
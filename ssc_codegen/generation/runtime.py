@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
+from typing import Any, NamedTuple
 
 import ssc_codegen.ast as a
 
 from ssc_codegen.targets.python.http_libs.base import HttpLibStrategy
 from ssc_codegen.targets.python.http_libs.httpx import HttpxStrategy
-from ssc_codegen.traversal.utils import module_has_rest
+from ssc_codegen.targets.python.regex import re_const_line
+from ssc_codegen.traversal.utils import collect_regex_patterns, module_has_rest
 
 _BASE_UTILITY_LINES: list[str] = [
     "_RE_HEX_ENTITY = re.compile(r'&#x([0-9a-fA-F]+);')",
@@ -27,8 +28,8 @@ _BASE_UTILITY_LINES: list[str] = [
     "    if not cond:",
     "        raise SscAssertionError(msg or 'ssc-gen assertion failed')",
     "",
-    "def std_re_search(pattern: str, value: str, msg: str = '') -> str:",
-    "    m = re.search(pattern, value)",
+    "def std_re_search(pattern: 're.Pattern[str]', value: str, msg: str = '') -> str:",
+    "    m = pattern.search(value)",
     "    if m is None:",
     "        raise SscRegexError(msg or 'ssc-gen re-match failed')",
     "    return m[1]",
@@ -72,10 +73,41 @@ _BASE_UTILITY_LINES: list[str] = [
 ]
 
 
+class RuntimeNeeds(NamedTuple):
+    """What the shared runtime file needs from one parser module.
+
+    A JSON-friendly summary, so cached ``generate`` results can rebuild
+    the runtime file without the module AST.
+    """
+
+    has_rest: bool
+    regex_patterns: list[str]
+
+
+def runtime_needs(module: a.Module) -> RuntimeNeeds:
+    """Summarize ``module`` for :func:`register_runtime_file`'s generator."""
+    return RuntimeNeeds(module_has_rest(module), collect_regex_patterns(module))
+
+
+def _regex_const_lines(needs: list[RuntimeNeeds]) -> list[str]:
+    """Precompiled regex constants for every pattern used by ``needs``."""
+    patterns: dict[str, None] = {}
+    for entry in needs:
+        for pattern in entry.regex_patterns:
+            patterns.setdefault(pattern, None)
+    if not patterns:
+        return []
+    lines = ["# precompiled regex patterns shared by parser modules"]
+    lines.extend(re_const_line(p) for p in patterns)
+    lines.append("")
+    return lines
+
+
 def runtime_module_content(
     module: a.Module,
     *,
     http_strategy: HttpLibStrategy | None = None,
+    modules: list[a.Module] | None = None,
 ) -> str:
     """Return the full source text of the separate runtime module file.
 
@@ -86,7 +118,24 @@ def runtime_module_content(
     both the import line and the REST runtime source (Ok/Err/ssc_rest_call
     etc.) — single source of truth, no drift between parser and runtime.
     Defaults to ``HttpxStrategy`` when not provided.
+
+    ``modules`` is the full set of modules sharing this runtime (defaults to
+    ``[module]``); every regex pattern they use is emitted as a precompiled
+    ``RE_*`` constant that the parser files import.
     """
+    return _runtime_content(
+        [runtime_needs(m) for m in modules or [module]],
+        has_rest=module_has_rest(module),
+        http_strategy=http_strategy,
+    )
+
+
+def _runtime_content(
+    needs: list[RuntimeNeeds],
+    *,
+    has_rest: bool,
+    http_strategy: HttpLibStrategy | None,
+) -> str:
     strategy = http_strategy or HttpxStrategy()
     lines: list[str] = [
         "# autogenerated runtime helpers — do not edit",
@@ -96,7 +145,6 @@ def runtime_module_content(
         "from typing import Any, Callable, Dict, Generic, List, Literal, Mapping, Optional, TypeVar, Union",
         "from html import unescape as ssc_html_unescape",
     ]
-    has_rest = module_has_rest(module)
     if has_rest:
         lines.extend(
             [
@@ -108,6 +156,7 @@ def runtime_module_content(
     lines.append("")
     lines.extend(_BASE_UTILITY_LINES)
     lines.append("")
+    lines.extend(_regex_const_lines(needs))
     if has_rest:
         lines.extend(strategy.rest_runtime_lines())
     return "\n".join(lines)
@@ -119,7 +168,7 @@ def register_runtime_file(
     *,
     include_fallback: bool = False,
     http_strategy: HttpLibStrategy | None = None,
-) -> Callable[[list[a.Module]], str]:
+) -> Callable[[list[RuntimeNeeds]], str]:
     """Register a runtime module file provider on the converter.
 
     ``http_strategy`` is the canonical source for both the transport import
@@ -149,13 +198,13 @@ def register_runtime_file(
             )
         )
 
-    def _generate_runtime(modules: list[a.Module]) -> str:
-        ref = next(
-            (m for m in modules if module_has_rest(m)),
-            modules[0],
-        )
+    def _generate_runtime(needs: list[RuntimeNeeds]) -> str:
         return _apply_fallback(
-            runtime_module_content(ref, http_strategy=http_strategy)
+            _runtime_content(
+                needs,
+                has_rest=any(entry.has_rest for entry in needs),
+                http_strategy=http_strategy,
+            )
         )
 
     return _generate_runtime
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Any, Literal
 
 from ssc_codegen.ast import (
     CssSelect,
@@ -30,6 +30,12 @@ from ssc_codegen.ast import (
     Module,
 )
 from ssc_codegen.ast.base import Node as AstNode
+from ssc_codegen.engines import (
+    DEFAULT_ENGINE,
+    DomEngine,
+    EngineError,
+    get_engine,
+)
 
 
 # selector types that expect exactly one match (or non-None)
@@ -252,18 +258,43 @@ def _selector_type_name(node: AstNode) -> str:
     return type_names.get(type(node), "unknown")
 
 
-def _check_css(html_soup, query: str) -> int:
+class _Page:
+    """The checked HTML, parsed once and shared by every struct.
+
+    CSS runs on the selected engine. XPath runs on it too when the
+    engine supports XPath; otherwise the page is parsed with lxml the
+    first time an XPath selector shows up.
+    """
+
+    def __init__(self, html: str, engine: DomEngine) -> None:
+        self.html = html
+        self.engine = engine
+        self.document = engine.parse(html)
+        self._xpath: tuple[DomEngine, Any] | None = None
+
+    def xpath_target(self) -> tuple[DomEngine, Any]:
+        """(engine, document) pair for XPath; raises EngineError."""
+        if self._xpath is None:
+            if self.engine.supports_xpath:
+                self._xpath = (self.engine, self.document)
+            else:
+                lxml_engine = get_engine("lxml")
+                self._xpath = (lxml_engine, lxml_engine.parse(self.html))
+        return self._xpath
+
+
+def _check_css(engine: DomEngine, document: Any, query: str) -> int:
     """Run CSS selector and return match count."""
     try:
-        return len(html_soup.select(query))
+        return len(engine.select(document, query))
     except Exception:
         return -1
 
 
-def _check_xpath(html_tree, query: str) -> int:
+def _check_xpath(engine: DomEngine, document: Any, query: str) -> int:
     """Run XPath selector and return match count."""
     try:
-        result = html_tree.xpath(query)
+        result = engine.xpath(document, query)
         if isinstance(result, list):
             return len(result)
         return 1 if result else 0
@@ -272,11 +303,18 @@ def _check_xpath(html_tree, query: str) -> int:
 
 
 def check_struct_health(
-    struct: StructBase, html: str, module: Module | None = None
+    struct: StructBase,
+    html: str,
+    module: Module | None = None,
+    *,
+    engine: str = DEFAULT_ENGINE,
 ) -> HealthResult:
-    """Check all selectors in a struct (and nested structs) against HTML."""
-    from bs4 import BeautifulSoup
+    """Check all selectors in a struct (and nested structs) against HTML.
 
+    `engine` names the HTML library that runs the selectors (see
+    `ssc_codegen.engines`); raises EngineError when it is unknown or not
+    installed.
+    """
     # build struct lookup from module
     struct_map: dict[str, StructBase] = {}
     if module is not None:
@@ -284,7 +322,7 @@ def check_struct_health(
             s.name: s for s in module.body if isinstance(s, StructBase)
         }
 
-    soup = BeautifulSoup(html, "lxml")
+    page = _Page(html, get_engine(engine))
     result = HealthResult(struct_name=struct.name)
 
     # RAW structs have no HTML selectors — skip health-check entirely.
@@ -304,7 +342,7 @@ def check_struct_health(
     # collect selectors + nested refs, then recurse into nested structs
     visited: set[str] = set()
     _check_struct_recursive(
-        struct, struct.name, soup, html, struct_map, result, visited
+        struct, struct.name, page, struct_map, result, visited
     )
 
     return result
@@ -313,8 +351,7 @@ def check_struct_health(
 def _check_struct_recursive(
     struct: StructBase,
     path_prefix: str,
-    soup,
-    html: str,
+    page: _Page,
     struct_map: dict[str, StructBase],
     result: HealthResult,
     visited: set[str],
@@ -326,17 +363,6 @@ def _check_struct_recursive(
 
     selectors, nested_refs = _collect_selectors(struct, path_prefix)
 
-    # check if we need lxml for xpath
-    has_xpath = any(isinstance(info.node, _XPATH_TYPES) for info in selectors)
-    lxml_tree = None
-    if has_xpath:
-        try:
-            from lxml import etree
-
-            lxml_tree = etree.HTML(html)
-        except ImportError:
-            pass
-
     for info in selectors:
         sel_node = info.node
         queries = getattr(sel_node, "queries", [])
@@ -350,13 +376,15 @@ def _check_struct_recursive(
                 count = 0
                 report_query = " || ".join(queries)
                 for query in queries:
-                    count = _check_css(soup, query)
+                    count = _check_css(page.engine, page.document, query)
                     if count == -1 or count > 0:
                         break
             else:
-                count = _check_css(soup, query)
+                count = _check_css(page.engine, page.document, query)
         elif isinstance(sel_node, _XPATH_TYPES):
-            if lxml_tree is None:
+            try:
+                xpath_engine, xpath_document = page.xpath_target()
+            except EngineError:
                 result.checks.append(
                     SelectorCheck(
                         path=info.path,
@@ -372,11 +400,11 @@ def _check_struct_recursive(
                 count = 0
                 report_query = " || ".join(queries)
                 for query in queries:
-                    count = _check_xpath(lxml_tree, query)
+                    count = _check_xpath(xpath_engine, xpath_document, query)
                     if count == -1 or count > 0:
                         break
             else:
-                count = _check_xpath(lxml_tree, query)
+                count = _check_xpath(xpath_engine, xpath_document, query)
         else:
             continue
 
@@ -440,5 +468,5 @@ def _check_struct_recursive(
             continue
         nested_path = f"{ref.path}[{ref.struct_name}]"
         _check_struct_recursive(
-            nested_struct, nested_path, soup, html, struct_map, result, visited
+            nested_struct, nested_path, page, struct_map, result, visited
         )
@@ -3,15 +3,25 @@
 from __future__ import annotations
 
 import enum
+import functools
+import json
 import keyword
+import os
+import time
 import traceback
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Annotated, List, Literal, Optional
+from typing import TYPE_CHECKING, Annotated, Any, List, Literal, Optional
 
 import typer
 
 from ssc_codegen._logging import logger, setup_debug_logging
+from ssc_codegen.cache import DEFAULT_CACHE_DIR, GenerateCache, ParserCache
 from ssc_codegen.core import parse_module, format_diagnostics, ReadDiagnostic
+from ssc_codegen.core.format import diagnostic_from_dict, diagnostic_to_dict
+from ssc_codegen.core.module_handler import ImportCache
 from ssc_codegen.exceptions import BuildTimeError
 from kdlquery import Severity
 from kdlquery.types import Position, Span
@@ -19,6 +29,9 @@ from ssc_codegen.targets.resolver import ResolutionError, resolve
 from ssc_codegen.targets.spec import TargetSpec
 from ssc_codegen.targets.profile import TargetProfile
 
+if TYPE_CHECKING:
+    from ssc_codegen.generation.runtime import RuntimeNeeds
+
 
 app = typer.Typer(
     no_args_is_help=True,
@@ -45,6 +58,19 @@ class FmtType(str, enum.Enum):
     JSON = "json"
 
 
+class Engine(str, enum.Enum):
+    """HTML library behind `scout` and `health` (see ssc_codegen.engines)."""
+
+    BS4 = "bs4"
+    LXML = "lxml"
+    SLAX = "slax"
+
+
+_HTML_SUFFIXES = (".html", ".htm")
+# Upper bound on documents per ``run --jobs`` task.
+_RUN_CHUNK_SIZE = 64
+
+
 def _dedupe_paths(paths: list[Path]) -> list[Path]:
     seen: set[str] = set()
     result: list[Path] = []
@@ -57,6 +83,54 @@ def _dedupe_paths(paths: list[Path]) -> list[Path]:
     return result
 
 
+def _collect_kdl_files(files: list[Path], *, warn: bool = True) -> list[Path]:
+    """Expand directories to their ``*.kdl`` files (sorted), deduplicated."""
+    kdl_files: list[Path] = []
+    for path in files:
+        if path.is_dir():
+            found = sorted(path.rglob("*.kdl"))
+            logger.debug(
+                "  directory %s: found %d .kdl file(s)", path, len(found)
+            )
+            kdl_files.extend(found)
+        elif path.is_file():
+            kdl_files.append(path)
+        elif warn:
+            typer.echo(
+                f"  WARNING: {path} is neither a file nor a directory, skipping",
+                err=True,
+            )
+    return _dedupe_paths(kdl_files)
+
+
+def _watch_and_rebuild(
+    files: list[Path], rebuild: Callable[[list[Path]], None]
+) -> None:
+    """Call ``rebuild(affected_schemas)`` on every change until Ctrl+C.
+
+    Runs in the same process, so imports, the in-memory generation cache
+    and memoized selector validation stay warm between rebuilds.
+    """
+    from ssc_codegen.watch import Watcher
+
+    watcher = Watcher(lambda: _collect_kdl_files(files, warn=False))
+    typer.echo("Watching for changes (Ctrl+C to stop)...", err=True)
+    try:
+        while True:
+            affected = watcher.wait()
+            typer.echo(
+                f"\n{len(affected)} schema(s) affected: "
+                + ", ".join(str(f) for f in affected),
+                err=True,
+            )
+            try:
+                rebuild(affected)
+            except typer.Exit:
+                pass
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.", err=True)
+
+
 def _plan_output_files(
     profile: TargetProfile,
     kdl_files: list[Path],
@@ -64,6 +138,7 @@ def _plan_output_files(
     *,
     separate_runtime: bool,
     runtime_name: str | None,
+    go_bench: bool = False,
 ) -> dict[Path, Path]:
     planned: dict[Path, Path] = {}
     owners: dict[str, Path | str] = {}
@@ -89,6 +164,8 @@ def _plan_output_files(
         register("Python runtime", output / f"{name}.py")
     if profile.language == "go":
         register("Go runtime", output / "sscgen_runtime.go")
+        if go_bench:
+            register("Go benchmark", output / "sscgen_bench_test.go")
     return planned
 
 
@@ -103,11 +180,251 @@ def _exception_diagnostic(path: Path, exc: Exception) -> ReadDiagnostic:
     )
 
 
+# Parsed + linted import files shared by every schema this process compiles
+# (including each --jobs worker and every --watch rebuild). Entries are
+# validated against the file text, so reuse is always safe.
+_IMPORT_CACHE = ImportCache()
+
+
+def _report_once(
+    diagnostics: list[ReadDiagnostic], kdl_file: Path, reported: set[tuple]
+) -> list[ReadDiagnostic]:
+    """Drop diagnostics of imported files already reported for a schema.
+
+    Every importer carries its imports' diagnostics (an import error must
+    still fail each importer), but a shared file is reported only once.
+    """
+    unique: list[ReadDiagnostic] = []
+    for d in diagnostics:
+        if d.path and d.path != str(kdl_file):
+            key = (d.path, d.span.start.offset, d.code, d.message)
+            if key in reported:
+                continue
+            reported.add(key)
+        unique.append(d)
+    return unique
+
+
+@dataclass
+class _CompiledFile:
+    """Outcome of parsing, linting and converting one .kdl file.
+
+    Picklable, so ``--jobs`` workers can ship it back to the parent, which
+    reports results and writes files in input order.
+    """
+
+    path: Path
+    diagnostics: list[ReadDiagnostic] = field(default_factory=list)
+    lint_failed: bool = False
+    runtime_needs: RuntimeNeeds | None = None
+    code: str | None = None
+    parse_error: str | None = None
+    convert_error: str | None = None
+    trace: str = ""
+    runtime_state: Any = None
+
+    def to_cache(self) -> dict[str, Any]:
+        """JSON value for ``GenerateCache``; ``code`` goes in as plain text."""
+        return {
+            "source": self.code,
+            "diagnostics": [diagnostic_to_dict(d) for d in self.diagnostics],
+            "lint_failed": self.lint_failed,
+            "runtime_needs": self.runtime_needs,
+            "runtime_state": self.runtime_state,
+        }
+
+    @classmethod
+    def from_cache(cls, path: Path, value: dict[str, Any]) -> _CompiledFile:
+        from ssc_codegen.generation.runtime import RuntimeNeeds
+
+        needs = value["runtime_needs"]
+        return cls(
+            path=path,
+            diagnostics=[diagnostic_from_dict(d) for d in value["diagnostics"]],
+            lint_failed=value["lint_failed"],
+            runtime_needs=RuntimeNeeds(*needs) if needs is not None else None,
+            code=value.get("source"),
+            runtime_state=value["runtime_state"],
+        )
+
+
+def _compile_file(
+    create_converter: Callable[[], Any],
+    kdl_file: Path,
+    meta: dict,
+    *,
+    skip_lint: bool,
+    keep_runtime: bool,
+) -> _CompiledFile:
+    """Parse, lint and convert ``kdl_file`` with a fresh converter.
+
+    A fresh converter keeps per-file Go runtime state separable, so it can
+    be cached and merged into the parent visitor in input order.
+    """
+    result = _CompiledFile(path=kdl_file)
+    try:
+        ast, err = parse_module(
+            kdl_file.read_text(encoding="utf-8"),
+            source_path=kdl_file,
+            import_cache=_IMPORT_CACHE,
+        )
+    except Exception as exc:
+        result.parse_error = str(exc)
+        result.trace = traceback.format_exc()
+        return result
+    if not skip_lint:
+        result.diagnostics = list(err)
+        if any(d.severity == Severity.ERROR for d in err):
+            result.lint_failed = True
+            return result
+    if keep_runtime:
+        from ssc_codegen.generation.runtime import runtime_needs
+
+        result.runtime_needs = runtime_needs(ast)
+    converter = create_converter()
+    try:
+        result.code = converter.convert(ast, **meta)
+    except Exception as exc:
+        result.convert_error = str(exc)
+        result.trace = traceback.format_exc()
+        return result
+    if hasattr(converter, "runtime_state"):
+        result.runtime_state = converter.runtime_state()
+    return result
+
+
+def _compile_file_worker(
+    spec: TargetSpec,
+    kdl_file: Path,
+    meta: dict,
+    *,
+    skip_lint: bool,
+    keep_runtime: bool,
+) -> _CompiledFile:
+    """Process-pool entry point; TargetProfile holds lambdas, so re-resolve."""
+    return _compile_file(
+        resolve(spec).create_converter,
+        kdl_file,
+        meta,
+        skip_lint=skip_lint,
+        keep_runtime=keep_runtime,
+    )
+
+
+def _compile_files(
+    spec: TargetSpec | None,
+    profile: TargetProfile,
+    converter: Any,
+    kdl_files: list[Path],
+    meta: dict,
+    *,
+    skip_lint: bool,
+    keep_runtime: bool,
+    jobs: int,
+    cache: GenerateCache | None = None,
+) -> list[_CompiledFile]:
+    """Compile every file, fanning out over a process pool if ``jobs`` > 1.
+
+    Files whose cache key hits ``cache`` are not compiled at all. Results
+    are returned in ``kdl_files`` order regardless of ``jobs``; Go runtime
+    state is merged into ``converter`` in that order too.
+    """
+    results: list[_CompiledFile | None] = [None] * len(kdl_files)
+    keys: list[str | None] = [None] * len(kdl_files)
+    if cache is not None and spec is not None:
+        for i, kdl_file in enumerate(kdl_files):
+            keys[i] = cache.key(
+                kdl_file,
+                spec=spec,
+                meta=meta,
+                skip_lint=skip_lint,
+                keep_runtime=keep_runtime,
+            )
+            cached = cache.load(keys[i]) if keys[i] is not None else None
+            if cached is not None:
+                results[i] = _CompiledFile.from_cache(kdl_file, cached)
+    pending = [i for i, result in enumerate(results) if result is None]
+    if cache is not None:
+        logger.debug(
+            "cache: %d hit(s), %d miss(es)",
+            len(kdl_files) - len(pending),
+            len(pending),
+        )
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(pending))
+    if spec is None or jobs <= 1:
+        fresh = [
+            _compile_file(
+                profile.create_converter,
+                kdl_files[i],
+                meta,
+                skip_lint=skip_lint,
+                keep_runtime=keep_runtime,
+            )
+            for i in pending
+        ]
+    else:
+        logger.debug("compiling %d file(s) on %d workers", len(pending), jobs)
+        worker = functools.partial(
+            _compile_file_worker,
+            spec,
+            meta=meta,
+            skip_lint=skip_lint,
+            keep_runtime=keep_runtime,
+        )
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fresh = list(pool.map(worker, [kdl_files[i] for i in pending]))
+
+    for i, result in zip(pending, fresh):
+        results[i] = result
+        key = keys[i]
+        # Exceptions may depend on the environment (e.g. gofmt) — retry them.
+        if (
+            key is not None
+            and result.parse_error is None
+            and result.convert_error is None
+        ):
+            cache.store(key, result.to_cache())
+
+    compiled = [result for result in results if result is not None]
+    for result in compiled:
+        if result.runtime_state is not None:
+            converter.merge_runtime_state(result.runtime_state)
+    return compiled
+
+
+def _write_output(path: Path, content: str, *, binary: bool = False) -> bool:
+    """Write ``content`` unless ``path`` already holds it; True if written.
+
+    Unchanged outputs keep their mtime, so build tools downstream of a
+    cached regeneration see nothing to rebuild. ``binary`` writes raw
+    UTF-8 with LF line endings (gofmt rejects CRLF).
+    """
+    try:
+        if binary:
+            unchanged = path.read_bytes() == content.encode("utf-8")
+        else:
+            unchanged = path.read_text(encoding="utf-8") == content
+    except (OSError, UnicodeDecodeError):
+        unchanged = False
+    if unchanged:
+        logger.debug("unchanged: %s", path)
+        return False
+    if binary:
+        path.write_bytes(content.encode("utf-8"))
+    else:
+        path.write_text(content, encoding="utf-8")
+    return True
+
+
 def _run_generate(
     profile: TargetProfile,
     files: List[Path],
     output: Path,
     *,
+    spec: TargetSpec | None = None,
     package: Optional[str] = None,
     http_client: Optional[str] = None,
     separate_runtime: bool = False,
@@ -115,25 +432,70 @@ def _run_generate(
     skip_lint: bool = False,
     verbose: bool = False,
     fmt: FmtType = FmtType.TEXT,
+    jobs: int = 1,
+    cache: GenerateCache | None = None,
+    watch: bool = False,
+    report_unchanged: bool = True,
+    go_bench: bool = False,
+    instrument: bool = False,
+    cse: bool = True,
+    fuse: bool = False,
+    peephole: bool = True,
 ) -> None:
-    """Shared generation loop for all language subcommands."""
-    kdl_files: list[Path] = []
-    for path in files:
-        if path.is_dir():
-            found = sorted(path.rglob("*.kdl"))
-            logger.debug(
-                "  directory %s: found %d .kdl file(s)", path, len(found)
-            )
-            kdl_files.extend(found)
-        elif path.is_file():
-            kdl_files.append(path)
-        else:
-            typer.echo(
-                f"  WARNING: {path} is neither a file nor a directory, skipping",
-                err=True,
-            )
+    """Shared generation loop for all language subcommands.
+
+    With ``jobs`` != 1 (and the ``spec`` the profile was resolved from),
+    parsing, linting and conversion run in a process pool; reporting,
+    file writes and the shared runtime files stay in the parent, in input
+    order, so output is identical to a serial run. With a ``cache``,
+    unchanged schemas are not recompiled at all.
+
+    ``watch`` keeps regenerating on every change. The shared runtime files
+    need every module, so each rebuild covers all schemas, but only those
+    affected by the change miss the cache and get recompiled.
+
+    ``go_bench`` also writes ``sscgen_bench_test.go`` next to the Go
+    parsers. ``instrument`` wraps the generated field methods with
+    per-method counters. ``cse=False`` disables hoisting of pipeline
+    prefixes shared between fields, ``peephole=False`` the collapsing of
+    redundant adjacent ops. ``fuse`` merges element-wise list
+    comprehensions (Python).
+    """
+    if watch:
+        if cache is None:
+            # --no-cache: still reuse results in memory between rebuilds.
+            cache = GenerateCache(persistent=False)
+        rerun = functools.partial(
+            _run_generate,
+            profile,
+            files,
+            output,
+            spec=spec,
+            package=package,
+            http_client=http_client,
+            separate_runtime=separate_runtime,
+            runtime_name=runtime_name,
+            skip_lint=skip_lint,
+            verbose=verbose,
+            fmt=fmt,
+            jobs=jobs,
+            cache=cache,
+            go_bench=go_bench,
+            instrument=instrument,
+            cse=cse,
+            fuse=fuse,
+            peephole=peephole,
+        )
+        try:
+            rerun()
+        except typer.Exit:
+            pass
+        _watch_and_rebuild(
+            files, lambda _affected: rerun(report_unchanged=False)
+        )
+        return
 
-    kdl_files = _dedupe_paths(kdl_files)
+    kdl_files = _collect_kdl_files(files)
     if not kdl_files:
         typer.echo("No .kdl files found to process.", err=True)
         raise typer.Exit(code=1)
@@ -147,6 +509,7 @@ def _run_generate(
             output,
             separate_runtime=separate_runtime,
             runtime_name=runtime_name,
+            go_bench=go_bench,
         )
         if profile.language == "go":
             from ssc_codegen.targets.golang.visitor import (
@@ -168,6 +531,14 @@ def _run_generate(
     meta: dict = {"package": package or default_package}
     if http_client:
         meta["http_client"] = http_client
+    if instrument:
+        meta["instrument"] = True
+    if not cse:
+        meta["cse"] = False
+    if fuse:
+        meta["fuse"] = True
+    if not peephole:
+        meta["peephole"] = False
 
     if separate_runtime:
         from ssc_codegen.generation.runtime import register_runtime_file
@@ -185,34 +556,50 @@ def _run_generate(
             http_strategy=http_strategy,
         )
 
-    from ssc_codegen.ast import Module
-
-    parsed: list[tuple[Path, Module]] = []
-    for kdl_file in kdl_files:
-        try:
-            ast, err = parse_module(
-                kdl_file.read_text(encoding="utf-8"), source_path=kdl_file
-            )
-            if not skip_lint:
-                all_diagnostics.extend(err)
-                lint_output = format_diagnostics(
-                    err, filepath=kdl_file, fmt=fmt.value
-                )
-                if lint_output and fmt == FmtType.TEXT:
-                    typer.echo(lint_output, err=True)
-                if any(d.severity == Severity.ERROR for d in err):
-                    errors.append(str(kdl_file))
-                    continue
-            logger.debug("AST built for %s", kdl_file)
-            parsed.append((kdl_file, ast))
-        except Exception as exc:
+    compiled = _compile_files(
+        spec,
+        profile,
+        converter,
+        kdl_files,
+        meta,
+        skip_lint=skip_lint,
+        keep_runtime=separate_runtime,
+        jobs=jobs,
+        cache=cache,
+    )
+    if cache is not None:
+        cache.evict()
+
+    parsed: list[_CompiledFile] = []
+    reported: set[tuple] = set()
+    for result in compiled:
+        kdl_file = result.path
+        if result.parse_error is not None:
             if verbose:
                 typer.echo(f"ERROR {kdl_file}:", err=True)
-                typer.echo(traceback.format_exc(), err=True)
+                typer.echo(result.trace, err=True)
             else:
-                typer.echo(f"  ERROR {kdl_file}: {exc}", err=True)
+                typer.echo(
+                    f"  ERROR {kdl_file}: {result.parse_error}", err=True
+                )
             errors.append(str(kdl_file))
-            all_diagnostics.append(_exception_diagnostic(kdl_file, exc))
+            all_diagnostics.append(
+                _exception_diagnostic(kdl_file, Exception(result.parse_error))
+            )
+            continue
+        if not skip_lint:
+            diagnostics = _report_once(result.diagnostics, kdl_file, reported)
+            all_diagnostics.extend(diagnostics)
+            lint_output = format_diagnostics(
+                diagnostics, filepath=kdl_file, fmt=fmt.value
+            )
+            if lint_output and fmt == FmtType.TEXT:
+                typer.echo(lint_output, err=True)
+            if result.lint_failed:
+                errors.append(str(kdl_file))
+                continue
+        logger.debug("AST built for %s", kdl_file)
+        parsed.append(result)
 
     if fmt == FmtType.JSON and all_diagnostics:
         typer.echo(
@@ -222,33 +609,33 @@ def _run_generate(
 
     if separate_runtime and parsed:
         runtime_path = output / f"{_runtime_name}.py"
-        runtime_path.write_text(
-            generate_runtime([ast for _, ast in parsed]),
-            encoding="utf-8",
+        written = _write_output(
+            runtime_path,
+            generate_runtime([result.runtime_needs for result in parsed]),
         )
-        typer.echo(f"  -> {runtime_path}")
+        if written or report_unchanged:
+            typer.echo(f"  -> {runtime_path}")
 
-    for kdl_file, ast in parsed:
+    for result in parsed:
+        kdl_file = result.path
         out_file = planned_outputs[kdl_file]
         logger.debug("processing: %s -> %s", kdl_file, out_file)
-        try:
-            code = converter.convert(ast, **meta)
-            if profile.language == "go":
-                # gofmt rejects CRLF — force LF line endings on Windows.
-                out_file.write_bytes(code.encode("utf-8"))
-            else:
-                out_file.write_text(code, encoding="utf-8")
-            logger.debug(
-                "code generated for %s (%d chars)", kdl_file, len(code)
-            )
-            typer.echo(f"  {kdl_file} -> {out_file}")
-        except Exception as exc:
+        if result.convert_error is not None:
             if verbose:
                 typer.echo(f"ERROR {kdl_file}:", err=True)
-                typer.echo(traceback.format_exc(), err=True)
+                typer.echo(result.trace, err=True)
             else:
-                typer.echo(f"  ERROR {kdl_file}: {exc}", err=True)
+                typer.echo(
+                    f"  ERROR {kdl_file}: {result.convert_error}", err=True
+                )
             errors.append(str(kdl_file))
+            continue
+        code = result.code
+        # gofmt rejects CRLF — force LF line endings on Windows.
+        written = _write_output(out_file, code, binary=profile.language == "go")
+        logger.debug("code generated for %s (%d chars)", kdl_file, len(code))
+        if written or report_unchanged:
+            typer.echo(f"  {kdl_file} -> {out_file}")
 
     # Go: emit shared runtime file (helpers, same package, no import needed).
     if profile.language == "go":
@@ -257,10 +644,22 @@ def _run_generate(
         if isinstance(converter, GoVisitor):
             runtime_path = output / "sscgen_runtime.go"
             # gofmt rejects CRLF — force LF.
-            runtime_path.write_bytes(
-                converter.emit_runtime(meta["package"]).encode("utf-8")
+            written = _write_output(
+                runtime_path,
+                converter.emit_runtime(meta["package"]),
+                binary=True,
             )
-            typer.echo(f"  -> {runtime_path}")
+            if written or report_unchanged:
+                typer.echo(f"  -> {runtime_path}")
+            if go_bench:
+                bench_path = output / "sscgen_bench_test.go"
+                written = _write_output(
+                    bench_path,
+                    converter.emit_bench(meta["package"]),
+                    binary=True,
+                )
+                if written or report_unchanged:
+                    typer.echo(f"  -> {bench_path}")
 
     if errors:
         raise typer.Exit(code=1)
@@ -353,19 +752,91 @@ def generate_python(
             help="Output format: 'text' (human-readable) or 'json' (for LLM pipelines).",
         ),
     ] = FmtType.TEXT,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Worker processes for parsing and conversion (0 = one per CPU). Default: 1.",
+        ),
+    ] = 1,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Recompile every schema instead of reusing cached results.",
+        ),
+    ] = False,
+    cache_dir: Annotated[
+        Path,
+        typer.Option(
+            "--cache-dir",
+            help="Generation cache directory.",
+            file_okay=False,
+            dir_okay=True,
+        ),
+    ] = DEFAULT_CACHE_DIR,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            "-w",
+            help="Keep running and regenerate when a schema or one of its imports changes.",
+        ),
+    ] = False,
+    instrument: Annotated[
+        bool,
+        typer.Option(
+            "--instrument",
+            help=(
+                "Count calls, time and errors of every generated field "
+                "method into a module-level metrics registry."
+            ),
+        ),
+    ] = False,
+    no_cse: Annotated[
+        bool,
+        typer.Option(
+            "--no-cse",
+            help=(
+                "Do not share pipeline prefixes repeated across fields "
+                "(common-subexpression elimination)."
+            ),
+        ),
+    ] = False,
+    no_peephole: Annotated[
+        bool,
+        typer.Option(
+            "--no-peephole",
+            help=(
+                "Keep redundant adjacent ops (css-all + first, trim after "
+                "normalize-space, ...) instead of collapsing them."
+            ),
+        ),
+    ] = False,
+    fuse: Annotated[
+        bool,
+        typer.Option(
+            "--fuse",
+            help=(
+                "Merge consecutive element-wise array steps into one list "
+                "comprehension instead of one per step."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Compile KDL schema files into Python parser code."""
     if verbose:
         setup_debug_logging()
+    spec = TargetSpec(
+        lang="python",
+        lib=lib.value if lib else None,
+        http_client=http_client,
+        separate_runtime=separate_runtime,
+    )
     try:
-        profile = resolve(
-            TargetSpec(
-                lang="python",
-                lib=lib.value if lib else None,
-                http_client=http_client,
-                separate_runtime=separate_runtime,
-            )
-        )
+        profile = resolve(spec)
     except ResolutionError as exc:
         typer.echo(f"ERROR: {exc}", err=True)
         raise typer.Exit(code=1)
@@ -379,6 +850,7 @@ def generate_python(
         profile,
         files,
         output,
+        spec=spec,
         package=package,
         http_client=http_client,
         separate_runtime=separate_runtime,
@@ -386,6 +858,13 @@ def generate_python(
         skip_lint=skip_lint,
         verbose=verbose,
         fmt=fmt,
+        jobs=jobs,
+        cache=None if no_cache else GenerateCache(cache_dir),
+        watch=watch,
+        instrument=instrument,
+        cse=not no_cse,
+        fuse=fuse,
+        peephole=not no_peephole,
     )
 
 
@@ -448,12 +927,76 @@ def generate_js(
             help="Output format: 'text' (human-readable) or 'json' (for LLM pipelines).",
         ),
     ] = FmtType.TEXT,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Worker processes for parsing and conversion (0 = one per CPU). Default: 1.",
+        ),
+    ] = 1,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Recompile every schema instead of reusing cached results.",
+        ),
+    ] = False,
+    cache_dir: Annotated[
+        Path,
+        typer.Option(
+            "--cache-dir",
+            help="Generation cache directory.",
+            file_okay=False,
+            dir_okay=True,
+        ),
+    ] = DEFAULT_CACHE_DIR,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            "-w",
+            help="Keep running and regenerate when a schema or one of its imports changes.",
+        ),
+    ] = False,
+    instrument: Annotated[
+        bool,
+        typer.Option(
+            "--instrument",
+            help=(
+                "Count calls, time and errors of every generated field "
+                "method into a module-level metrics registry."
+            ),
+        ),
+    ] = False,
+    no_cse: Annotated[
+        bool,
+        typer.Option(
+            "--no-cse",
+            help=(
+                "Do not share pipeline prefixes repeated across fields "
+                "(common-subexpression elimination)."
+            ),
+        ),
+    ] = False,
+    no_peephole: Annotated[
+        bool,
+        typer.Option(
+            "--no-peephole",
+            help=(
+                "Keep redundant adjacent ops (css-all + first, trim after "
+                "normalize-space, ...) instead of collapsing them."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Compile KDL schema files into JavaScript parser code."""
     if verbose:
         setup_debug_logging()
+    spec = TargetSpec(lang="js", http_client=http_client)
     try:
-        profile = resolve(TargetSpec(lang="js", http_client=http_client))
+        profile = resolve(spec)
     except ResolutionError as exc:
         typer.echo(f"ERROR: {exc}", err=True)
         raise typer.Exit(code=1)
@@ -464,11 +1007,18 @@ def generate_js(
         profile,
         files,
         output,
+        spec=spec,
         package=package,
         http_client=http_client,
         skip_lint=skip_lint,
         verbose=verbose,
         fmt=fmt,
+        jobs=jobs,
+        cache=None if no_cache else GenerateCache(cache_dir),
+        watch=watch,
+        instrument=instrument,
+        cse=not no_cse,
+        peephole=not no_peephole,
     )
 
 
@@ -524,12 +1074,86 @@ def generate_go(
             help="Output format: 'text' (human-readable) or 'json' (for LLM pipelines).",
         ),
     ] = FmtType.TEXT,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Worker processes for parsing and conversion (0 = one per CPU). Default: 1.",
+        ),
+    ] = 1,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Recompile every schema instead of reusing cached results.",
+        ),
+    ] = False,
+    cache_dir: Annotated[
+        Path,
+        typer.Option(
+            "--cache-dir",
+            help="Generation cache directory.",
+            file_okay=False,
+            dir_okay=True,
+        ),
+    ] = DEFAULT_CACHE_DIR,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            "-w",
+            help="Keep running and regenerate when a schema or one of its imports changes.",
+        ),
+    ] = False,
+    bench: Annotated[
+        bool,
+        typer.Option(
+            "--bench",
+            help=(
+                "Also write sscgen_bench_test.go with a `go test -bench` "
+                "benchmark per struct (input: testdata/<Struct>.html)."
+            ),
+        ),
+    ] = False,
+    instrument: Annotated[
+        bool,
+        typer.Option(
+            "--instrument",
+            help=(
+                "Count calls, time and errors of every generated field "
+                "method into a module-level metrics registry."
+            ),
+        ),
+    ] = False,
+    no_cse: Annotated[
+        bool,
+        typer.Option(
+            "--no-cse",
+            help=(
+                "Do not share pipeline prefixes repeated across fields "
+                "(common-subexpression elimination)."
+            ),
+        ),
+    ] = False,
+    no_peephole: Annotated[
+        bool,
+        typer.Option(
+            "--no-peephole",
+            help=(
+                "Keep redundant adjacent ops (css-all + first, trim after "
+                "normalize-space, ...) instead of collapsing them."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Compile KDL schema files into Go parser code (goquery + net/http)."""
     if verbose:
         setup_debug_logging()
+    spec = TargetSpec(lang="go")
     try:
-        profile = resolve(TargetSpec(lang="go"))
+        profile = resolve(spec)
     except ResolutionError as exc:
         typer.echo(f"ERROR: {exc}", err=True)
         raise typer.Exit(code=1)
@@ -540,21 +1164,93 @@ def generate_go(
         profile,
         files,
         output,
+        spec=spec,
         package=package,
         skip_lint=skip_lint,
         verbose=verbose,
         fmt=fmt,
+        jobs=jobs,
+        cache=None if no_cache else GenerateCache(cache_dir),
+        watch=watch,
+        instrument=instrument,
+        go_bench=bench,
+        cse=not no_cse,
+        peephole=not no_peephole,
     )
 
 
-@app.command()
-def check(
-    files: Annotated[
-        List[Path],
-        typer.Argument(
-            help="One or more .kdl schema files or directories containing .kdl files to check.",
-            exists=True,
-            file_okay=True,
+def _check_files(kdl_files: list[Path], *, fmt: FmtType, verbose: bool) -> None:
+    """Lint ``kdl_files`` and report; raises typer.Exit(1) on errors.
+
+    JSON output also lists the peephole rewrites codegen will apply to
+    error-free files, as ``info`` entries.
+    """
+    from ssc_codegen.optimize import rewrite_module
+
+    all_results: list[ReadDiagnostic] = []
+    rewrites: list[dict] = []
+    reported: set[tuple] = set()
+    total_errors = 0
+
+    for kdl_file in kdl_files:
+        try:
+            module, errs = parse_module(
+                kdl_file.read_text(encoding="utf-8"),
+                source_path=kdl_file,
+                import_cache=_IMPORT_CACHE,
+            )
+        except Exception as exc:
+            if verbose:
+                typer.echo(f"ERROR {kdl_file}:", err=True)
+                typer.echo(traceback.format_exc(), err=True)
+            else:
+                typer.echo(f"  ERROR {kdl_file}: {exc}", err=True)
+            all_results.append(_exception_diagnostic(kdl_file, exc))
+            total_errors += 1
+            continue
+        # errors of a shared import fail every importer; only the
+        # printed/emitted diagnostics are deduplicated
+        file_errors = [d for d in errs if d.severity == Severity.ERROR]
+        errs = _report_once(errs, kdl_file, reported)
+        all_results.extend(errs)
+
+        if file_errors:
+            total_errors += len(file_errors)
+        elif fmt == FmtType.JSON:
+            for rewrite in rewrite_module(module):
+                offset = rewrite.span.start.offset if rewrite.span else -1
+                key = (rewrite.scope, rewrite.code, offset)
+                if key not in reported:
+                    reported.add(key)
+                    rewrites.append(rewrite.to_dict(str(kdl_file)))
+        if errs and fmt == FmtType.TEXT:
+            output = format_diagnostics(errs, filepath=kdl_file, fmt=fmt.value)
+            if output:
+                typer.echo(output, err=True)
+
+    if fmt == FmtType.JSON:
+        results = [diagnostic_to_dict(d) for d in all_results] + rewrites
+        typer.echo(json.dumps(results, indent=2))
+
+    if total_errors > 0:
+        if fmt == FmtType.TEXT:
+            typer.echo(
+                f"\nFound {total_errors} error(s) in {len(kdl_files)} file(s).",
+                err=True,
+            )
+        raise typer.Exit(code=1)
+    if fmt == FmtType.TEXT:
+        typer.echo(f"All {len(kdl_files)} file(s) passed linting.")
+
+
+@app.command()
+def check(
+    files: Annotated[
+        List[Path],
+        typer.Argument(
+            help="One or more .kdl schema files or directories containing .kdl files to check.",
+            exists=True,
+            file_okay=True,
             dir_okay=True,
             readable=True,
         ),
@@ -575,6 +1271,14 @@ def check(
             help="Enable DEBUG logging.",
         ),
     ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            "-w",
+            help="Keep running and re-check schemas affected by each change.",
+        ),
+    ] = False,
 ) -> None:
     """Check KDL schema files for errors without generating code."""
 
@@ -585,68 +1289,229 @@ def check(
         "check() started: files=%s, format=%s", [str(f) for f in files], fmt
     )
 
-    kdl_files: list[Path] = []
-    for path in files:
-        if path.is_dir():
-            found = sorted(path.rglob("*.kdl"))
-            logger.debug(
-                "  directory %s: found %d .kdl file(s)", path, len(found)
-            )
-            kdl_files.extend(found)
-        elif path.is_file():
-            kdl_files.append(path)
-        else:
-            typer.echo(
-                f"  WARNING: {path} is neither a file nor a directory, skipping",
-                err=True,
-            )
-
-    kdl_files = _dedupe_paths(kdl_files)
+    kdl_files = _collect_kdl_files(files)
     if not kdl_files:
         typer.echo("No .kdl files found to check.", err=True)
         raise typer.Exit(code=1)
 
     logger.debug("total %d .kdl file(s) to check", len(kdl_files))
 
-    all_results: list[ReadDiagnostic] = []
-    total_errors = 0
+    if not watch:
+        _check_files(kdl_files, fmt=fmt, verbose=verbose)
+        return
+    try:
+        _check_files(kdl_files, fmt=fmt, verbose=verbose)
+    except typer.Exit:
+        pass
+    _watch_and_rebuild(
+        files,
+        lambda affected: _check_files(affected, fmt=fmt, verbose=verbose),
+    )
 
-    for kdl_file in kdl_files:
-        try:
-            _, errs = parse_module(
-                kdl_file.read_text(encoding="utf-8"), source_path=kdl_file
-            )
-        except Exception as exc:
-            if verbose:
-                typer.echo(f"ERROR {kdl_file}:", err=True)
-                typer.echo(traceback.format_exc(), err=True)
-            else:
-                typer.echo(f"  ERROR {kdl_file}: {exc}", err=True)
-            all_results.append(_exception_diagnostic(kdl_file, exc))
-            total_errors += 1
-            continue
-        all_results.extend(errs)
 
-        file_errors = [d for d in errs if d.severity == Severity.ERROR]
-        if file_errors:
-            total_errors += len(file_errors)
-        if errs and fmt == FmtType.TEXT:
-            output = format_diagnostics(errs, filepath=kdl_file, fmt=fmt.value)
+def _load_run_class(
+    kdl_path: Path,
+    struct_name: str,
+    lib: str | None,
+    *,
+    fmt: FmtType,
+    verbose: bool,
+    cache: ParserCache | None,
+) -> tuple[Any, str]:
+    """Return the generated parser class for ``struct_name`` and its source.
+
+    With a ``cache``, a schema that parsed cleanly is stored as a Python
+    module and later runs import it (and its cached bytecode) directly.
+    Any failure is reported and raises ``typer.Exit``.
+    """
+    from ssc_codegen.ast import StructBase
+    from ssc_codegen.naming import to_pascal_case
+
+    class_name = to_pascal_case(struct_name)
+    key = None
+    if cache is not None:
+        key = cache.key(kdl_path, lang="python", lib=lib)
+        module = cache.load(key) if key is not None else None
+        cls = getattr(module, class_name, None)
+        if cls is not None:
+            logger.debug("cache: reusing compiled parser for %s", kdl_path)
+            return cls, Path(module.__file__).read_text(encoding="utf-8")
+
+    try:
+        module_ast, errs = parse_module(
+            kdl_path.read_text(encoding="utf-8"),
+            source_path=kdl_path,
+            import_cache=_IMPORT_CACHE,
+        )
+        if errs:
+            output = format_diagnostics(errs, filepath=kdl_path, fmt=fmt.value)
             if output:
                 typer.echo(output, err=True)
+            raise typer.Exit(1)
 
-    if fmt == FmtType.JSON:
-        typer.echo(format_diagnostics(all_results, fmt="json") or "[]")
+    except typer.Exit:
+        raise
+    except Exception as exc:
+        if verbose:
+            typer.echo(traceback.format_exc(), err=True)
+        else:
+            typer.echo(f"ERROR: failed to parse {kdl_path}: {exc}", err=True)
+        raise typer.Exit(code=1)
 
-    if total_errors > 0:
-        if fmt == FmtType.TEXT:
+    structs = [n for n in module_ast.body if isinstance(n, StructBase)]
+    struct_names = [s.name for s in structs]
+    if struct_name not in struct_names:
+        typer.echo(
+            f"ERROR: struct '{struct_name}' not found in {kdl_path}. "
+            f"Available: {', '.join(struct_names)}",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    try:
+        profile = resolve(TargetSpec(lang="python", lib=lib))
+    except ResolutionError as exc:
+        typer.echo(f"ERROR: {exc}", err=True)
+        raise typer.Exit(code=1)
+
+    converter = profile.create_converter()
+    code = converter.convert(module_ast)
+
+    if verbose:
+        typer.echo("--- generated code ---", err=True)
+        typer.echo(code, err=True)
+        typer.echo("--- end generated code ---", err=True)
+
+    if cache is not None and key is not None:
+        cache.store(key, code)
+        cache.evict()
+        module = cache.load(key)
+        cls = getattr(module, class_name, None)
+        if cls is not None:
+            return cls, code
+
+    namespace: dict = {}
+    try:
+        exec(code, namespace)  # noqa: S102
+    except Exception as exc:
+        if verbose:
+            typer.echo(traceback.format_exc(), err=True)
+        else:
             typer.echo(
-                f"\nFound {total_errors} error(s) in {len(kdl_files)} file(s).",
-                err=True,
+                f"ERROR: failed to execute generated code: {exc}", err=True
             )
         raise typer.Exit(code=1)
-    if fmt == FmtType.TEXT:
-        typer.echo(f"All {len(kdl_files)} file(s) passed linting.")
+
+    cls = namespace.get(class_name)
+    if cls is None:
+        typer.echo(
+            f"ERROR: class '{class_name}' not found in generated code.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    return cls, code
+
+
+# Parser class of a ``run --jobs`` worker, set once by _init_run_worker.
+_RUN_CLASS: Any = None
+
+
+def _init_run_worker(code: str, class_name: str) -> None:
+    global _RUN_CLASS
+    namespace: dict = {}
+    exec(compile(code, "<ssc-gen run>", "exec"), namespace)  # noqa: S102
+    _RUN_CLASS = namespace[class_name]
+
+
+def _parse_document(cls: Any, html_file: str) -> dict[str, Any]:
+    """JSON Lines record for one document: result or error, plus timing."""
+    record: dict[str, Any] = {"file": html_file}
+    start = time.perf_counter()
+    try:
+        html = Path(html_file).read_text(encoding="utf-8")
+        record["result"] = cls(html).parse()
+    except Exception as exc:  # noqa: BLE001 - any parser failure is a record
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return record
+
+
+def _parse_documents_worker(html_files: list[str]) -> list[dict[str, Any]]:
+    """Process-pool entry point: parse one chunk with the worker's class."""
+    return [_parse_document(_RUN_CLASS, html_file) for html_file in html_files]
+
+
+def _iter_run_records(
+    cls: Any,
+    code: str,
+    class_name: str,
+    html_files: list[str],
+    *,
+    jobs: int,
+    ordered: bool,
+) -> Iterator[dict[str, Any]]:
+    """Parse ``html_files``, fanning out over a process pool if ``jobs`` > 1.
+
+    Workers exec the generated ``code`` once and receive documents in
+    chunks. Records follow ``html_files`` order if ``ordered``, otherwise
+    each chunk is yielded as soon as it finishes.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(html_files))
+    if jobs <= 1:
+        for html_file in html_files:
+            yield _parse_document(cls, html_file)
+        return
+
+    size = max(1, min(_RUN_CHUNK_SIZE, len(html_files) // (jobs * 4)))
+    chunks = [html_files[i : i + size] for i in range(0, len(html_files), size)]
+    logger.debug("parsing %d document(s) on %d workers", len(html_files), jobs)
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_run_worker,
+        initargs=(code, class_name),
+    ) as pool:
+        if ordered:
+            for records in pool.map(_parse_documents_worker, chunks):
+                yield from records
+        else:
+            futures = [
+                pool.submit(_parse_documents_worker, chunk) for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+
+
+def _collect_html_files(
+    input_dir: Path | None,
+    html_glob: str | None,
+    files_from: str | None,
+) -> list[str]:
+    """Documents for batch ``run`` and corpus ``scout --discover``.
+
+    ``files_from="-"`` reads stdin.
+    """
+    import glob
+    import sys
+
+    if input_dir is not None:
+        return sorted(
+            str(path)
+            for path in input_dir.rglob("*")
+            if path.suffix.lower() in _HTML_SUFFIXES and path.is_file()
+        )
+    if html_glob is not None:
+        return [
+            path
+            for path in sorted(glob.glob(html_glob, recursive=True))
+            if os.path.isfile(path)
+        ]
+    if files_from == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(files_from).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip()]
 
 
 @app.command()
@@ -670,13 +1535,58 @@ def run(
         typer.Option(
             "--input",
             "-i",
-            help="HTML input file. If omitted, reads from stdin.",
+            help=(
+                "HTML input file, or a directory to parse every "
+                "*.html/*.htm file in it (batch mode). "
+                "If omitted, reads from stdin."
+            ),
             exists=True,
             file_okay=True,
-            dir_okay=False,
+            dir_okay=True,
             readable=True,
         ),
     ] = None,
+    html_glob: Annotated[
+        str | None,
+        typer.Option(
+            "--html-glob",
+            help=(
+                "Parse every HTML file matching PATTERN ('**' recurses) "
+                "with one compiled parser; prints JSON Lines."
+            ),
+            metavar="PATTERN",
+        ),
+    ] = None,
+    files_from: Annotated[
+        str | None,
+        typer.Option(
+            "--files-from",
+            help=(
+                "Parse the HTML files listed one per line in FILE "
+                "('-' = stdin) (batch mode)."
+            ),
+            metavar="FILE",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Worker processes for batch mode (0 = one per CPU). Default: 1.",
+        ),
+    ] = 1,
+    ordered: Annotated[
+        bool,
+        typer.Option(
+            "--ordered/--unordered",
+            help=(
+                "Batch mode: emit records in input order, or as soon as "
+                "they are parsed."
+            ),
+        ),
+    ] = True,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -693,22 +1603,40 @@ def run(
             help="Output format: 'text' (human-readable) or 'json' (for LLM pipelines).",
         ),
     ] = FmtType.TEXT,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Regenerate the parser instead of reusing the cached one.",
+        ),
+    ] = False,
+    cache_dir: Annotated[
+        Path,
+        typer.Option(
+            "--cache-dir",
+            help="Compiled parser cache directory.",
+        ),
+    ] = DEFAULT_CACHE_DIR,
 ) -> None:
     """Run a KDL schema struct against HTML input and output JSON.
 
     Python dev/test tool: generates Python code, executes it in-process,
     and prints the parse result as JSON.
 
+    Batch mode (a directory, --html-glob or --files-from) prints one JSON
+    line per document with its result or error and the parse time.
+
     \b
     Examples:
         cat page.html | ssc-gen run examples/booksToScrape.kdl:MainCatalogue
         ssc-gen run schema.kdl:Product -i page.html
         ssc-gen run schema.kdl:Product -L lxml < page.html
+        ssc-gen run schema.kdl:Product -i dump/ -j 0 --unordered
+        find dump -name '*.html' | ssc-gen run schema.kdl:Product --files-from -
     """
     import json
     import sys
 
-    from ssc_codegen.ast import StructBase
     from ssc_codegen.naming import to_pascal_case
 
     if verbose:
@@ -721,59 +1649,68 @@ def run(
         )
         raise typer.Exit(code=1)
 
-    file_part, struct_name = schema.rsplit(":", 1)
-    kdl_path = Path(file_part)
-    if not kdl_path.is_file():
-        typer.echo(f"ERROR: file not found: {kdl_path}", err=True)
-        raise typer.Exit(code=1)
-
-    try:
-        module_ast, errs = parse_module(
-            kdl_path.read_text(encoding="utf-8"), source_path=kdl_path
+    input_dir = (
+        input_file if input_file is not None and input_file.is_dir() else None
+    )
+    sources = [
+        name
+        for name, value in (
+            ("--input", input_file),
+            ("--html-glob", html_glob),
+            ("--files-from", files_from),
         )
-        if errs:
-            output = format_diagnostics(errs, filepath=kdl_path, fmt=fmt.value)
-            if output:
-                typer.echo(output, err=True)
-            raise typer.Exit(1)
-
-    except Exception as exc:
-        if verbose:
-            typer.echo(traceback.format_exc(), err=True)
-        else:
-            typer.echo(f"ERROR: failed to parse {kdl_path}: {exc}", err=True)
-        raise typer.Exit(code=1)
-
-    structs = [n for n in module_ast.body if isinstance(n, StructBase)]
-    struct_names = [s.name for s in structs]
-    if struct_name not in struct_names:
+        if value is not None
+    ]
+    if len(sources) > 1:
         typer.echo(
-            f"ERROR: struct '{struct_name}' not found in {kdl_path}. "
-            f"Available: {', '.join(struct_names)}",
-            err=True,
+            f"ERROR: {' and '.join(sources)} are mutually exclusive", err=True
         )
         raise typer.Exit(code=1)
+    batch = (
+        input_dir is not None or html_glob is not None or files_from is not None
+    )
 
-    class_name = to_pascal_case(struct_name)
-
-    try:
-        profile = resolve(
-            TargetSpec(
-                lang="python",
-                lib=lib.value if lib else None,
-            )
-        )
-    except ResolutionError as exc:
-        typer.echo(f"ERROR: {exc}", err=True)
+    file_part, struct_name = schema.rsplit(":", 1)
+    kdl_path = Path(file_part)
+    if not kdl_path.is_file():
+        typer.echo(f"ERROR: file not found: {kdl_path}", err=True)
         raise typer.Exit(code=1)
 
-    converter = profile.create_converter()
-    code = converter.convert(module_ast)
-
-    if verbose:
-        typer.echo("--- generated code ---", err=True)
-        typer.echo(code, err=True)
-        typer.echo("--- end generated code ---", err=True)
+    cache = None if no_cache else ParserCache(cache_dir)
+    cls, code = _load_run_class(
+        kdl_path,
+        struct_name,
+        lib.value if lib else None,
+        fmt=fmt,
+        verbose=verbose,
+        cache=cache,
+    )
+    if batch:
+        try:
+            html_files = _collect_html_files(input_dir, html_glob, files_from)
+        except OSError as exc:
+            typer.echo(f"ERROR: cannot read --files-from: {exc}", err=True)
+            raise typer.Exit(code=1)
+        if not html_files:
+            typer.echo("ERROR: no HTML input files found", err=True)
+            raise typer.Exit(code=1)
+        failed = 0
+        for record in _iter_run_records(
+            cls,
+            code,
+            to_pascal_case(struct_name),
+            html_files,
+            jobs=jobs,
+            ordered=ordered,
+        ):
+            failed += "error" in record
+            typer.echo(json.dumps(record, ensure_ascii=False))
+        logger.debug(
+            "parsed %d document(s), %d failed", len(html_files), failed
+        )
+        if failed:
+            raise typer.Exit(code=1)
+        return
 
     if input_file is not None:
         html = input_file.read_text(encoding="utf-8")
@@ -789,26 +1726,6 @@ def run(
         typer.echo("ERROR: empty HTML input", err=True)
         raise typer.Exit(code=1)
 
-    namespace: dict = {}
-    try:
-        exec(code, namespace)  # noqa: S102
-    except Exception as exc:
-        if verbose:
-            typer.echo(traceback.format_exc(), err=True)
-        else:
-            typer.echo(
-                f"ERROR: failed to execute generated code: {exc}", err=True
-            )
-        raise typer.Exit(code=1)
-
-    cls = namespace.get(class_name)
-    if cls is None:
-        typer.echo(
-            f"ERROR: class '{class_name}' not found in generated code.",
-            err=True,
-        )
-        raise typer.Exit(code=1)
-
     try:
         result = cls(html).parse()
     except Exception as exc:
@@ -849,6 +1766,16 @@ def health(
             help="Output format: 'text' (human-readable) or 'json' (for LLM pipelines).",
         ),
     ] = "text",
+    engine: Annotated[
+        Engine,
+        typer.Option(
+            "--engine",
+            help=(
+                "HTML library that runs the selectors. XPath selectors "
+                "fall back to lxml on engines without XPath (slax)."
+            ),
+        ),
+    ] = Engine.BS4,
     verbose: Annotated[
         bool,
         typer.Option(
@@ -865,11 +1792,12 @@ def health(
         cat page.html | ssc-gen health examples/booksToScrape.kdl:MainCatalogue
         ssc-gen health schema.kdl:Product -i page.html
         ssc-gen health schema.kdl:Product -f json < page.html
+        ssc-gen health schema.kdl:Product -i page.html --engine lxml
     """
     import sys
 
-    from ssc_codegen import parse_module
     from ssc_codegen.ast import StructBase
+    from ssc_codegen.engines import EngineError
     from ssc_codegen.health import check_struct_health
 
     if verbose:
@@ -890,7 +1818,9 @@ def health(
 
     try:
         module_ast, diagnostics = parse_module(
-            kdl_path.read_text(encoding="utf-8"), source_path=kdl_path
+            kdl_path.read_text(encoding="utf-8"),
+            source_path=kdl_path,
+            import_cache=_IMPORT_CACHE,
         )
     except Exception as exc:
         if verbose:
@@ -932,13 +1862,189 @@ def health(
         typer.echo("ERROR: empty HTML input", err=True)
         raise typer.Exit(code=1)
 
-    result = check_struct_health(target_struct, html, module=module_ast)
+    try:
+        result = check_struct_health(
+            target_struct, html, module=module_ast, engine=engine.value
+        )
+    except EngineError as exc:
+        typer.echo(f"ERROR: {exc}", err=True)
+        raise typer.Exit(code=1)
     typer.echo(result.format(fmt=fmt))
 
     if result.has_failures():
         raise typer.Exit(code=1)
 
 
+@app.command()
+def bench(
+    schema: Annotated[
+        str,
+        typer.Argument(
+            help="Schema target in format 'path/to/schema.kdl:StructName'.",
+        ),
+    ],
+    input_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--input",
+            "-i",
+            help=("HTML corpus: a file, or a directory of *.html/*.htm files."),
+            exists=True,
+            file_okay=True,
+            dir_okay=True,
+            readable=True,
+        ),
+    ] = None,
+    html_glob: Annotated[
+        str | None,
+        typer.Option(
+            "--html-glob",
+            help="HTML corpus: every file matching PATTERN ('**' recurses).",
+            metavar="PATTERN",
+        ),
+    ] = None,
+    libs: Annotated[
+        str,
+        typer.Option(
+            "--lib",
+            "-L",
+            help="Comma-separated HTML libraries to compare.",
+        ),
+    ] = "bs4,lxml,parsel,slax",
+    iterations: Annotated[
+        int,
+        typer.Option(
+            "--iterations",
+            "-n",
+            min=1,
+            help="Timed passes over the corpus.",
+        ),
+    ] = 5,
+    warmup: Annotated[
+        int,
+        typer.Option(
+            "--warmup",
+            min=0,
+            help="Untimed passes over the corpus before measuring.",
+        ),
+    ] = 1,
+    fmt: Annotated[
+        Literal["text", "json"],
+        typer.Option(
+            "--format",
+            "-f",
+            help="Output format: 'text' (table) or 'json'.",
+        ),
+    ] = "text",
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Enable DEBUG logging.",
+        ),
+    ] = False,
+) -> None:
+    """Benchmark a struct's generated Python parser on each HTML library.
+
+    Every backend is generated in-process, warmed up and run over the
+    corpus; document construction and parse() are timed separately,
+    alongside per-field time, throughput and tracemalloc peak memory.
+
+    \b
+    Examples:
+        ssc-gen bench schema.kdl:Product -i pages/
+        ssc-gen bench schema.kdl:Product -i pages/ -L lxml,slax -n 20
+        ssc-gen bench schema.kdl:Product --html-glob 'pages/**/*.html' -f json
+    """
+    from ssc_codegen.ast import StructBase
+    from ssc_codegen.bench import bench_struct
+
+    if verbose:
+        setup_debug_logging()
+
+    if ":" not in schema:
+        typer.echo(
+            "ERROR: schema argument must be in format 'path/to/schema.kdl:StructName'",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    file_part, struct_name = schema.rsplit(":", 1)
+    kdl_path = Path(file_part)
+    if not kdl_path.is_file():
+        typer.echo(f"ERROR: file not found: {kdl_path}", err=True)
+        raise typer.Exit(code=1)
+
+    if (input_path is None) == (html_glob is None):
+        typer.echo("ERROR: pass exactly one of -i or --html-glob", err=True)
+        raise typer.Exit(code=1)
+
+    lib_names = [name.strip() for name in libs.split(",") if name.strip()]
+    known = {lib.value for lib in HtmlLib}
+    unknown = [name for name in lib_names if name not in known]
+    if unknown or not lib_names:
+        typer.echo(
+            f"ERROR: unknown library: {', '.join(unknown) or repr(libs)}. "
+            f"Available: {', '.join(sorted(known))}",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    if input_path is not None and input_path.is_file():
+        html_files = [str(input_path)]
+    else:
+        html_files = _collect_html_files(input_path, html_glob, None)
+    if not html_files:
+        typer.echo("ERROR: no HTML files to benchmark", err=True)
+        raise typer.Exit(code=1)
+    documents = [Path(path).read_text(encoding="utf-8") for path in html_files]
+
+    try:
+        module_ast, diagnostics = parse_module(
+            kdl_path.read_text(encoding="utf-8"),
+            source_path=kdl_path,
+            import_cache=_IMPORT_CACHE,
+        )
+    except Exception as exc:  # noqa: BLE001 - any parser failure is reported
+        if verbose:
+            typer.echo(traceback.format_exc(), err=True)
+        else:
+            typer.echo(f"ERROR: failed to parse {kdl_path}: {exc}", err=True)
+        raise typer.Exit(code=1)
+
+    if diagnostics:
+        output = format_diagnostics(diagnostics, filepath=kdl_path, fmt=fmt)
+        if output:
+            typer.echo(output, err=True)
+        if any(d.severity == Severity.ERROR for d in diagnostics):
+            raise typer.Exit(code=1)
+
+    struct_names = [
+        n.name for n in module_ast.body if isinstance(n, StructBase)
+    ]
+    if struct_name not in struct_names:
+        typer.echo(
+            f"ERROR: struct '{struct_name}' not found in {kdl_path}. "
+            f"Available: {', '.join(struct_names)}",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    result = bench_struct(
+        module_ast,
+        struct_name,
+        documents,
+        lib_names,
+        iterations=iterations,
+        warmup=warmup,
+    )
+    typer.echo(result.format(fmt=fmt))
+
+    if result.has_errors():
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def scout(
     input_file: Annotated[
@@ -946,13 +2052,39 @@ def scout(
         typer.Option(
             "--input",
             "-i",
-            help="HTML input file. If omitted, reads from stdin.",
+            help=(
+                "HTML input file, or a directory of *.html/*.htm files "
+                "for corpus --discover. If omitted, reads from stdin."
+            ),
             exists=True,
             file_okay=True,
-            dir_okay=False,
+            dir_okay=True,
             readable=True,
         ),
     ] = None,
+    html_glob: Annotated[
+        str | None,
+        typer.Option(
+            "--html-glob",
+            help=(
+                "Corpus --discover over every HTML file matching PATTERN "
+                "('**' recurses)."
+            ),
+            metavar="PATTERN",
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help=(
+                "Worker processes for corpus --discover (0 = one per CPU). "
+                "Default: 1."
+            ),
+        ),
+    ] = 1,
     text: Annotated[
         Optional[str],
         typer.Option(
@@ -1086,6 +2218,30 @@ def scout(
             help="Output format: 'text' (tabular) or 'json'.",
         ),
     ] = FmtType.TEXT,
+    engine: Annotated[
+        Engine,
+        typer.Option(
+            "--engine",
+            help=(
+                "HTML library that parses and queries the page: 'bs4' "
+                "(default), 'lxml' (fastest, same tree as bs4) or 'slax' "
+                "(HTML5 tree like browsers; no line numbers)."
+            ),
+        ),
+    ] = Engine.BS4,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            help=(
+                "Parse the input incrementally with lxml and drop finished "
+                "elements, so memory stays bounded on huge documents. "
+                "Supports --tag/--attr/--text filters and the tag/class/"
+                "id/data-* stats of --discover; no --css, navigation or "
+                "html field."
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Probe raw HTML with regex on text/attributes to discover selectors.
 
@@ -1113,18 +2269,152 @@ def scout(
 
         # pipe HTML via stdin
         curl -s https://example.com | ssc-gen scout --attr 'class=~\\bbtn\\b' -f json
+
+        # same probe on the lxml engine (faster on large pages)
+        ssc-gen scout -i page.html --engine lxml --discover -f json
+
+        # corpus overview: selectors that hold across many pages
+        ssc-gen scout --discover --html-glob 'pages/**/*.html' -j 0 -f json
+
+        # multi-GB dump: bounded memory, first 5 matches
+        ssc-gen scout -i dump.html --stream --text 'price' --limit 5 -f json
     """
     import sys
 
+    from ssc_codegen.engines import EngineError
     from ssc_codegen.explore import (
         DEFAULT_FIELDS,
+        STREAM_CHUNK_SIZE,
         FilterError,
         NavSpec,
         compile_filters,
+        run_corpus_discover,
         run_discover,
+        run_discover_stream,
         run_scout,
+        run_scout_stream,
+    )
+
+    corpus_dir = (
+        input_file if input_file is not None and input_file.is_dir() else None
+    )
+    if corpus_dir is not None or html_glob is not None:
+        if input_file is not None and html_glob is not None:
+            typer.echo(
+                "ERROR: --input and --html-glob are mutually exclusive",
+                err=True,
+            )
+            raise typer.Exit(code=2)
+        if not discover:
+            typer.echo(
+                "ERROR: a directory or --html-glob needs --discover", err=True
+            )
+            raise typer.Exit(code=2)
+        if stream:
+            typer.echo(
+                "ERROR: --stream reads a single document, not a corpus",
+                err=True,
+            )
+            raise typer.Exit(code=2)
+        html_files = _collect_html_files(corpus_dir, html_glob, None)
+        if not html_files:
+            typer.echo("ERROR: no HTML input files found", err=True)
+            raise typer.Exit(code=2)
+        try:
+            corpus_result = run_corpus_discover(
+                html_files, jobs=jobs, engine=engine.value
+            )
+        except EngineError as exc:
+            typer.echo(f"ERROR: {exc}", err=True)
+            raise typer.Exit(code=2)
+        if fmt == FmtType.JSON:
+            typer.echo(corpus_result.to_json())
+        else:
+            typer.echo(corpus_result.to_text())
+        if corpus_result.pages == 0:
+            raise typer.Exit(code=2)
+        return
+
+    field_list = (
+        [f.strip() for f in fields.split(",") if f.strip()]
+        if fields
+        else list(DEFAULT_FIELDS)
     )
 
+    if stream:
+        if up or down or next_ or prev:
+            typer.echo(
+                "ERROR: navigation is not supported with --stream", err=True
+            )
+            raise typer.Exit(code=2)
+        if input_file is None and sys.stdin.isatty():
+            typer.echo(
+                "Reading HTML from stdin (Ctrl+D to end, or use -i <file>)...",
+                err=True,
+            )
+        blank = True
+
+        def read_chunks(fh: Any) -> Iterator[str]:
+            nonlocal blank
+            for chunk in iter(
+                functools.partial(fh.read, STREAM_CHUNK_SIZE), ""
+            ):
+                if blank and chunk.strip():
+                    blank = False
+                yield chunk
+
+        fh = (
+            input_file.open(encoding="utf-8")
+            if input_file is not None
+            else sys.stdin
+        )
+        try:
+            if discover:
+                stream_result: Any = run_discover_stream(read_chunks(fh))
+            else:
+                filters = compile_filters(
+                    text=text,
+                    attrs=attr or [],
+                    tag=tag,
+                    css=css,
+                    ignore_case=ignore_case,
+                    fixed=fixed,
+                )
+                stream_result = run_scout_stream(
+                    read_chunks(fh),
+                    filters,
+                    field_list,
+                    invert=invert,
+                    limit=limit,
+                    offset=offset,
+                    snippet=snippet,
+                )
+        except FilterError as exc:
+            typer.echo(f"ERROR: {exc}", err=True)
+            raise typer.Exit(code=2)
+        finally:
+            if fh is not sys.stdin:
+                fh.close()
+        if blank:
+            typer.echo("ERROR: empty HTML input", err=True)
+            raise typer.Exit(code=2)
+        if discover:
+            typer.echo(
+                stream_result.to_json()
+                if fmt == FmtType.JSON
+                else stream_result.to_text()
+            )
+            return
+        if count:
+            typer.echo(stream_result.matched)
+        elif fmt == FmtType.JSON:
+            typer.echo(stream_result.to_json())
+        else:
+            typer.echo(stream_result.to_text())
+        if stream_result.matched == 0:
+            raise typer.Exit(code=1)
+        return
+
     if input_file is not None:
         html = input_file.read_text(encoding="utf-8")
     else:
@@ -1140,19 +2430,17 @@ def scout(
         raise typer.Exit(code=2)
 
     if discover:
-        discover_result = run_discover(html)
+        try:
+            discover_result = run_discover(html, engine=engine.value)
+        except EngineError as exc:
+            typer.echo(f"ERROR: {exc}", err=True)
+            raise typer.Exit(code=2)
         if fmt == FmtType.JSON:
             typer.echo(discover_result.to_json())
         else:
             typer.echo(discover_result.to_text())
         return
 
-    field_list = (
-        [f.strip() for f in fields.split(",") if f.strip()]
-        if fields
-        else list(DEFAULT_FIELDS)
-    )
-
     try:
         filters = compile_filters(
             text=text,
@@ -1171,8 +2459,9 @@ def scout(
             limit=limit,
             offset=offset,
             snippet=snippet,
+            engine=engine.value,
         )
-    except FilterError as exc:
+    except (FilterError, EngineError) as exc:
         typer.echo(f"ERROR: {exc}", err=True)
         raise typer.Exit(code=2)
 
@@ -0,0 +1,43 @@
+"""AST optimization passes run between ``parse_module`` and the converters.
+
+Passes rewrite a copy of the module into an equivalent one that generates
+faster code; the input AST is never mutated, so the same module can be
+converted with and without optimizations.
+"""
+
+from __future__ import annotations
+
+import copy
+
+from ssc_codegen.ast import Module
+from ssc_codegen.optimize.cse import eliminate_common_prefixes
+from ssc_codegen.optimize.peephole import rewrite_module
+
+__all__ = ["optimize_module", "rewrite_module"]
+
+
+def optimize_module(
+    module: Module, *, cse: bool = True, peephole: bool = True
+) -> Module:
+    """Return ``module`` with the enabled passes applied.
+
+    Args:
+        cse: hoist pipeline prefixes shared by several fields of a struct
+            into lazily computed values (see ``optimize.cse``).
+        peephole: collapse redundant adjacent ops (see
+            ``optimize.peephole``). Runs first, so canonicalized
+            pipelines can share more prefixes.
+
+    Returns ``module`` itself when no pass changed anything.
+    """
+    if not (cse or peephole):
+        return module
+    optimized = copy.deepcopy(module)
+    changed = 0
+    if peephole:
+        changed += len(rewrite_module(optimized, keep_shared=cse))
+    if cse:
+        changed += eliminate_common_prefixes(optimized)
+    if changed == 0:
+        return module
+    return optimized
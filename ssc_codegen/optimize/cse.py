@@ -0,0 +1,284 @@
+"""Common-subexpression elimination for shared field pipeline prefixes.
+
+Fields of a document-level struct often start with the same steps::
+
+    old-price { css ".price-box"; css ".old"; text }
+    new-price { css ".price-box"; css ".new"; text }
+
+Each ``_parse_*`` method would re-run ``css ".price-box"`` on the same
+document. This pass hoists the longest shared prefix into a synthesized
+lazy ``InitField`` (``cse_0``) and replaces it in every field with a
+``Self`` reference, so the prefix runs at most once per document.
+
+Hoisted values are lazy: computed on first use and, if a step raises,
+raised at that use, inside the field's own ``fallback``. Only ops whose
+generated code does not depend on the enclosing field are hoisted; ``re``
+and ``assert`` embed the field path in their error messages and stay put.
+
+Only ITEM structs and RAW structs without ``@split-doc`` are rewritten:
+their fields all receive the document. LIST/DICT/TABLE fields receive a
+different element per call. Structs with ``css-remove``/``xpath-remove``
+are skipped: hoisting would move a selection across the removal.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+from collections import defaultdict
+
+from ssc_codegen.ast import (
+    Attr,
+    CssSelect,
+    CssSelectAll,
+    Fallback,
+    Field,
+    Fmt,
+    Index,
+    InitField,
+    Join,
+    Jsonify,
+    Len,
+    Lower,
+    Ltrim,
+    Module,
+    NormalizeSpace,
+    Raw,
+    ReAll,
+    Repl,
+    ReplMap,
+    ReSub,
+    Return,
+    RmPrefix,
+    RmPrefixSuffix,
+    RmSuffix,
+    Rtrim,
+    Self,
+    Slice,
+    Split,
+    SplitDoc,
+    Struct,
+    StructType,
+    Text,
+    ToBool,
+    ToFloat,
+    ToInt,
+    Trim,
+    Unescape,
+    Unique,
+    Upper,
+    XpathSelect,
+    XpathSelectAll,
+)
+from ssc_codegen.ast.base import Node
+from ssc_codegen.naming import to_snake_case
+from ssc_codegen.traversal.utils import struct_removes_nodes
+
+# ops a shared prefix may start with
+_SELECTORS = (CssSelect, CssSelectAll, XpathSelect, XpathSelectAll)
+
+# side-effect free ops whose generated code only depends on their own
+# fields (no field path in messages, no DOM mutation)
+_HOISTABLE = (
+    *_SELECTORS,
+    Self,
+    Text,
+    Raw,
+    Attr,
+    Trim,
+    Ltrim,
+    Rtrim,
+    NormalizeSpace,
+    RmPrefix,
+    RmSuffix,
+    RmPrefixSuffix,
+    Fmt,
+    Repl,
+    ReplMap,
+    Lower,
+    Upper,
+    Split,
+    Join,
+    Unescape,
+    Index,
+    Slice,
+    Len,
+    Unique,
+    ToInt,
+    ToFloat,
+    ToBool,
+    Jsonify,
+    ReAll,
+    ReSub,
+)
+
+_NAME_PREFIX = "cse_"
+
+# node fields that do not affect generated code
+_IGNORED_FIELDS = frozenset({"parent", "body", "span"})
+
+
+def eliminate_common_prefixes(module: Module) -> int:
+    """Hoist shared field prefixes in every eligible struct of ``module``.
+
+    Mutates ``module`` in place; returns the number of synthesized
+    ``InitField`` nodes.
+    """
+    return sum(
+        _eliminate_in_struct(node)
+        for node in module.body
+        if isinstance(node, Struct) and _is_document_level(node)
+    )
+
+
+def shared_selector_fields(struct: Struct) -> set[int]:
+    """``id()`` of the fields whose leading selector CSE would share.
+
+    Empty when ``struct`` is not rewritten by this pass.
+    """
+    if not _is_document_level(struct):
+        return set()
+    groups: dict[tuple, list[Field]] = defaultdict(list)
+    for node in struct.body:
+        if not isinstance(node, Field):
+            continue
+        ops = _pipeline(node)
+        if ops and isinstance(ops[0], _SELECTORS):
+            groups[_op_key(ops[0])].append(node)
+    return {
+        id(field)
+        for members in groups.values()
+        if len(members) > 1
+        for field in members
+    }
+
+
+def _is_document_level(struct: Struct) -> bool:
+    # a remove op mutates the document between fields, so a prefix
+    # hoisted before it would see nodes a later field must not
+    if struct_removes_nodes(struct):
+        return False
+    if struct.type == StructType.ITEM:
+        return True
+    return struct.type == StructType.RAW and not any(
+        isinstance(n, SplitDoc) for n in struct.body
+    )
+
+
+def _op_key(node: Node) -> tuple:
+    """Structural identity of a pipeline op (ignores position and parent)."""
+    values = tuple(
+        repr(getattr(node, f.name))
+        for f in dataclasses.fields(node)
+        if f.name not in _IGNORED_FIELDS
+    )
+    return (type(node).__name__, values, tuple(_op_key(c) for c in node.body))
+
+
+def _pipeline(field: Field) -> list[Node]:
+    """Mutable op list of ``field`` (inside ``fallback`` when present)."""
+    body = field.body
+    if body and isinstance(body[0], Fallback):
+        return body[0].body
+    return body
+
+
+def _hoistable_prefix(ops: list[Node]) -> list[tuple]:
+    keys: list[tuple] = []
+    for op in ops:
+        if not isinstance(op, _HOISTABLE) or isinstance(op, Return):
+            break
+        if isinstance(op, Self) and keys:
+            break
+        keys.append(_op_key(op))
+    return keys
+
+
+def _common_length(prefixes: list[list[tuple]]) -> int:
+    n = 0
+    for column in zip(*prefixes):
+        if any(key != column[0] for key in column[1:]):
+            break
+        n += 1
+    return n
+
+
+def _eliminate_in_struct(struct: Struct) -> int:
+    # compared after snake-casing, like the generated member names
+    taken = {
+        to_snake_case(n.name)
+        for n in struct.body
+        if isinstance(n, (Field, InitField))
+    }
+    counter = 0
+    created = 0
+    changed = True
+    # Each round hoists one level; fields that share a longer prefix than
+    # the rest of their group are regrouped behind the new Self next round.
+    while changed:
+        changed = False
+        groups: dict[tuple, list[tuple[Field, list[tuple]]]] = defaultdict(list)
+        for node in struct.body:
+            if not isinstance(node, Field):
+                continue
+            prefix = _hoistable_prefix(_pipeline(node))
+            if not prefix:
+                continue
+            if prefix[0][0] != "Self":
+                groups[prefix[0]].append((node, prefix))
+            elif len(prefix) > 1:
+                # sharing only the Self reference itself gains nothing
+                groups[tuple(prefix[:2])].append((node, prefix))
+
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            length = _common_length([prefix for _, prefix in members])
+            while f"{_NAME_PREFIX}{counter}" in taken:
+                counter += 1
+            name = f"{_NAME_PREFIX}{counter}"
+            taken.add(name)
+            _hoist(struct, name, [field for field, _ in members], length)
+            created += 1
+            changed = True
+    return created
+
+
+def _hoist(struct: Struct, name: str, fields: list[Field], length: int) -> None:
+    template = _pipeline(fields[0])[:length]
+    ret = copy.deepcopy(template[-1].ret_type_info)
+    init = InitField(
+        parent=struct,
+        name=name,
+        lazy=True,
+        accept_type_info=copy.deepcopy(fields[0].accept_type_info),
+        ret_type_info=ret,
+    )
+    for field in fields:
+        ops = _pipeline(field)
+        ref = Self(
+            parent=ops[0].parent,
+            name=name,
+            accept_type_info=copy.deepcopy(ops[0].accept_type_info),
+            ret_type_info=copy.deepcopy(ret),
+            is_array=ret.is_array,
+        )
+        ops[:length] = [ref]
+    # the first field's ops move into the init; the others' are dropped
+    for op in template:
+        op.parent = init
+        init.body.append(op)
+    init.body.append(
+        Return(
+            parent=init,
+            accept_type_info=copy.deepcopy(ret),
+            ret_type_info=copy.deepcopy(ret),
+        )
+    )
+    # after Init (always body[0]) and the InitFields, before the fields
+    index = next(
+        i
+        for i, node in enumerate(struct.body)
+        if i > 0 and not isinstance(node, InitField)
+    )
+    struct.body.insert(index, init)
@@ -0,0 +1,343 @@
+"""Peephole rewrites of redundant and collapsible pipeline ops.
+
+Each rule looks at one op or a pair of adjacent ops and replaces them with
+a cheaper equivalent:
+
+- O101 ``css-all Q; first`` (or ``index 0``) -> ``css Q``; same for xpath.
+  Only applied when the element is dereferenced next (``text``, ``raw``,
+  ``attr`` or another selector), so a missing match still raises.
+- O102 ``trim`` next to ``normalize-space`` is dropped: normalized text
+  has no surrounding whitespace.
+- O103 an idempotent op repeated (``lower; lower``, ``trim; trim``,
+  ``unique; unique``...) keeps one copy.
+- O104 ``re-sub`` with a pattern free of regex syntax -> ``repl``.
+- O105 ``filter`` predicates a selector can express move into the
+  preceding ``css-all``/``xpath-all`` (see ``optimize.pushdown``).
+- O106 ``css-all Q; slice 0 N`` / ``index K`` keeps only the first
+  matches (``limit``), and ``css-all Q; len`` counts without the list
+  (``CssCount``); same for xpath. Backends stop the search early where
+  their engine allows it.
+
+Rewrites never change the accepted or returned type of the pipeline
+segment they touch, so ``type_checking`` results stay valid.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from kdlquery.parser import Span
+
+from ssc_codegen.ast import (
+    Attr,
+    CssCount,
+    CssSelect,
+    CssSelectAll,
+    FunctionDef,
+    Index,
+    Len,
+    Lower,
+    Ltrim,
+    Module,
+    NormalizeSpace,
+    Raw,
+    Repl,
+    ReSub,
+    Rtrim,
+    Slice,
+    Struct,
+    StructBase,
+    Text,
+    Trim,
+    Unique,
+    Upper,
+    XpathCount,
+    XpathSelect,
+    XpathSelectAll,
+)
+from ssc_codegen.ast.base import Node
+from ssc_codegen.optimize.cse import shared_selector_fields
+from ssc_codegen.optimize.pushdown import push_filter
+
+# characters that give a regex pattern (or a replacement) special meaning
+_REGEX_SYNTAX = frozenset(".^$*+?{}[]\\|()")
+_REPL_SYNTAX = frozenset("\\$")
+
+# ops that fail on a missing element, like indexing an empty list does
+_DEREFERENCES = (
+    Text,
+    Raw,
+    Attr,
+    CssSelect,
+    CssSelectAll,
+    XpathSelect,
+    XpathSelectAll,
+)
+
+_TRIMS = (Trim, Ltrim, Rtrim)
+
+
+@dataclass
+class Rewrite:
+    """One applied rewrite, for ``ssc-gen check`` reports."""
+
+    code: str
+    message: str
+    scope: str  # "Struct.field"
+    span: Span | None = None
+
+    def to_dict(self, path: str = "") -> dict:
+        """Serialize like ``format.diagnostic_to_dict``, severity ``info``."""
+        zero = {"offset": 0, "line": 0, "column": 0}
+        start = end = zero
+        if self.span is not None:
+            s, e = self.span.start, self.span.end
+            start = {"offset": s.offset, "line": s.line, "column": s.column}
+            end = {"offset": e.offset, "line": e.line, "column": e.column}
+        return {
+            "code": self.code,
+            "severity": "info",
+            "message": self.message,
+            "hint": "",
+            "path": path,
+            "label": "optimized",
+            "notes": [f"scope: {self.scope}"],
+            "span": {"start": start, "end": end},
+        }
+
+
+# A rule gets the op list and an index; it returns
+# (code, message, number of ops replaced, replacement ops) or None.
+_Match = tuple[str, str, int, list[Node]]
+_Rule = Callable[[list[Node], int], "_Match | None"]
+
+
+def _select_first(ops: list[Node], i: int) -> _Match | None:
+    if i + 2 >= len(ops):
+        return None
+    select, index, after = ops[i], ops[i + 1], ops[i + 2]
+    if not (
+        isinstance(select, (CssSelectAll, XpathSelectAll))
+        and isinstance(index, Index)
+        and index.i == 0
+        and isinstance(after, _DEREFERENCES)
+    ):
+        return None
+    single = CssSelect if isinstance(select, CssSelectAll) else XpathSelect
+    node = single(
+        parent=select.parent,
+        queries=list(select.queries),
+        accept_type_info=select.accept_type_info,
+        ret_type_info=index.ret_type_info,
+        is_array=False,
+        span=select.span,
+    )
+    kind = "css" if single is CssSelect else "xpath"
+    query = select.queries[0] if select.queries else ""
+    return (
+        "O101",
+        f"{kind}-all {query!r} + first collapsed to {kind} {query!r}",
+        2,
+        [node],
+    )
+
+
+def _trim_after_normalize(ops: list[Node], i: int) -> _Match | None:
+    if i + 1 >= len(ops):
+        return None
+    first, second = ops[i], ops[i + 1]
+    if isinstance(first, NormalizeSpace) and _is_plain_trim(second):
+        return (
+            "O102",
+            "'trim' after 'normalize-space' removed",
+            2,
+            [first],
+        )
+    if (
+        isinstance(first, Trim)
+        and not first.substr
+        and isinstance(second, NormalizeSpace)
+    ):
+        return (
+            "O102",
+            "'trim' before 'normalize-space' removed",
+            2,
+            [second],
+        )
+    return None
+
+
+def _is_plain_trim(node: Node) -> bool:
+    return isinstance(node, _TRIMS) and not node.substr
+
+
+def _duplicate(ops: list[Node], i: int) -> _Match | None:
+    if i + 1 >= len(ops):
+        return None
+    first, second = ops[i], ops[i + 1]
+    if type(first) is not type(second):
+        return None
+    if isinstance(first, (Lower, Upper, NormalizeSpace)):
+        same = True
+    elif isinstance(first, _TRIMS):
+        same = first.substr == second.substr
+    elif isinstance(first, Unique):
+        same = first.keep_order == second.keep_order
+    else:
+        return None
+    if not same:
+        return None
+    name = _OP_NAMES[type(first)]
+    return ("O103", f"repeated '{name}' removed", 2, [first])
+
+
+def _literal_re_sub(ops: list[Node], i: int) -> _Match | None:
+    op = ops[i]
+    if not isinstance(op, ReSub):
+        return None
+    if not op.pattern or _REGEX_SYNTAX.intersection(op.pattern):
+        return None
+    if _REPL_SYNTAX.intersection(op.repl):
+        return None
+    node = Repl(
+        parent=op.parent,
+        old=op.pattern,
+        new=op.repl,
+        accept_type_info=op.accept_type_info,
+        ret_type_info=op.ret_type_info,
+        is_array=op.is_array,
+        span=op.span,
+    )
+    return (
+        "O104",
+        f"re-sub {op.pattern!r} has no regex syntax; replaced by repl",
+        1,
+        [node],
+    )
+
+
+def _limit_or_count(ops: list[Node], i: int) -> _Match | None:
+    if i + 1 >= len(ops):
+        return None
+    select, after = ops[i], ops[i + 1]
+    if not (
+        isinstance(select, (CssSelectAll, XpathSelectAll))
+        and len(select.queries) == 1
+    ):
+        return None
+    kind = "css-all" if isinstance(select, CssSelectAll) else "xpath-all"
+    query = select.queries[0]
+    if isinstance(after, Len):
+        count = CssCount if isinstance(select, CssSelectAll) else XpathCount
+        node = count(
+            parent=select.parent,
+            queries=[query],
+            accept_type_info=select.accept_type_info,
+            ret_type_info=after.ret_type_info,
+            span=select.span,
+        )
+        return ("O106", f"{kind} {query!r} + len counted in place", 2, [node])
+    if isinstance(after, Slice) and 0 <= after.start < after.end:
+        limit = after.end
+        # slice 0 N is exactly the limit
+        replacement = [select] if after.start == 0 else [select, after]
+    elif isinstance(after, Index) and after.i >= 0:
+        limit = after.i + 1
+        replacement = [select, after]
+    else:
+        return None
+    if select.limit and select.limit <= limit:
+        return None
+    select.limit = limit
+    return (
+        "O106",
+        f"{kind} {query!r} stops after {limit} match(es)",
+        2,
+        replacement,
+    )
+
+
+_OP_NAMES: dict[type, str] = {
+    Lower: "lower",
+    Upper: "upper",
+    NormalizeSpace: "normalize-space",
+    Trim: "trim",
+    Ltrim: "ltrim",
+    Rtrim: "rtrim",
+    Unique: "unique",
+}
+
+_RULES: tuple[_Rule, ...] = (
+    push_filter,
+    _select_first,
+    _limit_or_count,
+    _trim_after_normalize,
+    _duplicate,
+    _literal_re_sub,
+)
+
+
+def _rewrite_ops(
+    ops: list[Node], scope: str, out: list[Rewrite], rules: tuple[_Rule, ...]
+) -> None:
+    i = 0
+    while i < len(ops):
+        for rule in rules:
+            match = rule(ops, i)
+            if match is None:
+                continue
+            code, message, count, replacement = match
+            out.append(Rewrite(code, message, scope, ops[i].span))
+            ops[i : i + count] = replacement
+            # the replacement may now pair with the op before it
+            i = max(i - 1, 0)
+            break
+        else:
+            i += 1
+
+
+def _walk(
+    node: Node, scope: str, out: list[Rewrite], rules: tuple[_Rule, ...]
+) -> None:
+    _rewrite_ops(node.body, scope, out, rules)
+    for child in node.body:
+        name = getattr(child, "name", None)
+        child_scope = f"{scope}.{name}" if isinstance(name, str) else scope
+        _walk(child, child_scope, out, rules)
+
+
+def rewrite_module(
+    module: Module, *, keep_shared: bool = True
+) -> list[Rewrite]:
+    """Apply every rule to all pipelines of ``module``, in place.
+
+    Args:
+        keep_shared: skip O106 on fields whose leading selector is shared
+            with another field, so ``optimize.cse`` can still run it once
+            for all of them.
+
+    Returns the applied rewrites in source order of their pipelines.
+    """
+    out: list[Rewrite] = []
+    early = tuple(r for r in _RULES if r is not _limit_or_count)
+    for node in module.body:
+        if not isinstance(node, (StructBase, FunctionDef)):
+            continue
+        found: list[list[Rewrite]] = []
+        for child in node.body:
+            name = getattr(child, "name", None) or type(child).__name__
+            found.append([])
+            _walk(child, f"{node.name}.{name}", found[-1], early)
+        # sharing is decided on the canonicalized pipelines
+        shared = (
+            shared_selector_fields(node)
+            if keep_shared and isinstance(node, Struct)
+            else set()
+        )
+        for child, rewrites in zip(node.body, found):
+            if id(child) not in shared:
+                name = getattr(child, "name", None) or type(child).__name__
+                _walk(child, f"{node.name}.{name}", rewrites, _RULES)
+            out.extend(rewrites)
+    return out
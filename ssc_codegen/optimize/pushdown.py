@@ -0,0 +1,240 @@
+"""Pushdown of ``filter`` predicates into the preceding ``css-all``/``xpath-all``.
+
+``css-all "a"; filter { attr-starts "href" "/" }`` builds the full match
+list and tests each element in the target language. The attribute test
+can run inside the selector engine instead::
+
+    css-all "a[href^=\"/\"]"
+
+Predicates a selector can express are moved into the query; the rest stay
+behind in a (smaller) residual ``filter``, which is dropped once empty.
+
+A predicate is only pushed where every backend gives the same result
+either way.
+
+Pushed into CSS (one value only; ``:is()`` is not assumed): ``attr-eq``,
+``attr-starts``, ``attr-ends``, ``attr-contains``.
+
+Pushed into XPath (``or`` for several values): ``has-attr``, ``attr-eq``,
+``attr-starts``, ``attr-contains`` and relative ``xpath`` (``./...``)
+sub-queries.
+
+Left in place: empty values (CSS ``[a^=""]`` never matches, ``startswith``
+always does), multi-query selectors (first-non-empty fallback must see
+the unfiltered lists), ``css`` sub-queries (``:has()`` scoping differs
+from ``select_one`` across backends) and anything under ``not``/``or``.
+Also ``has-attr`` in CSS (bs4 rejects empty-valued attributes, ``[a]``
+matches them), attribute tests on names bs4 splits into lists (``class``,
+``rel``, ...) in CSS, and ``text-contains`` (parsel joins text nodes
+with spaces, ``string(.)`` does not).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+
+from ssc_codegen.ast import (
+    CssSelectAll,
+    Filter,
+    LogicAnd,
+    PredAttrContains,
+    PredAttrEnds,
+    PredAttrEq,
+    PredAttrStarts,
+    PredHasAttr,
+    PredXpath,
+    XpathSelectAll,
+)
+from ssc_codegen.ast.base import Node
+
+_CSS_IDENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+# attributes bs4 returns as lists of tokens: its predicates compare them
+# differently from the selector engine, which sees the raw string
+_BS4_LIST_ATTRS = frozenset(
+    {
+        "class",
+        "rel",
+        "rev",
+        "accept-charset",
+        "headers",
+        "accesskey",
+        "dropzone",
+        "archive",
+    }
+)
+_CSS_OPERATORS: dict[type, str] = {
+    PredAttrEq: "=",
+    PredAttrStarts: "^=",
+    PredAttrEnds: "$=",
+    PredAttrContains: "*=",
+}
+
+
+def _css_string(value: str) -> str | None:
+    if not value or any(ord(c) < 0x20 for c in value):
+        return None
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def _css_predicate(pred: Node) -> str | None:
+    """``[attr...]`` equivalent of ``pred``, or None."""
+    op = _CSS_OPERATORS.get(type(pred))
+    if op is None or len(pred.values) != 1 or not _CSS_IDENT.match(pred.name):
+        return None
+    if pred.name.lower() in _BS4_LIST_ATTRS:
+        return None
+    value = _css_string(pred.values[0])
+    if value is None:
+        return None
+    return f"[{pred.name}{op}{value}]"
+
+
+def _xpath_string(value: str) -> str | None:
+    # XPath 1.0 string literals have no escapes
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return None
+
+
+def _xpath_any(template: str, values: tuple[str, ...]) -> str | None:
+    literals = [_xpath_string(v) for v in values if v]
+    if not literals or len(literals) != len(values) or None in literals:
+        return None
+    return " or ".join(template.format(v) for v in literals)
+
+
+def _xpath_predicate(pred: Node) -> str | None:
+    """XPath predicate expression equivalent of ``pred``, or None."""
+    if isinstance(pred, PredHasAttr):
+        if not all(_CSS_IDENT.match(a) for a in pred.attrs):
+            return None
+        return " or ".join(f"@{a}" for a in pred.attrs)
+    if isinstance(pred, (PredAttrEq, PredAttrStarts, PredAttrContains)):
+        if not _CSS_IDENT.match(pred.name):
+            return None
+        template = {
+            PredAttrEq: f"@{pred.name}={{}}",
+            PredAttrStarts: f"starts-with(@{pred.name}, {{}})",
+            PredAttrContains: f"contains(@{pred.name}, {{}})",
+        }[type(pred)]
+        return _xpath_any(template, pred.values)
+    if isinstance(pred, PredXpath):
+        # a location path yields a node-set: no positional reading
+        query = pred.query.strip()
+        return query if query.startswith("./") else None
+    return None
+
+
+def _top_level(query: str, chars: str) -> list[int]:
+    """Offsets of ``chars`` in ``query`` outside brackets and quotes."""
+    found = []
+    depth = 0
+    quote = ""
+    for pos, c in enumerate(query):
+        if quote:
+            if c == quote:
+                quote = ""
+        elif c in "'\"":
+            quote = c
+        elif c in "[(":
+            depth += 1
+        elif c in "])":
+            depth -= 1
+        elif depth == 0 and c in chars:
+            found.append(pos)
+    return found
+
+
+def _css_target(query: str) -> bool:
+    """True if ``[..]`` appended to ``query`` filters its matches."""
+    query = query.strip()
+    return bool(
+        query
+        and "::" not in query
+        and not _top_level(query, ",")
+        and query[-1] not in ">+~"
+    )
+
+
+def _xpath_target(query: str) -> str | None:
+    """``query`` in a form that takes a ``[..]`` filter, or None."""
+    query = query.strip()
+    slashes = _top_level(query, "/")
+    last = query[slashes[-1] + 1 :] if slashes else query
+    # attribute/text steps do not select elements; the abbreviated
+    # steps `.` and `..` cannot take a predicate in XPath 1.0
+    step = last.split("[", 1)[0].strip()
+    if not step or step.startswith("@") or "(" in step or step in (".", ".."):
+        return None
+    if _top_level(query, "|"):
+        return f"({query})"
+    return query
+
+
+def _partition(
+    preds: list[Node], translate: Callable[[Node], str | None]
+) -> tuple[list[str], list[Node]]:
+    """Split ``preds`` into pushed tests and residual nodes (AND semantics)."""
+    pushed: list[str] = []
+    residual: list[Node] = []
+    for pred in preds:
+        if isinstance(pred, LogicAnd):
+            inner_pushed, inner_residual = _partition(pred.body, translate)
+            pushed.extend(inner_pushed)
+            if inner_residual:
+                pred.body[:] = inner_residual
+                residual.append(pred)
+            continue
+        test = translate(pred)
+        if test is None:
+            residual.append(pred)
+        else:
+            pushed.append(test)
+    return pushed, residual
+
+
+def push_filter(ops: list[Node], i: int):
+    """Peephole rule: ``css-all/xpath-all Q; filter {..}`` -> ``Q[..]``.
+
+    Returns ``(code, message, count, replacement)`` like the rules in
+    ``optimize.peephole``, or None.
+    """
+    if i + 1 >= len(ops):
+        return None
+    select, filter_ = ops[i], ops[i + 1]
+    if not (
+        isinstance(select, (CssSelectAll, XpathSelectAll))
+        and isinstance(filter_, Filter)
+        and len(select.queries) == 1
+    ):
+        return None
+    query = select.queries[0]
+    if isinstance(select, CssSelectAll):
+        if not _css_target(query):
+            return None
+        pushed, residual = _partition(filter_.body, _css_predicate)
+        new_query = query.strip() + "".join(pushed)
+    else:
+        target = _xpath_target(query)
+        if target is None:
+            return None
+        pushed, residual = _partition(filter_.body, _xpath_predicate)
+        new_query = target + "".join(f"[{t}]" for t in pushed)
+    if not pushed:
+        return None
+    select.queries = [new_query]
+    replacement: list[Node] = [select]
+    if residual:
+        filter_.body[:] = residual
+        replacement.append(filter_)
+    kind = "css-all" if isinstance(select, CssSelectAll) else "xpath-all"
+    return (
+        "O105",
+        f"{len(pushed)} filter predicate(s) pushed into {kind} {new_query!r}",
+        2,
+        replacement,
+    )
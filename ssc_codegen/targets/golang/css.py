@@ -0,0 +1,27 @@
+"""Precompiled cascadia matchers for the Go backend.
+
+``Selection.Find(q)`` compiles ``q`` with cascadia on every call, so a
+list struct parsing thousands of rows recompiles each field selector per
+row. Every CSS query is instead hoisted into a package-level matcher var
+declared once in ``sscgen_runtime.go`` and passed to ``FindMatcher``.
+
+Var names are derived from the query text, so identical queries share one
+matcher across structs and across every parser file in the package.
+"""
+
+from __future__ import annotations
+
+from ssc_codegen.targets.golang.literals import go_str
+from ssc_codegen.traversal.utils import regex_digest
+
+CSS_VAR_PREFIX = "sscCss"
+
+
+def go_css_var_name(query: str) -> str:
+    """Package-level matcher var name for ``query``."""
+    return f"{CSS_VAR_PREFIX}{regex_digest(query)}"
+
+
+def go_css_var_line(query: str) -> str:
+    """Declaration of the precompiled matcher for ``query``."""
+    return f"var {go_css_var_name(query)} = stdCompileCss({go_str(query)})"
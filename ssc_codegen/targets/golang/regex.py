@@ -11,6 +11,8 @@ See docs/llm.txt for DSL regex grammar constraints.
 
 from __future__ import annotations
 
+from ssc_codegen.traversal.utils import regex_digest
+
 
 def py_re_to_go_raw(pattern: str) -> str:
     """Render a Python regex pattern as a Go raw-string literal.
@@ -24,3 +26,21 @@ def py_re_to_go_raw(pattern: str) -> str:
         return f"`{pattern}`"
     escaped = pattern.replace("\\", "\\\\").replace('"', '\\"')
     return f'"{escaped}"'
+
+
+RE_VAR_PREFIX = "sscRe"
+
+
+def go_re_var_name(pattern: str) -> str:
+    """Package-level ``*regexp.Regexp`` var name for ``pattern``.
+
+    Derived from the pattern text, so every parser file in the package
+    refers to the same var declared once in ``sscgen_runtime.go``.
+    """
+    return f"{RE_VAR_PREFIX}{regex_digest(pattern)}"
+
+
+def go_re_var_line(pattern: str) -> str:
+    """Declaration of the precompiled var for ``pattern``."""
+    raw = py_re_to_go_raw(pattern)
+    return f"var {go_re_var_name(pattern)} = regexp.MustCompile({raw})"
@@ -1,13 +1,18 @@
 """Go runtime helper definitions for ssc-gen.
 
-Three exports:
+Four exports:
 
 - BASE_RUNTIME      — always-present source lines (stdFallback, sentinel).
 - BASE_REST_RUNTIME — REST runtime types (always present in REST modules).
+- BENCH_RUNTIME     — helper lines of the generated benchmark file.
 - GO_RUNTIME        — dict {name: (imports, code)} for optional helpers.
 
 Every helper uses the std prefix.  Arr suffixed variants handle
-[]string inputs by calling the scalar version in a loop.
+[]string inputs by calling the scalar version in a loop.  Regex helpers
+take a precompiled ``*regexp.Regexp`` (package-level ``sscRe*`` vars
+emitted into the runtime file), never a pattern string.  CSS queries are
+likewise package-level ``sscCss*`` cascadia matchers built once by
+``stdCompileCss``.
 
 The visitor registers helpers via ModuleBuilder.require_std using the
 imports list so that emit_runtime can assemble correct Go imports
@@ -32,11 +37,187 @@ BASE_RUNTIME: list[str] = [
     "",
 ]
 
+# Shared helper of sscgen_bench_test.go (see GoVisitor.emit_bench).
+BENCH_RUNTIME: list[str] = [
+    "// sscBenchInput reads the benchmark document for a struct from",
+    "// $SSC_BENCH_DIR/<name>.html (default testdata/<name>.html).",
+    "func sscBenchInput(b *testing.B, name string) string {",
+    "\tb.Helper()",
+    '\tdir := os.Getenv("SSC_BENCH_DIR")',
+    '\tif dir == "" {',
+    '\t\tdir = "testdata"',
+    "\t}",
+    '\tdata, err := os.ReadFile(filepath.Join(dir, name+".html"))',
+    "\tif err != nil {",
+    '\t\tb.Skipf("no benchmark input: %v", err)',
+    "\t}",
+    "\treturn string(data)",
+    "}",
+    "",
+]
+
 # ---------------------------------------------------------------------------
 # Optional helpers — keyed by name, value is (go_imports, go_source).
 # ---------------------------------------------------------------------------
 
 GO_RUNTIME: dict[str, tuple[list[str], str]] = {
+    # === SELECTORS ===
+    "stdCompileCss": (
+        ['"github.com/andybalholm/cascadia"'],
+        """\
+// stdCompileCss compiles a CSS query once, at package init. Like
+// goquery's Find, an invalid query matches nothing instead of panicking.
+func stdCompileCss(query string) cascadia.Selector {
+\tsel, err := cascadia.Compile(query)
+\tif err != nil {
+\t\treturn cascadia.MustCompile(":not(*)")
+\t}
+\treturn sel
+}""",
+    ),
+    "stdFindLimit": (
+        [
+            '"github.com/PuerkitoBio/goquery"',
+            '"github.com/andybalholm/cascadia"',
+            'xhtml "golang.org/x/net/html"',
+        ],
+        """\
+// stdFindLimit is FindMatcher that stops after n matches, in document
+// order. Only the first n elements are collected instead of every match.
+func stdFindLimit(s *goquery.Selection, m cascadia.Selector, n int) *goquery.Selection {
+\tif len(s.Nodes) != 1 {
+\t\tfound := s.FindMatcher(m)
+\t\tif found.Length() > n {
+\t\t\treturn found.Slice(0, n)
+\t\t}
+\t\treturn found
+\t}
+\tvar found []*xhtml.Node
+\tvar walk func(*xhtml.Node) bool
+\twalk = func(node *xhtml.Node) bool {
+\t\tfor c := node.FirstChild; c != nil; c = c.NextSibling {
+\t\t\tif c.Type == xhtml.ElementNode && m.Match(c) {
+\t\t\t\tfound = append(found, c)
+\t\t\t\tif len(found) == n {
+\t\t\t\t\treturn false
+\t\t\t\t}
+\t\t\t}
+\t\t\tif !walk(c) {
+\t\t\t\treturn false
+\t\t\t}
+\t\t}
+\t\treturn true
+\t}
+\twalk(s.Nodes[0])
+\treturn s.FindNodes(found...)
+}""",
+    ),
+    "stdCountMatches": (
+        [
+            '"github.com/PuerkitoBio/goquery"',
+            '"github.com/andybalholm/cascadia"',
+            'xhtml "golang.org/x/net/html"',
+        ],
+        """\
+// stdCountMatches is FindMatcher(m).Length() without building the
+// Selection.
+func stdCountMatches(s *goquery.Selection, m cascadia.Selector) int64 {
+\tif len(s.Nodes) != 1 {
+\t\treturn int64(s.FindMatcher(m).Length())
+\t}
+\tvar count int64
+\tvar walk func(*xhtml.Node)
+\twalk = func(node *xhtml.Node) {
+\t\tfor c := node.FirstChild; c != nil; c = c.NextSibling {
+\t\t\tif c.Type == xhtml.ElementNode && m.Match(c) {
+\t\t\t\tcount++
+\t\t\t}
+\t\t\twalk(c)
+\t\t}
+\t}
+\twalk(s.Nodes[0])
+\treturn count
+}""",
+    ),
+    # === INSTRUMENTATION (--instrument) ===
+    "stdTrack": (
+        ['"sync"', '"time"'],
+        """\
+// SscMetric holds the counters of one instrumented method.
+type SscMetric struct {
+\tCalls   int64
+\tTotalNs int64
+\tErrors  int64
+}
+
+// SscMetricsSink receives one record per instrumented method call.
+type SscMetricsSink interface {
+\tRecord(name string, elapsed time.Duration, failed bool)
+}
+
+// SscRegistry is the default SscMetricsSink: in-memory counters, safe for
+// concurrent use.
+type SscRegistry struct {
+\tmu      sync.Mutex
+\tmetrics map[string]*SscMetric
+}
+
+func (r *SscRegistry) Record(name string, elapsed time.Duration, failed bool) {
+\tr.mu.Lock()
+\tdefer r.mu.Unlock()
+\tif r.metrics == nil {
+\t\tr.metrics = map[string]*SscMetric{}
+\t}
+\tm := r.metrics[name]
+\tif m == nil {
+\t\tm = &SscMetric{}
+\t\tr.metrics[name] = m
+\t}
+\tm.Calls++
+\tm.TotalNs += elapsed.Nanoseconds()
+\tif failed {
+\t\tm.Errors++
+\t}
+}
+
+// Snapshot returns a copy of the current counters keyed by "Struct.method".
+func (r *SscRegistry) Snapshot() map[string]SscMetric {
+\tr.mu.Lock()
+\tdefer r.mu.Unlock()
+\tout := make(map[string]SscMetric, len(r.metrics))
+\tfor name, m := range r.metrics {
+\t\tout[name] = *m
+\t}
+\treturn out
+}
+
+// Reset drops all counters.
+func (r *SscRegistry) Reset() {
+\tr.mu.Lock()
+\tdefer r.mu.Unlock()
+\tr.metrics = nil
+}
+
+// SscMetricsRegistry collects the counters of instrumented parsers.
+var SscMetricsRegistry = &SscRegistry{}
+
+// SscMetrics is where instrumented methods report; replace it to forward
+// the counters elsewhere.
+var SscMetrics SscMetricsSink = SscMetricsRegistry
+
+// stdTrack times one instrumented call; defer the returned func. A panic
+// is counted as an error and re-raised.
+func stdTrack(name string) func() {
+\tstart := time.Now()
+\treturn func() {
+\t\tr := recover()
+\t\tSscMetrics.Record(name, time.Since(start), r != nil)
+\t\tif r != nil {
+\t\t\tpanic(r)
+\t\t}
+\t}
+}""",
+    ),
     "stdJSONBody": (
         ['"encoding/json"'],
         """\
@@ -312,8 +493,7 @@ func stdUnescapeArr(arr []string) []string {
     "stdReSearch": (
         ['"regexp"'],
         """\
-func stdReSearch(pattern, value, msg string) string {
-\tre := regexp.MustCompile(pattern)
+func stdReSearch(re *regexp.Regexp, value, msg string) string {
 \tm := re.FindStringSubmatch(value)
 \tif m == nil {
 \t\tpanic("ssc-gen: " + msg)
@@ -322,12 +502,12 @@ func stdReSearch(pattern, value, msg string) string {
 }""",
     ),
     "stdReSearchArr": (
-        [],
+        ['"regexp"'],
         """\
-func stdReSearchArr(arr []string, pattern, msg string) []string {
+func stdReSearchArr(arr []string, re *regexp.Regexp, msg string) []string {
 \tr := make([]string, len(arr))
 \tfor i, s := range arr {
-\t\tr[i] = stdReSearch(pattern, s, msg)
+\t\tr[i] = stdReSearch(re, s, msg)
 \t}
 \treturn r
 }""",
@@ -335,15 +515,14 @@ func stdReSearchArr(arr []string, pattern, msg string) []string {
     "stdReMatch": (
         ['"regexp"'],
         """\
-func stdReMatch(pattern, value string) bool {
-\treturn regexp.MustCompile(pattern).MatchString(value)
+func stdReMatch(re *regexp.Regexp, value string) bool {
+\treturn re.MatchString(value)
 }""",
     ),
     "stdReAllMatch": (
         ['"regexp"'],
         """\
-func stdReAllMatch(pattern string, arr []string) bool {
-\tre := regexp.MustCompile(pattern)
+func stdReAllMatch(re *regexp.Regexp, arr []string) bool {
 \tfor _, s := range arr {
 \t\tif !re.MatchString(s) {
 \t\t\treturn false
@@ -355,8 +534,7 @@ func stdReAllMatch(pattern string, arr []string) bool {
     "stdReAnyMatch": (
         ['"regexp"'],
         """\
-func stdReAnyMatch(pattern string, arr []string) bool {
-\tre := regexp.MustCompile(pattern)
+func stdReAnyMatch(re *regexp.Regexp, arr []string) bool {
 \tfor _, s := range arr {
 \t\tif re.MatchString(s) {
 \t\t\treturn true
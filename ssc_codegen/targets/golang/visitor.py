@@ -20,6 +20,7 @@ from __future__ import annotations
 import re
 import shutil
 import subprocess
+from collections.abc import Iterable
 from typing import Any
 
 from ssc_codegen.ast import (
@@ -28,6 +29,7 @@ from ssc_codegen.ast import (
     CheckMethod,
     CodeEndHook,
     CodeStartHook,
+    CssCount,
     CssRemove,
     CssSelect,
     CssSelectAll,
@@ -127,6 +129,7 @@ from ssc_codegen.ast import (
     Utilities,
     Value,
     VariableType as VT,
+    XpathCount,
     XpathRemove,
     XpathSelect,
     XpathSelectAll,
@@ -137,21 +140,33 @@ from ssc_codegen.naming import (
     to_snake_case,
 )
 from ssc_codegen.traversal.utils import (
+    TableRoutes,
+    find_init_field,
     find_predicate_container,
+    find_struct,
     module_has_html_struct,
     module_uses_http,
+    struct_has_iter_parse,
+    table_routes,
 )
 from ssc_codegen.generation.builder import ModuleBuilder
+from ssc_codegen.optimize import optimize_module
 from ssc_codegen.exceptions import BuildTimeError
 from ssc_codegen.targets.golang.literals import (
     go_str as _go_str,
     go_str_array as _go_str_array,
     go_str_map as _go_str_map,
 )
-from ssc_codegen.targets.golang.regex import py_re_to_go_raw
+from ssc_codegen.targets.golang.css import go_css_var_line, go_css_var_name
+from ssc_codegen.targets.golang.regex import (
+    RE_VAR_PREFIX,
+    go_re_var_line,
+    go_re_var_name,
+)
 from ssc_codegen.targets.golang.runtime import (
     BASE_REST_RUNTIME,
     BASE_RUNTIME,
+    BENCH_RUNTIME,
     GO_RUNTIME,
 )
 from ssc_codegen.targets.golang import rest
@@ -188,6 +203,11 @@ def _json_tag(field_name: str) -> str:
     return to_snake_case(field_name)
 
 
+def _go_ints(values: Iterable[int]) -> str:
+    """``[]int{...}`` literal."""
+    return "[]int{" + ", ".join(str(v) for v in values) + "}"
+
+
 def _go_zero(go_type: str) -> str:
     """Go zero literal for a type string.
 
@@ -253,6 +273,16 @@ def _gofmt(source: str) -> str:
         raise BuildTimeError(f"failed to execute gofmt: {exc}") from exc
 
 
+# (std_defs, std_imports, consts, has_rest, bench_structs) accumulated
+# across converts.
+GoRuntimeState = tuple[
+    dict[str, tuple[list[str], str]],
+    list[str],
+    dict[str, str],
+    bool,
+    dict[str, bool],
+]
+
 _GO_PACKAGE_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _GO_KEYWORDS = {
     "break",
@@ -325,7 +355,9 @@ class GoVisitor(BaseWalker):
         self._file_providers: dict[str, Any] = {}
         self._all_std_defs: dict[str, tuple[list[str], str]] = {}
         self._all_std_imports: list[str] = []
+        self._all_consts: dict[str, str] = {}
         self._has_rest: bool = False
+        self._all_bench_structs: dict[str, bool] = {}
         self._err_schema_map: dict[str, str] = {}
         self._reset_state()
 
@@ -335,6 +367,8 @@ class GoVisitor(BaseWalker):
         self._builder = ModuleBuilder()
         self._http: GoHttpLibStrategy = NetHttpStrategy()
         self._err_schema_map = {}
+        # struct name -> is_raw, for emit_bench.
+        self._bench_structs: dict[str, bool] = {}
 
     def _make_ctx(self, meta: dict) -> WalkContext:
         return WalkContext(
@@ -357,17 +391,25 @@ class GoVisitor(BaseWalker):
 
     def convert_all(self, module_ast: Module, **meta) -> dict[str, str]:
         self._reset_state()
+        module_ast = optimize_module(
+            module_ast,
+            cse=meta.get("cse", True),
+            peephole=meta.get("peephole", True),
+        )
         ctx = self._make_ctx(meta)
         # pass 1: collect std/import registrations.
         self._walk_module(module_ast, ctx)
         # pass 2: emit output.
         lines = self._walk_module(module_ast, ctx)
-        self._all_std_defs.update(self._builder.std_defs)
-        for imp in self._builder.std_imports:
-            if imp not in self._all_std_imports:
-                self._all_std_imports.append(imp)
-        if module_uses_http(module_ast):
-            self._has_rest = True
+        self.merge_runtime_state(
+            (
+                self._builder.std_defs,
+                self._builder.std_imports,
+                self._builder.consts,
+                module_uses_http(module_ast),
+                self._bench_structs,
+            )
+        )
         out: dict[str, str] = {"": _gofmt("\n".join(lines))}
         for fname, provider in self._file_providers.items():
             out[fname] = provider(module_ast, ctx.meta)
@@ -381,6 +423,34 @@ class GoVisitor(BaseWalker):
 
     # === RUNTIME EMISSION ===
 
+    def runtime_state(self) -> GoRuntimeState:
+        """Picklable snapshot of everything accumulated for emit_runtime.
+
+        Lets ``generate --jobs`` convert files in worker processes and fold
+        their helpers back into the parent visitor in input order.
+        """
+        return (
+            dict(self._all_std_defs),
+            list(self._all_std_imports),
+            dict(self._all_consts),
+            self._has_rest,
+            dict(self._all_bench_structs),
+        )
+
+    def merge_runtime_state(self, state: GoRuntimeState) -> None:
+        """Accumulate a runtime_state() snapshot into this visitor."""
+        std_defs, std_imports, consts, has_rest, bench_structs = state
+        self._all_std_defs.update(std_defs)
+        for imp in std_imports:
+            if imp not in self._all_std_imports:
+                self._all_std_imports.append(imp)
+        for name, code in consts.items():
+            self._all_consts.setdefault(name, code)
+        if has_rest:
+            self._has_rest = True
+        for name, is_raw in bench_structs.items():
+            self._all_bench_structs.setdefault(name, is_raw)
+
     def emit_runtime(self, package: str) -> str:
         """Emit sscgen_runtime.go with all accumulated helper functions.
 
@@ -396,6 +466,9 @@ class GoVisitor(BaseWalker):
         ]
 
         imports = sorted(set(self._all_std_imports))
+        has_re = any(n.startswith(RE_VAR_PREFIX) for n in self._all_consts)
+        if has_re and '"regexp"' not in imports:
+            imports = sorted([*imports, '"regexp"'])
         if self._has_rest:
             for imp in self._http.rest_imports:
                 if imp not in imports:
@@ -410,6 +483,12 @@ class GoVisitor(BaseWalker):
 
         lines.extend(BASE_RUNTIME)
 
+        if self._all_consts:
+            # Precompiled regexes and CSS matchers shared by every parser
+            # file in the package.
+            lines.extend(self._all_consts.values())
+            lines.append("")
+
         if self._has_rest:
             lines.extend(BASE_REST_RUNTIME)
             lines.extend(self._http.rest_runtime_lines())
@@ -422,6 +501,77 @@ class GoVisitor(BaseWalker):
 
         return _gofmt("\n".join(lines))
 
+    def _re_var(self, pattern: str) -> str:
+        """Register a package-level precompiled regex var; return its name.
+
+        Vars are declared once in sscgen_runtime.go (see ``emit_runtime``)
+        so parser files never call ``regexp.MustCompile`` per invocation.
+        """
+        return self._builder.require_const(
+            go_re_var_name(pattern), code=go_re_var_line(pattern)
+        )
+
+    def emit_bench(self, package: str) -> str:
+        """Emit sscgen_bench_test.go: one ``go test -bench`` per struct.
+
+        Each benchmark builds the parser and calls ``Parse`` on
+        ``$SSC_BENCH_DIR/<Struct>.html`` (default ``testdata/``) and is
+        skipped when that file does not exist.
+        """
+        package = validate_go_package_name(package)
+        lines: list[str] = [
+            "// Code generated by ssc-gen. DO NOT EDIT.",
+            "",
+            f"package {package}",
+            "",
+            "import (",
+            '\t"os"',
+            '\t"path/filepath"',
+            '\t"testing"',
+            ")",
+            "",
+        ]
+        lines.extend(BENCH_RUNTIME)
+        for name, is_raw in self._all_bench_structs.items():
+            lines.append(f"func Benchmark{name}Parse(b *testing.B) {{")
+            lines.append(f"\tinput := sscBenchInput(b, {_go_str(name)})")
+            lines.append("\tb.ReportAllocs()")
+            lines.append("\tb.SetBytes(int64(len(input)))")
+            lines.append("\tb.ResetTimer()")
+            lines.append("\tfor i := 0; i < b.N; i++ {")
+            if is_raw:
+                lines.append(f"\t\tp := New{name}(input)")
+            else:
+                lines.append(f"\t\tp, err := New{name}(input)")
+                lines.append("\t\tif err != nil {")
+                lines.append("\t\t\tb.Fatal(err)")
+                lines.append("\t\t}")
+            lines.append("\t\t_ = p.Parse()")
+            lines.append("\t}")
+            lines.append("}")
+            lines.append("")
+        return _gofmt("\n".join(lines))
+
+    def _css_var(self, query: str) -> str:
+        """Register a package-level precompiled CSS matcher; return its name.
+
+        Used with ``FindMatcher`` so cascadia compiles each query once per
+        process instead of on every ``Find`` call.
+        """
+        self._require("stdCompileCss")
+        return self._builder.require_const(
+            go_css_var_name(query), code=go_css_var_line(query)
+        )
+
+    def _instrument(
+        self, struct: str, method: str, ctx: WalkContext
+    ) -> list[str]:
+        """``defer stdTrack(...)()`` for ``method`` under ``--instrument``."""
+        if not ctx.meta.get("instrument"):
+            return []
+        self._require("stdTrack")
+        return [f'{ctx.deeper().indent}defer stdTrack("{struct}.{method}")()']
+
     def _require(self, name: str) -> None:
         """Register a runtime helper from GO_RUNTIME by name.
 
@@ -657,6 +807,8 @@ class GoVisitor(BaseWalker):
     ) -> list[str]:
         name = to_pascal_case(node.name)
         rcv = _receiver(name)
+        if isinstance(node, Struct):
+            self._bench_structs[name] = node.type == ST.RAW
         lines: list[str] = []
         if node.doc:
             for doc_line in node.doc.splitlines():
@@ -672,6 +824,9 @@ class GoVisitor(BaseWalker):
         init_fields = self._collect_init_fields(node)
         for cn, gt, _ in init_fields:
             lines.append(f"\t{cn} {gt}")
+        for child in node.body:
+            if isinstance(child, InitField) and child.lazy:
+                lines.append(f"\t{to_camel_case(child.name)}Done bool")
         lines.append("}")
         lines.append("")
 
@@ -705,8 +860,10 @@ class GoVisitor(BaseWalker):
                 f"{i2}}}",
                 f"{i2}{rcv} := &{name}{{sel: doc.Selection}}",
             ]
-        init_fields = self._collect_init_fields(node)
-        if init_fields:
+        if any(
+            isinstance(child, InitField) and not child.lazy
+            for child in node.body
+        ):
             lines.append(f"{i2}{rcv}.init()")
         if is_raw:
             lines.append(f"{i2}return {rcv}")
@@ -783,9 +940,27 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) init{cap}(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, f"init{cap}", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
+        if node.lazy:
+            # the flag is set only after initX returns: a panic inside it
+            # propagates to the caller's fallback and is retried next time
+            i2 = ctx.deeper().indent
+            i3 = ctx.deeper().deeper().indent
+            lines.extend(
+                [
+                    f"{ctx.indent}func ({rcv} *{struct}) get{cap}() {t_ret} {{",
+                    f"{i2}if !{rcv}.{cn}Done {{",
+                    f"{i3}{rcv}.{cn} = {rcv}.init{cap}({rcv}.sel)",
+                    f"{i3}{rcv}.{cn}Done = true",
+                    f"{i2}}}",
+                    f"{i2}return {rcv}.{cn}",
+                    f"{ctx.indent}}}",
+                    "",
+                ]
+            )
         return lines
 
     def _nested_struct_ret_type(self, struct_name: str, nested_node) -> str:
@@ -841,11 +1016,15 @@ class GoVisitor(BaseWalker):
             # Strong-typed (value, bool) pattern: second value signals whether
             # the match predicate succeeded. Caller adds to result map only
             # when bool is true. Eliminates the ``any`` / sentinel workaround.
-            t_arg = "*goquery.Selection"
+            params = "v *goquery.Selection"
+            if self._struct_routes(node.struct) is not None:
+                # the routed row loop passes the key it already computed
+                params += ", key *string"
             i1 = ctx.indent
             i2 = ctx.deeper().indent
             lines = [
-                f"{i1}func ({rcv} *{struct}) {mn}(v {t_arg}) ({t_ret}, bool) {{",
+                f"{i1}func ({rcv} *{struct}) {mn}({params}) ({t_ret}, bool) {{",
+                *self._instrument(struct, mn, ctx),
                 f"{i2}_matched := true",
                 f"{i2}_result := func() {t_ret} {{",
             ]
@@ -859,6 +1038,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) {mn}(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, mn, ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -873,6 +1053,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) preValidate(v {t_arg}) {{"
         ]
+        lines.extend(self._instrument(struct, "preValidate", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -929,6 +1110,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) splitDoc(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, "splitDoc", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -942,6 +1124,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) parseKey(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, "parseKey", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -955,6 +1138,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) parseValue(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, "parseValue", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -970,6 +1154,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) tableConfig(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, "tableConfig", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -985,6 +1170,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) tableMatchKey(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, "tableMatchKey", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -998,6 +1184,7 @@ class GoVisitor(BaseWalker):
         lines = [
             f"{ctx.indent}func ({rcv} *{struct}) tableRows(v {t_arg}) {t_ret} {{"
         ]
+        lines.extend(self._instrument(struct, "tableRows", ctx))
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         lines.append("")
@@ -1005,6 +1192,74 @@ class GoVisitor(BaseWalker):
 
     # === START_PARSE ===
 
+    def _struct_routes(self, struct: Struct) -> TableRoutes | None:
+        start = next(n for n in struct.body if isinstance(n, StartParse))
+        return table_routes(struct, start.fields)
+
+    def _table_route(
+        self, routes: TableRoutes, name: str, rcv: str
+    ) -> list[str]:
+        """``tableRoute``: candidate field indexes for one row, computing
+        its match key once (see ``table_routes``). The key is returned too,
+        so the fields do not compute it again; it is nil when computing it
+        panicked.
+        """
+        var = f"ssc{name}Routes"
+        lines = [f"var {var} = map[string][]int{{"]
+        for key, fields in routes.exact.items():
+            lines.append(f"\t{_go_str(key)}: {_go_ints(fields)},")
+        lines.append("}")
+        lines.append("")
+        if routes.prefixes:
+            lines.append(f"var ssc{name}Prefixes = map[string][]int{{")
+            for prefix, fields in routes.prefixes.items():
+                lines.append(f"\t{_go_str(prefix)}: {_go_ints(fields)},")
+            lines.append("}")
+            lines.append("")
+        lines.extend(
+            [
+                f"func ({rcv} *{name}) tableRoute(row *goquery.Selection) (route []int, key *string) {{",
+                "\tdefer func() {",
+                "\t\tif recover() != nil {",
+                "\t\t\t// fields with a fallback still get to see this row",
+                f"\t\t\troute, key = {_go_ints(range(routes.size))}, nil",
+                "\t\t}",
+                "\t}()",
+                f"\tk := {rcv}.tableMatchKey(row)",
+                "\tkey = &k",
+                f"\tif r, ok := {var}[k]; ok {{",
+                "\t\treturn r, key",
+                "\t}",
+            ]
+        )
+        if not routes.prefixes:
+            lines.append(f"\treturn {_go_ints(routes.other)}, key")
+            lines.append("}")
+            lines.append("")
+            return lines
+        self._builder.require_import('"sort"')
+        lines.extend(
+            [
+                f"\troute = {_go_ints(routes.other)}",
+                f"\tfor _, n := range {_go_ints(routes.prefix_lengths)} {{",
+                "\t\tif n <= len(k) {",
+                f"\t\t\troute = append(route, ssc{name}Prefixes[k[:n]]...)",
+                "\t\t}",
+                "\t}",
+                "\tsort.Ints(route)",
+                "\tuniq := route[:0]",
+                "\tfor _, j := range route {",
+                "\t\tif len(uniq) == 0 || j != uniq[len(uniq)-1] {",
+                "\t\t\tuniq = append(uniq, j)",
+                "\t\t}",
+                "\t}",
+                "\treturn uniq, key",
+                "}",
+                "",
+            ]
+        )
+        return lines
+
     def visit_start_parse(
         self, node: StartParse, ctx: WalkContext
     ) -> list[str]:
@@ -1015,6 +1270,7 @@ class GoVisitor(BaseWalker):
         ind = ctx.indent_char
         i, i2, i3, i4 = "", ind, ind * 2, ind * 3
         lines: list[str] = [f"{i}func ({rcv} *{name}) Parse() {ret_type} {{"]
+        route_method: list[str] = []
         if node.use_pre_validate:
             lines.append(f"{i2}{rcv}.preValidate({rcv}.sel)")
 
@@ -1101,16 +1357,31 @@ class GoVisitor(BaseWalker):
                 lines.append(
                     f"{i2}{rcv}.tableRows(table).Each(func(_ int, _row *goquery.Selection) {{"
                 )
-                for f in node.fields:
+                routes = table_routes(struct, node.fields)
+                ind_f = i3
+                if routes is not None:
+                    route_method = self._table_route(routes, name, rcv)
+                    lines.append(f"{i3}_route, _key := {rcv}.tableRoute(_row)")
+                    lines.append(f"{i3}for _, _j := range _route {{")
+                    lines.append(f"{i3}\tswitch _j {{")
+                    ind_f = i3 + "\t\t"
+                for j, f in enumerate(node.fields):
                     mn = _go_method_name(f.name)
                     tag = _json_tag(f.name)
+                    args = "_row"
+                    if routes is not None:
+                        lines.append(f"{i3}\tcase {j}:")
+                        args = "_row, _key"
                     lines.append(
-                        f"{i3}if _val, _ok := {rcv}.{mn}(_row); _ok {{"
+                        f"{ind_f}if _val, _ok := {rcv}.{mn}({args}); _ok {{"
                     )
                     lines.append(
-                        f"{i3}\tif _, _exists := result[{_go_str(tag)}]; !_exists {{"
+                        f"{ind_f}\tif _, _exists := result[{_go_str(tag)}]; !_exists {{"
                     )
-                    lines.append(f"{i3}\t\tresult[{_go_str(tag)}] = _val")
+                    lines.append(f"{ind_f}\t\tresult[{_go_str(tag)}] = _val")
+                    lines.append(f"{ind_f}\t}}")
+                    lines.append(f"{ind_f}}}")
+                if routes is not None:
                     lines.append(f"{i3}\t}}")
                     lines.append(f"{i3}}}")
                 lines.append(f"{i2}}})")
@@ -1118,6 +1389,64 @@ class GoVisitor(BaseWalker):
 
         lines.append(f"{i}}}")
         lines.append("")
+        lines.extend(route_method)
+        lines.extend(self._emit_iter_parse(node, ctx, name))
+        return lines
+
+    def _emit_iter_parse(
+        self, node: StartParse, ctx: WalkContext, name: str
+    ) -> list[str]:
+        """``IterParse(yield)`` pushing split-doc items one at a time.
+
+        The signature matches ``iter.Seq``/``iter.Seq2``, so Go 1.23+ can
+        ``range`` over it; older Go calls it with a callback. Dict structs
+        yield key/value pairs. Returning false from ``yield`` stops early.
+        """
+        struct = node.struct
+        if not struct_has_iter_parse(struct):
+            return []
+        rcv = _receiver(name)
+        ind = ctx.indent_char
+        i2, i3, i4 = ind, ind * 2, ind * 3
+        if struct.type == ST.DICT:
+            value = next(n for n in struct.body if isinstance(n, Value))
+            vt = self._resolve_type(value.ret_type_info)
+            sig = f"yield func(string, {vt}) bool"
+        else:
+            sig = f"yield func({name}Type) bool"
+        lines = [f"func ({rcv} *{name}) IterParse({sig}) {{"]
+        if node.use_pre_validate:
+            lines.append(f"{i2}{rcv}.preValidate({rcv}.sel)")
+        lines.append(f"{i2}rows := {rcv}.splitDoc({rcv}.sel)")
+        if struct.type == ST.RAW:
+            lines.append(f"{i2}for _, item := range rows {{")
+            lines.append(f"{i3}if !yield({name}Type{{")
+            for f in node.fields:
+                fn = _go_field_name(f.name)
+                mn = _go_method_name(f.name)
+                lines.append(f"{i4}{fn}: {rcv}.{mn}(item),")
+            lines.append(f"{i3}}}) {{")
+            lines.append(f"{i4}return")
+            lines.append(f"{i3}}}")
+            lines.append(f"{i2}}}")
+        else:
+            lines.append(
+                f"{i2}rows.EachWithBreak(func(_ int, item *goquery.Selection) bool {{"
+            )
+            if struct.type == ST.DICT:
+                lines.append(
+                    f"{i3}return yield({rcv}.parseKey(item), {rcv}.parseValue(item))"
+                )
+            else:
+                lines.append(f"{i3}return yield({name}Type{{")
+                for f in node.fields:
+                    fn = _go_field_name(f.name)
+                    mn = _go_method_name(f.name)
+                    lines.append(f"{i4}{fn}: {rcv}.{mn}(item),")
+                lines.append(f"{i3}}})")
+            lines.append(f"{i2}}})")
+        lines.append("}")
+        lines.append("")
         return lines
 
     # === SELECTORS ===
@@ -1125,19 +1454,21 @@ class GoVisitor(BaseWalker):
     def visit_css_select(self, node: CssSelect, ctx: WalkContext) -> list[str]:
         queries = node.queries or [node.query]
         if len(queries) == 1:
-            q = _go_str(queries[0])
-            return [f"{ctx.indent}{ctx.nxt} := {ctx.prv}.Find({q}).First()"]
+            m = self._css_var(queries[0])
+            return [
+                f"{ctx.indent}{ctx.nxt} := {ctx.prv}.FindMatcher({m}).First()"
+            ]
         lines: list[str] = []
         for i, query in enumerate(queries):
-            q = _go_str(query)
+            m = self._css_var(query)
             if i == 0:
                 lines.append(
-                    f"{ctx.indent}{ctx.nxt} := {ctx.prv}.Find({q}).First()"
+                    f"{ctx.indent}{ctx.nxt} := {ctx.prv}.FindMatcher({m}).First()"
                 )
             else:
                 lines.append(f"{ctx.indent}if {ctx.nxt}.Length() == 0 {{")
                 lines.append(
-                    f"{ctx.indent}\t{ctx.nxt} = {ctx.prv}.Find({q}).First()"
+                    f"{ctx.indent}\t{ctx.nxt} = {ctx.prv}.FindMatcher({m}).First()"
                 )
                 lines.append(f"{ctx.indent}}}")
         return lines
@@ -1147,23 +1478,41 @@ class GoVisitor(BaseWalker):
     ) -> list[str]:
         queries = node.queries or [node.query]
         if len(queries) == 1:
-            q = _go_str(queries[0])
-            return [f"{ctx.indent}{ctx.nxt} := {ctx.prv}.Find({q})"]
+            m = self._css_var(queries[0])
+            if node.limit:
+                self._require("stdFindLimit")
+                return [
+                    f"{ctx.indent}{ctx.nxt} := stdFindLimit({ctx.prv}, {m}, {node.limit})"
+                ]
+            return [f"{ctx.indent}{ctx.nxt} := {ctx.prv}.FindMatcher({m})"]
         lines: list[str] = []
         for i, query in enumerate(queries):
-            q = _go_str(query)
+            m = self._css_var(query)
             if i == 0:
-                lines.append(f"{ctx.indent}{ctx.nxt} := {ctx.prv}.Find({q})")
+                lines.append(
+                    f"{ctx.indent}{ctx.nxt} := {ctx.prv}.FindMatcher({m})"
+                )
             else:
                 lines.append(f"{ctx.indent}if {ctx.nxt}.Length() == 0 {{")
-                lines.append(f"{ctx.indent}\t{ctx.nxt} = {ctx.prv}.Find({q})")
+                lines.append(
+                    f"{ctx.indent}\t{ctx.nxt} = {ctx.prv}.FindMatcher({m})"
+                )
                 lines.append(f"{ctx.indent}}}")
+        if node.limit:
+            lines.append(
+                f"{ctx.indent}if {ctx.nxt}.Length() > {node.limit} {{ {ctx.nxt} = {ctx.nxt}.Slice(0, {node.limit}) }}"
+            )
         return lines
 
+    def visit_css_count(self, node: CssCount, ctx: WalkContext) -> list[str]:
+        m = self._css_var(node.queries[0])
+        self._require("stdCountMatches")
+        return [f"{ctx.indent}{ctx.nxt} := stdCountMatches({ctx.prv}, {m})"]
+
     def visit_css_remove(self, node: CssRemove, ctx: WalkContext) -> list[str]:
-        q = _go_str(node.query)
+        m = self._css_var(node.query)
         return [
-            f"{ctx.indent}{ctx.prv}.Find({q}).Remove()",
+            f"{ctx.indent}{ctx.prv}.FindMatcher({m}).Remove()",
             f"{ctx.indent}{ctx.nxt} := {ctx.prv}",
         ]
 
@@ -1183,6 +1532,14 @@ class GoVisitor(BaseWalker):
             "Use CSS selectors instead."
         )
 
+    def visit_xpath_count(
+        self, node: XpathCount, ctx: WalkContext
+    ) -> list[str]:
+        raise NotImplementedError(
+            "XPath is not supported in the Go backend (goquery has no XPath). "
+            "Use CSS selectors instead."
+        )
+
     def visit_xpath_remove(
         self, node: XpathRemove, ctx: WalkContext
     ) -> list[str]:
@@ -1376,17 +1733,17 @@ class GoVisitor(BaseWalker):
             f"{src_file}:{src_line}:{src_col} "
             f"re-match failed{loc_str} pattern={node.pattern}"
         )
-        pattern = py_re_to_go_raw(node.pattern)
-        return [
-            f"{ctx.indent}{ctx.nxt} := {fn}({pattern}, {ctx.prv}, {_go_str(msg)})"
-        ]
+        rx = self._re_var(node.pattern)
+        if node.is_array:
+            args = f"{ctx.prv}, {rx}, {_go_str(msg)}"
+        else:
+            args = f"{rx}, {ctx.prv}, {_go_str(msg)}"
+        return [f"{ctx.indent}{ctx.nxt} := {fn}({args})"]
 
     def visit_re_all(self, node: ReAll, ctx: WalkContext) -> list[str]:
-        self._builder.require_import('"regexp"')
-        pattern = py_re_to_go_raw(node.pattern)
+        rx = self._re_var(node.pattern)
         return [
-            f"{ctx.indent}_re := regexp.MustCompile({pattern})",
-            f"{ctx.indent}_matches := _re.FindAllStringSubmatch({ctx.prv}, -1)",
+            f"{ctx.indent}_matches := {rx}.FindAllStringSubmatch({ctx.prv}, -1)",
             f"{ctx.indent}{ctx.nxt} := make([]string, len(_matches))",
             f"{ctx.indent}for _i, _m := range _matches {{",
             f"{ctx.indent}\t{ctx.nxt}[_i] = _m[1]",
@@ -1394,19 +1751,16 @@ class GoVisitor(BaseWalker):
         ]
 
     def visit_re_sub(self, node: ReSub, ctx: WalkContext) -> list[str]:
-        self._builder.require_import('"regexp"')
-        pattern = py_re_to_go_raw(node.pattern)
+        rx = self._re_var(node.pattern)
         repl = _go_str(node.repl)
         if not node.is_array:
             return [
-                f"{ctx.indent}_re := regexp.MustCompile({pattern})",
-                f"{ctx.indent}{ctx.nxt} := _re.ReplaceAllString({ctx.prv}, {repl})",
+                f"{ctx.indent}{ctx.nxt} := {rx}.ReplaceAllString({ctx.prv}, {repl})",
             ]
         return [
-            f"{ctx.indent}_re := regexp.MustCompile({pattern})",
             f"{ctx.indent}{ctx.nxt} := make([]string, len({ctx.prv}))",
             f"{ctx.indent}for _i, _s := range {ctx.prv} {{",
-            f"{ctx.indent}\t{ctx.nxt}[_i] = _re.ReplaceAllString(_s, {repl})",
+            f"{ctx.indent}\t{ctx.nxt}[_i] = {rx}.ReplaceAllString(_s, {repl})",
             f"{ctx.indent}}}",
         ]
 
@@ -1491,6 +1845,10 @@ class GoVisitor(BaseWalker):
         struct = self._enclosing_struct_name(node)
         rcv = _receiver(struct)
         name = to_camel_case(node.name)
+        init = find_init_field(node, node.name)
+        if init is not None and init.lazy:
+            cap = name[0].upper() + name[1:]
+            return [f"{ctx.indent}{ctx.nxt} := {rcv}.get{cap}()"]
         return [f"{ctx.indent}{ctx.nxt} := {rcv}.{name}"]
 
     def visit_return(self, node: Return, ctx: WalkContext) -> list[str]:
@@ -1661,8 +2019,19 @@ class GoVisitor(BaseWalker):
             else "any"
         )
         zero = _go_zero(t_ret)
-        lines = [
-            f"{i1}_key := {rcv}.tableMatchKey({ctx.prv})",
+        owner = find_struct(node)
+        if isinstance(owner, Struct) and self._struct_routes(owner) is not None:
+            lines = [
+                f"{i1}var _key string",
+                f"{i1}if key != nil {{",
+                f"{i2}_key = *key",
+                f"{i1}}} else {{",
+                f"{i2}_key = {rcv}.tableMatchKey({ctx.prv})",
+                f"{i1}}}",
+            ]
+        else:
+            lines = [f"{i1}_key := {rcv}.tableMatchKey({ctx.prv})"]
+        lines += [
             f"{i1}if !({expr}) {{",
             f"{i2}_matched = false",
             f"{i2}return {zero}",
@@ -1725,9 +2094,9 @@ class GoVisitor(BaseWalker):
         return [f"{ctx.indent}{prefix}{cond}"]
 
     def visit_predicate_css(self, node: PredCss, ctx: WalkContext) -> list[str]:
-        q = _go_str(node.query)
+        m = self._css_var(node.query)
         target = self._pred_target(node)
-        return self._pred_line(f"{target}.Find({q}).Length() > 0", ctx)
+        return self._pred_line(f"{target}.FindMatcher({m}).Length() > 0", ctx)
 
     def visit_predicate_xpath(
         self, node: PredXpath, ctx: WalkContext
@@ -1801,7 +2170,7 @@ class GoVisitor(BaseWalker):
     ) -> list[str]:
         self._require("stdReMatch")
         self._require("stdAttrOr")
-        rx = py_re_to_go_raw(node.pattern)
+        rx = self._re_var(node.pattern)
         name = _go_str(node.name)
         target = self._pred_target(node)
         cond = f"stdReMatch({rx}, stdAttrOr({target}, {name}))"
@@ -1835,7 +2204,7 @@ class GoVisitor(BaseWalker):
         self, node: PredTextRe, ctx: WalkContext
     ) -> list[str]:
         self._require("stdReMatch")
-        rx = py_re_to_go_raw(node.pattern)
+        rx = self._re_var(node.pattern)
         target = self._pred_text_target(node, ctx)
         cond = f"stdReMatch({rx}, {target})"
         return self._pred_line(cond, ctx)
@@ -1924,7 +2293,7 @@ class GoVisitor(BaseWalker):
 
     def visit_predicate_re(self, node: PredRe, ctx: WalkContext) -> list[str]:
         self._require("stdReMatch")
-        rx = py_re_to_go_raw(node.pattern)
+        rx = self._re_var(node.pattern)
         target = self._pred_text_target(node, ctx)
         cond = f"stdReMatch({rx}, {target})"
         return self._pred_line(cond, ctx)
@@ -1933,7 +2302,7 @@ class GoVisitor(BaseWalker):
         self, node: PredReAll, ctx: WalkContext
     ) -> list[str]:
         self._require("stdReAllMatch")
-        rx = py_re_to_go_raw(node.pattern)
+        rx = self._re_var(node.pattern)
         target = self._pred_target(node)
         return self._pred_line(f"stdReAllMatch({rx}, {target})", ctx)
 
@@ -1941,7 +2310,7 @@ class GoVisitor(BaseWalker):
         self, node: PredReAny, ctx: WalkContext
     ) -> list[str]:
         self._require("stdReAnyMatch")
-        rx = py_re_to_go_raw(node.pattern)
+        rx = self._re_var(node.pattern)
         target = self._pred_target(node)
         return self._pred_line(f"stdReAnyMatch({rx}, {target})", ctx)
 
@@ -23,6 +23,7 @@ from ssc_codegen.ast import (
     CheckMethod,
     CodeEndHook,
     CodeStartHook,
+    CssCount,
     CssRemove,
     CssSelect,
     CssSelectAll,
@@ -122,17 +123,23 @@ from ssc_codegen.ast import (
     Utilities,
     Value,
     VariableType as VT,
+    XpathCount,
     XpathRemove,
     XpathSelect,
     XpathSelectAll,
 )
-from ssc_codegen.naming import to_camel_case, to_pascal_case
+from ssc_codegen.naming import to_camel_case, to_pascal_case, to_snake_case
 from ssc_codegen.traversal.utils import (
+    TableRoutes,
     find_predicate_container,
+    find_struct,
     jsonify_path_to_segments,
     module_has_rest,
+    struct_has_iter_parse,
+    table_routes,
 )
 from ssc_codegen.generation.builder import ModuleBuilder
+from ssc_codegen.optimize import optimize_module
 from ssc_codegen.targets.javascript import rest
 from ssc_codegen.targets.javascript.http_libs.axios import AxiosStrategy
 from ssc_codegen.targets.javascript.http_libs.base import JsHttpLibStrategy
@@ -212,6 +219,14 @@ def _pred_attr_target(node, ctx: WalkContext) -> str:
 # ===========================================================================
 
 
+def _js_route_map(routes: dict[str, tuple[int, ...]]) -> str:
+    """``new Map([...])`` literal of a ``TableRoutes`` lookup table."""
+    entries = ", ".join(
+        f"[{json.dumps(key)}, {list(fields)}]" for key, fields in routes.items()
+    )
+    return f"new Map([{entries}])"
+
+
 def _js_method_name(field_name: str) -> str:
     n = to_camel_case(field_name)
     return f"_parse{n[0].upper() + n[1:]}"
@@ -267,6 +282,8 @@ class JsVisitor(BaseWalker):
     def _reset_state(self) -> None:
         self._builder = ModuleBuilder()
         self._http: JsHttpLibStrategy = FetchStrategy()
+        # methods of the current struct to wrap under --instrument
+        self._instrumented: list[str] = []
 
     def _make_ctx(self, meta: dict) -> WalkContext:
         return WalkContext(
@@ -292,6 +309,11 @@ class JsVisitor(BaseWalker):
         client = meta.get("http_client")
         if client and client in self._HTTP_STRATEGIES:
             self._http = self._HTTP_STRATEGIES[client]()
+        module_ast = optimize_module(
+            module_ast,
+            cse=meta.get("cse", True),
+            peephole=meta.get("peephole", True),
+        )
         ctx = self._make_ctx(meta)
         self._walk_module(module_ast, ctx)
         lines = self._walk_module(module_ast, ctx)
@@ -363,6 +385,9 @@ class JsVisitor(BaseWalker):
             lines.extend(FetchStrategy().rest_call_lines())
             lines.extend(AxiosStrategy().rest_call_lines())
         lines.extend(self._render_std_section(ctx))
+        if self._builder.has_consts:
+            lines.extend(self._builder.consts.values())
+            lines.append("")
         return lines
 
     def visit_code_start_hook(
@@ -432,12 +457,77 @@ class JsVisitor(BaseWalker):
         type_ = self._resolve_type(node.type_info)
         return [f" * @property {{{type_}}} {name}"]
 
+    # === INSTRUMENTATION ===
+
+    def _instrument(self, method: str, ctx: WalkContext) -> None:
+        """Mark ``method`` of the current struct for ``--instrument``."""
+        if ctx.meta.get("instrument"):
+            self._instrumented.append(method)
+
+    def _instrument_struct(self, node: Struct, ctx: WalkContext) -> list[str]:
+        """Wrap the marked methods so they report into ``sscMetrics``.
+
+        ``sscMetrics`` is a module-level registry; reassign it to any object
+        with a ``record(name, elapsedNs, failed)`` method to send the
+        counters elsewhere.
+        """
+        if not self._instrumented:
+            return []
+        self._builder.require_std(
+            "sscMetrics",
+            code="""class SscMetrics {
+    constructor() { this._stats = new Map(); }
+    record(name, elapsedNs, failed) {
+        let s = this._stats.get(name);
+        if (s === undefined) {
+            s = { calls: 0, totalNs: 0, errors: 0 };
+            this._stats.set(name, s);
+        }
+        s.calls++;
+        s.totalNs += elapsedNs;
+        if (failed) s.errors++;
+    }
+    snapshot() {
+        const out = {};
+        for (const [name, s] of this._stats) out[name] = { ...s };
+        return out;
+    }
+    reset() { this._stats.clear(); }
+}
+let sscMetrics = new SscMetrics();""",
+        )
+        self._builder.require_std(
+            "_sscInstrument",
+            code="""function _sscInstrument(cls, methods) {
+    for (const method of methods) {
+        const fn = cls.prototype[method];
+        const name = `${cls.name}.${method}`;
+        cls.prototype[method] = function (...args) {
+            const start = performance.now();
+            let failed = true;
+            try {
+                const result = fn.apply(this, args);
+                failed = false;
+                return result;
+            } finally {
+                sscMetrics.record(name, Math.round((performance.now() - start) * 1e6), failed);
+            }
+        };
+    }
+}""",
+        )
+        name = to_pascal_case(node.name)
+        methods = ", ".join(repr(m) for m in self._instrumented)
+        return [f"_sscInstrument({name}, [{methods}]);"]
+
     # === STRUCT ===
 
     def visit_struct(self, node: Struct, ctx: WalkContext) -> list[str]:
+        self._instrumented = []
         lines = list(_js_struct_header(node))
         lines.extend(self.walk_children(node, ctx))
         lines.append("}")
+        lines.extend(self._instrument_struct(node, ctx))
         return lines
 
     def visit_struct_rest(
@@ -497,15 +587,36 @@ class JsVisitor(BaseWalker):
     def visit_init_field(self, node: InitField, ctx: WalkContext) -> list[str]:
         name = to_camel_case(node.name)
         cap = name[0].upper() + name[1:]
+        self._instrument(f"_init{cap}", ctx)
         lines = [f"{ctx.indent}_init{cap}(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
+        if node.lazy:
+            # computed on first access, then shadowed by an own property
+            i2 = ctx.deeper().indent
+            lines.extend(
+                [
+                    f"{ctx.indent}get _{name}() {{",
+                    f"{i2}const value = this._init{cap}(this._doc);",
+                    f"{i2}Object.defineProperty(this, '_{name}', {{ value }});",
+                    f"{i2}return value;",
+                    f"{ctx.indent}}}",
+                ]
+            )
         return lines
 
     def visit_field(self, node: Field, ctx: WalkContext) -> list[str]:
         name = to_camel_case(node.name)
         cap = name[0].upper() + name[1:]
-        lines = [f"{ctx.indent}_parse{cap}(v) {{"]
+        self._instrument(f"_parse{cap}", ctx)
+        params = "v"
+        if (
+            node.struct.type == ST.TABLE
+            and self._struct_routes(node.struct) is not None
+        ):
+            # the routed row loop passes the key it already computed
+            params = "v, key"
+        lines = [f"{ctx.indent}_parse{cap}({params}) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         return lines
@@ -513,6 +624,7 @@ class JsVisitor(BaseWalker):
     def visit_pre_validate(
         self, node: PreValidate, ctx: WalkContext
     ) -> list[str]:
+        self._instrument("_preValidate", ctx)
         lines = [f"{ctx.indent}_preValidate(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
@@ -556,18 +668,21 @@ class JsVisitor(BaseWalker):
         return lines
 
     def visit_split_doc(self, node: SplitDoc, ctx: WalkContext) -> list[str]:
+        self._instrument("_splitDoc", ctx)
         lines = [f"{ctx.indent}_splitDoc(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         return lines
 
     def visit_key(self, node: Key, ctx: WalkContext) -> list[str]:
+        self._instrument("_parseKey", ctx)
         lines = [f"{ctx.indent}_parseKey(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         return lines
 
     def visit_value(self, node: Value, ctx: WalkContext) -> list[str]:
+        self._instrument("_parseValue", ctx)
         lines = [f"{ctx.indent}_parseValue(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
@@ -576,6 +691,7 @@ class JsVisitor(BaseWalker):
     def visit_table_config(
         self, node: TableConfig, ctx: WalkContext
     ) -> list[str]:
+        self._instrument("_tableConfig", ctx)
         lines = [f"{ctx.indent}_tableConfig(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
@@ -584,12 +700,14 @@ class JsVisitor(BaseWalker):
     def visit_table_match_key(
         self, node: TableMatchKey, ctx: WalkContext
     ) -> list[str]:
+        self._instrument("_tableMatchKey", ctx)
         lines = [f"{ctx.indent}_tableMatchKey(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
         return lines
 
     def visit_table_rows(self, node: TableRows, ctx: WalkContext) -> list[str]:
+        self._instrument("_tableRows", ctx)
         lines = [f"{ctx.indent}_tableRows(v) {{"]
         lines.extend(self.walk_children(node, ctx))
         lines.append(f"{ctx.indent}}}")
@@ -597,6 +715,82 @@ class JsVisitor(BaseWalker):
 
     # === START_PARSE ===
 
+    def _struct_routes(self, struct: Struct) -> TableRoutes | None:
+        start = next(n for n in struct.body if isinstance(n, StartParse))
+        return table_routes(struct, start.fields)
+
+    def _table_dispatch(
+        self,
+        node: StartParse,
+        routes: TableRoutes,
+        name: str,
+        ctx: WalkContext,
+    ) -> list[str]:
+        """Row loop that computes each row key once and only calls the
+        fields that can accept it (see ``table_routes``). The key is passed
+        on, so the fields do not compute it again.
+        """
+        const = f"{to_snake_case(name).upper()}_ROUTES"
+        self._builder.require_const(
+            const, code=f"const {const} = {_js_route_map(routes.exact)};"
+        )
+        i2, i3, i4 = ctx.indent * 2, ctx.indent * 3, ctx.indent * 4
+        i5 = ctx.indent * 5
+        lines = [f"{i2}let _fields = ["]
+        for f in node.fields:
+            n = to_camel_case(f.name)
+            lines.append(f"{i3}[{n!r}, this.{_js_method_name(f.name)}],")
+        lines.extend(
+            [
+                f"{i2}];",
+                f"{i2}for (let _row of this._tableRows(_table)) {{",
+                f"{i3}let _route, _key;",
+                f"{i3}try {{",
+                f"{i4}_key = this._tableMatchKey(_row);",
+            ]
+        )
+        if routes.prefixes:
+            prefixes = f"{to_snake_case(name).upper()}_PREFIXES"
+            self._builder.require_const(
+                prefixes,
+                code=f"const {prefixes} = {_js_route_map(routes.prefixes)};",
+            )
+            lines.extend(
+                [
+                    f"{i4}_route = {const}.get(_key);",
+                    f"{i4}if (_route === undefined) {{",
+                    f"{i5}let _hits = new Set({list(routes.other)});",
+                    f"{i5}for (let n of {routes.prefix_lengths}) {{",
+                    f"{i5}{ctx.indent}for (let j of {prefixes}.get(_key.slice(0, n)) ?? []) _hits.add(j);",
+                    f"{i5}}}",
+                    f"{i5}_route = [..._hits].sort((a, b) => a - b);",
+                    f"{i4}}}",
+                ]
+            )
+        else:
+            lines.append(
+                f"{i4}_route = {const}.get(_key) ?? {list(routes.other)};"
+            )
+        lines.extend(
+            [
+                f"{i3}}} catch (e) {{",
+                # fields with a fallback still get to see this row
+                f"{i4}_route = {list(range(routes.size))};",
+                f"{i3}}}",
+                f"{i3}for (let _j of _route) {{",
+                f"{i4}let [_name, _parse] = _fields[_j];",
+                f"{i4}let _value = _parse.call(this, _row, _key);",
+                (
+                    f"{i4}if (_value !== UNMATCHED_TABLE_ROW "
+                    f"&& !Object.prototype.hasOwnProperty.call(_result, _name)) "
+                    f"_result[_name] = _value;"
+                ),
+                f"{i3}}}",
+                f"{i2}}}",
+            ]
+        )
+        return lines
+
     def visit_start_parse(
         self, node: StartParse, ctx: WalkContext
     ) -> list[str]:
@@ -667,6 +861,13 @@ class JsVisitor(BaseWalker):
         elif st == ST.TABLE:
             lines.append(f"{i2}let _result = {{}};")
             lines.append(f"{i2}let _table = this._tableConfig(this._doc);")
+            routes = table_routes(struct, node.fields)
+            if routes is not None:
+                lines.extend(self._table_dispatch(node, routes, name, ctx))
+                lines.append(f"{i2}return _result;")
+                lines.append(f"{i1}}}")
+                lines.extend(self._emit_iter_parse(node, ctx, name))
+                return lines
             lines.append(f"{i2}for (let _row of this._tableRows(_table)) {{")
             for f in node.fields:
                 n = to_camel_case(f.name)
@@ -699,6 +900,50 @@ class JsVisitor(BaseWalker):
                     )
                 lines.append(f"{i2}}};")
         lines.append(f"{i1}}}")
+        lines.extend(self._emit_iter_parse(node, ctx, name))
+        return lines
+
+    def _emit_iter_parse(
+        self, node: StartParse, ctx: WalkContext, name: str
+    ) -> list[str]:
+        """``*iterParse()`` generator yielding split-doc items one at a time.
+
+        Dict structs yield ``[key, value]`` pairs, so
+        ``Object.fromEntries(p.iterParse())`` equals ``p.parse()``.
+        """
+        struct = node.struct
+        if not struct_has_iter_parse(struct):
+            return []
+        if struct.type == ST.DICT:
+            value = next(n for n in struct.body if isinstance(n, Value))
+            item_type = f"[string, {self._resolve_type(value.ret_type_info)}]"
+        else:
+            item_type = f"{name}Type"
+        i1, i2, i3, i4 = (
+            ctx.indent,
+            ctx.indent * 2,
+            ctx.indent * 3,
+            ctx.indent * 4,
+        )
+        lines = [
+            f"{i1}/**",
+            f"{i1}* @returns {{Generator<{item_type}>}}",
+            f"{i1}*/",
+            f"{i1}*iterParse() {{",
+        ]
+        if node.use_pre_validate:
+            lines.append(f"{i2}this._preValidate(this._doc);")
+        lines.append(f"{i2}for (const i of this._splitDoc(this._doc)) {{")
+        if struct.type == ST.DICT:
+            lines.append(f"{i3}yield [this._parseKey(i), this._parseValue(i)];")
+        else:
+            lines.append(f"{i3}yield {{")
+            for f in node.fields:
+                n = to_camel_case(f.name)
+                lines.append(f"{i4}{n}: this.{_js_method_name(f.name)}(i),")
+            lines.append(f"{i3}}};")
+        lines.append(f"{i2}}}")
+        lines.append(f"{i1}}}")
         return lines
 
     # === SELECTORS ===
@@ -723,6 +968,16 @@ class JsVisitor(BaseWalker):
     def visit_css_select_all(
         self, node: CssSelectAll, ctx: WalkContext
     ) -> list[str]:
+        if len(node.queries) == 1 and node.limit:
+            q = repr(node.queries[0])
+            if node.limit == 1:
+                # querySelector stops at the first match
+                return [
+                    f"{ctx.indent}let {ctx.nxt} = [{ctx.prv}.querySelector({q})].filter(e => e !== null);"
+                ]
+            return [
+                f"{ctx.indent}let {ctx.nxt} = Array.prototype.slice.call({ctx.prv}.querySelectorAll({q}), 0, {node.limit});"
+            ]
         if node.queries:
             lines: list[str] = []
             for i, query in enumerate(node.queries):
@@ -735,12 +990,26 @@ class JsVisitor(BaseWalker):
                     lines.append(
                         f"{ctx.indent}if ({ctx.nxt}.length === 0) {ctx.nxt} = Array.from({ctx.prv}.querySelectorAll({q}));"
                     )
-            return lines
+            return lines + self._truncate(node, ctx)
         q = repr(node.query)
         return [
             f"{ctx.indent}let {ctx.nxt} = Array.from({ctx.prv}.querySelectorAll({q}));"
         ]
 
+    def _truncate(
+        self, node: CssSelectAll | XpathSelectAll, ctx: WalkContext
+    ) -> list[str]:
+        """Apply ``node.limit`` to a match list built without it."""
+        if not node.limit:
+            return []
+        return [f"{ctx.indent}{ctx.nxt} = {ctx.nxt}.slice(0, {node.limit});"]
+
+    def visit_css_count(self, node: CssCount, ctx: WalkContext) -> list[str]:
+        q = repr(node.queries[0])
+        return [
+            f"{ctx.indent}let {ctx.nxt} = {ctx.prv}.querySelectorAll({q}).length;"
+        ]
+
     def visit_css_remove(self, node: CssRemove, ctx: WalkContext) -> list[str]:
         q = repr(node.query)
         return [
@@ -782,8 +1051,11 @@ class JsVisitor(BaseWalker):
         self, node: XpathSelectAll, ctx: WalkContext
     ) -> list[str]:
         if node.queries:
+            queries = node.queries
+            if len(queries) == 1 and node.limit:
+                queries = [f"({queries[0]})[position() <= {node.limit}]"]
             lines: list[str] = []
-            for i, query in enumerate(node.queries):
+            for i, query in enumerate(queries):
                 q = repr(query)
                 if i == 0:
                     lines.extend(
@@ -803,6 +1075,8 @@ class JsVisitor(BaseWalker):
                             f"{ctx.indent}}}",
                         ]
                     )
+            if len(queries) > 1:
+                lines.extend(self._truncate(node, ctx))
             return lines
         q = repr(node.query)
         return [
@@ -811,6 +1085,14 @@ class JsVisitor(BaseWalker):
             f"{ctx.indent}while (xrn{ctx.nxt}) {{ {ctx.nxt}.push(xrn{ctx.nxt}); xrn{ctx.nxt} = xr{ctx.nxt}.iterateNext(); }}",
         ]
 
+    def visit_xpath_count(
+        self, node: XpathCount, ctx: WalkContext
+    ) -> list[str]:
+        q = repr(f"count({node.queries[0]})")
+        return [
+            f"{ctx.indent}let {ctx.nxt} = document.evaluate({q}, {ctx.prv}, null, XPathResult.NUMBER_TYPE, null).numberValue;"
+        ]
+
     def visit_xpath_remove(
         self, node: XpathRemove, ctx: WalkContext
     ) -> list[str]:
@@ -1296,8 +1578,15 @@ class JsVisitor(BaseWalker):
     def visit_match(self, node: Match, ctx: WalkContext) -> list[str]:
         local = f"i{ctx.prv}"
         setattr(node, "_local_name", local)
+        key = f"this._tableMatchKey({ctx.prv})"
+        struct = find_struct(node)
+        if (
+            isinstance(struct, Struct)
+            and self._struct_routes(struct) is not None
+        ):
+            key = f"key ?? {key}"
         lines = [
-            f"{ctx.indent}let {local} = this._tableMatchKey({ctx.prv});",
+            f"{ctx.indent}let {local} = {key};",
             f"{ctx.indent}if (!(",
         ]
         lines.extend(self.walk_children(node, ctx))
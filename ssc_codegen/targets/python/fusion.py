@@ -0,0 +1,171 @@
+"""Loop fusion of element-wise array steps in generated Python code.
+
+Array pipelines emit one list comprehension per step::
+
+    v1 = [i.text for i in v]
+    v2 = [i.strip() for i in v1]
+    v3 = [float(i) for i in v2]
+
+Each step allocates a full intermediate list. This pass merges runs of
+such comprehensions into one::
+
+    v3 = [float(i.text.strip()) for i in v]
+
+It works on emitted lines, so every DOM dialect gets it for free; being
+a text rewrite, it only runs when asked for (``--fuse``). Only
+plain ``vN = [<expr> for i in vM]`` lines take part, where ``vM`` is the
+previous line's target and is not read anywhere else. Steps that filter
+(``... if ...``), aggregate (``unique``, ``len``, ``join``) or index
+leave other shapes behind and act as barriers.
+
+An element expression that reads ``i`` more than once (``normalize-space``)
+is not inlined. The previous value is rebound instead
+(``for i in [<expr>]``), which still saves the intermediate list.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+
+_COMPREHENSION = re.compile(r"^(?P<indent>\s*)(?P<dst>v\d*) = (?P<rhs>\[.+\])$")
+_VAR = re.compile(r"^v\d*$")
+
+# nodes that could shadow or capture ``i`` inside an element expression
+_SCOPES = (
+    ast.Lambda,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+    ast.NamedExpr,
+)
+
+# inner expressions that can be substituted for ``i`` without parentheses
+_ATOMS = (ast.Attribute, ast.Call, ast.Name, ast.Subscript)
+
+
+class _Comprehension:
+    """``[expr for i in src for i in [rebinds[0]] ...]`` being built up."""
+
+    def __init__(self, indent: str, dst: str, src: str, expr: str):
+        self.indent = indent
+        self.dst = dst
+        self.src = src
+        self.expr = expr
+        self.rebinds: list[str] = []
+
+    def render(self) -> str:
+        clauses = "".join(f" for i in [{e}]" for e in self.rebinds)
+        return (
+            f"{self.indent}{self.dst} = "
+            f"[{self.expr} for i in {self.src}{clauses}]"
+        )
+
+    def absorb(self, dst: str, outer: str) -> None:
+        """Apply the element expression ``outer`` on top of this one."""
+        tree = ast.parse(outer, mode="eval")
+        uses = [
+            n for n in ast.walk(tree) if isinstance(n, ast.Name) and n.id == "i"
+        ]
+        if len(uses) == 1:
+            inner = self.expr
+            if not isinstance(ast.parse(inner, mode="eval").body, _ATOMS):
+                inner = f"({inner})"
+            # ast offsets are UTF-8 byte offsets
+            raw = outer.encode("utf-8")
+            name = uses[0]
+            self.expr = (
+                raw[: name.col_offset]
+                + inner.encode("utf-8")
+                + raw[name.end_col_offset :]
+            ).decode("utf-8")
+        else:
+            self.rebinds.append(self.expr)
+            self.expr = outer
+        self.dst = dst
+
+
+def _parse(line: str) -> _Comprehension | None:
+    """Return the element-wise step on ``line``, or None."""
+    match = _COMPREHENSION.match(line)
+    if match is None:
+        return None
+    rhs = match["rhs"]
+    try:
+        comp = ast.parse(rhs, mode="eval").body
+    except SyntaxError:
+        return None
+    if not isinstance(comp, ast.ListComp) or len(comp.generators) != 1:
+        return None
+    gen = comp.generators[0]
+    if (
+        gen.ifs
+        or gen.is_async
+        or not isinstance(gen.target, ast.Name)
+        or gen.target.id != "i"
+        or not isinstance(gen.iter, ast.Name)
+        or not _VAR.match(gen.iter.id)
+    ):
+        return None
+    if any(isinstance(n, _SCOPES) for n in ast.walk(comp.elt)):
+        return None
+    expr = ast.get_source_segment(rhs, comp.elt)
+    if expr is None:
+        return None
+    return _Comprehension(match["indent"], match["dst"], gen.iter.id, expr)
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip())
+
+
+def _used_later(lines: list[str], start: int, var: str, indent: int) -> bool:
+    """True if ``var`` is read from ``lines[start:]`` in the same method."""
+    # the enclosing ``def`` is the nearest line above with less indent
+    owner = next(
+        (
+            _indent(line)
+            for line in reversed(lines[:start])
+            if line.strip()
+            and _indent(line) < indent
+            and line.lstrip().startswith("def ")
+        ),
+        -1,
+    )
+    pattern = re.compile(rf"\b{var}\b")
+    for line in lines[start:]:
+        if line.strip() and _indent(line) <= owner:
+            return False
+        if pattern.search(line):
+            return True
+    return False
+
+
+def fuse_comprehensions(lines: list[str]) -> list[str]:
+    """Merge consecutive element-wise list comprehensions in ``lines``."""
+    out: list[str] = []
+    index = 0
+    while index < len(lines):
+        current = _parse(lines[index])
+        if current is None:
+            out.append(lines[index])
+            index += 1
+            continue
+        start = index
+        index += 1
+        while index < len(lines):
+            following = _parse(lines[index])
+            if (
+                following is None
+                or following.indent != current.indent
+                or following.src != current.dst
+                or _used_later(
+                    lines, index + 1, current.dst, len(current.indent)
+                )
+            ):
+                break
+            current.absorb(following.dst, following.expr)
+            index += 1
+        out.append(current.render() if index - start > 1 else lines[start])
+    return out
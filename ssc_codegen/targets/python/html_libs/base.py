@@ -20,15 +20,39 @@ from ssc_codegen.ast.predicate_ops import (
     PredXpath,
 )
 from ssc_codegen.ast.selectors import (
+    CssCount,
     CssRemove,
     CssSelect,
     CssSelectAll,
+    XpathCount,
     XpathRemove,
     XpathSelect,
     XpathSelectAll,
 )
 from ssc_codegen.traversal.context import WalkContext as ConverterContext
 from ssc_codegen.generation.builder import ModuleBuilder
+from ssc_codegen.targets.python.regex import require_re_const
+
+
+def css_to_xpath(query: str) -> str | None:
+    """XPath 1.0 equivalent of CSS ``query``, or None if untranslatable.
+
+    For dialects that evaluate CSS through XPath (lxml, parsel), so a
+    limit or count can be spelled in the query itself.
+    """
+    from cssselect import ExpressionError, HTMLTranslator, SelectorError
+
+    if "::" in query:  # parsel pseudo-elements
+        return None
+    try:
+        return HTMLTranslator().css_to_xpath(query)
+    except (SelectorError, ExpressionError):
+        return None
+
+
+def xpath_limit(query: str, limit: int) -> str:
+    """``query`` restricted to its first ``limit`` nodes."""
+    return f"({query})[position() <= {limit}]"
 
 
 class DomSpelling(ABC):
@@ -50,6 +74,10 @@ class DomSpelling(ABC):
         """Access the module builder for registering imports / std helpers."""
         return self._builder
 
+    def re_const(self, pattern: str) -> str:
+        """Register a precompiled regex constant; return its name."""
+        return require_re_const(self._builder, pattern)
+
     # === DATA (override in concrete subclasses) ===
 
     parser_imports: tuple[str, ...] = ()
@@ -60,6 +88,14 @@ class DomSpelling(ABC):
     extra_utilities: tuple[str, ...] = ()
     supports_xpath: bool = False
 
+    def truncate(
+        self, ctx: ConverterContext, node: CssSelectAll | XpathSelectAll
+    ) -> list[str]:
+        """Apply ``node.limit`` to a match list built without it."""
+        if not node.limit:
+            return []
+        return [f"{ctx.indent}{ctx.nxt} = {ctx.nxt}[:{node.limit}]"]
+
     # === EXPRESSION BEHAVIOR (return list[str] — complete lines) ===
 
     @abstractmethod
@@ -72,6 +108,14 @@ class DomSpelling(ABC):
         self, ctx: ConverterContext, node: CssSelectAll
     ) -> list[str]: ...
 
+    def css_count(self, ctx: ConverterContext, node: CssCount) -> list[str]:
+        """Number of matches; by default the length of the match list."""
+        select = CssSelectAll(queries=node.queries)
+        return [
+            *self.css_select_all(ctx, select),
+            f"{ctx.indent}{ctx.nxt} = len({ctx.nxt})",
+        ]
+
     @abstractmethod
     def css_remove(
         self, ctx: ConverterContext, node: CssRemove
@@ -87,6 +131,14 @@ class DomSpelling(ABC):
         self, ctx: ConverterContext, node: XpathSelectAll
     ) -> list[str]: ...
 
+    def xpath_count(self, ctx: ConverterContext, node: XpathCount) -> list[str]:
+        """Number of matches; by default the length of the match list."""
+        select = XpathSelectAll(queries=node.queries)
+        return [
+            *self.xpath_select_all(ctx, select),
+            f"{ctx.indent}{ctx.nxt} = len({ctx.nxt})",
+        ]
+
     @abstractmethod
     def xpath_remove(
         self, ctx: ConverterContext, node: XpathRemove
@@ -65,7 +65,9 @@ class Bs4DomSpelling(DomSpelling):
     ) -> list[str]:
         if len(node.queries) == 1:
             q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.select({q})"]
+            # soupsieve stops walking the tree once ``limit`` tags matched
+            limit = f", limit={node.limit}" if node.limit else ""
+            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.select({q}{limit})"]
         self._builder.require_std(
             "std_select_all_first",
             code="""
@@ -80,7 +82,8 @@ class Bs4DomSpelling(DomSpelling):
         )
         args = ",".join(repr(q) for q in node.queries)
         return [
-            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})"
+            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})",
+            *self.truncate(ctx, node),
         ]
 
     def css_remove(self, ctx: ConverterContext, node: CssRemove) -> list[str]:
@@ -202,10 +205,8 @@ class Bs4DomSpelling(DomSpelling):
 
     def pred_attr_re(self, node: PredAttrRe) -> str:
         key = node.name
-        pat = repr(node.pattern)
-        return (
-            f"bool(i.get({key!r})) and bool(re.search({pat}, i.get({key!r})))"
-        )
+        rx = self.re_const(node.pattern)
+        return f"bool(i.get({key!r})) and bool({rx}.search(i.get({key!r})))"
 
     def pred_text_contains(self, node: PredTextContains) -> str:
         vals = repr(node.values)
@@ -220,5 +221,5 @@ class Bs4DomSpelling(DomSpelling):
         return f"i.text.endswith({vals})"
 
     def pred_text_re(self, node: PredTextRe) -> str:
-        pat = repr(node.pattern)
-        return f"bool(re.search({pat}, i.text))"
+        rx = self.re_const(node.pattern)
+        return f"bool({rx}.search(i.text))"
@@ -18,15 +18,33 @@ from ssc_codegen.ast.predicate_ops import (
     PredXpath,
 )
 from ssc_codegen.ast.selectors import (
+    CssCount,
     CssRemove,
     CssSelect,
     CssSelectAll,
+    XpathCount,
     XpathRemove,
     XpathSelect,
     XpathSelectAll,
 )
 from ssc_codegen.traversal.context import WalkContext as ConverterContext
-from ssc_codegen.targets.python.html_libs.base import DomSpelling
+from ssc_codegen.traversal.utils import regex_digest
+from ssc_codegen.targets.python.html_libs.base import (
+    DomSpelling,
+    css_to_xpath,
+    xpath_limit,
+)
+
+
+def _xpath_compiles(query: str) -> bool:
+    """Whether lxml accepts ``query`` as an XPath expression."""
+    from lxml import etree
+
+    try:
+        etree.XPath(query)
+    except etree.XPathError:
+        return False
+    return True
 
 
 class LxmlDomSpelling(DomSpelling):
@@ -49,113 +67,174 @@ class LxmlDomSpelling(DomSpelling):
     )
     supports_xpath = True
 
+    # === CONSTANTS ===
+
+    def css_const(self, query: str) -> str:
+        """Register a module-level ``CSSSelector`` for ``query``.
+
+        ``el.cssselect(q)`` translates CSS to XPath and compiles a fresh
+        evaluator on every call; the constant does it once at import.
+        Queries cssselect cannot translate keep the per-call form, so
+        they fail in their own field instead of on module import.
+        """
+        name = f"CSS_{regex_digest(query).upper()}"
+        if css_to_xpath(query) is None:
+            return self._per_call_const(name, "cssselect", query)
+        self._builder.require_import("from lxml.cssselect import CSSSelector")
+        return self._builder.require_const(
+            name, code=f"{name} = CSSSelector({query!r}, translator='html')"
+        )
+
+    def xpath_const(self, query: str) -> str:
+        """Register a module-level ``etree.XPath`` for ``query``.
+
+        Invalid queries keep the per-call ``el.xpath(q)`` form.
+        """
+        name = f"XPATH_{regex_digest(query).upper()}"
+        if not _xpath_compiles(query):
+            return self._per_call_const(name, "xpath", query)
+        self._builder.require_import("from lxml import etree")
+        return self._builder.require_const(
+            name, code=f"{name} = etree.XPath({query!r})"
+        )
+
+    def _per_call_const(self, name: str, method: str, query: str) -> str:
+        """Register ``name`` as a callable doing ``el.<method>(query)``."""
+        self._builder.require_import("from operator import methodcaller")
+        return self._builder.require_const(
+            name, code=f"{name} = methodcaller({method!r}, {query!r})"
+        )
+
     # === EXPRESSIONS ===
 
     def css_select(self, ctx: ConverterContext, node: CssSelect) -> list[str]:
         if len(node.queries) == 1:
-            q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.cssselect({q})[0]"]
+            sel = self.css_const(node.queries[0])
+            return [f"{ctx.indent}{ctx.nxt} = {sel}({ctx.prv})[0]"]
         self._builder.require_std(
             "std_select_first",
             code="""
-                def std_select_first(tag, *queries):
-                    for q in queries:
-                        t = tag.cssselect(q)
+                def std_select_first(tag, *selectors):
+                    for sel in selectors:
+                        t = sel(tag)
                         if t:
                             return t[0]
             """,
         )
-        args = ",".join(repr(q) for q in node.queries)
+        args = ",".join(self.css_const(q) for q in node.queries)
         return [f"{ctx.indent}{ctx.nxt} = std_select_first({ctx.prv}, {args})"]
 
     def css_select_all(
         self, ctx: ConverterContext, node: CssSelectAll
     ) -> list[str]:
         if len(node.queries) == 1:
-            q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.cssselect({q})"]
+            path = css_to_xpath(node.queries[0]) if node.limit else None
+            if path:
+                xp = self.xpath_const(xpath_limit(path, node.limit))
+                return [f"{ctx.indent}{ctx.nxt} = {xp}({ctx.prv})"]
+            sel = self.css_const(node.queries[0])
+            return [
+                f"{ctx.indent}{ctx.nxt} = {sel}({ctx.prv})",
+                *self.truncate(ctx, node),
+            ]
         self._builder.require_std(
             "std_select_all_first",
             code="""
-                def std_select_all_first(tag, *queries):
-                    for q in queries:
-                        t = tag.cssselect(q)
+                def std_select_all_first(tag, *selectors):
+                    for sel in selectors:
+                        t = sel(tag)
                         if t:
                             return t
                     return []
             """,
         )
-        args = ",".join(repr(q) for q in node.queries)
+        args = ",".join(self.css_const(q) for q in node.queries)
         return [
-            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})"
+            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})",
+            *self.truncate(ctx, node),
         ]
 
+    def css_count(self, ctx: ConverterContext, node: CssCount) -> list[str]:
+        path = css_to_xpath(node.queries[0])
+        if path is None:
+            return super().css_count(ctx, node)
+        xp = self.xpath_const(f"count({path})")
+        return [f"{ctx.indent}{ctx.nxt} = int({xp}({ctx.prv}))"]
+
     def css_remove(self, ctx: ConverterContext, node: CssRemove) -> list[str]:
-        q = repr(node.query)
+        sel = self.css_const(node.query)
         self._builder.require_std(
             "std_select_remove",
             code="""
-                def std_select_remove(tag, q):
-                    [_el.getparent().remove(_el) for _el in tag.cssselect(q) if _el.getparent() is not None]
+                def std_select_remove(tag, sel):
+                    [_el.getparent().remove(_el) for _el in sel(tag) if _el.getparent() is not None]
                     return tag
             """,
         )
-        return [f"{ctx.indent}{ctx.nxt} = std_select_remove({ctx.prv}, {q})"]
+        return [f"{ctx.indent}{ctx.nxt} = std_select_remove({ctx.prv}, {sel})"]
 
     def xpath_select(
         self, ctx: ConverterContext, node: XpathSelect
     ) -> list[str]:
         if len(node.queries) == 1:
-            q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.xpath({q})[0]"]
+            xp = self.xpath_const(node.queries[0])
+            return [f"{ctx.indent}{ctx.nxt} = {xp}({ctx.prv})[0]"]
         self._builder.require_std(
             "std_xpath_first",
             code="""
-                def std_xpath_first(tag, *queries):
-                    for q in queries:
-                        t = tag.xpath(q)
+                def std_xpath_first(tag, *xpaths):
+                    for xp in xpaths:
+                        t = xp(tag)
                         if t:
                             return t[0]
             """,
         )
-        args = ",".join(repr(q) for q in node.queries)
+        args = ",".join(self.xpath_const(q) for q in node.queries)
         return [f"{ctx.indent}{ctx.nxt} = std_xpath_first({ctx.prv}, {args})"]
 
     def xpath_select_all(
         self, ctx: ConverterContext, node: XpathSelectAll
     ) -> list[str]:
         if len(node.queries) == 1:
-            q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.xpath({q})"]
+            query = node.queries[0]
+            if node.limit:
+                query = xpath_limit(query, node.limit)
+            xp = self.xpath_const(query)
+            return [f"{ctx.indent}{ctx.nxt} = {xp}({ctx.prv})"]
         self._builder.require_std(
             "std_xpath_all_first",
             code="""
-                def std_xpath_all_first(tag, *queries):
-                    for q in queries:
-                        t = tag.xpath(q)
+                def std_xpath_all_first(tag, *xpaths):
+                    for xp in xpaths:
+                        t = xp(tag)
                         if t:
                             return t
                     return []
             """,
         )
-        args = ",".join(repr(q) for q in node.queries)
+        args = ",".join(self.xpath_const(q) for q in node.queries)
         return [
-            f"{ctx.indent}{ctx.nxt} = std_xpath_all_first({ctx.prv}, {args})"
+            f"{ctx.indent}{ctx.nxt} = std_xpath_all_first({ctx.prv}, {args})",
+            *self.truncate(ctx, node),
         ]
 
+    def xpath_count(self, ctx: ConverterContext, node: XpathCount) -> list[str]:
+        xp = self.xpath_const(f"count({node.queries[0]})")
+        return [f"{ctx.indent}{ctx.nxt} = int({xp}({ctx.prv}))"]
+
     def xpath_remove(
         self, ctx: ConverterContext, node: XpathRemove
     ) -> list[str]:
-        q = repr(node.query)
+        xp = self.xpath_const(node.query)
         self._builder.require_std(
             "std_xpath_remove",
             code="""
-                def std_xpath_remove(tag, q):
-                    [_el.getparent().remove(_el) for _el in tag.xpath(q) if _el.getparent() is not None]
+                def std_xpath_remove(tag, xp):
+                    [_el.getparent().remove(_el) for _el in xp(tag) if _el.getparent() is not None]
                     return tag
             """,
         )
-        return [f"{ctx.indent}{ctx.nxt} = std_xpath_remove({ctx.prv}, {q})"]
+        return [f"{ctx.indent}{ctx.nxt} = std_xpath_remove({ctx.prv}, {xp})"]
 
     def text(self, ctx: ConverterContext, node: Text) -> list[str]:
         if node.accept_type_info.is_array:
@@ -217,12 +296,12 @@ class LxmlDomSpelling(DomSpelling):
     # === PREDICATES ===
 
     def pred_css(self, node: PredCss) -> str:
-        query = repr(node.query)
-        return f"bool(i.cssselect({query}))"
+        sel = self.css_const(node.query)
+        return f"bool({sel}(i))"
 
     def pred_xpath(self, node: PredXpath) -> str:
-        query = repr(node.query)
-        return f"bool(i.xpath({query}))"
+        xp = self.xpath_const(node.query)
+        return f"bool({xp}(i))"
 
     def pred_has_attr(self, node: PredHasAttr) -> str:
         attrs = node.attrs
@@ -267,8 +346,8 @@ class LxmlDomSpelling(DomSpelling):
 
     def pred_attr_re(self, node: PredAttrRe) -> str:
         name = node.name
-        pat = repr(node.pattern)
-        return f"bool(re.search({pat}, i.get({name!r}, '')))"
+        rx = self.re_const(node.pattern)
+        return f"bool({rx}.search(i.get({name!r}, '')))"
 
     def pred_text_contains(self, node: PredTextContains) -> str:
         values = node.values
@@ -289,5 +368,5 @@ class LxmlDomSpelling(DomSpelling):
         return f"any(i.text_content().endswith(v) for v in {values!r})"
 
     def pred_text_re(self, node: PredTextRe) -> str:
-        pat = repr(node.pattern)
-        return f"bool(re.search({pat}, i.text_content()))"
+        rx = self.re_const(node.pattern)
+        return f"bool({rx}.search(i.text_content()))"
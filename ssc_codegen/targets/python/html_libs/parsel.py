@@ -18,15 +18,21 @@ from ssc_codegen.ast.predicate_ops import (
     PredXpath,
 )
 from ssc_codegen.ast.selectors import (
+    CssCount,
     CssRemove,
     CssSelect,
     CssSelectAll,
+    XpathCount,
     XpathRemove,
     XpathSelect,
     XpathSelectAll,
 )
 from ssc_codegen.traversal.context import WalkContext as ConverterContext
-from ssc_codegen.targets.python.html_libs.base import DomSpelling
+from ssc_codegen.targets.python.html_libs.base import (
+    DomSpelling,
+    css_to_xpath,
+    xpath_limit,
+)
 
 
 class ParselDomSpelling(DomSpelling):
@@ -64,8 +70,15 @@ class ParselDomSpelling(DomSpelling):
         self, ctx: ConverterContext, node: CssSelectAll
     ) -> list[str]:
         if len(node.queries) == 1:
+            path = css_to_xpath(node.queries[0]) if node.limit else None
+            if path:
+                q = repr(xpath_limit(path, node.limit))
+                return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.xpath({q})"]
             q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.css({q})"]
+            return [
+                f"{ctx.indent}{ctx.nxt} = {ctx.prv}.css({q})",
+                *self.truncate(ctx, node),
+            ]
         self._builder.require_std(
             "std_select_all_first",
             code="""
@@ -79,7 +92,20 @@ class ParselDomSpelling(DomSpelling):
         )
         args = ",".join(repr(q) for q in node.queries)
         return [
-            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})"
+            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})",
+            *self.truncate(ctx, node),
+        ]
+
+    def css_count(self, ctx: ConverterContext, node: CssCount) -> list[str]:
+        path = css_to_xpath(node.queries[0])
+        if path is None:
+            return super().css_count(ctx, node)
+        return self._xpath_count(ctx, path)
+
+    def _xpath_count(self, ctx: ConverterContext, query: str) -> list[str]:
+        q = repr(f"count({query})")
+        return [
+            f"{ctx.indent}{ctx.nxt} = int(float({ctx.prv}.xpath({q}).get()))"
         ]
 
     def css_remove(self, ctx: ConverterContext, node: CssRemove) -> list[str]:
@@ -117,8 +143,10 @@ class ParselDomSpelling(DomSpelling):
         self, ctx: ConverterContext, node: XpathSelectAll
     ) -> list[str]:
         if len(node.queries) == 1:
-            q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.xpath({q})"]
+            query = node.queries[0]
+            if node.limit:
+                query = xpath_limit(query, node.limit)
+            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.xpath({query!r})"]
         self._builder.require_std(
             "std_xpath_all_first",
             code="""
@@ -132,9 +160,13 @@ class ParselDomSpelling(DomSpelling):
         )
         args = ",".join(repr(q) for q in node.queries)
         return [
-            f"{ctx.indent}{ctx.nxt} = std_xpath_all_first({ctx.prv}, {args})"
+            f"{ctx.indent}{ctx.nxt} = std_xpath_all_first({ctx.prv}, {args})",
+            *self.truncate(ctx, node),
         ]
 
+    def xpath_count(self, ctx: ConverterContext, node: XpathCount) -> list[str]:
+        return self._xpath_count(ctx, node.queries[0])
+
     def xpath_remove(
         self, ctx: ConverterContext, node: XpathRemove
     ) -> list[str]:
@@ -249,8 +281,8 @@ class ParselDomSpelling(DomSpelling):
 
     def pred_attr_re(self, node: PredAttrRe) -> str:
         name = node.name
-        pat = repr(node.pattern)
-        return f"bool(re.search({pat}, i.attrib.get({name!r}, '')))"
+        rx = self.re_const(node.pattern)
+        return f"bool({rx}.search(i.attrib.get({name!r}, '')))"
 
     def pred_text_contains(self, node: PredTextContains) -> str:
         values = node.values
@@ -271,7 +303,5 @@ class ParselDomSpelling(DomSpelling):
         return f"any(' '.join(i.xpath('.//text()').getall()).endswith(v) for v in {values!r})"
 
     def pred_text_re(self, node: PredTextRe) -> str:
-        pat = repr(node.pattern)
-        return (
-            f"bool(re.search({pat}, ' '.join(i.xpath('.//text()').getall())))"
-        )
+        rx = self.re_const(node.pattern)
+        return f"bool({rx}.search(' '.join(i.xpath('.//text()').getall())))"
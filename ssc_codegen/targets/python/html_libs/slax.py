@@ -68,7 +68,10 @@ class SlaxDomSpelling(DomSpelling):
     ) -> list[str]:
         if len(node.queries) == 1:
             q = repr(node.queries[0])
-            return [f"{ctx.indent}{ctx.nxt} = {ctx.prv}.css({q})"]
+            return [
+                f"{ctx.indent}{ctx.nxt} = {ctx.prv}.css({q})",
+                *self.truncate(ctx, node),
+            ]
         self._builder.require_std(
             "std_select_all_first",
             code="""
@@ -83,7 +86,8 @@ class SlaxDomSpelling(DomSpelling):
         )
         args = ",".join(repr(q) for q in node.queries)
         return [
-            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})"
+            f"{ctx.indent}{ctx.nxt} = std_select_all_first({ctx.prv}, {args})",
+            *self.truncate(ctx, node),
         ]
 
     def css_remove(self, ctx: ConverterContext, node: CssRemove) -> list[str]:
@@ -214,8 +218,8 @@ class SlaxDomSpelling(DomSpelling):
 
     def pred_attr_re(self, node: PredAttrRe) -> str:
         name = node.name
-        pat = repr(node.pattern)
-        return f"bool(re.search({pat}, i.attributes.get({name!r}, '')))"
+        rx = self.re_const(node.pattern)
+        return f"bool({rx}.search(i.attributes.get({name!r}, '')))"
 
     def pred_text_contains(self, node: PredTextContains) -> str:
         values = node.values
@@ -236,5 +240,5 @@ class SlaxDomSpelling(DomSpelling):
         return f"any(i.text().endswith(v) for v in {values!r})"
 
     def pred_text_re(self, node: PredTextRe) -> str:
-        pat = repr(node.pattern)
-        return f"bool(re.search({pat}, i.text()))"
+        rx = self.re_const(node.pattern)
+        return f"bool({rx}.search(i.text()))"
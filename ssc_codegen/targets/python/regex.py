@@ -0,0 +1,40 @@
+"""Precompiled regex constants for the Python backend.
+
+Every regex used by a generated module (pipeline ``re``/``re-all``/
+``re-sub`` and regex predicates) is hoisted into a module-level
+``re.compile`` constant, so parsing calls the compiled ``re.Pattern``
+directly instead of going through the ``re`` module cache on every item.
+
+Constant names are derived from the pattern text, so identical patterns
+share one constant across structs, and — under ``-R`` — across all parser
+files importing from the runtime module.
+"""
+
+from __future__ import annotations
+
+from ssc_codegen.generation.builder import ModuleBuilder
+from ssc_codegen.traversal.utils import regex_digest
+
+RE_CONST_PREFIX = "RE_"
+
+
+def re_const_name(pattern: str) -> str:
+    """Module-level constant name for ``pattern``."""
+    return f"{RE_CONST_PREFIX}{regex_digest(pattern).upper()}"
+
+
+def is_re_const(name: str) -> bool:
+    """True if ``name`` was produced by :func:`re_const_name`."""
+    return name.startswith(RE_CONST_PREFIX)
+
+
+def re_const_line(pattern: str) -> str:
+    """Definition line of the compiled constant for ``pattern``."""
+    return f"{re_const_name(pattern)} = re.compile({pattern!r})"
+
+
+def require_re_const(builder: ModuleBuilder, pattern: str) -> str:
+    """Register the compiled constant for ``pattern``; return its name."""
+    return builder.require_const(
+        re_const_name(pattern), code=re_const_line(pattern)
+    )
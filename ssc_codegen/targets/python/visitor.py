@@ -45,9 +45,11 @@ from ssc_codegen.ast import (
     MatcherListDef,
     CssSelect,
     CssSelectAll,
+    CssCount,
     CssRemove,
     XpathSelect,
     XpathSelectAll,
+    XpathCount,
     XpathRemove,
     Attr,
     Text,
@@ -125,17 +127,24 @@ from ssc_codegen.ast import (
 )
 from ssc_codegen.naming import to_pascal_case, to_snake_case
 from ssc_codegen.traversal.utils import (
+    TableRoutes,
+    find_struct,
     jsonify_path_to_segments,
     module_has_html_struct,
     module_has_rest,
     module_uses_http,
+    struct_has_iter_parse,
+    table_routes,
 )
 from ssc_codegen.generation.builder import ModuleBuilder
+from ssc_codegen.optimize import optimize_module
 from ssc_codegen.targets.python import rest
+from ssc_codegen.targets.python.fusion import fuse_comprehensions
 from ssc_codegen.targets.python.http_libs.aiohttp import AioHttpStrategy
 from ssc_codegen.targets.python.http_libs.base import HttpLibStrategy
 from ssc_codegen.targets.python.http_libs.httpx import HttpxStrategy
 from ssc_codegen.targets.python.http_libs.requests import RequestsStrategy
+from ssc_codegen.targets.python.regex import is_re_const, require_re_const
 from ssc_codegen.traversal.context import WalkContext
 from ssc_codegen.traversal.walker import BaseWalker
 
@@ -240,9 +249,16 @@ class PythonVisitor(BaseWalker):
     def convert_all(self, module_ast: Module, **meta) -> dict[str, str]:
         self._reset_state()
         self._http = self.http_strategy_for(meta.get("http_client"))
+        module_ast = optimize_module(
+            module_ast,
+            cse=meta.get("cse", True),
+            peephole=meta.get("peephole", True),
+        )
         ctx = self._make_ctx(meta)
         self._walk_module(module_ast, ctx)
         lines = self._walk_module(module_ast, ctx)
+        if ctx.meta.get("fuse", False):
+            lines = fuse_comprehensions("\n".join(lines).split("\n"))
         out: dict[str, str] = {"": "\n".join(lines)}
         if not ctx.meta.get("inline_std", True) and self._builder.has_std:
             name = ctx.meta.get("std_module_name", self.STD_MODULE_NAME)
@@ -300,6 +316,32 @@ class PythonVisitor(BaseWalker):
             f"from {module_name} import {', '.join(self._builder.std_names)}"
         ]
 
+    def _render_const_section(self, ctx: WalkContext) -> list[str]:
+        """Module-level constants hoisted out of generated methods.
+
+        Under -R, precompiled regexes are imported from the runtime module
+        (which defines every pattern of every generated file), the rest
+        stay inlined.
+        """
+        if not self._builder.has_consts:
+            return []
+        runtime = ctx.meta.get("runtime_module")
+        imported: list[str] = []
+        inlined: list[str] = []
+        for name, code in self._builder.consts.items():
+            if runtime and is_re_const(name):
+                imported.append(name)
+            else:
+                inlined.append(code)
+        lines: list[str] = []
+        if imported:
+            lines.append(f"from .{runtime} import " + ", ".join(imported))
+            lines.append("")
+        if inlined:
+            lines.extend(inlined)
+            lines.append("")
+        return lines
+
     def _render_std_module(self) -> str:
         lines: list[str] = ["# autogenerated std runtime. DO NOT EDIT", ""]
         lines.extend(self._builder.std_imports)
@@ -366,6 +408,14 @@ class PythonVisitor(BaseWalker):
         self._builder.require_import(
             "from typing import Any, Dict, List, Optional, TypedDict, Union"
         )
+        iter_types = {
+            struct.type
+            for struct in node.body
+            if isinstance(struct, Struct) and struct_has_iter_parse(struct)
+        }
+        if iter_types:
+            names = "Iterator, Tuple" if ST.DICT in iter_types else "Iterator"
+            self._builder.require_import(f"from typing import {names}")
         self._builder.require_import("import re")
         self._builder.require_import("import json")
         if has_rest:
@@ -425,6 +475,7 @@ class PythonVisitor(BaseWalker):
             lines.append(f"from .{runtime} import " + ", ".join(names))
             lines.append("")
             lines.extend(self._render_std_section(ctx))
+            lines.extend(self._render_const_section(ctx))
             return lines
         lines.extend(self._builder.imports)
         lines.append("")
@@ -445,6 +496,7 @@ class PythonVisitor(BaseWalker):
         if isinstance(mod, Module) and module_has_rest(mod):
             lines.extend(self._http.rest_runtime_lines())
         lines.extend(self._render_std_section(ctx))
+        lines.extend(self._render_const_section(ctx))
         return lines
 
     def visit_code_start_hook(
@@ -513,6 +565,71 @@ class PythonVisitor(BaseWalker):
             return []
         return [f"{ctx.indent}{name!r}: {t},"]
 
+    # === INSTRUMENTATION ===
+
+    def _instrument(
+        self, node: Node, method: str, ctx: WalkContext
+    ) -> list[str]:
+        """``@std_instrument`` line for ``method`` when ``--instrument`` is on.
+
+        Counters are recorded into the module-level ``SSC_METRICS``
+        registry; assign another object with a ``record()`` method to it
+        to send them elsewhere.
+        """
+        if not ctx.meta.get("instrument"):
+            return []
+        self._builder.require_std(
+            "SSC_METRICS",
+            code="""
+                class SscMetrics:
+                    def __init__(self):
+                        self._stats = {}
+
+                    def record(self, name, elapsed_ns, failed):
+                        stats = self._stats.get(name)
+                        if stats is None:
+                            stats = self._stats[name] = [0, 0, 0]
+                        stats[0] += 1
+                        stats[1] += elapsed_ns
+                        if failed:
+                            stats[2] += 1
+
+                    def snapshot(self):
+                        return {
+                            name: {'calls': calls, 'total_ns': total_ns, 'errors': errors}
+                            for name, (calls, total_ns, errors) in self._stats.items()
+                        }
+
+                    def reset(self):
+                        self._stats.clear()
+
+                SSC_METRICS = SscMetrics()
+            """,
+        )
+        self._builder.require_std(
+            "std_instrument",
+            imports=["import functools", "from time import perf_counter_ns"],
+            code="""
+                def std_instrument(name):
+                    def decorator(fn):
+                        @functools.wraps(fn)
+                        def wrapper(self, *args):
+                            start = perf_counter_ns()
+                            try:
+                                result = fn(self, *args)
+                            except BaseException:
+                                SSC_METRICS.record(name, perf_counter_ns() - start, True)
+                                raise
+                            SSC_METRICS.record(name, perf_counter_ns() - start, False)
+                            return result
+                        return wrapper
+                    return decorator
+            """,
+        )
+        struct = find_struct(node)
+        label = f"{to_pascal_case(struct.name)}.{method}" if struct else method
+        return [f"{ctx.indent}@std_instrument({label!r})"]
+
     # === STRUCT ===
 
     def visit_struct(self, node: Struct, ctx: WalkContext) -> list[str]:
@@ -584,31 +701,61 @@ class PythonVisitor(BaseWalker):
         name = to_snake_case(node.name)
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [f"{ctx.indent}def _init_{name}(self, v: {t_arg}) -> {t_ret}:"]
+        lines = self._instrument(node, f"_init_{name}", ctx)
+        lines.append(
+            f"{ctx.indent}def _init_{name}(self, v: {t_arg}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
+        if node.lazy:
+            # no InitFieldCall: computed on first Self access, cached per
+            # instance; an exception is not cached and re-raises next time
+            self._builder.require_import(
+                "from functools import cached_property"
+            )
+            i2 = ctx.deeper().indent
+            lines.extend(
+                [
+                    f"{ctx.indent}@cached_property",
+                    f"{ctx.indent}def _{name}(self) -> {t_ret}:",
+                    f"{i2}return self._init_{name}(self._doc)",
+                ]
+            )
         return lines
 
     def visit_field(self, node: Field, ctx: WalkContext) -> list[str]:
         name = to_snake_case(node.name)
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
+        params = f"v: {t_arg}"
         if node.struct.type == ST.TABLE:
             t_ret = f"Union[{t_ret}, UnmatchedTableRow]"
-        lines = [f"{ctx.indent}def _parse_{name}(self, v: {t_arg}) -> {t_ret}:"]
+            if self._struct_routes(node.struct) is not None:
+                # the routed row loop passes the key it already computed
+                params += ", key: Optional[str] = None"
+        lines = self._instrument(node, f"_parse_{name}", ctx)
+        lines.append(
+            f"{ctx.indent}def _parse_{name}(self, {params}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
     def visit_key(self, node: Key, ctx: WalkContext) -> list[str]:
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [f"{ctx.indent}def _parse_key(self, v: {t_arg}) -> {t_ret}:"]
+        lines = self._instrument(node, "_parse_key", ctx)
+        lines.append(
+            f"{ctx.indent}def _parse_key(self, v: {t_arg}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
     def visit_value(self, node: Value, ctx: WalkContext) -> list[str]:
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [f"{ctx.indent}def _parse_value(self, v: {t_arg}) -> {t_ret}:"]
+        lines = self._instrument(node, "_parse_value", ctx)
+        lines.append(
+            f"{ctx.indent}def _parse_value(self, v: {t_arg}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
@@ -617,7 +764,10 @@ class PythonVisitor(BaseWalker):
     ) -> list[str]:
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [f"{ctx.indent}def _table_config(self, v: {t_arg}) -> {t_ret}:"]
+        lines = self._instrument(node, "_table_config", ctx)
+        lines.append(
+            f"{ctx.indent}def _table_config(self, v: {t_arg}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
@@ -626,16 +776,20 @@ class PythonVisitor(BaseWalker):
     ) -> list[str]:
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [
+        lines = self._instrument(node, "_table_match_key", ctx)
+        lines.append(
             f"{ctx.indent}def _table_match_key(self, v: {t_arg}) -> {t_ret}:"
-        ]
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
     def visit_table_rows(self, node: TableRows, ctx: WalkContext) -> list[str]:
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [f"{ctx.indent}def _table_rows(self, v: {t_arg}) -> {t_ret}:"]
+        lines = self._instrument(node, "_table_rows", ctx)
+        lines.append(
+            f"{ctx.indent}def _table_rows(self, v: {t_arg}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
@@ -644,7 +798,10 @@ class PythonVisitor(BaseWalker):
     ) -> list[str]:
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [f"{ctx.indent}def _pre_validate(self, v: {t_arg}) -> {t_ret}:"]
+        lines = self._instrument(node, "_pre_validate", ctx)
+        lines.append(
+            f"{ctx.indent}def _pre_validate(self, v: {t_arg}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
@@ -685,10 +842,85 @@ class PythonVisitor(BaseWalker):
     def visit_split_doc(self, node: SplitDoc, ctx: WalkContext) -> list[str]:
         t_arg = self._resolve_type(node.accept_type_info)
         t_ret = self._resolve_type(node.ret_type_info)
-        lines = [f"{ctx.indent}def _split_doc(self, v: {t_arg}) -> {t_ret}:"]
+        lines = self._instrument(node, "_split_doc", ctx)
+        lines.append(
+            f"{ctx.indent}def _split_doc(self, v: {t_arg}) -> {t_ret}:"
+        )
         lines.extend(self.walk_children(node, ctx))
         return lines
 
+    def _struct_routes(self, struct: Struct) -> TableRoutes | None:
+        start = next(n for n in struct.body if isinstance(n, StartParse))
+        return table_routes(struct, start.fields)
+
+    def _table_dispatch(
+        self,
+        node: StartParse,
+        routes: TableRoutes,
+        name: str,
+        ctx: WalkContext,
+    ) -> list[str]:
+        """Row loop that computes each row key once and only calls the
+        fields that can accept it (see ``table_routes``). The key is passed
+        on, so the fields do not compute it again.
+        """
+        const = f"{to_snake_case(name).upper()}_ROUTES"
+        self._builder.require_const(const, code=f"{const} = {routes.exact!r}")
+        i2 = ctx.deeper().indent
+        i3 = ctx.deeper().deeper().indent
+        i4 = ctx.deeper().deeper().deeper().indent
+        i5 = ctx.deeper().deeper().deeper().deeper().indent
+        lines = [f"{i2}_fields = ("]
+        for field in node.fields:
+            fn = to_snake_case(field.name)
+            lines.append(f"{i3}({fn!r}, self._parse_{fn}),")
+        lines.extend(
+            [
+                f"{i2})",
+                f"{i2}for _row in self._table_rows(_table):",
+                f"{i3}try:",
+                f"{i4}_key = self._table_match_key(_row)",
+                f"{i3}except Exception:",
+                # fields with a fallback still get to see this row; they
+                # compute the key themselves and apply their fallback
+                f"{i4}_key = None",
+                f"{i4}_route = range({routes.size})",
+                f"{i3}else:",
+            ]
+        )
+        if routes.prefixes:
+            prefixes = f"{to_snake_case(name).upper()}_PREFIXES"
+            self._builder.require_const(
+                prefixes, code=f"{prefixes} = {routes.prefixes!r}"
+            )
+            lengths = tuple(routes.prefix_lengths)
+            hits = (
+                f"j for n in {lengths!r} for j in {prefixes}.get(_key[:n], ())"
+            )
+            if routes.other:
+                other = ", ".join(map(str, routes.other))
+                hits = f"{other}, *({hits})"
+            lines.extend(
+                [
+                    f"{i4}_route = {const}.get(_key)",
+                    f"{i4}if _route is None:",
+                    f"{i5}_route = sorted({{{hits}}})",
+                ]
+            )
+        else:
+            lines.append(f"{i4}_route = {const}.get(_key, {routes.other!r})")
+        lines.extend(
+            [
+                f"{i3}for _j in _route:",
+                f"{i4}_name, _parse = _fields[_j]",
+                f"{i4}_value = _parse(_row, _key)",
+                f"{i4}if _value != UNMATCHED_TABLE_ROW and _name not in _result:",
+                f"{i5}_result[_name] = _value",
+                f"{i5}break",
+            ]
+        )
+        return lines
+
     def visit_start_parse(
         self, node: StartParse, ctx: WalkContext
     ) -> list[str]:
@@ -737,6 +969,12 @@ class PythonVisitor(BaseWalker):
             case ST.TABLE:
                 lines.append(f"{i2}_result: {name}Type = {{}}")
                 lines.append(f"{i2}_table = self._table_config(self._doc)")
+                routes = table_routes(node.struct, node.fields)
+                if routes is not None:
+                    lines.extend(self._table_dispatch(node, routes, name, ctx))
+                    lines.append(f"{i2}return _result")
+                    lines.extend(self._emit_iter_parse(node, ctx, name))
+                    return lines
                 lines.append(f"{i2}for _row in self._table_rows(_table):")
                 for field in node.fields:
                     fn = to_snake_case(field.name)
@@ -762,6 +1000,40 @@ class PythonVisitor(BaseWalker):
                             f"{i3}{fn!r}: self._parse_{fn}(self._doc),"
                         )
                     lines.append(f"{i3}}}")
+        lines.extend(self._emit_iter_parse(node, ctx, name))
+        return lines
+
+    def _emit_iter_parse(
+        self, node: StartParse, ctx: WalkContext, name: str
+    ) -> list[str]:
+        """``iter_parse()`` generator yielding split-doc items one at a time.
+
+        Emitted for list/dict structs (and raw structs with ``@split-doc``);
+        dict structs yield ``(key, value)`` pairs.
+        """
+        if not struct_has_iter_parse(node.struct):
+            return []
+        st = node.struct.type
+        i2 = ctx.deeper().indent
+        i3 = ctx.deeper().deeper().indent
+        i4 = ctx.deeper().deeper().deeper().indent
+        if st == ST.DICT:
+            value = next(n for n in node.struct.body if isinstance(n, Value))
+            t = f"Tuple[str, {self._resolve_type(value.ret_type_info)}]"
+        else:
+            t = f"{name}Type"
+        lines = [f"{ctx.indent}def iter_parse(self) -> Iterator[{t}]:"]
+        if node.use_pre_validate:
+            lines.append(f"{i2}self._pre_validate(self._doc)")
+        lines.append(f"{i2}for i in self._split_doc(self._doc):")
+        if st == ST.DICT:
+            lines.append(f"{i3}yield self._parse_key(i), self._parse_value(i)")
+            return lines
+        lines.append(f"{i3}yield {{")
+        for field in node.fields:
+            fn = to_snake_case(field.name)
+            lines.append(f"{i4}{fn!r}: self._parse_{fn}(i),")
+        lines.append(f"{i3}}}")
         return lines
 
     # === REST / FETCH (delegate to rest.py) ===
@@ -786,6 +1058,9 @@ class PythonVisitor(BaseWalker):
     ) -> list[str]:
         return self._dom.css_select_all(ctx, node)
 
+    def visit_css_count(self, node: CssCount, ctx: WalkContext) -> list[str]:
+        return self._dom.css_count(ctx, node)
+
     def visit_css_remove(self, node: CssRemove, ctx: WalkContext) -> list[str]:
         return self._dom.css_remove(ctx, node)
 
@@ -799,6 +1074,11 @@ class PythonVisitor(BaseWalker):
     ) -> list[str]:
         return self._dom.xpath_select_all(ctx, node)
 
+    def visit_xpath_count(
+        self, node: XpathCount, ctx: WalkContext
+    ) -> list[str]:
+        return self._dom.xpath_count(ctx, node)
+
     def visit_xpath_remove(
         self, node: XpathRemove, ctx: WalkContext
     ) -> list[str]:
@@ -1060,33 +1340,33 @@ class PythonVisitor(BaseWalker):
                     pass
 
                 def std_re_search(pattern, value, msg=''):
-                    m = re.search(pattern, value)
+                    m = pattern.search(value)
                     if m is None:
                         raise SscRegexError(msg or 'ssc-gen re-match failed')
                     return m[1]
             """,
         )
-        pattern = repr(node.pattern)
+        rx = require_re_const(self._builder, node.pattern)
         if node.is_array:
             return [
-                f"{ctx.indent}{ctx.nxt} = [std_re_search({pattern}, i, {msg!r}) for i in {ctx.prv}]"
+                f"{ctx.indent}{ctx.nxt} = [std_re_search({rx}, i, {msg!r}) for i in {ctx.prv}]"
             ]
         return [
-            f"{ctx.indent}{ctx.nxt} = std_re_search({pattern}, {ctx.prv}, {msg!r})"
+            f"{ctx.indent}{ctx.nxt} = std_re_search({rx}, {ctx.prv}, {msg!r})"
         ]
 
     def visit_re_all(self, node: ReAll, ctx: WalkContext) -> list[str]:
-        pattern = repr(node.pattern)
-        return [f"{ctx.indent}{ctx.nxt} = re.findall({pattern}, {ctx.prv})"]
+        rx = require_re_const(self._builder, node.pattern)
+        return [f"{ctx.indent}{ctx.nxt} = {rx}.findall({ctx.prv})"]
 
     def visit_re_sub(self, node: ReSub, ctx: WalkContext) -> list[str]:
-        pattern = repr(node.pattern)
+        rx = require_re_const(self._builder, node.pattern)
         repl = repr(node.repl)
         if node.is_array:
             return [
-                f"{ctx.indent}{ctx.nxt} = [re.sub({pattern}, {repl}, i) for i in {ctx.prv}]"
+                f"{ctx.indent}{ctx.nxt} = [{rx}.sub({repl}, i) for i in {ctx.prv}]"
             ]
-        return [f"{ctx.indent}{ctx.nxt} = re.sub({pattern}, {repl}, {ctx.prv})"]
+        return [f"{ctx.indent}{ctx.nxt} = {rx}.sub({repl}, {ctx.prv})"]
 
     # === ARRAY ===
 
@@ -1262,8 +1542,15 @@ class PythonVisitor(BaseWalker):
         return lines
 
     def visit_match(self, node: Match, ctx: WalkContext) -> list[str]:
+        key = f"self._table_match_key({ctx.prv})"
+        struct = find_struct(node)
+        if (
+            isinstance(struct, Struct)
+            and self._struct_routes(struct) is not None
+        ):
+            key = f"{key} if key is None else key"
         lines = [
-            f"{ctx.indent}i = self._table_match_key({ctx.prv})",
+            f"{ctx.indent}i = {key}",
             f"{ctx.indent}if not (",
         ]
         lines.extend(self.walk_children(node, ctx))
@@ -1392,24 +1679,20 @@ class PythonVisitor(BaseWalker):
         return [f"{ctx.indent}{prefix}len(i) != {node.value}"]
 
     def visit_predicate_re(self, node: PredRe, ctx: WalkContext) -> list[str]:
-        pat = repr(node.pattern)
+        rx = require_re_const(self._builder, node.pattern)
         prefix = "" if ctx.index == 0 else "and "
-        return [f"{ctx.indent}{prefix}bool(re.search({pat}, i))"]
+        return [f"{ctx.indent}{prefix}bool({rx}.search(i))"]
 
     def visit_predicate_re_any(
         self, node: PredReAny, ctx: WalkContext
     ) -> list[str]:
-        pat = repr(node.pattern)
+        rx = require_re_const(self._builder, node.pattern)
         prefix = "" if ctx.index == 0 else "and "
-        return [
-            f"{ctx.indent}{prefix}any(bool(re.search({pat}, j)) for j in i)"
-        ]
+        return [f"{ctx.indent}{prefix}any(bool({rx}.search(j)) for j in i)"]
 
     def visit_predicate_re_all(
         self, node: PredReAll, ctx: WalkContext
     ) -> list[str]:
-        pat = repr(node.pattern)
+        rx = require_re_const(self._builder, node.pattern)
         prefix = "" if ctx.index == 0 else "and "
-        return [
-            f"{ctx.indent}{prefix}all(bool(re.search({pat}, j)) for j in i)"
-        ]
+        return [f"{ctx.indent}{prefix}all(bool({rx}.search(j)) for j in i)"]
@@ -2,22 +2,43 @@
 
 from __future__ import annotations
 
+import hashlib
+from dataclasses import dataclass
+
 from ssc_codegen.ast import (
     Assert,
+    CssRemove,
     ErrorResponse,
+    Fallback,
+    Field,
     Filter,
     FunctionDef,
+    InitField,
     Match,
     MethodBase,
     Module,
     Node,
     PlaceholderSpec,
     PlaceholderTemplate,
+    PredAttrRe,
+    PredEq,
+    PredRe,
+    PredReAll,
+    PredReAny,
+    PredStarts,
+    PredTextRe,
     PreValidate,
+    Re,
+    ReAll,
+    ReSub,
+    SplitDoc,
     Struct,
     StructBase,
     StructRest,
     StructType,
+    TableMatchKey,
+    VariableType,
+    XpathRemove,
 )
 
 
@@ -67,6 +88,72 @@ def module_has_html_struct(module: Module) -> bool:
     return False
 
 
+def struct_has_iter_parse(struct: Struct) -> bool:
+    """True if backends emit a streaming ``iter_parse`` for ``struct``.
+
+    List and dict structs, plus RAW structs with ``@split-doc`` — every
+    struct whose ``parse()`` collects items over ``_split_doc``.
+    """
+    if struct.type in (StructType.LIST, StructType.DICT):
+        return True
+    return struct.type == StructType.RAW and any(
+        isinstance(n, SplitDoc) for n in struct.body
+    )
+
+
+def struct_removes_nodes(struct: StructBase) -> bool:
+    """True if any pipeline of ``struct`` runs ``css-remove``/``xpath-remove``.
+
+    Those ops mutate the shared document, so the order in which fields
+    and ``@init`` values run becomes observable.
+    """
+    stack: list[Node] = list(struct.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (CssRemove, XpathRemove)):
+            return True
+        stack.extend(node.body)
+    return False
+
+
+# Nodes whose ``pattern`` field is a regex evaluated by generated code.
+_REGEX_NODES = (
+    Re,
+    ReAll,
+    ReSub,
+    PredRe,
+    PredReAny,
+    PredReAll,
+    PredTextRe,
+    PredAttrRe,
+)
+
+
+def collect_regex_patterns(module: Module) -> list[str]:
+    """Return every distinct regex pattern used in ``module``.
+
+    Order follows first appearance in the AST, so output built from the
+    result is deterministic for a given schema.
+    """
+    seen: dict[str, None] = {}
+    stack: list[Node] = [module]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _REGEX_NODES):
+            seen.setdefault(node.pattern, None)
+        stack.extend(reversed(node.body))
+    return list(seen)
+
+
+def regex_digest(pattern: str) -> str:
+    """Stable short digest of a regex pattern, used to name hoisted constants.
+
+    Derived from the pattern text only, so the same pattern gets the same
+    name in every generated file and in the shared runtime module.
+    """
+    return hashlib.sha1(pattern.encode("utf-8")).hexdigest()[:10]
+
+
 def err_subclass_name(struct_name: str, err: ErrorResponse) -> str:
     """Deterministic error-subclass name from struct name + error spec."""
     from ssc_codegen.core.rest_artifacts import (
@@ -106,6 +193,27 @@ def find_predicate_container(node: Node) -> Node | None:
     return None
 
 
+def find_struct(node: Node) -> StructBase | None:
+    """Walk the parent chain to find the struct that owns ``node``."""
+    cur = node.parent
+    while cur:
+        if isinstance(cur, StructBase):
+            return cur
+        cur = cur.parent
+    return None
+
+
+def find_init_field(node: Node, name: str) -> InitField | None:
+    """Return the ``InitField`` called ``name`` in the struct owning ``node``."""
+    struct = find_struct(node)
+    if struct is None:
+        return None
+    for child in struct.body:
+        if isinstance(child, InitField) and child.name == name:
+            return child
+    return None
+
+
 def jsonify_path_to_segments(query: str) -> list[str]:
     """Split a dot-notation path into segments, quoting string keys.
 
@@ -120,3 +228,92 @@ def jsonify_path_to_segments(query: str) -> list[str]:
         else:
             parts.append(repr(part))
     return parts
+
+
+@dataclass
+class TableRoutes:
+    """Candidate fields of a ``(table)struct`` per row match key.
+
+    Indexes point into ``StartParse.fields`` and are sorted, so trying
+    them in order keeps the first-match-wins semantics of the full scan.
+    A field whose ``match`` has a top-level ``eq`` (strings only) or
+    ``starts`` is keyed: it can only accept rows whose key is one of the
+    values or starts with one of them.
+    """
+
+    exact: dict[str, tuple[int, ...]]
+    """literal key -> every field that may accept it"""
+    prefixes: dict[str, tuple[int, ...]]
+    """``starts`` value -> fields keyed by it"""
+    other: tuple[int, ...]
+    """fields without a literal key test, tried for every row"""
+    size: int
+
+    @property
+    def prefix_lengths(self) -> list[int]:
+        return sorted({len(p) for p in self.prefixes})
+
+
+def _match_of(field: Field) -> Match | None:
+    for node in field.body:
+        if isinstance(node, Fallback):
+            node = next(iter(node.body), None)
+        if isinstance(node, Match):
+            return node
+    return None
+
+
+def _literal_key_test(match: Match) -> tuple[str, tuple[str, ...]] | None:
+    starts = None
+    for pred in match.body:
+        values = getattr(pred, "values", ())
+        # `eq 3` compares the length; `starts ""` accepts every key
+        if not values or not all(isinstance(v, str) and v for v in values):
+            continue
+        if isinstance(pred, PredEq):
+            return "eq", values
+        if isinstance(pred, PredStarts) and starts is None:
+            starts = ("starts", values)
+    return starts
+
+
+def table_routes(struct: Struct, fields: list[Field]) -> TableRoutes | None:
+    """Key dispatch for the row loop of ``struct``, or None if no field is
+    keyed by a literal.
+    """
+    key = next((n for n in struct.body if isinstance(n, TableMatchKey)), None)
+    if key is None or key.ret_type_info.is_array:
+        return None
+    # a null key is neither looked up nor sliced
+    if key.ret_type_info.is_optional:
+        return None
+    if key.ret_type_info.base != VariableType.STRING:
+        return None
+    eq: dict[str, list[int]] = {}
+    prefixes: dict[str, list[int]] = {}
+    other: list[int] = []
+    for j, field in enumerate(fields):
+        match = _match_of(field)
+        test = _literal_key_test(match) if match else None
+        if test is None:
+            other.append(j)
+            continue
+        kind, values = test
+        target = eq if kind == "eq" else prefixes
+        for value in dict.fromkeys(values):
+            target.setdefault(value, []).append(j)
+    if not eq and not prefixes:
+        return None
+    exact = {}
+    for value, keyed in eq.items():
+        candidates = set(keyed) | set(other)
+        for prefix, starts in prefixes.items():
+            if value.startswith(prefix):
+                candidates.update(starts)
+        exact[value] = tuple(sorted(candidates))
+    return TableRoutes(
+        exact=exact,
+        prefixes={p: tuple(js) for p, js in prefixes.items()},
+        other=tuple(other),
+        size=len(fields),
+    )
@@ -35,6 +35,8 @@ from ssc_codegen.ast import (
     CssSelectAll,
     XpathSelect,
     XpathSelectAll,
+    CssCount,
+    XpathCount,
     CssRemove,
     XpathRemove,
     Attr,
@@ -193,6 +195,8 @@ class BaseWalker:
         CssRemove: "visit_css_remove",
         XpathSelect: "visit_xpath_select",
         XpathSelectAll: "visit_xpath_select_all",
+        CssCount: "visit_css_count",
+        XpathCount: "visit_xpath_count",
         XpathRemove: "visit_xpath_remove",
         Text: "visit_text",
         Raw: "visit_raw",
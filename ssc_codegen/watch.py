@@ -0,0 +1,88 @@
+"""Polling file watcher for ``generate --watch`` and ``check --watch``.
+
+Tracks every schema plus everything it imports (via ``import_closure``,
+the same resolution ``resolve_imports`` performs) and maps each changed
+file back to the schemas that must be rebuilt. Polling mtimes keeps the
+watcher dependency-free and works on network and container mounts.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from ssc_codegen.core.module_handler import import_closure
+
+DEFAULT_INTERVAL = 0.5
+
+
+def dependency_graph(kdl_files: list[Path]) -> dict[Path, list[Path]]:
+    """Map each watched file (resolved) to the schemas depending on it.
+
+    A schema depends on itself and on every file it transitively imports.
+    Schemas keep their ``kdl_files`` order in each list.
+    """
+    graph: dict[Path, list[Path]] = {}
+    for schema in kdl_files:
+        for path in (schema.resolve(), *import_closure(schema)):
+            dependents = graph.setdefault(path, [])
+            if schema not in dependents:
+                dependents.append(schema)
+    return graph
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class Watcher:
+    """Detect which schemas are affected by file changes since last poll."""
+
+    def __init__(
+        self,
+        collect: Callable[[], list[Path]],
+        *,
+        interval: float = DEFAULT_INTERVAL,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._collect = collect
+        self._interval = interval
+        self._sleep = sleep
+        self._files: list[Path] = []
+        self._graph: dict[Path, list[Path]] = {}
+        self._mtimes: dict[Path, int | None] = {}
+        self._refresh(collect())
+
+    def _refresh(self, files: list[Path]) -> None:
+        self._files = list(files)
+        self._graph = dependency_graph(files)
+        self._mtimes = {path: _mtime(path) for path in self._graph}
+
+    def poll(self) -> list[Path]:
+        """Schemas affected since the previous poll, in collection order.
+
+        New schemas count as affected; removed ones are dropped silently.
+        The import graph is rebuilt after every change, so edits that add
+        or remove ``import`` nodes are tracked from the next poll on.
+        """
+        files = self._collect()
+        affected: set[Path] = {f for f in files if f not in self._files}
+        for path, old in self._mtimes.items():
+            if _mtime(path) != old:
+                affected.update(self._graph[path])
+        if not affected and files == self._files:
+            return []
+        self._refresh(files)
+        return [f for f in files if f in affected]
+
+    def wait(self) -> list[Path]:
+        """Block until a poll reports affected schemas; return them."""
+        while True:
+            self._sleep(self._interval)
+            affected = self.poll()
+            if affected:
+                return affected
@@ -13,6 +13,7 @@ Only HTML-parsing schemas are exercised.
 
 from __future__ import annotations
 
+import re
 import shutil
 import subprocess
 from pathlib import Path
@@ -108,7 +109,10 @@ def _go_module_template(tmp_path_factory):
             "go",
             "get",
             "github.com/PuerkitoBio/goquery@v1.12.0",
+            "github.com/andybalholm/cascadia@v1.3.3",
             "github.com/tidwall/gjson@v1.18.0",
+            # stdFindLimit / stdCountMatches walk *xhtml.Node directly
+            "golang.org/x/net@latest",
         ],
         cwd=tmp,
         capture_output=True,
@@ -222,3 +226,180 @@ def test_gofmt_failure_is_not_silenced(monkeypatch):
 
     with pytest.raises(BuildTimeError, match="syntax error"):
         visitor._gofmt("package main\ninvalid")
+
+
+def test_iter_parse_signatures():
+    """List/dict structs get an iter.Seq-shaped IterParse; items do not."""
+    code = GO_CONVERTER.convert(_parse_kdl(SCHEMAS_DIR / "06_dict.kdl"))
+    assert (
+        "func (m *MetaDict) IterParse(yield func(string, string) bool) {"
+        in code
+    )
+    assert "EachWithBreak(" in code
+    assert "func (d *DictRoot) IterParse(" not in code
+
+
+class TestPrecompiledMatchers:
+    """CSS queries become package-level cascadia matchers (FindMatcher)."""
+
+    def test_parser_uses_find_matcher(self):
+        from ssc_codegen.targets.golang.visitor import GoVisitor
+
+        ast = _parse_kdl(SCHEMAS_DIR / "03_filters_and_predicates.kdl")
+        code = GoVisitor().convert(ast, package="p")
+        assert ".Find(" not in code
+        assert ".FindMatcher(" in code
+        assert "stdCompileCss(" not in code
+        assert ".FindMatcher(sscCss" in code
+
+    def test_runtime_declares_each_matcher_once(self):
+        from ssc_codegen.targets.golang.visitor import GoVisitor
+
+        conv = GoVisitor()
+        ast = _parse_kdl(SCHEMAS_DIR / "06_dict.kdl")
+        code = conv.convert(ast, package="p")
+        conv.convert(ast, package="p")
+        runtime = conv.emit_runtime("p")
+        names = set(re.findall(r"\bsscCss[0-9a-f]+\b", code))
+        assert names
+        for name in names:
+            assert runtime.count(f"var {name} = stdCompileCss(") == 1
+        assert '"github.com/andybalholm/cascadia"' in runtime
+        assert '"regexp"' not in runtime
+
+
+def test_emit_bench_covers_every_struct():
+    from ssc_codegen.targets.golang.visitor import GoVisitor
+
+    conv = GoVisitor()
+    conv.convert(_parse_kdl(SCHEMAS_DIR / "06_dict.kdl"), package="p")
+    conv.convert(_parse_kdl(SCHEMAS_DIR / "23_raw_struct.kdl"), package="p")
+    bench = conv.emit_bench("p")
+    assert bench.startswith("// Code generated by ssc-gen. DO NOT EDIT.")
+    assert "func BenchmarkMetaDictParse(b *testing.B) {" in bench
+    assert "p, err := NewMetaDict(input)" in bench
+    assert "p := NewRawLineItems(input)" in bench
+
+
+def test_instrument_defers_tracking():
+    """--instrument adds one stdTrack defer per method; off by default."""
+    from ssc_codegen.targets.golang.visitor import GoVisitor
+
+    ast = _parse_kdl(SCHEMAS_DIR / "07_table.kdl")
+    conv = GoVisitor()
+    code = conv.convert(ast, package="p", instrument=True)
+    assert 'defer stdTrack("TableCoverage.tableRows")()' in code
+    assert 'defer stdTrack("TableCoverage.parseValue")()' in code
+    runtime = conv.emit_runtime("p")
+    assert "func (r *SscRegistry) Snapshot() map[string]SscMetric {" in runtime
+    assert '"sync"' in runtime
+
+    plain = GoVisitor().convert(ast, package="p")
+    assert "stdTrack" not in plain
+
+
+def test_cse_lazy_accessor():
+    """Shared css-all prefix is computed once via a lazy getter."""
+    ast = _parse_kdl(SCHEMAS_DIR / "31_css_all_indexing.kdl")
+    code = GO_CONVERTER.convert(ast, package="p", peephole=False)
+    assert "func (d *DocIndexing) getCse0() *goquery.Selection {" in code
+    assert "\tif !d.cse0Done {" in code
+    assert code.count("v1 := d.getCse0()") == 4
+    assert "d.init()" not in code
+
+    plain = GO_CONVERTER.convert(ast, package="p", cse=False)
+    assert "getCse0" not in plain
+
+
+def test_limit_and_count_pushdown():
+    """css-all + slice/len stop the tree walk early or only count."""
+    from ssc_codegen.targets.golang.visitor import GoVisitor
+
+    ast, _ = parse_module(
+        "struct Page {\n"
+        '    head  { css-all "li"; slice 0 2; text }\n'
+        '    total { css-all "a"; len }\n'
+        "}\n"
+    )
+    conv = GoVisitor()
+    code = conv.convert(ast, package="p")
+    assert re.search(r"v1 := stdFindLimit\(v, sscCss\w+, 2\)", code)
+    assert re.search(r"v1 := stdCountMatches\(v, sscCss\w+\)", code)
+    runtime = conv.emit_runtime("p")
+    assert "func stdFindLimit(" in runtime
+    assert 'xhtml "golang.org/x/net/html"' in runtime
+
+
+_UNESCAPE_AND_LIMIT = (
+    "struct Page {\n"
+    '    title { css "h1"; text; unescape }\n'
+    '    head  { css-all "li"; slice 0 2; text }\n'
+    '    total { css-all "a"; len }\n'
+    "}\n"
+)
+
+
+def test_limit_helpers_and_unescape_imports():
+    """x/net/html is aliased so it does not clash with std html."""
+    from ssc_codegen.targets.golang.visitor import GoVisitor
+
+    ast, _ = parse_module(_UNESCAPE_AND_LIMIT)
+    conv = GoVisitor()
+    conv.convert(ast, package="p")
+    runtime = conv.emit_runtime("p")
+    assert "func stdFindLimit(" in runtime
+    assert "func stdCountMatches(" in runtime
+    assert "html.UnescapeString(" in runtime
+    assert '\t"html"\n' in runtime
+    assert '\txhtml "golang.org/x/net/html"\n' in runtime
+    assert "*html.Node" not in runtime
+    assert " html.ElementNode" not in runtime
+
+
+def test_limit_helpers_and_unescape_compile(go_module):
+    """Runtime with both html packages passes go vet + go build."""
+    from ssc_codegen.targets.golang.visitor import GoVisitor
+
+    ast, _ = parse_module(_UNESCAPE_AND_LIMIT)
+    conv = GoVisitor()
+    code = conv.convert(ast, package="sscgen_test")
+    (go_module / "page.go").write_bytes(code.encode("utf-8"))
+    (go_module / "sscgen_runtime.go").write_bytes(
+        conv.emit_runtime("sscgen_test").encode("utf-8")
+    )
+    for cmd in (["go", "vet", "./..."], ["go", "build", "./..."]):
+        proc = subprocess.run(
+            cmd,
+            cwd=go_module,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert proc.returncode == 0, (
+            f"{' '.join(cmd)} failed:\n"
+            f"STDOUT:\n{proc.stdout}\nSTDERR:\n{proc.stderr}"
+        )
+
+
+def test_table_keyed_dispatch():
+    """Literal eq/starts match keys route each row to its candidate fields."""
+    ast = _parse_kdl(SCHEMAS_DIR / "07_table.kdl")
+    code = GO_CONVERTER.convert(ast, package="p")
+    assert "_route, _key := t.tableRoute(_row)" in code
+    assert "for _, _j := range _route {" in code
+    # fields reuse the key computed by tableRoute
+    assert code.count("t.tableMatchKey(row)") == 1
+    assert "_key = *key" in code
+    assert '\t"identifier": []int{0, 1, 3},' in code
+    assert "var sscTableCoveragePrefixes = map[string][]int{" in code
+    assert "func (t *TableCoverage) tableRoute(" in code
+
+
+def test_init_lazy_accessor():
+    """@init values are computed on first use, not in init()."""
+    ast = _parse_kdl(SCHEMAS_DIR / "00_full.kdl")
+    code = GO_CONVERTER.convert(ast, package="p")
+    assert "func (f *FlatCoverage) getHrefs() []string {" in code
+    assert "v1 := f.getHrefs()" in code
+    assert "f.hrefs = f.initHrefs(f.sel)\n\t\tf.hrefsDone = true" in code
+    assert "func (f *FlatCoverage) init() {\n}" in code
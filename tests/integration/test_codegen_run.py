@@ -53,18 +53,20 @@ def _run_schema(
     target: str = "py-bs4",
 ) -> dict | list:
     """Parse KDL, generate code, exec, instantiate class, call parse()."""
-    p = Path(schema_path)
-    module_ast = _parse_kdl(p)
-    class_name = to_pascal_case(struct_name)
+    return _load_class(schema_path, struct_name, target)(html).parse()
 
-    converter = _get_converter(target)
-    code = converter.convert(module_ast)
+
+def _load_class(
+    schema_path: str | Path, struct_name: str, target: str = "py-bs4"
+) -> type:
+    """Parse KDL, generate code, exec, return the generated class."""
+    module_ast = _parse_kdl(Path(schema_path))
+    code = _get_converter(target).convert(module_ast)
 
     namespace: dict = {}
     exec(code, namespace)  # noqa: S102
 
-    cls = namespace[class_name]
-    return cls(html).parse()
+    return namespace[to_pascal_case(struct_name)]
 
 
 @pytest.fixture(scope="module")
@@ -531,3 +533,123 @@ class TestFnRaw:
             target,
         )
         assert result == "1.2.3"
+
+
+class TestLxmlPrecompiledSelectors:
+    """py-lxml hoists every css/xpath query into a module-level constant."""
+
+    def test_no_per_call_selector_translation(self):
+        module_ast = _parse_kdl(SCHEMAS_DIR / "00_full.kdl")
+        code = _get_converter("py-lxml").convert(module_ast)
+        assert "CSSSelector(" in code
+        assert ".cssselect(" not in code
+        assert ".xpath(" not in code
+
+    def test_untranslatable_css_keeps_per_call_form(self):
+        # `:not()` with a selector list is CSS4: cssselect rejects it, so
+        # only the fields using it may fail, not the module import.
+        schema = (
+            Path(__file__).parents[2] / "examples" / "metaExtractorCss4.kdl"
+        )
+        module_ast = _parse_kdl(schema)
+        code = _get_converter("py-lxml").convert(module_ast)
+        assert "methodcaller('cssselect', " in code
+
+        namespace: dict = {}
+        exec(code, namespace)  # noqa: S102
+        page = "<html><head><meta name='description' content='d'></head></html>"
+        assert namespace["MetaBase"](page).parse()["description"] == "d"
+
+    def test_matches_bs4_output(self, html):
+        schema = SCHEMAS_DIR / "03_filters_and_predicates.kdl"
+        expected = _run_schema(schema, "FiltersAndPredicates", html)
+        result = _run_schema(
+            schema, "FiltersAndPredicates", html, target="py-lxml"
+        )
+        assert result == expected
+
+
+class TestIterParse:
+    """iter_parse() streams exactly what parse() collects."""
+
+    @pytest.mark.parametrize("target", _TARGETS)
+    def test_list_struct(self, html, target):
+        cls = _load_class(
+            SCHEMAS_DIR / "02_arrays_and_conversions.kdl",
+            "ArraysAndConversions",
+            target,
+        )
+        items = cls(html).iter_parse()
+        assert not isinstance(items, list)
+        assert list(items) == cls(html).parse()
+
+    @pytest.mark.parametrize("target", _TARGETS)
+    def test_dict_struct_yields_pairs(self, html, target):
+        cls = _load_class(SCHEMAS_DIR / "06_dict.kdl", "MetaDict", target)
+        pairs = list(cls(html).iter_parse())
+        assert all(isinstance(pair, tuple) for pair in pairs)
+        assert dict(pairs) == cls(html).parse()
+
+    def test_raw_split_doc_struct(self):
+        cls = _load_class(SCHEMAS_DIR / "23_raw_struct.kdl", "RawLineItems")
+        items = cls(_PLAYLIST_TEXT).iter_parse()
+        assert next(items) == cls(_PLAYLIST_TEXT).parse()[0]
+
+    def test_table_struct_has_no_iter_parse(self, html):
+        cls = _load_class(SCHEMAS_DIR / "07_table.kdl", "TableCoverage")
+        assert not hasattr(cls, "iter_parse")
+
+
+class TestInstrument:
+    """--instrument: per-method counters in a module-level registry."""
+
+    @staticmethod
+    def _module(target: str) -> tuple[str, dict]:
+        module_ast = _parse_kdl(SCHEMAS_DIR / "07_table.kdl")
+        code = _get_converter(target).convert(module_ast, instrument=True)
+        namespace: dict = {}
+        exec(code, namespace)  # noqa: S102
+        return code, namespace
+
+    @pytest.mark.parametrize("target", _TARGETS)
+    def test_counts_calls_and_keeps_results(self, html, target):
+        _, namespace = self._module(target)
+        plain = _load_class(
+            SCHEMAS_DIR / "07_table.kdl", "TableCoverage", target
+        )
+        metrics = namespace["SSC_METRICS"]
+        cls = namespace["TableCoverage"]
+
+        assert cls(html).parse() == plain(html).parse()
+        snapshot = metrics.snapshot()
+        assert snapshot["TableCoverage._table_rows"]["calls"] == 1
+        assert snapshot["TableCoverage._parse_value"]["calls"] >= 1
+        assert all(m["total_ns"] >= 0 for m in snapshot.values())
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_counts_errors(self):
+        _, namespace = self._module("py-lxml")
+        cls = namespace["TableCoverage"]
+        with pytest.raises(namespace["SscAssertionError"]):
+            cls("<p>no table</p>").parse()
+        snapshot = namespace["SSC_METRICS"].snapshot()
+        assert sum(m["errors"] for m in snapshot.values()) >= 1
+
+    def test_sink_is_replaceable(self, html):
+        _, namespace = self._module("py-lxml")
+        records = []
+
+        class Sink:
+            def record(self, name, elapsed_ns, failed):
+                records.append(name)
+
+        namespace["SSC_METRICS"] = Sink()
+        namespace["TableCoverage"](html).parse()
+        assert "TableCoverage._table_config" in records
+
+    def test_off_by_default(self):
+        module_ast = _parse_kdl(SCHEMAS_DIR / "07_table.kdl")
+        code = _get_converter("py-lxml").convert(module_ast)
+        assert "std_instrument" not in code
+        assert "SSC_METRICS" not in code
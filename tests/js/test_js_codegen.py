@@ -249,3 +249,66 @@ class TestJsRawStructList:
         assert r[0]["quality"] == "480p"
         assert r[0]["url"] == "/v/anime/01_480p.m3u8"
         assert r[2]["quality"] == "1080p"
+
+
+def test_instrument_wraps_methods():
+    """--instrument wraps each struct's methods once; off by default."""
+    module_ast = _parse_kdl(SCHEMAS_DIR / "07_table.kdl")
+    code = JS_CONVERTER.convert(module_ast, instrument=True)
+    assert code.count("_sscInstrument(TableCoverage, [") == 1
+    assert "'_tableRows'" in code and "'_parseValue'" in code
+    assert "let sscMetrics = new SscMetrics();" in code
+    assert "sscMetrics" not in JS_CONVERTER.convert(module_ast)
+
+
+def test_cse_memoized_getter():
+    """Shared css-all prefix becomes a getter that caches on first use."""
+    module_ast = _parse_kdl(SCHEMAS_DIR / "31_css_all_indexing.kdl")
+    code = JS_CONVERTER.convert(module_ast, peephole=False)
+    assert "  get _cse0() {" in code
+    assert "Object.defineProperty(this, '_cse0', { value });" in code
+    assert code.count("let v1 = this._cse0;") == 4
+    assert "_cse0" not in JS_CONVERTER.convert(module_ast, cse=False)
+
+
+def test_limit_and_count_pushdown():
+    """css-all + slice/len stop early or count without building the list."""
+    module_ast, _ = parse_module(
+        "struct Page {\n"
+        '    head  { css-all "li"; slice 0 2; text }\n'
+        '    first { css-all "p"; index 0 }\n'
+        '    total { css-all "a"; len }\n'
+        '    rows  { xpath-all "//tr"; slice 0 3; text }\n'
+        "}\n"
+    )
+    code = JS_CONVERTER.convert(module_ast)
+    assert "Array.prototype.slice.call(v.querySelectorAll('li'), 0, 2)" in code
+    assert "[v.querySelector('p')].filter(e => e !== null)" in code
+    assert "let v1 = v.querySelectorAll('a').length;" in code
+    assert "'(//tr)[position() <= 3]'" in code
+    plain = JS_CONVERTER.convert(module_ast, peephole=False)
+    assert "querySelectorAll('a').length" not in plain
+    assert "position() <=" not in plain
+
+
+def test_table_keyed_dispatch():
+    """Literal eq/starts match keys route each row to its candidate fields."""
+    module_ast = _parse_kdl(SCHEMAS_DIR / "07_table.kdl")
+    code = JS_CONVERTER.convert(module_ast)
+    assert (
+        'const TABLE_COVERAGE_ROUTES = new Map([["id", [0, 1, 3]], '
+        '["identifier", [0, 1, 3]], ["state", [1, 3, 4]], ["status", [1, 3, 4]]]);'
+    ) in code
+    assert 'const TABLE_COVERAGE_PREFIXES = new Map([["price", [2]]]);' in code
+    assert code.count("this._tableMatchKey(_row)") == 1
+    # fields reuse the key computed by the row loop
+    assert "_parse.call(this, _row, _key)" in code
+    assert "key ?? this._tableMatchKey(v)" in code
+
+
+def test_init_memoized_getter():
+    """@init values are getters computed on first use, not in the constructor."""
+    module_ast = _parse_kdl(SCHEMAS_DIR / "00_full.kdl")
+    code = JS_CONVERTER.convert(module_ast)
+    assert "  get _hrefs() {" in code
+    assert "this._hrefs = " not in code
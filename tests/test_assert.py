@@ -11,6 +11,7 @@ Covers:
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
@@ -235,9 +236,9 @@ class TestRuntimeExports:
         ns["std_assert"](True, "should not raise")
         # Smoke: std_re_search with no match raises SscRegexError.
         with pytest.raises(ns["SscRegexError"]):
-            ns["std_re_search"](r"(x)", "abc", "no match")
+            ns["std_re_search"](re.compile(r"(x)"), "abc", "no match")
         # Smoke: std_re_search with match returns capture group.
-        assert ns["std_re_search"](r"(\d+)", "abc123", "") == "123"
+        assert ns["std_re_search"](re.compile(r"(\d+)"), "abc123", "") == "123"
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,115 @@
+import json
+
+from typer.testing import CliRunner
+
+from ssc_codegen.bench import bench_struct
+from ssc_codegen.core import parse_module
+from ssc_codegen.main import app
+
+runner = CliRunner()
+
+SCHEMA = """
+struct Page {
+    title { css "h1"; text }
+    links { css-all "a"; attr "href" }
+}
+"""
+DOCUMENTS = [
+    '<h1>One</h1><a href="/a">a</a>',
+    '<h1>Two</h1><a href="/b">b</a><a href="/c">c</a>',
+]
+
+
+def _module():
+    module, errors = parse_module(SCHEMA)
+    assert not errors
+    return module
+
+
+def test_bench_struct_reports_every_lib() -> None:
+    result = bench_struct(
+        _module(), "Page", DOCUMENTS, ["bs4", "lxml"], iterations=2
+    )
+    assert [r.lib for r in result.results] == ["bs4", "lxml"]
+    for lib in result.results:
+        assert lib.error is None
+        assert lib.runs == 4
+        assert lib.construct_s > 0 and lib.parse_s > 0
+        assert lib.docs_per_s > 0
+        assert lib.peak_bytes > 0
+        fields = {f.name: f for f in lib.fields}
+        assert set(fields) == {"title", "links"}
+        # the per-field pass runs each document exactly once
+        assert fields["title"].calls == len(DOCUMENTS)
+
+
+def test_bench_struct_records_backend_errors() -> None:
+    result = bench_struct(
+        _module(), "Page", ["<p>no heading</p>"], ["lxml"], iterations=1
+    )
+    assert result.has_errors()
+    assert "lxml: ERROR" in result.format("text")
+    assert "error" in result.to_dict()["results"][0]
+
+
+def test_bench_cli_json(tmp_path) -> None:
+    (tmp_path / "page.kdl").write_text(SCHEMA, encoding="utf-8")
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    for i, html in enumerate(DOCUMENTS):
+        (pages / f"p{i}.html").write_text(html, encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            f"{tmp_path / 'page.kdl'}:Page",
+            "-i",
+            str(pages),
+            "-L",
+            "lxml,parsel",
+            "-n",
+            "1",
+            "--warmup",
+            "0",
+            "-f",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["struct"] == "Page"
+    assert [r["lib"] for r in report["results"]] == ["lxml", "parsel"]
+    assert report["results"][0]["documents"] == 2
+
+
+def test_bench_cli_rejects_unknown_lib(tmp_path) -> None:
+    (tmp_path / "page.kdl").write_text(SCHEMA, encoding="utf-8")
+    (tmp_path / "p.html").write_text(DOCUMENTS[0], encoding="utf-8")
+    result = runner.invoke(
+        app,
+        [
+            "bench",
+            f"{tmp_path / 'page.kdl'}:Page",
+            "-i",
+            str(tmp_path / "p.html"),
+            "-L",
+            "lxml,html5",
+        ],
+    )
+    assert result.exit_code == 1
+    assert "unknown library: html5" in result.output
+
+
+def test_bench_discover_reports_every_size() -> None:
+    from ssc_codegen.bench import bench_discover
+
+    result = bench_discover((500, 2_000))
+    assert [r.nodes for r in result.results] == [503, 2003]
+    for timing in result.results:
+        assert timing.parse_s > 0
+        assert timing.discover_s > 0
+        assert timing.us_per_node > 0
+    report = json.loads(result.format("json"))
+    assert [r["nodes"] for r in report["results"]] == [503, 2003]
+    assert "us/node" in result.format()
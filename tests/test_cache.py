@@ -0,0 +1,279 @@
+"""Tests for the ``ssc-gen generate`` and ``run`` caches."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from ssc_codegen import main as cli
+from ssc_codegen.cache import GenerateCache, ParserCache
+from ssc_codegen.core.module_handler import import_closure
+
+runner = CliRunner()
+
+SCHEMA = 'import "shared.kdl"\nstruct Page { title { css "h1"; text } }\n'
+SHARED = 'define TITLE="h1"\n'
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "page.kdl").write_text(SCHEMA, encoding="utf-8")
+    (tmp_path / "shared.kdl").write_text(SHARED, encoding="utf-8")
+    return tmp_path
+
+
+def _generate(project, *extra: str):
+    return runner.invoke(
+        cli.app,
+        [
+            "generate",
+            "python",
+            str(project / "page.kdl"),
+            "-o",
+            str(project / "out"),
+            "--cache-dir",
+            str(project / "cache"),
+            *extra,
+        ],
+    )
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("parse_module called on a cache hit")
+
+
+class TestImportClosure:
+    def test_transitive_and_deduplicated(self, tmp_path):
+        (tmp_path / "a.kdl").write_text(
+            'import "b.kdl"\nimport "c.kdl"\n', encoding="utf-8"
+        )
+        (tmp_path / "b.kdl").write_text('import "c.kdl"\n', encoding="utf-8")
+        (tmp_path / "c.kdl").write_text('import "a.kdl"\n', encoding="utf-8")
+        closure = import_closure(tmp_path / "a.kdl")
+        assert closure == [
+            (tmp_path / "b.kdl").resolve(),
+            (tmp_path / "c.kdl").resolve(),
+        ]
+
+    def test_missing_import_is_listed(self, tmp_path):
+        (tmp_path / "a.kdl").write_text('import "gone.kdl"\n', encoding="utf-8")
+        assert import_closure(tmp_path / "a.kdl") == [
+            (tmp_path / "gone.kdl").resolve()
+        ]
+
+
+class TestCacheKey:
+    def test_key_tracks_source_imports_and_options(self, project):
+        cache = GenerateCache(project / "cache")
+        schema = project / "page.kdl"
+        base = cache.key(schema, meta={"package": "out"})
+        assert base == cache.key(schema, meta={"package": "out"})
+        assert base != cache.key(schema, meta={"package": "other"})
+
+        (project / "shared.kdl").write_text(SHARED + "\n", encoding="utf-8")
+        after_import = cache.key(schema, meta={"package": "out"})
+        assert after_import != base
+
+        schema.write_text(SCHEMA + "\n", encoding="utf-8")
+        assert cache.key(schema, meta={"package": "out"}) != after_import
+
+    def test_key_tracks_generator_sources(self, project, monkeypatch):
+        from ssc_codegen import cache as cache_module
+
+        cache = GenerateCache(project / "cache")
+        schema = project / "page.kdl"
+        base = cache.key(schema)
+        monkeypatch.setattr(cache_module, "codegen_fingerprint", lambda: "x")
+        assert cache.key(schema) != base
+
+    def test_unreadable_schema_has_no_key(self, tmp_path):
+        cache = GenerateCache(tmp_path / "cache")
+        assert cache.key(tmp_path / "missing.kdl") is None
+
+
+class TestCacheStore:
+    def test_round_trip(self, tmp_path):
+        cache = GenerateCache(tmp_path / "cache")
+        assert cache.load("ab" * 32) is None
+        cache.store("ab" * 32, {"lint_failed": False, "source": "x = 1\n"})
+        assert GenerateCache(tmp_path / "cache").load("ab" * 32) == {
+            "lint_failed": False,
+            "source": "x = 1\n",
+        }
+        # Generated code is plain text next to a JSON manifest.
+        entry = next((tmp_path / "cache").rglob("*.json"))
+        assert entry.with_suffix(".txt").read_text() == "x = 1\n"
+        assert "x = 1" not in entry.read_text()
+
+    def test_memory_only_cache_writes_nothing(self, tmp_path):
+        cache = GenerateCache(tmp_path / "cache", persistent=False)
+        cache.store("ef" * 32, {"source": "code"})
+        assert cache.load("ef" * 32) == {"source": "code"}
+        assert not (tmp_path / "cache").exists()
+        assert cache.evict() == 0
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = GenerateCache(tmp_path / "cache")
+        cache.store("cd" * 32, {"source": "x"})
+        entry = next((tmp_path / "cache").rglob("*.json"))
+        entry.write_bytes(b"not json")
+        assert GenerateCache(tmp_path / "cache").load("cd" * 32) is None
+        assert not entry.exists()
+        assert not entry.with_suffix(".txt").exists()
+
+    def test_evict_by_age(self, tmp_path):
+        cache = GenerateCache(tmp_path / "cache", max_age=60)
+        cache.store("aa" * 32, {"n": 1})
+        cache.store("bb" * 32, {"n": 2})
+        old = time.time() - 120
+        entry = next((tmp_path / "cache").rglob("aa*.json"))
+        os.utime(entry, (old, old))
+        assert cache.evict() == 1
+        assert cache.load("aa" * 32) is None
+        assert cache.load("bb" * 32) == {"n": 2}
+
+    def test_evict_by_size_drops_least_recently_used(self, tmp_path):
+        cache = GenerateCache(tmp_path / "cache", max_bytes=0)
+        cache.store("aa" * 32, {"source": "x" * 100})
+        size = sum(
+            path.stat().st_size for path in (tmp_path / "cache").rglob("aa*.*")
+        )
+        cache.max_bytes = size
+        cache.store("bb" * 32, {"source": "x" * 100})
+        old = time.time() - 10
+        os.utime(next((tmp_path / "cache").rglob("aa*.json")), (old, old))
+        assert cache.evict() == 1
+        assert cache.load("aa" * 32) is None
+        assert cache.load("bb" * 32) == {"source": "x" * 100}
+
+    def test_default_root_is_per_user(self, monkeypatch, tmp_path):
+        from ssc_codegen.cache import default_cache_dir
+
+        monkeypatch.setattr("sys.platform", "linux")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "ssc-codegen"
+
+
+class TestGenerateWithCache:
+    def test_hit_skips_parsing_and_keeps_outputs(self, project, monkeypatch):
+        first = _generate(project, "-R")
+        assert first.exit_code == 0, first.output
+        out = project / "out" / "page.py"
+        runtime = project / "out" / "sscgen_runtime.py"
+        code, mtime = out.read_text(encoding="utf-8"), out.stat().st_mtime_ns
+
+        monkeypatch.setattr(cli, "parse_module", _fail_parse)
+        second = _generate(project, "-R")
+        assert second.exit_code == 0, second.output
+        assert second.output == first.output
+        assert out.read_text(encoding="utf-8") == code
+        assert out.stat().st_mtime_ns == mtime
+        assert runtime.is_file()
+
+    def test_import_change_invalidates(self, project, monkeypatch):
+        assert _generate(project).exit_code == 0
+        (project / "shared.kdl").write_text(
+            'define TITLE="h2"\n', encoding="utf-8"
+        )
+        monkeypatch.setattr(cli, "parse_module", _fail_parse)
+        result = _generate(project)
+        assert result.exit_code == 1
+        assert "cache hit" in result.output
+
+    def test_no_cache_always_recompiles(self, project, monkeypatch):
+        assert _generate(project).exit_code == 0
+        monkeypatch.setattr(cli, "parse_module", _fail_parse)
+        result = _generate(project, "--no-cache")
+        assert result.exit_code == 1
+        assert "cache hit" in result.output
+
+    def test_lint_errors_are_replayed_from_cache(self, project):
+        (project / "page.kdl").write_text("unknown-node\n", encoding="utf-8")
+        first = _generate(project)
+        second = _generate(project)
+        assert first.exit_code == second.exit_code == 1
+        assert "unknown-node" in first.output
+        assert second.output == first.output
+
+
+def _run(project, *extra: str):
+    return runner.invoke(
+        cli.app,
+        [
+            "run",
+            f"{project / 'page.kdl'}:Page",
+            "--cache-dir",
+            str(project / "cache"),
+            *extra,
+        ],
+    )
+
+
+class TestParserCache:
+    def test_store_compiles_bytecode_and_load_imports(self, tmp_path):
+        cache = ParserCache(tmp_path)
+        key = "cd" * 32
+        cache.store(key, "ANSWER = 42\n")
+        source = cache._entry(key)
+        assert source.suffix == ".py"
+        assert os.path.isfile(importlib.util.cache_from_source(str(source)))
+        assert ParserCache(tmp_path).load(key).ANSWER == 42
+
+    def test_evict_removes_bytecode(self, tmp_path):
+        cache = ParserCache(tmp_path, max_age=0)
+        key = "ef" * 32
+        cache.store(key, "ANSWER = 42\n")
+        pyc = importlib.util.cache_from_source(str(cache._entry(key)))
+        time.sleep(0.01)
+        assert cache.evict() == 1
+        assert not os.path.exists(pyc)
+
+
+class TestRunWithCache:
+    def test_hit_skips_parsing(self, project, monkeypatch):
+        page = project / "page.html"
+        page.write_text("<h1>Hello</h1>", encoding="utf-8")
+        first = _run(project, "-i", str(page))
+        assert first.exit_code == 0, first.output
+
+        monkeypatch.setattr(cli, "parse_module", _fail_parse)
+        second = _run(project, "-i", str(page))
+        assert second.exit_code == 0, second.output
+        assert json.loads(second.output) == {"title": "Hello"}
+
+    def test_unknown_struct_is_reported_after_hit(self, project):
+        page = project / "page.html"
+        page.write_text("<h1>Hello</h1>", encoding="utf-8")
+        assert _run(project, "-i", str(page)).exit_code == 0
+        result = runner.invoke(
+            cli.app,
+            [
+                "run",
+                f"{project / 'page.kdl'}:Missing",
+                "-i",
+                str(page),
+                "--cache-dir",
+                str(project / "cache"),
+            ],
+        )
+        assert result.exit_code == 1
+        assert "Available: Page" in result.output
+
+    def test_html_glob_emits_json_lines(self, project):
+        pages = project / "pages"
+        (pages / "sub").mkdir(parents=True)
+        (pages / "a.html").write_text("<h1>A</h1>", encoding="utf-8")
+        (pages / "sub" / "b.html").write_text("<h1>B</h1>", encoding="utf-8")
+        result = _run(project, "--html-glob", str(pages / "**" / "*.html"))
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["result"] for r in records] == [
+            {"title": "A"},
+            {"title": "B"},
+        ]
+        assert records[1]["file"].endswith("b.html")
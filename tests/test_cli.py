@@ -91,6 +91,37 @@ def test_generate_go_rejects_invalid_package_before_writing(tmp_path) -> None:
     assert not output.exists()
 
 
+def test_generate_jobs_matches_serial_output(tmp_path) -> None:
+    schemas = tmp_path / "schemas"
+    schemas.mkdir()
+    for name in ("alpha", "beta", "gamma"):
+        (schemas / f"{name}.kdl").write_text(
+            f'struct {name.title()} {{ {name} {{ css "p"; text; re #"(\\d+)"# }} }}\n',
+            encoding="utf-8",
+        )
+    (schemas / "broken.kdl").write_text("unknown-node\n", encoding="utf-8")
+
+    outputs = {}
+    for target in ("python", "go"):
+        for jobs in ("1", "3"):
+            output = tmp_path / f"{target}-{jobs}"
+            args = ["generate", target, str(schemas), "-o", str(output)]
+            if target == "python":
+                args.append("-R")
+            result = runner.invoke(app, [*args, "-j", jobs])
+            assert result.exit_code == 1
+            assert "broken.kdl" in result.output
+            outputs[target, jobs] = (
+                result.output.replace(str(output), "<out>"),
+                {p.name: p.read_bytes() for p in sorted(output.iterdir())},
+            )
+        assert outputs[target, "1"] == outputs[target, "3"]
+    assert "sscgen_runtime.go" in outputs["go", "3"][1]
+    assert "sscgen_runtime.py" in outputs["python", "3"][1]
+    assert "alpha.py" in outputs["python", "3"][1]
+    assert "gamma.go" in outputs["go", "3"][1]
+
+
 def test_check_json_is_single_document_for_multiple_files(tmp_path) -> None:
     files = []
     for name in ("one", "two"):
@@ -127,3 +158,271 @@ def test_health_stops_on_schema_diagnostics(tmp_path) -> None:
 
     assert result.exit_code == 1
     assert "Unknown node: unknown" in result.output
+
+
+def _batch_project(tmp_path):
+    (tmp_path / "page.kdl").write_text(
+        'struct Page { title { css "h1"; text } }\n', encoding="utf-8"
+    )
+    pages = tmp_path / "pages"
+    (pages / "sub").mkdir(parents=True)
+    for i in range(12):
+        (pages / f"p{i:02}.html").write_text(f"<h1>T{i}</h1>", encoding="utf-8")
+    (pages / "sub" / "broken.htm").write_text("<p>", encoding="utf-8")
+    (pages / "notes.txt").write_text("<h1>skip</h1>", encoding="utf-8")
+    return tmp_path
+
+
+def _run_batch(project, *extra: str, **kwargs):
+    return runner.invoke(
+        app,
+        [
+            "run",
+            f"{project / 'page.kdl'}:Page",
+            "--cache-dir",
+            str(project / "cache"),
+            *extra,
+        ],
+        **kwargs,
+    )
+
+
+def test_run_batch_directory_jobs_matches_serial(tmp_path) -> None:
+    project = _batch_project(tmp_path)
+    outputs = {}
+    for jobs in ("1", "3"):
+        result = _run_batch(project, "-i", str(project / "pages"), "-j", jobs)
+        assert result.exit_code == 1
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert all(r["elapsed_ms"] >= 0 for r in records)
+        outputs[jobs] = [
+            (r["file"], r.get("result"), "error" in r) for r in records
+        ]
+    assert outputs["1"] == outputs["3"]
+    assert len(outputs["1"]) == 13
+    assert outputs["1"][0][1] == {"title": "T0"}
+    assert outputs["1"][-1][0].endswith("broken.htm")
+    assert outputs["1"][-1][2]
+
+
+def test_run_batch_unordered_files_from_stdin(tmp_path) -> None:
+    project = _batch_project(tmp_path)
+    listing = "\n".join(
+        str(project / "pages" / f"p{i:02}.html") for i in range(12)
+    )
+    result = _run_batch(
+        project,
+        "--files-from",
+        "-",
+        "-j",
+        "2",
+        "--unordered",
+        input=listing + "\n\n",
+    )
+    assert result.exit_code == 0, result.output
+    titles = sorted(
+        json.loads(line)["result"]["title"]
+        for line in result.output.splitlines()
+    )
+    assert titles == sorted(f"T{i}" for i in range(12))
+
+
+def test_run_batch_sources_are_exclusive(tmp_path) -> None:
+    project = _batch_project(tmp_path)
+    result = _run_batch(
+        project, "-i", str(project / "pages"), "--html-glob", "*.html"
+    )
+    assert result.exit_code == 1
+    assert "mutually exclusive" in result.output
+
+
+def test_generate_go_bench_writes_benchmark_file(tmp_path) -> None:
+    schema = tmp_path / "page.kdl"
+    schema.write_text(
+        'struct Page { title { css "h1"; text } }\n', encoding="utf-8"
+    )
+    output = tmp_path / "out"
+
+    result = runner.invoke(
+        app, ["generate", "go", str(schema), "-o", str(output), "--bench"]
+    )
+
+    assert result.exit_code == 0, result.output
+    bench = (output / "sscgen_bench_test.go").read_text(encoding="utf-8")
+    assert "func BenchmarkPageParse(b *testing.B) {" in bench
+    runtime = (output / "sscgen_runtime.go").read_text(encoding="utf-8")
+    assert "stdCompileCss(" in runtime
+
+
+def test_generate_no_cse_keeps_repeated_prefixes(tmp_path) -> None:
+    schema = tmp_path / "page.kdl"
+    schema.write_text(
+        'struct Page {\n  a { css "h1"; text }\n  b { css "h1"; raw }\n}\n',
+        encoding="utf-8",
+    )
+
+    outputs = {}
+    for flags in ([], ["--no-cse"]):
+        output = tmp_path / ("plain" if flags else "cse")
+        result = runner.invoke(
+            app,
+            ["generate", "python", str(schema), "-o", str(output), "--no-cache"]
+            + flags,
+        )
+        assert result.exit_code == 0, result.output
+        outputs[bool(flags)] = (output / "page.py").read_text(encoding="utf-8")
+
+    assert outputs[False].count("select_one('h1')") == 1
+    assert outputs[True].count("select_one('h1')") == 2
+
+
+def test_check_json_reports_peephole_rewrites(tmp_path) -> None:
+    schema = tmp_path / "page.kdl"
+    schema.write_text(
+        "struct Page {\n"
+        '  a { css-all "h1"; first; text; normalize-space; trim }\n'
+        "}\n",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(app, ["check", str(schema), "-f", "json"])
+
+    assert result.exit_code == 0, result.output
+    entries = json.loads(result.stdout)
+    assert [e["code"] for e in entries] == ["O101", "O102"]
+    assert {e["severity"] for e in entries} == {"info"}
+    assert entries[0]["notes"] == ["scope: Page.a"]
+    assert entries[0]["span"]["start"]["line"] == 2
+
+    text = runner.invoke(app, ["check", str(schema)])
+    assert "O101" not in text.output
+
+
+def test_scout_and_health_accept_engine(tmp_path) -> None:
+    schema = tmp_path / "page.kdl"
+    schema.write_text(
+        "struct Page {\n"
+        '    title { css "h1"; text }\n'
+        '    link { xpath "//a"; attr "href" }\n'
+        "}\n",
+        encoding="utf-8",
+    )
+    html = tmp_path / "page.html"
+    html.write_text(
+        "<h1>T</h1><ul><li><a href='/1'>1</a></li><li><a href='/2'>2</a></li>"
+        "<li><a href='/3'>3</a></li></ul>",
+        encoding="utf-8",
+    )
+    for engine in ("bs4", "lxml", "slax"):
+        engine_args = ["-i", str(html), "--engine", engine]
+        health = runner.invoke(
+            app, ["health", f"{schema}:Page", "-f", "json", *engine_args]
+        )
+        assert health.exit_code == 0, health.output
+        checks = json.loads(health.output)["checks"]
+        assert [c["matches"] for c in checks] == [1, 3]
+
+        scout = runner.invoke(
+            app, ["scout", "--tag", "a", "--count", *engine_args]
+        )
+        assert scout.exit_code == 0, scout.output
+        assert scout.output.strip() == "3"
+
+        discover = runner.invoke(
+            app, ["scout", "--discover", "-f", "json", *engine_args]
+        )
+        assert discover.exit_code == 0, discover.output
+        containers = json.loads(discover.output)["repeat_containers"]
+        assert containers[0]["count"] == 3
+
+    unknown = runner.invoke(
+        app, ["scout", "--discover", "-i", str(html), "--engine", "nope"]
+    )
+    assert unknown.exit_code == 2
+
+
+def test_scout_corpus_discover(tmp_path) -> None:
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    for i in range(3):
+        (pages / f"p{i}.html").write_text(
+            "<ul>" + "<li><a href='/x'>x</a></li>" * (3 + i) + "</ul>",
+            encoding="utf-8",
+        )
+
+    result = runner.invoke(
+        app,
+        ["scout", "--discover", "-i", str(pages), "-j", "2", "-f", "json"],
+    )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert payload["pages"] == 3
+    top = payload["containers"][0]
+    assert top["item_tag"] == "li"
+    assert (top["pages"], top["count"]["min"], top["count"]["max"]) == (3, 3, 5)
+
+    glob_result = runner.invoke(
+        app,
+        ["scout", "--discover", "--html-glob", str(pages / "*.html")],
+    )
+    assert glob_result.exit_code == 0
+    assert "pages=3/3" in glob_result.output
+
+    no_discover = runner.invoke(app, ["scout", "-i", str(pages), "--tag", "a"])
+    assert no_discover.exit_code == 2
+    assert "needs --discover" in no_discover.output
+
+
+def test_scout_stream(tmp_path) -> None:
+    html = tmp_path / "dump.html"
+    html.write_text(
+        "<table>"
+        + "".join(
+            f"<tr class='row'><td>{i}</td><td>price {i}</td></tr>"
+            for i in range(20)
+        )
+        + "</table>",
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "scout",
+            "-i",
+            str(html),
+            "--stream",
+            "--text",
+            "price",
+            "--limit",
+            "2",
+            "-f",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.output)
+    assert (payload["matched"], payload["truncated"]) == (20, True)
+    assert [r["text"] for r in payload["results"]] == ["price 0", "price 1"]
+
+    count = runner.invoke(
+        app,
+        ["scout", "--stream", "--tag", "td", "--count"],
+        input=html.read_text(),
+    )
+    assert count.output.strip() == "40"
+
+    discover = runner.invoke(
+        app, ["scout", "-i", str(html), "--stream", "--discover", "-f", "json"]
+    )
+    assert discover.exit_code == 0, discover.output
+    assert json.loads(discover.output)["class_stats"][0] == {
+        "class": "row",
+        "count": 20,
+    }
+
+    for extra in (["--css", "td"], ["--tag", "td", "--up", "1"]):
+        rejected = runner.invoke(
+            app, ["scout", "-i", str(html), "--stream", *extra]
+        )
+        assert rejected.exit_code == 2
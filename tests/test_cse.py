@@ -0,0 +1,223 @@
+"""Tests for the shared-prefix (CSE) optimization pass."""
+
+from __future__ import annotations
+
+import pytest
+from kdlquery import Severity
+
+from ssc_codegen.ast import (
+    CssSelect,
+    Fallback,
+    Field,
+    InitField,
+    Self,
+    Struct,
+)
+from ssc_codegen.core import parse_module
+from ssc_codegen.optimize import optimize_module
+
+PRODUCT = """\
+struct Product {
+    old-price { css ".price-box"; css ".old"; text; trim }
+    new-price { css ".price-box"; css ".new"; text; trim }
+    title { css "h1"; text; trim; lower }
+    slug  { css "h1"; text; trim; upper }
+    tags  { css-all ".tag"; text }
+    note  { css ".price-box"; attr "data-note"; fallback #null }
+    code  { css "h1"; text; re #"(\\d+)"# }
+    sku   { css "h1"; text; re #"(\\d+)"# }
+}
+"""
+
+HTML = """\
+<html><body>
+<h1>Widget 42</h1>
+<div class="price-box" data-note="sale">
+  <span class="old"> 10 </span><span class="new"> 8 </span>
+</div>
+<a class="tag">a</a><a class="tag">b</a>
+</body></html>
+"""
+
+REMOVE = """\
+struct Page {
+    first { css ".ad"; text }
+    clean { css-remove ".ad"; raw }
+    second { css ".ad"; text; fallback "gone" }
+}
+"""
+
+_LIBS = ["bs4", "lxml", "parsel", "slax"]
+
+
+def _parse(src: str):
+    module, diagnostics = parse_module(src)
+    errors = [d for d in diagnostics if d.severity == Severity.ERROR]
+    assert not errors, errors
+    return module
+
+
+def _struct(module, name: str = "Product") -> Struct:
+    return next(
+        n for n in module.body if isinstance(n, Struct) and n.name == name
+    )
+
+
+def _fields(struct: Struct) -> dict[str, Field]:
+    return {n.name: n for n in struct.body if isinstance(n, Field)}
+
+
+def _inits(struct: Struct) -> dict[str, InitField]:
+    return {n.name: n for n in struct.body if isinstance(n, InitField)}
+
+
+class TestPass:
+    def test_shared_prefixes_hoisted(self):
+        struct = _struct(optimize_module(_parse(PRODUCT)))
+        inits = _inits(struct)
+        # css .price-box / css h1; text / (self) trim
+        assert set(inits) == {"cse_0", "cse_1", "cse_2"}
+        assert all(init.lazy for init in inits.values())
+        fields = _fields(struct)
+        first = fields["old-price"].body[0]
+        assert isinstance(first, Self) and first.parent is fields["old-price"]
+        assert fields["new-price"].body[0].name == first.name
+        assert fields["code"].body[0].name == fields["sku"].body[0].name
+        title = inits[fields["title"].body[0].name]
+        assert [type(op).__name__ for op in title.body] == [
+            "Self",
+            "Trim",
+            "Return",
+        ]
+
+    def test_fallback_body_rewritten(self):
+        fields = _fields(_struct(optimize_module(_parse(PRODUCT))))
+        fallback = fields["note"].body[0]
+        assert isinstance(fallback, Fallback)
+        assert isinstance(fallback.body[0], Self)
+        assert fallback.body[0].parent is fields["note"]
+
+    def test_field_path_dependent_ops_stay(self):
+        # re embeds "Struct.field" in its error message
+        fields = _fields(_struct(optimize_module(_parse(PRODUCT))))
+        code_ops = [type(op).__name__ for op in fields["code"].body]
+        assert code_ops[:2] == ["Self", "Re"]
+
+    def test_input_not_mutated(self):
+        module = _parse(PRODUCT)
+        optimized = optimize_module(module)
+        assert optimized is not module
+        assert not _inits(_struct(module))
+        assert isinstance(_fields(_struct(module))["title"].body[0], CssSelect)
+
+    def test_disabled_and_unchanged_return_input(self):
+        module = _parse(PRODUCT)
+        assert optimize_module(module, cse=False) is module
+        single = _parse('struct S {\n  a { css "a"; text }\n}\n')
+        assert optimize_module(single) is single
+
+    def test_list_struct_untouched(self):
+        module = _parse(
+            "(list)struct S {\n"
+            '  @split-doc { css-all "li" }\n'
+            '  a { css "b"; text }\n'
+            '  b { css "b"; raw }\n'
+            "}\n"
+        )
+        assert optimize_module(module) is module
+
+    def test_struct_with_remove_untouched(self):
+        # `second` must select after `clean` removed the nodes
+        module = _parse(REMOVE)
+        assert optimize_module(module) is module
+
+    def test_nested_sharing(self):
+        struct = _struct(
+            optimize_module(
+                _parse(
+                    "struct S {\n"
+                    '  a { css ".box"; css ".p"; text }\n'
+                    '  b { css ".box"; css ".p"; raw }\n'
+                    '  c { css ".box"; css ".q"; text }\n'
+                    "}\n"
+                ),
+            ),
+            "S",
+        )
+        inits = _inits(struct)
+        assert len(inits) == 2
+        inner = next(i for i in inits.values() if isinstance(i.body[0], Self))
+        assert [type(op).__name__ for op in inner.body] == [
+            "Self",
+            "CssSelect",
+            "Return",
+        ]
+
+    def test_name_avoids_existing_fields(self):
+        struct = _struct(
+            optimize_module(
+                _parse(
+                    "struct S {\n"
+                    '  cse_0 { css "a"; text }\n'
+                    '  b { css "a"; raw }\n'
+                    "}\n"
+                )
+            ),
+            "S",
+        )
+        assert set(_inits(struct)) == {"cse_1"}
+
+
+class TestPythonOutput:
+    @pytest.mark.parametrize("lib", _LIBS)
+    def test_same_result_as_unoptimized(self, lib):
+        from ssc_codegen.targets.resolver import resolve
+        from ssc_codegen.targets.spec import TargetSpec
+
+        module = _parse(PRODUCT)
+        converter = resolve(
+            TargetSpec(lang="python", lib=lib)
+        ).create_converter()
+        results = []
+        for cse in (True, False):
+            namespace: dict = {}
+            exec(converter.convert(module, cse=cse), namespace)  # noqa: S102
+            results.append(namespace["Product"](HTML).parse())
+        assert results[0] == results[1]
+        assert results[0]["title"] == "widget 42"
+
+    @pytest.mark.parametrize("lib", _LIBS)
+    def test_remove_runs_before_later_selection(self, lib):
+        from ssc_codegen.targets.resolver import resolve
+        from ssc_codegen.targets.spec import TargetSpec
+
+        converter = resolve(
+            TargetSpec(lang="python", lib=lib)
+        ).create_converter()
+        namespace: dict = {}
+        exec(converter.convert(_parse(REMOVE)), namespace)  # noqa: S102
+        result = namespace["Page"](
+            '<html><body><p class="ad">x</p></body></html>'
+        ).parse()
+        assert result["first"] == "x"
+        assert result["second"] == "gone"
+
+    def test_prefix_computed_once(self):
+        from ssc_codegen.targets.python import PY_BS4_CONVERTER
+
+        code = PY_BS4_CONVERTER.convert(_parse(PRODUCT))
+        assert code.count("select_one('.price-box')") == 1
+        assert "@cached_property" in code
+        plain = PY_BS4_CONVERTER.convert(_parse(PRODUCT), cse=False)
+        assert plain.count("select_one('.price-box')") == 3
+        assert "cached_property" not in plain
+
+    def test_failing_prefix_uses_field_fallback(self):
+        from ssc_codegen.targets.python import PY_BS4_CONVERTER
+
+        namespace: dict = {}
+        exec(PY_BS4_CONVERTER.convert(_parse(PRODUCT)), namespace)  # noqa: S102
+        doc = namespace["Product"]("<html><h1>x 1</h1></html>")
+        assert doc._parse_note(doc._doc) is None
+        with pytest.raises(AttributeError):
+            doc._parse_old_price(doc._doc)
@@ -621,6 +621,44 @@ def test_line_field_via_lxml(html: str) -> None:
     assert lines == [31, 58]
 
 
+def test_line_field_reuses_initial_parse(
+    html: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from lxml import etree
+
+    def _reparse(*args: object, **kwargs: object) -> None:
+        raise AssertionError("line lookup must not re-parse the document")
+
+    monkeypatch.setattr(etree, "HTML", _reparse)
+    result = run_scout(
+        "<ul>\n" + "".join(f"<li>{i}</li>\n" for i in range(500)) + "</ul>",
+        compile_filters(
+            text=None,
+            attrs=[],
+            tag="li",
+            css=None,
+            ignore_case=False,
+            fixed=False,
+        ),
+        NavSpec(),
+        ["line"],
+        limit=0,
+    )
+    assert [r["line"] for r in result.results] == list(range(2, 502))
+
+
+def test_parse_html_matches_bs4_lxml_tree(html: str) -> None:
+    from bs4 import BeautifulSoup
+
+    from ssc_codegen.explore import parse_html
+
+    ours = parse_html(html)
+    stock = BeautifulSoup(html, "lxml")
+    # Whitespace after </html> is the only thing lxml's tree drops.
+    assert str(ours) == str(stock).rstrip()
+    assert all(tag.sourceline for tag in ours.find_all(True))
+
+
 def test_snippet_truncates_text(html: str) -> None:
     # Long text node — script contains JSON. Use the script tag.
     result = run_scout(
@@ -1214,6 +1252,70 @@ def test_discover_signature_groups_by_class_set_not_list() -> None:
     assert matched[0]["count"] == 3
 
 
+def test_dom_index_matches_per_tag_helpers(html: str) -> None:
+    from ssc_codegen.engines import get_engine
+    from ssc_codegen.explore import _DomIndex, parse_html
+
+    soup = parse_html(html)
+    index = _DomIndex(get_engine("bs4"), soup)
+    tags = soup.find_all(True)
+    assert index.nodes == tags
+    for pos, tag in enumerate(tags):
+        assert index.path(pos) == compute_css_path(tag)
+        assert index.signature[pos] == (
+            tag.name,
+            frozenset(tag.get("class", [])),
+        )
+        assert [index.nodes[i] for i in index.descendants(pos)] == (
+            tag.find_all(True)
+        )
+        assert [index.nodes[i] for i in index.children(pos)] == (
+            tag.find_all(True, recursive=False)
+        )
+        parent = index.parent[pos]
+        assert (index.nodes[parent] if parent >= 0 else soup) is tag.parent
+        expected_depth = 1 if parent < 0 else index.depth[parent] + 1
+        assert index.depth[pos] == expected_depth
+
+
+def test_dom_index_sibling_positions() -> None:
+    from ssc_codegen.engines import get_engine
+    from ssc_codegen.explore import _DomIndex, parse_html
+
+    index = _DomIndex(
+        get_engine("bs4"),
+        parse_html(
+            "<html><body><p>a</p><div class='x'>b</div><p class='y'>c</p>"
+            "<span>d</span></body></html>"
+        ),
+    )
+    (body,) = index.named("body")
+    assert [index.path(pos) for pos in index.descendants(body)] == [
+        "html > body > p:nth-of-type(1)",
+        "html > body > div.x",
+        "html > body > p.y:nth-of-type(2)",
+        "html > body > span",
+    ]
+
+
+def test_discover_synthetic_listing() -> None:
+    from ssc_codegen.bench import synthetic_listing
+
+    result = run_discover(synthetic_listing(3_000))
+    top = result.repeat_containers[0]
+    assert top["item_selector"] == "section.page-0 > div"
+    assert top["item_classes"] == ["card"]
+    assert top["count"] == 100
+    assert top["depth"] == 5
+    assert [d["tag"] for d in top["common_descendants"]] == [
+        "a",
+        "li",
+        "p",
+        "span",
+        "ul",
+    ]
+
+
 # ─────────────────────────── json_signals ──────────────────────────
 
 
@@ -1729,3 +1831,239 @@ def test_discover_to_text_includes_new_sections() -> None:
     assert "sample_normalized: true" in text
     # item_selector line is present on every container.
     assert "item_selector:" in text
+
+
+# ─────────────────────────── engines ───────────────────────────────
+
+
+@pytest.mark.parametrize("engine", ["lxml", "slax"])
+def test_run_scout_engines_agree_with_bs4(html: str, engine: str) -> None:
+    pytest.importorskip("selectolax" if engine == "slax" else "lxml")
+    filters = compile_filters(
+        text=None,
+        attrs=["href"],
+        tag="a",
+        css=None,
+        ignore_case=False,
+        fixed=False,
+    )
+    fields = ["tag", "attr.href", "classes", "path"]
+    expected = run_scout(html, filters, NavSpec(up=1), fields)
+    got = run_scout(html, filters, NavSpec(up=1), fields, engine=engine)
+    assert got.matched == expected.matched > 0
+    assert got.results == expected.results
+
+
+def test_lxml_engine_paths_and_lines_match_bs4(html: str) -> None:
+    from ssc_codegen.engines import get_engine
+    from ssc_codegen.explore import parse_html
+
+    bs4_engine, lxml_engine = get_engine("bs4"), get_engine("lxml")
+    tags = bs4_engine.elements(parse_html(html))
+    nodes = lxml_engine.elements(lxml_engine.parse(html))
+    assert [lxml_engine.tag_name(n) for n in nodes] == [t.name for t in tags]
+    for tag, node in zip(tags, nodes):
+        assert compute_css_path(node, lxml_engine) == compute_css_path(tag)
+        assert lxml_engine.line(node) == bs4_engine.line(tag)
+        assert lxml_engine.text(node, strip=True) == tag.get_text(strip=True)
+
+
+def test_discover_lxml_engine_matches_bs4(html: str) -> None:
+    assert run_discover(html, engine="lxml") == run_discover(html)
+
+
+def test_discover_slax_engine_uses_html5_tree(html: str) -> None:
+    pytest.importorskip("selectolax")
+    result = run_discover(html, engine="slax")
+    # lexbor inserts <tbody> into bare tables, like browsers do.
+    assert any(
+        c["selector"].endswith(" > tbody > tr") for c in result.table_candidates
+    )
+
+
+def test_unknown_engine_is_rejected(html: str) -> None:
+    from ssc_codegen.engines import EngineError
+
+    with pytest.raises(EngineError, match="unknown engine"):
+        run_discover(html, engine="html5lib")
+
+
+# ─────────────────────────── corpus discover ───────────────────────
+
+
+def _write_corpus(tmp_path: Path) -> list[str]:
+    paths = []
+    for page, cards in enumerate((3, 5, 8, 8)):
+        items = "".join(
+            f"<div class='card'><h2>T{i}</h2><span class='price'>{i}</span>"
+            "</div>"
+            for i in range(cards)
+        )
+        path = tmp_path / f"p{page}.html"
+        path.write_text(
+            f"<html><body><main id='list'>{items}</main>"
+            "<ul class='nav'><li>a</li><li>b</li><li>c</li></ul>"
+            "</body></html>",
+            encoding="utf-8",
+        )
+        paths.append(str(path))
+    return paths
+
+
+def test_corpus_discover_merges_pages(tmp_path: Path) -> None:
+    from ssc_codegen.explore import run_corpus_discover
+
+    paths = _write_corpus(tmp_path)
+    broken = tmp_path / "broken.html"
+    broken.write_bytes(b"\xff\xfe<p>")
+    result = run_corpus_discover([*paths, str(broken)])
+    assert result.pages == 4
+    assert [f["file"] for f in result.failed] == [str(broken)]
+
+    nav, cards = result.containers[:2]
+    # Same count everywhere ranks first.
+    assert nav["item_selector"] == "ul.nav > li"
+    assert nav["count"] == {
+        "min": 3,
+        "max": 3,
+        "mean": 3.0,
+        "stdev": 0.0,
+        "cv": 0.0,
+    }
+    # `.card` is a rare anchor class only on small pages; both selectors
+    # are grouped as one container.
+    assert cards["pages"] == 4
+    assert cards["item_selectors"] == [
+        {"selector": "#list > div", "pages": 2},
+        {"selector": "#list > div.card", "pages": 2},
+    ]
+    assert cards["count"]["min"] == 3 and cards["count"]["max"] == 8
+    assert [(d["tag"], d["pages"]) for d in cards["common_descendants"]] == [
+        ("h2", 4),
+        ("span", 4),
+    ]
+
+
+def test_corpus_discover_jobs_match_serial(tmp_path: Path) -> None:
+    from ssc_codegen.explore import run_corpus_discover
+
+    paths = _write_corpus(tmp_path)
+    serial = run_corpus_discover(paths)
+    assert run_corpus_discover(paths, jobs=2) == serial
+    assert "also: #list > div.card" in serial.to_text()
+
+
+# ─────────────────────────── stream mode ───────────────────────────
+
+
+def _chunks(html: str, size: int) -> list[str]:
+    return [html[i : i + size] for i in range(0, len(html), size)]
+
+
+@pytest.mark.parametrize(
+    ("flags", "invert", "limit", "offset"),
+    [
+        ({"tag": "a", "attrs": ["href"]}, False, 50, 0),
+        ({"text": r"\d"}, False, 3, 2),
+        ({"attrs": ["class"]}, True, 5, 0),
+        ({"tag": "td"}, False, 0, 0),
+    ],
+)
+def test_scout_stream_matches_lxml_engine(
+    html: str, flags: dict, invert: bool, limit: int, offset: int
+) -> None:
+    from ssc_codegen.explore import run_scout_stream
+
+    filters = compile_filters(
+        text=flags.get("text"),
+        attrs=flags.get("attrs", []),
+        tag=flags.get("tag"),
+        css=None,
+        ignore_case=False,
+        fixed=False,
+    )
+    fields = ["index", "path", "tag", "text", "attrs", "line"]
+    expected = run_scout(
+        html,
+        filters,
+        NavSpec(),
+        fields,
+        invert=invert,
+        limit=limit,
+        offset=offset,
+        snippet=40,
+        engine="lxml",
+    )
+    got = run_scout_stream(
+        _chunks(html, 97),
+        filters,
+        fields,
+        invert=invert,
+        limit=limit,
+        offset=offset,
+        snippet=40,
+    )
+    assert got == expected
+
+
+def test_scout_stream_text_skips_script_contents() -> None:
+    from ssc_codegen.explore import run_scout_stream
+
+    html = (
+        "<div><p>a<script>var x = 'a';</script>b<!-- c -->d</p>"
+        "<style>p {}</style>e</div>"
+    )
+    # `--text` checks own text: only "e" belongs to the div itself.
+    filters = compile_filters(
+        text="a|e",
+        attrs=[],
+        tag=None,
+        css=None,
+        ignore_case=False,
+        fixed=False,
+    )
+    fields = ["tag", "text"]
+    got = run_scout_stream(_chunks(html, 5), filters, fields)
+    assert got.results == [
+        {"tag": "div", "text": "abde"},
+        {"tag": "p", "text": "abd"},
+        {"tag": "script", "text": "var x = 'a';"},
+    ]
+    assert got == run_scout(html, filters, NavSpec(), fields, engine="lxml")
+
+
+def test_scout_stream_rejects_whole_tree_features(html: str) -> None:
+    from ssc_codegen.explore import run_scout_stream
+
+    scoped = compile_filters(
+        text=None,
+        attrs=[],
+        tag=None,
+        css="a",
+        ignore_case=False,
+        fixed=False,
+    )
+    with pytest.raises(FilterError, match="--css"):
+        run_scout_stream([html], scoped, ["path"])
+    plain = compile_filters(
+        text=None,
+        attrs=[],
+        tag="a",
+        css=None,
+        ignore_case=False,
+        fixed=False,
+    )
+    with pytest.raises(FilterError, match="html field"):
+        run_scout_stream([html], plain, ["path", "html"])
+
+
+def test_discover_stream_stats_match_lxml_engine(html: str) -> None:
+    from ssc_codegen.explore import run_discover_stream
+
+    expected = run_discover(html, engine="lxml")
+    got = run_discover_stream(_chunks(html, 64))
+    assert got.tag_stats == expected.tag_stats
+    assert got.class_stats == expected.class_stats
+    assert got.id_stats == expected.id_stats
+    assert got.data_attrs == expected.data_attrs
+    assert got.repeat_containers == []
@@ -0,0 +1,123 @@
+"""Tests for fusion of element-wise list comprehensions (Python backend)."""
+
+from __future__ import annotations
+
+import pytest
+from kdlquery import Severity
+
+from ssc_codegen.core import parse_module
+from ssc_codegen.targets.python.fusion import fuse_comprehensions
+
+SCHEMA = """\
+struct Page {
+    prices { css-all ".p"; text; trim; re #"(\\d+)"#; to-float }
+    names  { css-all ".n"; text; normalize-space; upper; unique }
+    hrefs  { css-all "a"; attr "href"; trim; lower }
+    count  { css-all ".p"; text; trim; len }
+}
+"""
+
+HTML = """\
+<html><body>
+<span class="p"> $1 </span><span class="p">2 usd</span>
+<b class="n">  a   b </b><b class="n">c</b><b class="n">a b</b>
+<a href=" /X ">x</a><a href="/y">y</a>
+</body></html>
+"""
+
+
+def _method(*body: str) -> list[str]:
+    return ["    def _parse_x(self, v):", *(f"        {b}" for b in body)]
+
+
+class TestFuseLines:
+    def test_chain_inlined(self):
+        lines = _method(
+            "v1 = [i.text for i in v]",
+            "v2 = [i.strip() for i in v1]",
+            "v3 = [float(i) for i in v2]",
+            "return v3",
+        )
+        assert fuse_comprehensions(lines) == _method(
+            "v3 = [float(i.text.strip()) for i in v]",
+            "return v3",
+        )
+
+    def test_non_atom_inner_parenthesized(self):
+        lines = _method(
+            "v1 = [' '.join(i.split()) if i else '' for i in v]",
+            "v2 = [i.upper() for i in v1]",
+        )
+        assert fuse_comprehensions(lines)[1] == (
+            "        v2 = [(' '.join(i.split()) if i else '').upper() for i in v]"
+        )
+
+    def test_multiple_reads_rebind(self):
+        lines = _method(
+            "v1 = [i.text for i in v]",
+            "v2 = [' '.join(i.split()) if i else '' for i in v1]",
+        )
+        assert fuse_comprehensions(lines)[1] == (
+            "        v2 = [' '.join(i.split()) if i else '' "
+            "for i in v for i in [i.text]]"
+        )
+
+    @pytest.mark.parametrize(
+        "barrier",
+        [
+            "v2 = list(dict.fromkeys(v1))",
+            "v2 = [i for i in v1 if i]",
+            "v2 = [i.get(k) for i in v1 for k in ('a', 'b')]",
+        ],
+    )
+    def test_barriers(self, barrier):
+        lines = _method(
+            "v1 = [i.text for i in v]",
+            barrier,
+            "v3 = [i.strip() for i in v2]",
+        )
+        assert fuse_comprehensions(lines) == lines
+
+    def test_intermediate_read_later_not_fused(self):
+        lines = _method(
+            "v1 = [i.text for i in v]",
+            "v2 = [i.strip() for i in v1]",
+            "return v1 + v2",
+        )
+        assert fuse_comprehensions(lines) == lines
+
+    def test_unicode_literals(self):
+        lines = _method(
+            "v1 = [i.replace('é', 'ü') for i in v]",
+            "v2 = [i.removeprefix('→') for i in v1]",
+        )
+        assert fuse_comprehensions(lines)[1] == (
+            "        v2 = [i.replace('é', 'ü').removeprefix('→') for i in v]"
+        )
+
+
+@pytest.mark.parametrize("lib", ["bs4", "lxml", "parsel", "slax"])
+def test_same_result_as_unfused(lib):
+    from ssc_codegen.targets.resolver import resolve
+    from ssc_codegen.targets.spec import TargetSpec
+
+    module, diagnostics = parse_module(SCHEMA)
+    assert not [d for d in diagnostics if d.severity == Severity.ERROR]
+    converter = resolve(TargetSpec(lang="python", lib=lib)).create_converter()
+    results = []
+    for fuse in (True, False):
+        code = converter.convert(module, fuse=fuse)
+        namespace: dict = {}
+        exec(code, namespace)  # noqa: S102
+        results.append(namespace["Page"](HTML).parse())
+    assert results[0] == results[1]
+    assert results[0]["prices"] == [1.0, 2.0]
+
+
+def test_off_by_default():
+    from ssc_codegen.targets.python import PY_BS4_CONVERTER
+
+    module, _ = parse_module(SCHEMA)
+    code = PY_BS4_CONVERTER.convert(module)
+    assert code == PY_BS4_CONVERTER.convert(module, fuse=False)
+    assert code != PY_BS4_CONVERTER.convert(module, fuse=True)
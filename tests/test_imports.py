@@ -1,5 +1,6 @@
 """Tests for the import statement in the KDL DSL parser."""
 
+import json
 from pathlib import Path
 
 
@@ -172,6 +173,123 @@ def test_imported_document_is_structurally_linted(tmp_path):
     assert error.path == str(imported.resolve())
 
 
+def _shared_import_project(tmp_path, shared_src):
+    shared = tmp_path / "shared.kdl"
+    shared.write_text(shared_src, encoding="utf-8")
+    roots = []
+    for name in ("one", "two"):
+        root = tmp_path / f"{name}.kdl"
+        root.write_text(
+            'import "./shared.kdl"\n'
+            f"struct {name.title()} {{ child {{ nested Common }} }}\n",
+            encoding="utf-8",
+        )
+        roots.append(root)
+    return shared, roots
+
+
+def test_import_cache_parses_shared_import_once(tmp_path, monkeypatch):
+    from ssc_codegen.core import module_handler
+
+    _, roots = _shared_import_project(
+        tmp_path, 'struct Common { title { css "h1"; text } }\n'
+    )
+    parsed = []
+    real_parse = module_handler.kdl_parse
+
+    def counting_parse(src):
+        parsed.append(src)
+        return real_parse(src)
+
+    monkeypatch.setattr(module_handler, "kdl_parse", counting_parse)
+    cache = module_handler.ImportCache()
+    for root in roots:
+        module, diagnostics = parse_module(
+            root.read_text(encoding="utf-8"),
+            source_path=root,
+            import_cache=cache,
+        )
+        assert not _error_messages(diagnostics)
+        assert "Common" in [s.name for s in _structs(module)]
+    assert len(parsed) == 1
+
+
+def test_import_cache_revalidates_changed_file(tmp_path):
+    from ssc_codegen.core.module_handler import ImportCache
+
+    shared, roots = _shared_import_project(
+        tmp_path, 'struct Common { title { css "h1"; text } }\n'
+    )
+    cache = ImportCache()
+    _, diagnostics = parse_module(
+        roots[0].read_text(encoding="utf-8"),
+        source_path=roots[0],
+        import_cache=cache,
+    )
+    assert not _error_messages(diagnostics)
+
+    shared.write_text("unknown-node\n", encoding="utf-8")
+    _, diagnostics = parse_module(
+        roots[1].read_text(encoding="utf-8"),
+        source_path=roots[1],
+        import_cache=cache,
+    )
+    assert any("Unknown node" in m for m in _error_messages(diagnostics))
+
+
+def test_check_reports_shared_import_diagnostics_once(tmp_path):
+    from typer.testing import CliRunner
+
+    from ssc_codegen.main import app
+
+    _shared_import_project(
+        tmp_path,
+        'unknown-node\nstruct Common { title { css "h1"; text } }\n',
+    )
+    result = CliRunner().invoke(
+        app,
+        [
+            "check",
+            str(tmp_path / "one.kdl"),
+            str(tmp_path / "two.kdl"),
+            "-f",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 1
+    messages = [d["message"] for d in json.loads(result.stdout)]
+    assert messages.count("Unknown node: unknown-node") == 1
+
+
+def test_check_fails_every_importer_of_broken_import(tmp_path):
+    from typer.testing import CliRunner
+
+    from ssc_codegen.main import app
+
+    (tmp_path / "shared.kdl").write_text("unknown-node\n", encoding="utf-8")
+    roots = []
+    for name in ("one", "two"):
+        root = tmp_path / f"{name}.kdl"
+        # `css-all; first` would be rewritten by the peephole pass
+        root.write_text(
+            'import "./shared.kdl"\n'
+            f'struct {name.title()} {{ a {{ css-all "a"; first; text }} }}\n',
+            encoding="utf-8",
+        )
+        roots.append(str(root))
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["check", *roots])
+    assert result.exit_code == 1
+    assert "Found 2 error(s) in 2 file(s)" in result.output
+
+    result = runner.invoke(app, ["check", *roots, "-f", "json"])
+    assert result.exit_code == 1
+    entries = json.loads(result.stdout)
+    assert [d["message"] for d in entries] == ["Unknown node: unknown-node"]
+
+
 # ── error cases ───────────────────────────────────────────────────────────────
 
 
@@ -0,0 +1,121 @@
+"""Tests for lazily computed ``@init`` values."""
+
+from __future__ import annotations
+
+import pytest
+from kdlquery import Severity
+
+from ssc_codegen.ast import InitField, Struct
+from ssc_codegen.core import parse_module
+
+SCHEMA = """\
+struct Page {
+    @init {
+        title { css "h1"; text }
+        code { css "h1"; text; re #"(\\d+)"# }
+    }
+    title { @title; upper }
+    code { @code; fallback "none" }
+}
+"""
+
+EAGER = """\
+struct Page {
+    @init {
+        first { css "p"; text }
+        clean { css-remove ".ad" }
+        last { css "p"; text }
+    }
+    ads { css-all ".ad"; len }
+    first { @first }
+}
+"""
+
+ASSERTS = """\
+struct Page {
+    @init {
+        first { css "p"; text }
+        checked { css "h1"; assert { has-attr "id" } }
+        last { css "p"; text }
+    }
+    first { @first }
+}
+"""
+
+FIELD_REMOVE = """\
+struct Page {
+    @init {
+        ads-count { css-all ".ad"; len }
+    }
+    clean { css-remove ".ad"; raw }
+    ads { @ads-count }
+}
+"""
+
+HTML = """\
+<html><body><h1>Hello</h1><p class="ad">ad</p><p>text</p></body></html>
+"""
+
+_LIBS = ["bs4", "lxml", "parsel", "slax"]
+
+
+def _parse(src: str):
+    module, diagnostics = parse_module(src)
+    errors = [d for d in diagnostics if d.severity == Severity.ERROR]
+    assert not errors, errors
+    return module
+
+
+def _inits(module) -> dict[str, InitField]:
+    struct = next(n for n in module.body if isinstance(n, Struct))
+    return {n.name: n for n in struct.body if isinstance(n, InitField)}
+
+
+def test_init_fields_lazy():
+    assert all(f.lazy for f in _inits(_parse(SCHEMA)).values())
+
+
+def test_assert_keeps_it_and_earlier_entries_eager():
+    inits = _inits(_parse(ASSERTS))
+    assert [f.lazy for f in inits.values()] == [False, False, True]
+
+
+def test_remove_keeps_every_entry_eager():
+    inits = _inits(_parse(EAGER))
+    assert [f.lazy for f in inits.values()] == [False, False, False]
+
+
+def test_field_remove_keeps_every_entry_eager():
+    inits = _inits(_parse(FIELD_REMOVE))
+    assert [f.lazy for f in inits.values()] == [False]
+
+
+def _load(src: str, lib: str):
+    from ssc_codegen.targets.resolver import resolve
+    from ssc_codegen.targets.spec import TargetSpec
+
+    converter = resolve(TargetSpec(lang="python", lib=lib)).create_converter()
+    namespace: dict = {}
+    exec(converter.convert(_parse(src)), namespace)  # noqa: S102
+    return namespace["Page"]
+
+
+@pytest.mark.parametrize("lib", _LIBS)
+def test_value_computed_on_first_use(lib):
+    page = _load(SCHEMA, lib)(HTML)
+    # the failing `re` no longer raises in the constructor; the field's
+    # fallback applies instead
+    assert page.parse() == {"title": "HELLO", "code": "none"}
+    assert page.__dict__["_title"] == "Hello"
+
+
+@pytest.mark.parametrize("lib", _LIBS)
+def test_dom_mutation_still_in_constructor(lib):
+    result = _load(EAGER, lib)(HTML).parse()
+    assert result == {"ads": 0, "first": "ad"}
+
+
+@pytest.mark.parametrize("lib", _LIBS)
+def test_init_computed_before_field_remove(lib):
+    html = '<html><body><p class="ad">a</p><p class="ad">b</p></body></html>'
+    assert _load(FIELD_REMOVE, lib)(html).parse()["ads"] == 2
@@ -0,0 +1,151 @@
+"""Tests for limit/count pushdown into css-all/xpath-all."""
+
+from __future__ import annotations
+
+import pytest
+from kdlquery import Severity
+
+from ssc_codegen.ast import (
+    CssCount,
+    CssSelectAll,
+    Field,
+    Index,
+    Slice,
+    Struct,
+    XpathCount,
+)
+from ssc_codegen.core import parse_module
+from ssc_codegen.optimize import rewrite_module
+
+SCHEMA = """\
+struct Page {
+    head  { css-all "li"; slice 0 2; text }
+    tail  { css-all "ul li"; slice 1 3; text }
+    third { css-all "ul > li"; index 2; text }
+    total { css-all "body li"; len }
+    many  { css-all { "ol > li"; "li" }; slice 0 2; text }
+}
+"""
+
+XPATH = """\
+struct Page {
+    head  { xpath-all "//li"; slice 0 2; text }
+    total { xpath-all "//li | //p"; len }
+}
+"""
+
+HTML = """\
+<html><body>
+<ul><li>a</li><li>b</li><li>c</li><li>d</li></ul>
+<p>p</p>
+</body></html>
+"""
+
+
+def _parse(src: str):
+    module, diagnostics = parse_module(src)
+    errors = [d for d in diagnostics if d.severity == Severity.ERROR]
+    assert not errors, errors
+    return module
+
+
+def _fields(module) -> dict[str, Field]:
+    struct = next(n for n in module.body if isinstance(n, Struct))
+    return {n.name: n for n in struct.body if isinstance(n, Field)}
+
+
+class TestRule:
+    def test_leading_slice_becomes_limit(self):
+        module = _parse(SCHEMA)
+        rewrite_module(module)
+        head = _fields(module)["head"]
+        assert head.body[0].limit == 2
+        assert not any(isinstance(op, Slice) for op in head.body)
+
+    def test_offset_slice_kept(self):
+        module = _parse(SCHEMA)
+        rewrite_module(module)
+        tail = _fields(module)["tail"]
+        assert tail.body[0].limit == 3
+        assert isinstance(tail.body[1], Slice)
+
+    def test_index_bounds_limit(self):
+        module = _parse(SCHEMA)
+        rewrite_module(module)
+        third = _fields(module)["third"]
+        assert third.body[0].limit == 3
+        assert isinstance(third.body[1], Index)
+
+    def test_len_becomes_count(self):
+        module = _parse(SCHEMA)
+        rewrite_module(module)
+        total = _fields(module)["total"]
+        assert isinstance(total.body[0], CssCount)
+        assert total.body[0].queries == ["body li"]
+        module = _parse(XPATH)
+        rewrite_module(module)
+        assert isinstance(_fields(module)["total"].body[0], XpathCount)
+
+    def test_multi_query_untouched(self):
+        module = _parse(SCHEMA)
+        rewrites = rewrite_module(module)
+        many = _fields(module)["many"]
+        assert isinstance(many.body[0], CssSelectAll)
+        assert many.body[0].limit == 0
+        assert "Page.many" not in {r.scope for r in rewrites}
+
+    def test_shared_selector_left_to_cse(self):
+        src = """\
+struct Page {
+    first  { css-all "td"; index 1; text }
+    second { css-all "td"; index 2; text }
+}
+"""
+        module = _parse(src)
+        assert not [r for r in rewrite_module(module) if r.code == "O106"]
+        module = _parse(src)
+        rewrite_module(module, keep_shared=False)
+        fields = _fields(module)
+        assert [f.body[0].limit for f in fields.values()] == [2, 3]
+
+
+def _convert(src: str, lib: str, **meta) -> str:
+    from ssc_codegen.targets.resolver import resolve
+    from ssc_codegen.targets.spec import TargetSpec
+
+    converter = resolve(TargetSpec(lang="python", lib=lib)).create_converter()
+    return converter.convert(_parse(src), **meta)
+
+
+def _parse_page(code: str) -> dict:
+    namespace: dict = {}
+    exec(code, namespace)  # noqa: S102
+    return namespace["Page"](HTML).parse()
+
+
+@pytest.mark.parametrize("lib", ["bs4", "lxml", "parsel", "slax"])
+def test_css_same_result(lib):
+    limited = _parse_page(_convert(SCHEMA, lib))
+    assert limited == _parse_page(_convert(SCHEMA, lib, peephole=False))
+    assert limited == {
+        "head": ["a", "b"],
+        "tail": ["b", "c"],
+        "third": "c",
+        "total": 4,
+        "many": ["a", "b"],
+    }
+
+
+@pytest.mark.parametrize("lib", ["lxml", "parsel"])
+def test_xpath_same_result(lib):
+    limited = _parse_page(_convert(XPATH, lib))
+    assert limited == _parse_page(_convert(XPATH, lib, peephole=False))
+    assert limited == {"head": ["a", "b"], "total": 5}
+
+
+def test_native_limit_and_count():
+    assert "limit=2" in _convert(SCHEMA, "bs4")
+    for lib in ("lxml", "parsel"):
+        code = _convert(SCHEMA, lib)
+        assert "count(" in code
+        assert "position() <= 2" in code
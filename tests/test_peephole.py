@@ -0,0 +1,151 @@
+"""Tests for the peephole rewrite pass."""
+
+from __future__ import annotations
+
+import pytest
+from kdlquery import Severity
+
+from ssc_codegen.ast import CssSelect, Field, Repl, ReSub, Struct
+from ssc_codegen.core import parse_module
+from ssc_codegen.optimize import optimize_module, rewrite_module
+
+SCHEMA = """\
+struct Page {
+    title { css-all "h1"; first; text; normalize-space; trim }
+    link  { css-all "a"; index 0; attr "href"; trim; trim }
+    names { css-all ".n"; text; trim; normalize-space; upper; upper }
+    price { css ".p"; text; re-sub "USD" "$" }
+    clean { css ".p"; text; re-sub "USD" "" }
+    shout { css ".p"; text; lower; lower; upper }
+}
+"""
+
+HTML = """\
+<html><body>
+<h1>  Hello
+  world </h1><h1>second</h1>
+<a href=" /x ">x</a>
+<b class="n"> a  b </b><b class="n">c</b>
+<span class="p">10 USD</span>
+</body></html>
+"""
+
+# xpath is not available in every Python backend; only checked on the AST
+XPATH = """\
+struct Page {
+    link  { xpath-all "//a"; first; text }
+    items { xpath-all "//b"; first }
+}
+"""
+
+_LIBS = ["bs4", "lxml", "parsel", "slax"]
+
+
+def _parse(src: str = SCHEMA):
+    module, diagnostics = parse_module(src)
+    errors = [d for d in diagnostics if d.severity == Severity.ERROR]
+    assert not errors, errors
+    return module
+
+
+def _ops(module, field: str) -> list[str]:
+    struct = next(n for n in module.body if isinstance(n, Struct))
+    node = next(
+        n for n in struct.body if isinstance(n, Field) and n.name == field
+    )
+    return [type(op).__name__ for op in node.body]
+
+
+class TestRules:
+    def test_select_all_first(self):
+        module = _parse()
+        rewrites = rewrite_module(module)
+        assert _ops(module, "title")[0] == "CssSelect"
+        assert _ops(module, "link")[0] == "CssSelect"
+        assert [r.scope for r in rewrites if r.code == "O101"] == [
+            "Page.title",
+            "Page.link",
+        ]
+        module = _parse(XPATH)
+        rewrite_module(module)
+        assert _ops(module, "link")[0] == "XpathSelect"
+
+    def test_select_all_first_not_dereferenced_kept(self):
+        # a bare ``first`` raises on no match; a single select would not
+        module = _parse(XPATH)
+        rewrite_module(module)
+        assert _ops(module, "items")[:2] == ["XpathSelectAll", "Index"]
+
+    def test_trim_around_normalize_space(self):
+        module = _parse()
+        rewrite_module(module)
+        assert "Trim" not in _ops(module, "title")
+        assert _ops(module, "names")[:3] == [
+            "CssSelectAll",
+            "Text",
+            "NormalizeSpace",
+        ]
+
+    def test_repeated_ops(self):
+        module = _parse()
+        rewrite_module(module)
+        assert _ops(module, "link").count("Trim") == 1
+        assert _ops(module, "names").count("Upper") == 1
+        # lower; lower; upper -> lower; upper: only adjacent duplicates go
+        assert _ops(module, "shout")[2:4] == ["Lower", "Upper"]
+
+    def test_literal_re_sub(self):
+        module = _parse()
+        rewrite_module(module)
+        struct = next(n for n in module.body if isinstance(n, Struct))
+        fields = {n.name: n for n in struct.body if isinstance(n, Field)}
+        # "$" is special in JS/Go replacement strings
+        assert isinstance(fields["price"].body[2], ReSub)
+        repl = fields["clean"].body[2]
+        assert isinstance(repl, Repl)
+        assert (repl.old, repl.new) == ("USD", "")
+
+    def test_types_preserved(self):
+        module = _parse()
+        struct = next(n for n in module.body if isinstance(n, Struct))
+        before = {
+            n.name: n.body[-2].ret for n in struct.body if isinstance(n, Field)
+        }
+        rewrite_module(module)
+        fields = {n.name: n for n in struct.body if isinstance(n, Field)}
+        for name, node in fields.items():
+            assert node.body[-2].ret == before[name]
+            for prev, op in zip(node.body, node.body[1:-1]):
+                assert prev.ret == op.accept, (name, prev, op)
+        select = fields["title"].body[0]
+        assert isinstance(select, CssSelect) and not select.is_array
+
+    def test_rewrites_carry_spans(self):
+        rewrites = rewrite_module(_parse())
+        assert all(r.span is not None for r in rewrites)
+        assert rewrites[0].to_dict("page.kdl")["span"]["start"]["line"] == 2
+
+    def test_optimize_module_toggle(self):
+        module = _parse()
+        assert optimize_module(module, cse=False, peephole=False) is module
+        optimized = optimize_module(module, cse=False)
+        assert optimized is not module
+        assert _ops(module, "link")[0] == "CssSelectAll"
+        assert _ops(optimized, "link")[0] == "CssSelect"
+
+
+@pytest.mark.parametrize("lib", _LIBS)
+def test_same_result_as_unoptimized(lib):
+    from ssc_codegen.targets.resolver import resolve
+    from ssc_codegen.targets.spec import TargetSpec
+
+    module = _parse()
+    converter = resolve(TargetSpec(lang="python", lib=lib)).create_converter()
+    results = []
+    for peephole in (True, False):
+        namespace: dict = {}
+        exec(converter.convert(module, peephole=peephole), namespace)  # noqa: S102
+        results.append(namespace["Page"](HTML).parse())
+    assert results[0] == results[1]
+    assert results[0]["title"] == "Hello world"
+    assert results[0]["clean"] == "10 "
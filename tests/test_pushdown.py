@@ -0,0 +1,227 @@
+"""Tests for pushing filter predicates into css-all/xpath-all queries."""
+
+from __future__ import annotations
+
+import pytest
+from kdlquery import Severity
+
+from ssc_codegen.ast import Field, Filter, Struct
+from ssc_codegen.core import parse_module
+from ssc_codegen.optimize import rewrite_module
+
+CSS = """\
+struct Page {
+    local  { css-all "a"; filter { attr-starts "href" "/" }; attr "href" }
+    mixed  {
+        css-all "a"
+        filter { has-attr "title"; text-contains "x"; attr-ends "href" ".html" }
+        attr "href"
+    }
+    nested {
+        css-all "a"
+        filter { and { attr-eq "title" "t"; text-re "\\\\d" } }
+        text
+    }
+    kept   {
+        css-all "a"
+        filter {
+            attr-eq "rel" "next" "prev"
+            attr-starts "href" ""
+            css "b"
+            not { has-attr "title" }
+        }
+        text
+    }
+    many   {
+        css-all { "a"; "b" }
+        filter { has-attr "title" }
+        text
+    }
+    quoted { css-all "a"; filter { attr-eq "title" "say \\"hi\\"" }; text }
+    rel    { css-all "a"; filter { attr-eq "rel" "next" }; text }
+}
+"""
+
+XPATH = """\
+struct Page {
+    rows  {
+        xpath-all "//tr"
+        filter { has-attr "id"; text-contains "a" "b"; xpath "./td[2]" }
+        text
+    }
+    union { xpath-all "//th | //td"; filter { attr-eq "class" "x" }; text }
+    attrs { xpath-all "//a/@href"; filter { text-contains "x" } }
+    quote { xpath-all "//tr"; filter { attr-eq "title" "it's" }; text }
+    up    { xpath-all "//td/.."; filter { has-attr "id" }; text }
+}
+"""
+
+HTML = """\
+<html><body>
+<a href="/a.html" title="t" rel="next">x1</a>
+<a href="https://e/b.html" rel="prev">x2</a>
+<a href="/c" title='say "hi"'>y3</a>
+<b title="t">bold</b>
+<table>
+<tr id="r1" class="x"><td>a</td><td>it's</td></tr>
+<tr><td>b</td><td>2</td></tr>
+<tr id="r3"><td>c</td></tr>
+</table>
+</body></html>
+"""
+
+
+def _parse(src: str):
+    module, diagnostics = parse_module(src)
+    errors = [d for d in diagnostics if d.severity == Severity.ERROR]
+    assert not errors, errors
+    return module
+
+
+def _fields(module) -> dict[str, Field]:
+    struct = next(n for n in module.body if isinstance(n, Struct))
+    return {n.name: n for n in struct.body if isinstance(n, Field)}
+
+
+class TestCss:
+    def test_all_pushed_filter_removed(self):
+        module = _parse(CSS)
+        rewrite_module(module)
+        local = _fields(module)["local"]
+        assert local.body[0].queries == ['a[href^="/"]']
+        assert not isinstance(local.body[1], Filter)
+
+    def test_residual_filter(self):
+        module = _parse(CSS)
+        rewrite_module(module)
+        mixed = _fields(module)["mixed"]
+        assert mixed.body[0].queries == ['a[href$=".html"]']
+        residual = mixed.body[1]
+        assert isinstance(residual, Filter)
+        # bs4 has-attr rejects empty values, CSS [title] does not
+        assert [type(p).__name__ for p in residual.body] == [
+            "PredHasAttr",
+            "PredTextContains",
+        ]
+
+    def test_and_block_flattened(self):
+        module = _parse(CSS)
+        rewrite_module(module)
+        nested = _fields(module)["nested"]
+        assert nested.body[0].queries == ['a[title="t"]']
+        (logic,) = nested.body[1].body
+        assert [type(p).__name__ for p in logic.body] == ["PredTextRe"]
+
+    def test_not_pushable_kept(self):
+        module = _parse(CSS)
+        rewrites = rewrite_module(module)
+        fields = _fields(module)
+        assert fields["kept"].body[0].queries == ["a"]
+        assert len(fields["kept"].body[1].body) == 4
+        # first non-empty fallback needs the unfiltered lists
+        assert fields["many"].body[0].queries == ["a", "b"]
+        # bs4 compares rel/class as token lists
+        assert fields["rel"].body[0].queries == ["a"]
+        assert {r.scope for r in rewrites if r.code == "O105"} == {
+            "Page.local",
+            "Page.mixed",
+            "Page.nested",
+            "Page.quoted",
+        }
+
+    def test_value_escaped(self):
+        module = _parse(CSS)
+        rewrite_module(module)
+        quoted = _fields(module)["quoted"]
+        assert quoted.body[0].queries == ['a[title="say \\"hi\\""]']
+
+
+class TestXpath:
+    def test_predicates_appended(self):
+        module = _parse(XPATH)
+        rewrite_module(module)
+        fields = _fields(module)
+        assert fields["rows"].body[0].queries == ["//tr[@id][./td[2]]"]
+        # parsel matches text-contains against space-joined text nodes
+        (residual,) = fields["rows"].body[1].body
+        assert type(residual).__name__ == "PredTextContains"
+        assert fields["union"].body[0].queries == ["(//th | //td)[@class='x']"]
+        assert fields["quote"].body[0].queries == ['//tr[@title="it\'s"]']
+
+    def test_attribute_step_untouched(self):
+        module = _parse(XPATH)
+        rewrite_module(module)
+        attrs = _fields(module)["attrs"]
+        assert attrs.body[0].queries == ["//a/@href"]
+        assert isinstance(attrs.body[1], Filter)
+
+    def test_abbreviated_step_untouched(self):
+        module = _parse(XPATH)
+        rewrite_module(module)
+        up = _fields(module)["up"]
+        assert up.body[0].queries == ["//td/.."]
+        assert isinstance(up.body[1], Filter)
+
+
+def _run(src: str, lib: str, html: str = HTML) -> list[dict]:
+    from ssc_codegen.targets.resolver import resolve
+    from ssc_codegen.targets.spec import TargetSpec
+
+    module = _parse(src)
+    converter = resolve(TargetSpec(lang="python", lib=lib)).create_converter()
+    results = []
+    for peephole in (True, False):
+        namespace: dict = {}
+        exec(converter.convert(module, peephole=peephole), namespace)  # noqa: S102
+        results.append(namespace["Page"](html).parse())
+    return results
+
+
+@pytest.mark.parametrize("lib", ["lxml", "parsel", "slax"])
+def test_css_same_result(lib):
+    pushed, plain = _run(CSS, lib)
+    assert pushed == plain
+    assert pushed["local"] == ["/a.html", "/c"]
+    assert pushed["quoted"] == ["y3"]
+
+
+def test_css_bs4_same_result():
+    pushed, plain = _run(CSS, "bs4")
+    assert pushed == plain
+    assert pushed["nested"] == ["x1"]
+    # bs4 compares the rel token list to a string, which never matches
+    assert pushed["rel"] == []
+
+
+@pytest.mark.parametrize("lib", ["bs4", "lxml", "parsel", "slax"])
+def test_has_attr_empty_value_same_result(lib):
+    src = (
+        "struct Page {\n"
+        '    n { css-all "input"; filter { has-attr "disabled" }; len }\n'
+        "}\n"
+    )
+    html = '<html><body><input disabled><input disabled=""></body></html>'
+    pushed, plain = _run(src, lib, html)
+    assert pushed == plain
+
+
+@pytest.mark.parametrize("lib", ["lxml", "parsel"])
+def test_xpath_same_result(lib):
+    src = XPATH.replace(
+        '    attrs { xpath-all "//a/@href"; filter { text-contains "x" } }\n',
+        "",
+    )
+    pushed, plain = _run(src, lib)
+    assert pushed == plain
+    assert len(pushed["rows"]) == 1
+
+
+def test_xpath_text_contains_parsel_joins_text_nodes():
+    src = (
+        "struct Page {\n"
+        '    items { xpath-all "//p"; filter { text-contains "a b" }; len }\n'
+        "}\n"
+    )
+    html = "<html><body><p>a<b>b</b></p><p>a b</p></body></html>"
+    pushed, plain = _run(src, "parsel", html)
+    assert pushed == plain == {"items": 2}
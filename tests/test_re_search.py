@@ -5,6 +5,7 @@ Covers:
 - Parser: _expr_re populates span from KdlNode.span
 - Python codegen: std_re_search() emission, message construction, location
 - JS codegen: _stdReSearch() emission
+- Go codegen: package-level precompiled regexp vars
 - Runtime helpers: SscRegexError + std_re_search always exported
 - Separate-runtime (-R): import std_re_search from runtime, do not inline
 - Linter: re-all requires exactly one capture group (matches re behaviour)
@@ -13,6 +14,7 @@ Covers:
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
@@ -147,6 +149,99 @@ class TestPythonReCodegen:
         assert "for i in" in code
 
 
+class TestPythonReConstants:
+    SRC = (
+        "struct Page type=item {\n"
+        '    A { css ".x"; text; re #"(\\d+)"# }\n'
+        '    B { css-all ".x"; text; re #"(\\d+)"#; filter { re #"\\d"# } }\n'
+        '    C { css ".x"; text; re-sub #"\\s+"# " " }\n'
+        '    D { css ".x"; text; re-all #"(\\w+)"# }\n'
+        "}\n"
+    )
+
+    def test_patterns_hoisted_and_deduplicated(self, py_lxml):
+        from ssc_codegen.targets.python.regex import re_const_name
+
+        code = py_lxml.convert(_parse(self.SRC))
+        name = re_const_name(r"(\d+)")
+        assert code.count(f"{name} = re.compile(") == 1
+        assert f"std_re_search({name}, " in code
+        assert re_const_name(r"\d") + ".search(i)" in code
+        assert re_const_name(r"\s+") + ".sub(" in code
+        assert re_const_name(r"(\w+)") + ".findall(" in code
+        assert "re.search(" not in code
+        assert "re.sub(" not in code
+        assert "re.findall(" not in code
+
+    def test_hoisted_constants_execute(self, py_lxml):
+        code = py_lxml.convert(_parse(self.SRC))
+        ns: dict = {}
+        exec(code, ns)  # noqa: S102
+        result = ns["Page"]('<div class="x">ab 12</div>').parse()
+        assert result == {
+            "a": "12",
+            "b": ["12"],
+            "c": "ab 12",
+            "d": ["ab", "12"],
+        }
+
+    def test_dom_regex_predicates_use_constants(self):
+        from ssc_codegen.targets.python import (
+            PY_BS4_CONVERTER,
+            PY_LXML_CONVERTER,
+            PY_PARSEL_CONVERTER,
+            PY_SLAX_CONVERTER,
+        )
+        from ssc_codegen.targets.python.regex import re_const_name
+
+        src = (
+            "struct Page type=item {\n"
+            '    F { css-all "a"; filter { attr-re "href" #"^/p/"#; text-re #"\\w"# }; attr "href" }\n'
+            "}\n"
+        )
+        module = _parse(src)
+        for conv in (
+            PY_BS4_CONVERTER,
+            PY_LXML_CONVERTER,
+            PY_PARSEL_CONVERTER,
+            PY_SLAX_CONVERTER,
+        ):
+            code = conv.convert(module)
+            assert re_const_name("^/p/") + ".search(" in code
+            assert re_const_name(r"\w") + ".search(" in code
+            assert "re.search(" not in code
+
+    def test_separate_runtime_imports_constants(self, py_lxml):
+        from ssc_codegen.generation.runtime import runtime_module_content
+        from ssc_codegen.targets.python.regex import re_const_name
+
+        module = _parse(self.SRC)
+        code = py_lxml.convert(module, runtime_module="sscgen_runtime")
+        name = re_const_name(r"(\d+)")
+        assert f"{name} = re.compile(" not in code
+        assert "from .sscgen_runtime import RE_" in code
+        runtime = runtime_module_content(module)
+        assert runtime.count(f"{name} = re.compile(") == 1
+        ns: dict = {}
+        exec(compile(runtime, "<runtime>", "exec"), ns)  # noqa: S102
+        assert ns[name].pattern == r"(\d+)"
+
+    def test_runtime_shares_constants_across_modules(self):
+        from ssc_codegen.generation.runtime import runtime_module_content
+        from ssc_codegen.targets.python.regex import re_const_name
+
+        a = _parse(self.SRC)
+        b = _parse(
+            "struct Other type=item {\n"
+            '    X { css ".y"; text; re #"(\\d+)"# }\n'
+            '    Y { css ".y"; text; re #"(\\S+)"# }\n'
+            "}\n"
+        )
+        runtime = runtime_module_content(a, modules=[a, b])
+        assert runtime.count(re_const_name(r"(\d+)") + " = ") == 1
+        assert re_const_name(r"(\S+)") + " = " in runtime
+
+
 # ---------------------------------------------------------------------------
 # Runtime helpers
 # ---------------------------------------------------------------------------
@@ -174,12 +269,12 @@ class TestReRuntimeHelpers:
         assert issubclass(ns["SscRegexError"], Exception)
         # No-match path.
         with pytest.raises(ns["SscRegexError"]):
-            ns["std_re_search"](r"(\d+)", "abc", "loc")
+            ns["std_re_search"](re.compile(r"(\d+)"), "abc", "loc")
         # Match path — returns first capture group.
-        assert ns["std_re_search"](r"(\d+)", "abc123", "") == "123"
+        assert ns["std_re_search"](re.compile(r"(\d+)"), "abc123", "") == "123"
         # Empty msg fallback works.
         with pytest.raises(ns["SscRegexError"]) as exc_info:
-            ns["std_re_search"](r"(x)", "abc", "")
+            ns["std_re_search"](re.compile(r"(x)"), "abc", "")
         assert "ssc-gen" in str(exc_info.value) or "re-match" in str(
             exc_info.value
         )
@@ -263,6 +358,46 @@ class TestJsReCodegen:
         assert "Page.Field" in code
 
 
+# ---------------------------------------------------------------------------
+# Go codegen — package-level precompiled regexps
+# ---------------------------------------------------------------------------
+
+
+class TestGoReVars:
+    SRC = (
+        "struct Page type=item {\n"
+        '    A { css ".x"; text; re #"(\\d+)"# }\n'
+        '    B { css-all ".x"; text; re #"(\\d+)"#; filter { re #"\\d"# } }\n'
+        '    C { css ".x"; text; re-sub #"\\s+"# " " }\n'
+        "}\n"
+    )
+
+    def test_parser_references_package_vars(self):
+        from ssc_codegen.targets.golang.regex import go_re_var_name
+        from ssc_codegen.targets.golang.visitor import GoVisitor
+
+        code = GoVisitor().convert(_parse(self.SRC), package="p")
+        name = go_re_var_name(r"(\d+)")
+        assert "regexp.MustCompile" not in code
+        assert f"stdReSearch({name}, " in code
+        assert "stdReSearchArr(" in code and f", {name}, " in code
+        assert go_re_var_name(r"\s+") + ".ReplaceAllString(" in code
+        assert "stdReMatch(" + go_re_var_name(r"\d") in code
+
+    def test_runtime_declares_each_var_once(self):
+        from ssc_codegen.targets.golang.regex import go_re_var_name
+        from ssc_codegen.targets.golang.visitor import GoVisitor
+
+        conv = GoVisitor()
+        conv.convert(_parse(self.SRC), package="p")
+        conv.convert(_parse(self.SRC), package="p")
+        runtime = conv.emit_runtime("p")
+        name = go_re_var_name(r"(\d+)")
+        assert runtime.count(f"var {name} = regexp.MustCompile(") == 1
+        assert '"regexp"' in runtime
+        assert "func stdReSearch(re *regexp.Regexp" in runtime
+
+
 # ---------------------------------------------------------------------------
 # Linter — re-all now requires exactly one capture group
 # ---------------------------------------------------------------------------
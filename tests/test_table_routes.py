@@ -0,0 +1,109 @@
+"""Tests for keyed row dispatch in ``(table)struct`` parsers."""
+
+from __future__ import annotations
+
+import pytest
+from kdlquery import Severity
+
+from ssc_codegen.ast import StartParse, Struct
+from ssc_codegen.core import parse_module
+from ssc_codegen.traversal.utils import table_routes
+
+SCHEMA = """\
+(table)struct Spec {
+    @table { css "table" }
+    @rows { css-all "tr" }
+    @match { css "th"; text; trim; lower }
+    @value { css "td"; text; trim }
+
+    weight { match { eq "weight" "mass" }; fallback "-" }
+    wide   { match { starts "w" "wi" } }
+    width  { match { eq "width"; ne "x" } }
+    color  { match { contains "colo" }; fallback "none" }
+    short  { match { eq 3 } }
+}
+"""
+
+ROWS = """\
+<tr><th>Mass</th><td>1 kg</td></tr>
+<tr><th>weight</th><td>2 kg</td></tr>
+<tr><th>width</th><td>10</td></tr>
+<tr><th>wingspan</th><td>5</td></tr>
+<tr><th>colour</th><td>red</td></tr>
+<tr><th>top</th><td>t</td></tr>
+"""
+
+
+def _parse(src: str = SCHEMA):
+    module, diagnostics = parse_module(src)
+    errors = [d for d in diagnostics if d.severity == Severity.ERROR]
+    assert not errors, errors
+    return module
+
+
+def _routes(src: str = SCHEMA):
+    module = _parse(src)
+    struct = next(n for n in module.body if isinstance(n, Struct))
+    start = next(n for n in struct.body if isinstance(n, StartParse))
+    return table_routes(struct, start.fields)
+
+
+class TestPlan:
+    def test_literal_keys(self):
+        routes = _routes()
+        # color (3) and short (4) have no literal test
+        assert routes.other == (3, 4)
+        assert routes.exact["mass"] == (0, 3, 4)
+        # "width" also starts with "w" and "wi"
+        assert routes.exact["width"] == (1, 2, 3, 4)
+        assert routes.prefixes == {"w": (1,), "wi": (1,)}
+        assert routes.prefix_lengths == [1, 2]
+
+    def test_no_literal_field(self):
+        src = (
+            SCHEMA.replace('eq "weight" "mass"', "eq 2")
+            .replace('starts "w" "wi"', 'ends "w"')
+            .replace('eq "width"; ne "x"', 'ne "x"')
+        )
+        assert _routes(src) is None
+
+
+def _load(lib: str, **meta):
+    from ssc_codegen.targets.resolver import resolve
+    from ssc_codegen.targets.spec import TargetSpec
+
+    converter = resolve(TargetSpec(lang="python", lib=lib)).create_converter()
+    namespace: dict = {}
+    exec(converter.convert(_parse(), **meta), namespace)  # noqa: S102
+    return namespace["Spec"]
+
+
+@pytest.mark.parametrize("lib", ["bs4", "lxml", "parsel", "slax"])
+@pytest.mark.parametrize(
+    "rows",
+    [
+        ROWS,
+        # a row without a key cell: fields with a fallback still see it
+        "<tr><td>no key</td></tr>" + ROWS.replace("colour", "shade"),
+    ],
+)
+def test_same_result_as_full_scan(lib, rows, monkeypatch):
+    from ssc_codegen.targets.python import visitor
+
+    html = f"<html><body><table>{rows}</table></body></html>"
+    routed = _load(lib)(html)
+    monkeypatch.setattr(visitor, "table_routes", lambda *_: None)
+    scanned = _load(lib)(html)
+    expected = scanned.parse()
+    assert routed.parse() == expected
+    assert expected["width"] == "10"
+
+
+def test_key_computed_once_per_row():
+    spec = _load("bs4", instrument=True)
+    html = f"<html><body><table>{ROWS}</table></body></html>"
+    metrics = spec.parse.__globals__["SSC_METRICS"]
+    metrics.reset()
+    spec(html).parse()
+    stats = metrics.snapshot()
+    assert stats["Spec._table_match_key"]["calls"] == ROWS.count("<tr>")
@@ -0,0 +1,140 @@
+"""Tests for ``--watch``: import-aware change detection and rebuild loop."""
+
+from __future__ import annotations
+
+import os
+
+from typer.testing import CliRunner
+
+from ssc_codegen import main as cli
+from ssc_codegen.watch import Watcher, dependency_graph
+
+runner = CliRunner()
+
+PAGE = 'import "shared.kdl"\nstruct Page { title { css "h1"; text } }\n'
+OTHER = 'struct Other { title { css "h2"; text } }\n'
+SHARED = 'define TITLE="h1"\n'
+
+
+def _project(tmp_path):
+    (tmp_path / "page.kdl").write_text(PAGE, encoding="utf-8")
+    (tmp_path / "other.kdl").write_text(OTHER, encoding="utf-8")
+    (tmp_path / "shared.kdl").write_text(SHARED, encoding="utf-8")
+    return [tmp_path / "other.kdl", tmp_path / "page.kdl"]
+
+
+def _touch(path, content):
+    st = path.stat() if path.exists() else None
+    path.write_text(content, encoding="utf-8")
+    if st is not None:
+        bumped = st.st_mtime_ns + 1_000_000_000
+        os.utime(path, ns=(bumped, bumped))
+
+
+class TestDependencyGraph:
+    def test_imports_map_back_to_importers(self, tmp_path):
+        files = _project(tmp_path)
+        graph = dependency_graph(files)
+        assert graph[(tmp_path / "shared.kdl").resolve()] == [files[1]]
+        assert graph[files[0].resolve()] == [files[0]]
+        assert graph[files[1].resolve()] == [files[1]]
+
+
+class TestWatcher:
+    def test_no_change_no_rebuild(self, tmp_path):
+        files = _project(tmp_path)
+        watcher = Watcher(lambda: files)
+        assert watcher.poll() == []
+
+    def test_import_change_rebuilds_importers_only(self, tmp_path):
+        files = _project(tmp_path)
+        watcher = Watcher(lambda: files)
+        _touch(tmp_path / "shared.kdl", 'define TITLE="h2"\n')
+        assert watcher.poll() == [tmp_path / "page.kdl"]
+        assert watcher.poll() == []
+
+    def test_new_import_is_tracked_after_rebuild(self, tmp_path):
+        files = _project(tmp_path)
+        watcher = Watcher(lambda: files)
+        _touch(tmp_path / "other.kdl", 'import "shared.kdl"\n' + OTHER)
+        assert watcher.poll() == [tmp_path / "other.kdl"]
+        _touch(tmp_path / "shared.kdl", 'define TITLE="h3"\n')
+        assert watcher.poll() == files
+
+    def test_new_schema_is_affected(self, tmp_path):
+        files = _project(tmp_path)
+        current = list(files)
+        watcher = Watcher(lambda: current)
+        extra = tmp_path / "extra.kdl"
+        extra.write_text(OTHER.replace("Other", "Extra"), encoding="utf-8")
+        current.append(extra)
+        assert watcher.poll() == [extra]
+
+    def test_wait_sleeps_between_polls(self, tmp_path):
+        files = _project(tmp_path)
+        naps = []
+
+        def sleep(seconds):
+            naps.append(seconds)
+            if len(naps) == 3:
+                _touch(tmp_path / "other.kdl", OTHER + "\n")
+
+        watcher = Watcher(lambda: files, interval=0.25, sleep=sleep)
+        assert watcher.wait() == [files[0]]
+        assert naps == [0.25, 0.25, 0.25]
+
+
+class TestWatchCli:
+    def _fake_wait(self, monkeypatch, batches):
+        def wait(self):
+            if not batches:
+                raise KeyboardInterrupt
+            return batches.pop(0)
+
+        monkeypatch.setattr(Watcher, "wait", wait)
+
+    def test_check_watch_rechecks_affected(self, tmp_path, monkeypatch):
+        files = _project(tmp_path)
+        self._fake_wait(monkeypatch, [[files[1]]])
+        result = runner.invoke(cli.app, ["check", str(tmp_path), "--watch"])
+        assert result.exit_code == 0, result.output
+        assert "All 3 file(s) passed linting." in result.output
+        assert "1 schema(s) affected" in result.output
+        assert "All 1 file(s) passed linting." in result.output
+        assert "Stopped watching." in result.output
+
+    def test_generate_watch_reports_only_rewritten(self, tmp_path, monkeypatch):
+        files = _project(tmp_path)
+        out = tmp_path / "out"
+
+        def edit_then_affect():
+            _touch(files[0], OTHER.replace("h2", "h3"))
+            return [files[0]]
+
+        batches = [None]
+
+        def wait(self):
+            if not batches:
+                raise KeyboardInterrupt
+            batches.pop()
+            return edit_then_affect()
+
+        monkeypatch.setattr(Watcher, "wait", wait)
+        result = runner.invoke(
+            cli.app,
+            [
+                "generate",
+                "python",
+                *(str(f) for f in files),
+                "-o",
+                str(out),
+                "--no-cache",
+                "--watch",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        first, _, rebuild = result.output.partition("schema(s) affected")
+        assert "page.kdl ->" in first and "other.kdl ->" in first
+        assert "other.kdl ->" in rebuild
+        assert "page.kdl ->" not in rebuild
+        assert "'h3'" in (out / "other.py").read_text(encoding="utf-8")